@@ -28,6 +28,8 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # Importar todos os modelos SQLModel da nova estrutura (Clean Architecture)
 from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa: F401
+from app.infrastructure.database.models.estatistica_regra_model import EstatisticaRegraModel  # noqa: F401
+from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel  # noqa: F401
 from app.infrastructure.database.models.regra_model import RegraModel, RegraTagModel  # noqa: F401
 from app.infrastructure.database.models.tag_model import TagModel, TransacaoTagModel  # noqa: F401
 from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa: F401
@@ -0,0 +1,37 @@
+"""adiciona tabela regraestatistica
+
+Revision ID: 4c1d7e2a9b36
+Revises: 67238a2f576e
+Create Date: 2026-10-19 09:10:12.418305
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1d7e2a9b36'
+down_revision: Union[str, Sequence[str], None] = '67238a2f576e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Contadores acumulados por regra (gravados em lote ao final de cada execução)
+    op.create_table('regraestatistica',
+        sa.Column('regra_id', sa.Integer(), nullable=False),
+        sa.Column('total_avaliacoes', sa.Integer(), nullable=False),
+        sa.Column('total_correspondencias', sa.Integer(), nullable=False),
+        sa.Column('total_aplicacoes', sa.Integer(), nullable=False),
+        sa.Column('tempo_total_ms', sa.Float(), nullable=False),
+        sa.Column('atualizado_em', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['regra_id'], ['regra.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('regra_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('regraestatistica')
@@ -0,0 +1,55 @@
+"""adiciona lote de importacao
+
+Revision ID: 9e3b5f1a7c24
+Revises: 4c1d7e2a9b36
+Create Date: 2026-10-19 11:05:37.204811
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3b5f1a7c24'
+down_revision: Union[str, Sequence[str], None] = '4c1d7e2a9b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Um registro por arquivo importado
+    op.create_table('importacao_lote',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('hash_arquivo', sa.String(length=64), nullable=False),
+        sa.Column('nome_arquivo', sa.String(), nullable=False),
+        sa.Column('parser_id', sa.String(), nullable=False),
+        sa.Column('usuario_id', sa.Integer(), nullable=False),
+        sa.Column('total_linhas', sa.Integer(), nullable=False),
+        sa.Column('total_importado', sa.Integer(), nullable=False),
+        sa.Column('criado_em', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['usuario_id'], ['usuario.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_importacao_lote_hash_arquivo'), 'importacao_lote', ['hash_arquivo'])
+    op.create_index(op.f('ix_importacao_lote_usuario_id'), 'importacao_lote', ['usuario_id'])
+    
+    # Transações existentes ficam sem lote (NULL)
+    op.add_column('transacao', sa.Column('lote_importacao_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_transacao_importacao_lote',
+        'transacao', 'importacao_lote',
+        ['lote_importacao_id'], ['id']
+    )
+    op.create_index(op.f('ix_transacao_lote_importacao_id'), 'transacao', ['lote_importacao_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_transacao_lote_importacao_id'), table_name='transacao')
+    op.drop_constraint('fk_transacao_importacao_lote', 'transacao', type_='foreignkey')
+    op.drop_column('transacao', 'lote_importacao_id')
+    op.drop_index(op.f('ix_importacao_lote_usuario_id'), table_name='importacao_lote')
+    op.drop_index(op.f('ix_importacao_lote_hash_arquivo'), table_name='importacao_lote')
+    op.drop_table('importacao_lote')
@@ -0,0 +1,28 @@
+"""adiciona resultado em importacao_lote
+
+Revision ID: b7d2c94e1f58
+Revises: 9e3b5f1a7c24
+Create Date: 2026-10-19 11:40:08.551392
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2c94e1f58'
+down_revision: Union[str, Sequence[str], None] = '9e3b5f1a7c24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Resultado guardado para responder reenvios do mesmo arquivo
+    op.add_column('importacao_lote', sa.Column('resultado', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('importacao_lote', 'resultado')
@@ -20,8 +20,11 @@ class LinhaImportacaoDTO:
 class ResultadoImportacaoDTO:
     """DTO de resposta da importação"""
     total_importado: int
-    transacoes_ids: List[int]
+    transacoes_ids: List[int]  # Vazio para arquivos lidos em blocos (usar lote_id)
     mensagem: str
+    lote_id: int | None = None  # Lote de importação registrado para o arquivo
+    replay: bool = False  # True se o arquivo já havia sido importado (resultado anterior)
+    total_duplicadas: int = 0  # Linhas ignoradas por já existirem no banco
 
 
 @dataclass
@@ -33,6 +36,8 @@ class ResultadoArquivoDTO:
     transacoes_ids: List[int]
     mensagem: str
     erro: str | None = None
+    lote_id: int | None = None
+    replay: bool = False
 
 
 @dataclass
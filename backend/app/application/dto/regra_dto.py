@@ -52,3 +52,17 @@ class ResultadoAplicacaoDTO:
     sucesso: bool
     transacoes_modificadas: int
     mensagem: str
+
+
+@dataclass
+class EstatisticaRegraDTO:
+    """DTO de leitura das estatísticas acumuladas de uma regra"""
+    regra_id: int
+    nome: str
+    ativo: bool
+    prioridade: int
+    total_avaliacoes: int
+    total_correspondencias: int
+    total_aplicacoes: int
+    tempo_total_ms: float
+    tempo_medio_ms: float
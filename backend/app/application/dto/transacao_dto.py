@@ -4,7 +4,7 @@ Objetos simples para transferir dados entre camadas
 """
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 
@@ -75,6 +75,23 @@ class FiltrosTransacaoDTO:
     usuario_id: Optional[int] = None  # Novo filtro por usuário
 
 
+@dataclass
+class AtualizarTransacoesEmLoteDTO:
+    """DTO para atualizar campos de várias transações (apenas os presentes em alteracoes)"""
+    transacao_ids: Optional[List[int]] = None
+    filtros: Optional[FiltrosTransacaoDTO] = None
+    alteracoes: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class AtualizarTagsEmLoteDTO:
+    """DTO para adicionar/remover tags de várias transações"""
+    transacao_ids: Optional[List[int]] = None
+    filtros: Optional[FiltrosTransacaoDTO] = None
+    adicionar_tag_ids: List[int] = field(default_factory=list)
+    remover_tag_ids: List[int] = field(default_factory=list)
+
+
 @dataclass
 class ResumoMensalDTO:
     """DTO para resumo mensal de transações"""
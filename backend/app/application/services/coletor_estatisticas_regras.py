@@ -0,0 +1,87 @@
+"""
+Serviço de coleta de estatísticas de execução de regras
+
+Responsabilidades:
+- Aplicar regras medindo correspondências, aplicações e tempo por regra
+- Acumular contadores em memória durante uma execução
+- Gravar os contadores em lote ao final (nunca por transação)
+"""
+import logging
+from time import perf_counter
+from typing import Dict, Optional
+
+from app.domain.entities.estatistica_regra import EstatisticaRegra
+from app.domain.entities.regra import Regra
+from app.domain.entities.transacao import Transacao
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ColetorEstatisticasRegras:
+    """
+    Aplica regras instrumentando cada avaliação.
+    
+    Uso:
+        coletor = ColetorEstatisticasRegras(estatistica_repo)
+        for transacao in transacoes:
+            for regra in regras:
+                coletor.aplicar(regra, transacao)
+        coletor.descarregar()
+    
+    Sem repositório, apenas aplica as regras (contadores são descartados).
+    """
+    
+    def __init__(self, estatistica_repo: Optional[IEstatisticaRegraRepository] = None):
+        self._estatistica_repo = estatistica_repo
+        self._estatisticas: Dict[int, EstatisticaRegra] = {}
+    
+    def aplicar(self, regra: Regra, transacao: Transacao) -> bool:
+        """
+        Aplica a regra na transação registrando o resultado.
+        
+        Returns:
+            True se a regra foi aplicada (mesma semântica de Regra.aplicar_em)
+        """
+        inicio = perf_counter()
+        correspondeu = regra.corresponde_criterio(transacao)
+        aplicada = correspondeu and regra.executar_acao(transacao)
+        tempo_ms = (perf_counter() - inicio) * 1000
+        
+        if regra.id is not None:
+            estatistica = self._estatisticas.get(regra.id)
+            if estatistica is None:
+                estatistica = EstatisticaRegra(regra_id=regra.id)
+                self._estatisticas[regra.id] = estatistica
+            estatistica.registrar_avaliacao(correspondeu, aplicada, tempo_ms)
+        
+        return aplicada
+    
+    def acumular(self, estatistica: EstatisticaRegra) -> None:
+        """Soma contadores já agregados (ex: medidos por uma carga em massa)"""
+        acumulada = self._estatisticas.get(estatistica.regra_id)
+        if acumulada is None:
+            acumulada = EstatisticaRegra(regra_id=estatistica.regra_id)
+            self._estatisticas[estatistica.regra_id] = acumulada
+        acumulada.total_avaliacoes += estatistica.total_avaliacoes
+        acumulada.total_correspondencias += estatistica.total_correspondencias
+        acumulada.total_aplicacoes += estatistica.total_aplicacoes
+        acumulada.tempo_total_ms += estatistica.tempo_total_ms
+    
+    def descarregar(self) -> None:
+        """
+        Grava os contadores acumulados em lote e reinicia o acumulador.
+        
+        Falhas de gravação são apenas registradas em log: estatísticas
+        nunca devem invalidar uma importação já concluída.
+        """
+        estatisticas = list(self._estatisticas.values())
+        self._estatisticas = {}
+        
+        if not self._estatistica_repo or not estatisticas:
+            return
+        
+        try:
+            self._estatistica_repo.registrar(estatisticas)
+        except Exception:
+            logger.warning("Falha ao gravar estatísticas de regras", exc_info=True)
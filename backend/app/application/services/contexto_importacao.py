@@ -0,0 +1,31 @@
+"""
+Contexto de importação compartilhado
+
+Responsabilidades:
+- Guardar dados resolvidos uma única vez por requisição de importação
+  (CPF do usuário, tag Rotina, regras ativas, parsers já obtidos)
+- Permitir que vários arquivos do mesmo envio reutilizem esses dados
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.domain.entities.regra import Regra
+from app.domain.entities.tag import Tag
+from app.domain.parsers.extrato_parser import IExtratoParser
+
+
+@dataclass
+class ContextoImportacao:
+    """
+    Dados de configuração de uma importação, válidos durante uma requisição.
+    
+    Regras ativas são carregadas uma vez, já ordenadas por prioridade
+    (maior primeiro); alterações feitas em regras durante a requisição
+    só valem para a próxima importação.
+    """
+    
+    usuario_id: int
+    cpf_usuario: Optional[str]
+    tag_rotina: Tag
+    regras: List[Regra] = field(default_factory=list)
+    parsers: Dict[str, IExtratoParser] = field(default_factory=dict)
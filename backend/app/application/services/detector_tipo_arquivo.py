@@ -1,12 +1,35 @@
 """
-Serviço para detectar qual parser usar baseado no nome do arquivo.
+Serviço para detectar qual parser usar baseado no nome e no conteúdo do arquivo.
 
 Responsabilidade (Single Responsibility):
 - Analisar padrão do nome do arquivo
-- Retornar parser_id apropriado
+- Conferir o cabeçalho do conteúdo (primeiros KB) contra o formato esperado
+- Retornar parser_id apropriado ou rejeitar o arquivo sem parse completo
 """
+import csv
 import re
 
+from app.application.exceptions import ValidationException
+
+# Bytes do início do arquivo analisados na detecção
+TAMANHO_CABECALHO = 8 * 1024
+
+# Assinaturas de formato
+ASSINATURA_OLE2 = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"  # .xls e planilhas OOXML criptografadas
+ASSINATURA_ZIP = b"PK\x03\x04"  # .xlsx
+MARCADOR_CRIPTOGRAFIA = "EncryptedPackage".encode("utf-16-le")  # stream da planilha protegida
+
+# Formatos identificados pelo cabeçalho
+FORMATO_TEXTO = "texto"
+FORMATO_XLSX = "xlsx"
+FORMATO_XLS = "xls"
+FORMATO_CRIPTOGRAFADO = "criptografado"
+
+# Leitura do cabeçalho CSV: exportações de planilha costumam vir em Latin-1 e
+# com ";" (Excel pt-BR); latin-1 decodifica qualquer byte, então é o último recurso
+CODIFICACOES_CSV = ("utf-8-sig", "cp1252", "latin-1")
+DELIMITADORES_CSV = (",", ";", "\t")
+
 
 class DetectorTipoArquivo:
     """
@@ -14,13 +37,18 @@ class DetectorTipoArquivo:
     
     Para adicionar novo parser:
     1. Apenas adicione uma entrada em PADROES
-    2. O método detectar() automaticamente vai testá-lo
+    2. Declare os formatos aceitos em FORMATOS_ACEITOS
+    3. Se for CSV, adicione as colunas do cabeçalho em CABECALHOS_CSV
     
     Padrões suportados:
     - btg_extrato: Extrato_YYYY-MM-DD_a_YYYY-MM-DD_NNNN...
     - btg_fatura: YYYY-MM-DD_Fatura_NOME_NNNN_BTG.xlsx
     - nubank_fatura: Nubank_YYYY-MM-DD
     - nubank_extrato: NU_NNNN_DDMMMYYYY_DDMMMYYYY
+    
+    Com o cabeçalho do conteúdo, arquivos renomeados são reconhecidos pelas
+    colunas do CSV e conteúdos incompatíveis (binário desconhecido, planilha
+    protegida fora do padrão BTG) são rejeitados antes de qualquer parse.
     """
     
     # Mapa: parser_id → regex pattern
@@ -32,16 +60,64 @@ class DetectorTipoArquivo:
         'nubank_extrato': re.compile(r'^NU_\d+_\d{2}[A-Z]{3}\d{4}_\d{2}[A-Z]{3}\d{4}', re.IGNORECASE),
     }
     
-    def detectar(self, nome_arquivo: str) -> str:
+    # Mapa: parser_id → formatos de conteúdo que o parser sabe ler
+    # (btg_fatura aceita qualquer OLE2: em planilhas protegidas grandes o diretório
+    # com "EncryptedPackage" fica além de TAMANHO_CABECALHO e o conteúdo é
+    # identificado como xls; a descriptografia no parser é quem confirma)
+    FORMATOS_ACEITOS = {
+        'btg_extrato': {FORMATO_XLS, FORMATO_XLSX},
+        'btg_fatura': {FORMATO_XLS, FORMATO_XLSX, FORMATO_CRIPTOGRAFADO},
+        'nubank_fatura': {FORMATO_TEXTO},
+        'nubank_extrato': {FORMATO_TEXTO},
+        'arquivo_tratado': {FORMATO_TEXTO, FORMATO_XLS, FORMATO_XLSX},
+    }
+    
+    # Mapa: parser_id → colunas (minúsculas) que identificam o CSV, em ordem de prioridade
+    CABECALHOS_CSV = {
+        'nubank_fatura': {'date', 'title', 'amount'},
+        'nubank_extrato': {'data', 'valor', 'descrição'},
+        'arquivo_tratado': {'data', 'descricao', 'valor', 'origem'},
+    }
+    
+    def detectar(self, nome_arquivo: str, cabecalho: bytes | None = None) -> str:
         """
-        Detecta qual parser usar baseado no nome do arquivo.
+        Detecta qual parser usar baseado no nome (e no conteúdo, se fornecido).
         
         Args:
             nome_arquivo: Nome do arquivo (com ou sem extensão)
+            cabecalho: Primeiros bytes do arquivo (ver TAMANHO_CABECALHO). Sem ele,
+                       a detecção usa apenas o nome.
             
         Returns:
             parser_id para usar no registry (ex: 'btg_extrato', 'arquivo_tratado')
+            
+        Raises:
+            ValidationException: Se o conteúdo não puder ser lido por nenhum parser
         """
+        parser_id = self._detectar_por_nome(nome_arquivo)
+        
+        if cabecalho is None:
+            return parser_id
+        
+        formato = self._identificar_formato(cabecalho)
+        
+        if formato == FORMATO_TEXTO:
+            return self._detectar_por_colunas(nome_arquivo, cabecalho, parser_id)
+        
+        if formato in self.FORMATOS_ACEITOS[parser_id]:
+            return parser_id
+        
+        if formato == FORMATO_CRIPTOGRAFADO:
+            raise ValidationException(
+                f"Arquivo '{nome_arquivo}' é uma planilha protegida por senha. "
+                f"Apenas faturas BTG (YYYY-MM-DD_Fatura_NOME_NNNN_BTG.xlsx) são suportadas"
+            )
+        
+        # Nome de parser CSV com conteúdo de planilha: tratar como arquivo tratado
+        return 'arquivo_tratado'
+    
+    def _detectar_por_nome(self, nome_arquivo: str) -> str:
+        """Detecta parser_id pelo padrão do nome do arquivo"""
         # Remover extensão para análise
         nome_base = self._remover_extensao(nome_arquivo)
         
@@ -53,10 +129,72 @@ class DetectorTipoArquivo:
         # Nenhum padrão reconhecido → arquivo já tratado
         return 'arquivo_tratado'
     
+    def _identificar_formato(self, cabecalho: bytes) -> str:
+        """Identifica o formato pelo início do conteúdo"""
+        if not cabecalho:
+            raise ValidationException("Arquivo vazio")
+        
+        if cabecalho.startswith(ASSINATURA_OLE2):
+            # O marcador só é visto se o diretório CFB estiver no cabeçalho:
+            # sem ele, a planilha ainda pode ser protegida (ver FORMATOS_ACEITOS)
+            if MARCADOR_CRIPTOGRAFIA in cabecalho:
+                return FORMATO_CRIPTOGRAFADO
+            return FORMATO_XLS
+        
+        if cabecalho.startswith(ASSINATURA_ZIP):
+            return FORMATO_XLSX
+        
+        if b"\x00" in cabecalho:
+            raise ValidationException(
+                "Conteúdo do arquivo não é planilha (.xls/.xlsx) nem CSV"
+            )
+        
+        return FORMATO_TEXTO
+    
+    def _detectar_por_colunas(self, nome_arquivo: str, cabecalho: bytes, parser_id: str) -> str:
+        """Escolhe o parser CSV pelas colunas da primeira linha"""
+        leituras = self._ler_colunas(cabecalho)
+        
+        def compativel(candidato: str) -> bool:
+            esperadas = self.CABECALHOS_CSV.get(candidato)
+            return esperadas is not None and any(esperadas <= colunas for colunas in leituras)
+        
+        # Colunas compatíveis com o parser do nome: mantém a escolha pelo nome
+        if compativel(parser_id):
+            return parser_id
+        
+        for candidato in self.CABECALHOS_CSV:
+            if compativel(candidato):
+                return candidato
+        
+        raise ValidationException(
+            f"Colunas do arquivo '{nome_arquivo}' não correspondem a nenhum formato suportado. "
+            f"Arquivo tratado deve ter: {', '.join(sorted(self.CABECALHOS_CSV['arquivo_tratado']))}"
+        )
+    
+    def _ler_colunas(self, cabecalho: bytes) -> list[set[str]]:
+        """
+        Colunas (minúsculas) da primeira linha, uma leitura por delimitador.
+        
+        Só a primeira linha é decodificada: o cabeçalho truncado em
+        TAMANHO_CABECALHO pode terminar no meio de um caractere UTF-8.
+        """
+        primeira_linha = cabecalho.split(b"\n", 1)[0].rstrip(b"\r")
+        for codificacao in CODIFICACOES_CSV:
+            try:
+                texto = primeira_linha.decode(codificacao)
+                break
+            except UnicodeDecodeError:
+                continue
+        
+        return [
+            {coluna.strip().lower() for coluna in next(csv.reader([texto], delimiter=delimitador), [])}
+            for delimitador in DELIMITADORES_CSV
+        ]
+    
     def _remover_extensao(self, nome_arquivo: str) -> str:
         """Remove extensão do nome do arquivo"""
         for ext in ['.csv', '.xlsx', '.xls', '.txt']:
             if nome_arquivo.lower().endswith(ext):
                 return nome_arquivo[:-len(ext)]
         return nome_arquivo
-
@@ -4,16 +4,26 @@ Serviço de Importação de Transações
 Responsabilidades:
 - Processar DataFrame normalizado e criar transações
 - Garantir existência da tag Rotina
+- Ignorar transações já importadas (mesma chave de importação)
 - Aplicar regras ativas
+- Delegar cargas muito grandes ao repositório de importação em massa
+
+Com um ContextoImportacao, tag Rotina, regras e CPF vêm do contexto
+(resolvidos uma vez por requisição) em vez de consultados a cada importação.
 """
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from app.application.dto.importacao_dto import ResultadoImportacaoDTO
+from app.application.services.coletor_estatisticas_regras import ColetorEstatisticasRegras
+from app.application.services.contexto_importacao import ContextoImportacao
+from app.domain.entities.regra import Regra
 from app.domain.entities.tag import Tag
 from app.domain.entities.transacao import Transacao
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
+from app.domain.repositories.importacao_em_massa_repository import IImportacaoEmMassaRepository
 from app.domain.repositories.regra_repository import IRegraRepository
 from app.domain.repositories.tag_repository import ITagRepository
 from app.domain.repositories.transacao_repository import ITransacaoRepository
@@ -37,13 +47,19 @@ class ImportacaoService:
         tag_repo: ITagRepository,
         regra_repo: IRegraRepository,
         usuario_repo: IUsuarioRepository,
-        usuario_id: int = 1  # Padrão: "Não definido"
+        usuario_id: int = 1,  # Padrão: "Não definido"
+        estatistica_repo: Optional[IEstatisticaRegraRepository] = None,
+        importacao_em_massa_repo: Optional[IImportacaoEmMassaRepository] = None,
+        contexto: Optional[ContextoImportacao] = None
     ):
         self._transacao_repo = transacao_repo
         self._tag_repo = tag_repo
         self._regra_repo = regra_repo
         self._usuario_repo = usuario_repo
         self._usuario_id = usuario_id
+        self._estatistica_repo = estatistica_repo
+        self._importacao_em_massa_repo = importacao_em_massa_repo
+        self._contexto = contexto
     
     def obter_cpf_usuario(self) -> str | None:
         """
@@ -52,16 +68,39 @@ class ImportacaoService:
         Returns:
             CPF do usuário ou None se não cadastrado
         """
+        if self._contexto is not None:
+            return self._contexto.cpf_usuario
+        
         usuario = self._usuario_repo.buscar_por_id(self._usuario_id)
         return usuario.cpf if usuario else None
     
-    def importar(self, df: pd.DataFrame) -> ResultadoImportacaoDTO:
+    def montar_contexto(self) -> ContextoImportacao:
+        """
+        Resolve CPF, tag Rotina e regras ativas para reuso entre importações.
+        
+        Returns:
+            ContextoImportacao do usuário deste service
+        """
+        return ContextoImportacao(
+            usuario_id=self._usuario_id,
+            cpf_usuario=self.obter_cpf_usuario(),
+            tag_rotina=self._garantir_tag_rotina(),
+            regras=self._listar_regras_ativas()
+        )
+    
+    def importar(
+        self,
+        df: pd.DataFrame | List[Dict[str, Any]],
+        lote_importacao_id: Optional[int] = None
+    ) -> ResultadoImportacaoDTO:
         """
         Importa transações a partir de um DataFrame normalizado.
         
         Args:
             df: DataFrame com colunas: data, descricao, valor, origem, categoria (opcional), 
-                banco (opcional), data_fatura (opcional)
+                banco (opcional), data_fatura (opcional); ou lista de registros
+                (dicts) com as mesmas chaves, vinda do caminho rápido dos parsers
+            lote_importacao_id: Lote registrado para o arquivo (carimbado em cada transação)
             
         Returns:
             ResultadoImportacaoDTO com detalhes da importação
@@ -69,8 +108,8 @@ class ImportacaoService:
         # Garantir que tag "Rotina" existe
         tag_rotina = self._garantir_tag_rotina()
         
-        # Processar linhas e criar transações
-        transacoes_ids = self._processar_linhas(df, tag_rotina)
+        # Processar linhas e criar transações (ignorando as já importadas)
+        transacoes_ids, total_duplicadas = self._processar_linhas(df, tag_rotina, lote_importacao_id)
         
         # Aplicar regras ativas em todas as transações importadas
         self._aplicar_regras(transacoes_ids)
@@ -78,16 +117,133 @@ class ImportacaoService:
         return ResultadoImportacaoDTO(
             total_importado=len(transacoes_ids),
             transacoes_ids=transacoes_ids,
-            mensagem=f"{len(transacoes_ids)} transações importadas com sucesso"
+            mensagem=self._mensagem(len(transacoes_ids), total_duplicadas),
+            total_duplicadas=total_duplicadas
         )
     
-    def _processar_linhas(self, df: pd.DataFrame, tag_rotina: Tag) -> List[int]:
-        """Processa cada linha do DataFrame e cria transações."""
+    def importar_em_massa(self, df: pd.DataFrame, lote_importacao_id: Optional[int] = None) -> ResultadoImportacaoDTO:
+        """
+        Importa um DataFrame grande sem criar uma entidade por linha.
+        
+        Normaliza as colunas de forma vetorizada e delega deduplicação,
+        tag Rotina e regras ao repositório de importação em massa.
+        
+        Raises:
+            ValueError: Se o service foi criado sem importacao_em_massa_repo
+        """
+        if self._importacao_em_massa_repo is None:
+            raise ValueError("Importação em massa requer importacao_em_massa_repo")
+        
+        tag_rotina = self._garantir_tag_rotina()
+        regras = self._listar_regras_ativas()
+        
+        resultado = self._importacao_em_massa_repo.importar(
+            self._normalizar_em_massa(df),
+            usuario_id=self._usuario_id,
+            tag_rotina_id=tag_rotina.id,
+            regras=regras,
+            lote_importacao_id=lote_importacao_id
+        )
+        
+        coletor = ColetorEstatisticasRegras(self._estatistica_repo)
+        for estatistica in resultado.estatisticas:
+            coletor.acumular(estatistica)
+        coletor.descarregar()
+        
+        total = len(resultado.transacoes_ids)
+        return ResultadoImportacaoDTO(
+            total_importado=total,
+            transacoes_ids=resultado.transacoes_ids,
+            mensagem=self._mensagem(total, resultado.total_duplicadas),
+            total_duplicadas=resultado.total_duplicadas
+        )
+    
+    @staticmethod
+    def _mensagem(total: int, total_duplicadas: int) -> str:
+        mensagem = f"{total} transações importadas com sucesso"
+        if total_duplicadas:
+            mensagem += f" ({total_duplicadas} duplicadas ignoradas)"
+        return mensagem
+    
+    def _normalizar_em_massa(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Versão vetorizada de _linha_para_transacao.
+        
+        Linhas que a entidade Transacao rejeitaria (data/valor inválidos,
+        data_fatura anterior à data) são descartadas.
+        """
+        datas = pd.to_datetime(df['data'], dayfirst=True, errors='coerce')
+        valores = pd.to_numeric(df['valor'], errors='coerce')
+        origem = df['origem'].astype(str).str.lower()
+        
+        normalizado = pd.DataFrame({
+            'data': datas,
+            'descricao': df['descricao'].astype(str),
+            'valor': valores.abs(),
+            # Fatura sempre é saída; extrato usa o sinal do valor
+            'tipo': TipoTransacao.SAIDA.name,
+            'origem': origem,
+        })
+        normalizado.loc[(origem != 'fatura_cartao') & (valores > 0), 'tipo'] = TipoTransacao.ENTRADA.name
+        
+        for coluna in ('categoria', 'banco'):
+            if coluna in df.columns:
+                normalizado[coluna] = df[coluna].where(pd.notna(df[coluna]), None).map(
+                    lambda v: str(v) if v is not None else None
+                )
+        
+        datas_fatura = None
+        if 'data_fatura' in df.columns:
+            datas_fatura = pd.to_datetime(df['data_fatura'], dayfirst=True, errors='coerce')
+        
+        validas = normalizado['data'].notna() & normalizado['valor'].notna()
+        if datas_fatura is not None:
+            validas &= datas_fatura.isna() | (datas_fatura >= normalizado['data'])
+            normalizado['data_fatura'] = datas_fatura
+        
+        normalizado = normalizado[validas].copy()
+        normalizado['data'] = normalizado['data'].dt.date
+        if datas_fatura is not None:
+            normalizado['data_fatura'] = [d.date() if pd.notna(d) else None for d in normalizado['data_fatura']]
+        
+        return normalizado
+    
+    def _processar_linhas(
+        self,
+        df: pd.DataFrame | List[Dict[str, Any]],
+        tag_rotina: Tag,
+        lote_importacao_id: Optional[int] = None
+    ) -> Tuple[List[int], int]:
+        """
+        Processa cada linha do DataFrame (ou registro) e cria transações.
+        
+        Linhas cuja chave de importação já existe no banco são ignoradas,
+        como no repositório de importação em massa.
+        
+        Returns:
+            IDs criados e quantidade de linhas ignoradas por já existirem
+        """
+        transacoes = []
+        linhas = (row for _, row in df.iterrows()) if isinstance(df, pd.DataFrame) else df
+        
+        for row in linhas:
+            try:
+                transacoes.append(self._linha_para_transacao(row))
+            except Exception as e:
+                # Log erro mas continua processamento
+                print(f"Erro ao processar linha: {str(e)}")
+        
+        existentes = self._chaves_existentes(transacoes, lote_importacao_id)
         transacoes_ids = []
+        total_duplicadas = 0
         
-        for _, row in df.iterrows():
+        for transacao in transacoes:
+            if transacao.chave_importacao() in existentes:
+                total_duplicadas += 1
+                continue
+            
             try:
-                transacao = self._linha_para_transacao(row)
+                transacao.lote_importacao_id = lote_importacao_id
                 
                 # Persistir
                 transacao = self._transacao_repo.criar(transacao)
@@ -103,9 +259,23 @@ class ImportacaoService:
                 print(f"Erro ao processar linha: {str(e)}")
                 continue
         
-        return transacoes_ids
+        return transacoes_ids, total_duplicadas
     
-    def _linha_para_transacao(self, row: pd.Series) -> Transacao:
+    def _chaves_existentes(
+        self,
+        transacoes: List[Transacao],
+        lote_importacao_id: Optional[int]
+    ) -> Set[tuple]:
+        """Chaves já gravadas no período das transações (uma consulta)"""
+        if not transacoes:
+            return set()
+        
+        datas = [t.data for t in transacoes]
+        return self._transacao_repo.listar_chaves_importacao(
+            self._usuario_id, min(datas), max(datas), excluir_lote_id=lote_importacao_id
+        )
+    
+    def _linha_para_transacao(self, row: pd.Series | Dict[str, Any]) -> Transacao:
         """
         Converte linha do DataFrame em entidade Transacao.
         
@@ -148,6 +318,9 @@ class ImportacaoService:
     
     def _garantir_tag_rotina(self) -> Tag:
         """Garante que tag 'Rotina' existe, criando se necessário."""
+        if self._contexto is not None:
+            return self._contexto.tag_rotina
+        
         tag = self._tag_repo.buscar_por_nome("Rotina")
         
         if not tag:
@@ -160,8 +333,19 @@ class ImportacaoService:
         
         return tag
     
-    def _converter_data(self, valor) -> datetime.date:
+    def _listar_regras_ativas(self) -> List[Regra]:
+        """Regras ativas do contexto ou, sem contexto, do repositório."""
+        if self._contexto is not None:
+            return self._contexto.regras
+        return self._regra_repo.listar(apenas_ativas=True)
+    
+    def _converter_data(self, valor) -> date:
         """Converte valor para date, suportando múltiplos formatos."""
+        # datetime/Timestamp e date (caminho rápido) dispensam o pandas
+        if isinstance(valor, datetime):
+            return valor.date()
+        if isinstance(valor, date):
+            return valor
         if isinstance(valor, str):
             if '/' in valor:
                 return pd.to_datetime(valor, format='%d/%m/%Y').date()
@@ -171,8 +355,9 @@ class ImportacaoService:
             return pd.to_datetime(valor).date()
     
     def _aplicar_regras(self, transacoes_ids: List[int]) -> None:
-        """Aplica todas as regras ativas nas transações."""
-        regras = self._regra_repo.listar(apenas_ativas=True)
+        """Aplica todas as regras ativas nas transações, coletando estatísticas."""
+        regras = self._listar_regras_ativas()
+        coletor = ColetorEstatisticasRegras(self._estatistica_repo)
         
         for transacao_id in transacoes_ids:
             transacao = self._transacao_repo.buscar_por_id(transacao_id)
@@ -181,7 +366,9 @@ class ImportacaoService:
             
             # Aplicar cada regra
             for regra in regras:
-                regra.aplicar_em(transacao)
+                coletor.aplicar(regra, transacao)
             
             # Atualizar transação
             self._transacao_repo.atualizar(transacao)
+        
+        coletor.descarregar()
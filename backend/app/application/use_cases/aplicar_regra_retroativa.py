@@ -2,9 +2,15 @@
 Caso de Uso: Aplicar Regra Retroativamente
 Aplica uma regra específica em todas as transações existentes
 """
+import time
+from typing import Optional
+
 from app.application.exceptions.application_exceptions import EntityNotFoundException
+from app.application.services.coletor_estatisticas_regras import ColetorEstatisticasRegras
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
 from app.domain.repositories.regra_repository import IRegraRepository
 from app.domain.repositories.transacao_repository import ITransacaoRepository
+from app.infrastructure.observabilidade.metricas import registrar_retroativa
 
 
 class AplicarRegraRetroativamenteUseCase:
@@ -17,10 +23,12 @@ class AplicarRegraRetroativamenteUseCase:
     def __init__(
         self,
         transacao_repository: ITransacaoRepository,
-        regra_repository: IRegraRepository
+        regra_repository: IRegraRepository,
+        estatistica_repository: Optional[IEstatisticaRegraRepository] = None
     ):
         self._transacao_repository = transacao_repository
         self._regra_repository = regra_repository
+        self._estatistica_repository = estatistica_repository
     
     def execute(self, regra_id: int) -> dict:
         """
@@ -39,6 +47,8 @@ class AplicarRegraRetroativamenteUseCase:
         Raises:
             EntityNotFoundException: Se regra não existe
         """
+        inicio = time.perf_counter()
+        
         # Busca regra
         regra = self._regra_repository.buscar_por_id(regra_id)
         if not regra:
@@ -49,12 +59,16 @@ class AplicarRegraRetroativamenteUseCase:
         
         # Aplica regra
         total_modificado = 0
+        coletor = ColetorEstatisticasRegras(self._estatistica_repository)
         
         for transacao in transacoes:
-            if regra.aplicar_em(transacao):
+            if coletor.aplicar(regra, transacao):
                 self._transacao_repository.atualizar(transacao)
                 total_modificado += 1
         
+        coletor.descarregar()
+        registrar_retroativa("regra", len(transacoes), time.perf_counter() - inicio)
+        
         return {
             "total_processado": len(transacoes),
             "total_modificado": total_modificado
@@ -2,8 +2,14 @@
 Caso de Uso: Aplicar Todas as Regras Retroativamente
 Aplica todas as regras ativas em todas as transações existentes
 """
+import time
+from typing import Optional
+
+from app.application.services.coletor_estatisticas_regras import ColetorEstatisticasRegras
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
 from app.domain.repositories.regra_repository import IRegraRepository
 from app.domain.repositories.transacao_repository import ITransacaoRepository
+from app.infrastructure.observabilidade.metricas import registrar_retroativa
 
 
 class AplicarTodasRegrasRetroativaUseCase:
@@ -16,10 +22,12 @@ class AplicarTodasRegrasRetroativaUseCase:
     def __init__(
         self,
         transacao_repository: ITransacaoRepository,
-        regra_repository: IRegraRepository
+        regra_repository: IRegraRepository,
+        estatistica_repository: Optional[IEstatisticaRegraRepository] = None
     ):
         self._transacao_repository = transacao_repository
         self._regra_repository = regra_repository
+        self._estatistica_repository = estatistica_repository
     
     def execute(self) -> dict:
         """
@@ -32,6 +40,8 @@ class AplicarTodasRegrasRetroativaUseCase:
                 "total_modificado": int (número de transações modificadas)
             }
         """
+        inicio = time.perf_counter()
+        
         # Busca todas as transações
         transacoes = self._transacao_repository.listar()
         
@@ -40,18 +50,22 @@ class AplicarTodasRegrasRetroativaUseCase:
         
         # Aplica regras
         total_modificado = 0
+        coletor = ColetorEstatisticasRegras(self._estatistica_repository)
         
         for transacao in transacoes:
             modificado = False
             
             for regra in regras:
-                if regra.aplicar_em(transacao):
+                if coletor.aplicar(regra, transacao):
                     modificado = True
             
             if modificado:
                 self._transacao_repository.atualizar(transacao)
                 total_modificado += 1
         
+        coletor.descarregar()
+        registrar_retroativa("todas", len(transacoes), time.perf_counter() - inicio)
+        
         return {
             "total_processado": len(transacoes),
             "total_modificado": total_modificado
@@ -0,0 +1,100 @@
+"""
+Caso de uso: Adicionar/Remover Tags em Lote
+"""
+from typing import List, Optional
+
+from app.application.dto.transacao_dto import AtualizarTagsEmLoteDTO, FiltrosTransacaoDTO
+from app.application.exceptions.application_exceptions import EntityNotFoundException, ValidationException
+from app.domain.repositories.configuracao_repository import IConfiguracaoRepository
+from app.domain.repositories.tag_repository import ITagRepository
+from app.domain.repositories.transacao_repository import ITransacaoRepository
+from app.domain.value_objects.selecao_transacoes import SelecaoTransacoes
+
+
+def montar_selecao(
+    transacao_ids: Optional[List[int]],
+    filtros: Optional[FiltrosTransacaoDTO],
+    criterio_data: str
+) -> SelecaoTransacoes:
+    """
+    Converte IDs e/ou filtros de listagem em uma SelecaoTransacoes.
+    
+    Raises:
+        ValidationException: Se nenhum critério de seleção foi informado
+    """
+    filtros = filtros or FiltrosTransacaoDTO()
+    selecao = SelecaoTransacoes(
+        ids=transacao_ids,
+        mes=filtros.mes,
+        ano=filtros.ano,
+        data_inicio=filtros.data_inicio,
+        data_fim=filtros.data_fim,
+        categoria=filtros.categoria,
+        tipo=filtros.tipo,
+        tag_ids=filtros.tag_ids,
+        sem_tags=filtros.sem_tags,
+        sem_categoria=filtros.sem_categoria,
+        criterio_data=criterio_data,
+        usuario_id=filtros.usuario_id
+    )
+    if selecao.vazia():
+        raise ValidationException("Informe os IDs das transações ou ao menos um filtro")
+    return selecao
+
+
+class AtualizarTagsEmLoteUseCase:
+    """
+    Caso de uso para adicionar e remover tags de várias transações.
+    
+    Responsabilidades:
+    - Validar seleção e tags informadas
+    - Delegar ao repositório a atualização set-based (sem carregar transações)
+    """
+    
+    def __init__(
+        self,
+        transacao_repository: ITransacaoRepository,
+        tag_repository: ITagRepository,
+        configuracao_repository: IConfiguracaoRepository
+    ):
+        self._transacao_repository = transacao_repository
+        self._tag_repository = tag_repository
+        self._configuracao_repository = configuracao_repository
+    
+    def execute(self, dto: AtualizarTagsEmLoteDTO) -> int:
+        """
+        Executa o caso de uso.
+        
+        Args:
+            dto: Seleção de transações e tags a adicionar/remover
+            
+        Returns:
+            Quantidade de transações afetadas
+            
+        Raises:
+            ValidationException: Se seleção ou listas de tags forem inválidas
+            EntityNotFoundException: Se alguma tag não existir
+        """
+        adicionar = list(dict.fromkeys(dto.adicionar_tag_ids))
+        remover = list(dict.fromkeys(dto.remover_tag_ids))
+        
+        if not adicionar and not remover:
+            raise ValidationException("Informe ao menos uma tag para adicionar ou remover")
+        
+        conflitantes = set(adicionar) & set(remover)
+        if conflitantes:
+            raise ValidationException(
+                f"Tags não podem ser adicionadas e removidas ao mesmo tempo: {sorted(conflitantes)}"
+            )
+        
+        # Validar que todas as tags existem
+        tag_ids = adicionar + remover
+        encontradas = {tag.id for tag in self._tag_repository.listar_por_ids(tag_ids)}
+        for tag_id in tag_ids:
+            if tag_id not in encontradas:
+                raise EntityNotFoundException("Tag", tag_id)
+        
+        criterio = self._configuracao_repository.obter("criterio_data_transacao") or "data_transacao"
+        selecao = montar_selecao(dto.transacao_ids, dto.filtros, criterio)
+        
+        return self._transacao_repository.atualizar_tags_em_lote(selecao, adicionar, remover)
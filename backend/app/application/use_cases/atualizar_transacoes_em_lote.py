@@ -0,0 +1,65 @@
+"""
+Caso de uso: Atualizar Transações em Lote
+"""
+from app.application.dto.transacao_dto import AtualizarTransacoesEmLoteDTO
+from app.application.exceptions.application_exceptions import EntityNotFoundException, ValidationException
+from app.application.use_cases.atualizar_tags_em_lote import montar_selecao
+from app.domain.repositories.configuracao_repository import IConfiguracaoRepository
+from app.domain.repositories.transacao_repository import ITransacaoRepository
+from app.domain.repositories.usuario_repository import IUsuarioRepository
+
+# Campos que podem ser alterados em lote
+CAMPOS_PERMITIDOS = {"categoria", "observacoes", "usuario_id"}
+
+
+class AtualizarTransacoesEmLoteUseCase:
+    """
+    Caso de uso para aplicar o mesmo patch de campos a várias transações.
+    
+    Responsabilidades:
+    - Validar seleção e campos informados
+    - Delegar ao repositório um único UPDATE (sem carregar transações)
+    """
+    
+    def __init__(
+        self,
+        transacao_repository: ITransacaoRepository,
+        usuario_repository: IUsuarioRepository,
+        configuracao_repository: IConfiguracaoRepository
+    ):
+        self._transacao_repository = transacao_repository
+        self._usuario_repository = usuario_repository
+        self._configuracao_repository = configuracao_repository
+    
+    def execute(self, dto: AtualizarTransacoesEmLoteDTO) -> int:
+        """
+        Executa o caso de uso.
+        
+        Args:
+            dto: Seleção de transações e campos a alterar
+            
+        Returns:
+            Quantidade de transações atualizadas
+            
+        Raises:
+            ValidationException: Se seleção ou campos forem inválidos
+            EntityNotFoundException: Se o usuário informado não existir
+        """
+        if not dto.alteracoes:
+            raise ValidationException("Informe ao menos um campo para atualizar")
+        
+        invalidos = set(dto.alteracoes) - CAMPOS_PERMITIDOS
+        if invalidos:
+            raise ValidationException(f"Campos não podem ser atualizados em lote: {sorted(invalidos)}")
+        
+        if "usuario_id" in dto.alteracoes:
+            usuario_id = dto.alteracoes["usuario_id"]
+            if usuario_id is None:
+                raise ValidationException("usuario_id não pode ser nulo")
+            if not self._usuario_repository.buscar_por_id(usuario_id):
+                raise EntityNotFoundException("Usuario", usuario_id)
+        
+        criterio = self._configuracao_repository.obter("criterio_data_transacao") or "data_transacao"
+        selecao = montar_selecao(dto.transacao_ids, dto.filtros, criterio)
+        
+        return self._transacao_repository.atualizar_campos_em_lote(selecao, dict(dto.alteracoes))
@@ -0,0 +1,31 @@
+"""
+Caso de uso: Desfazer Importação
+"""
+from app.application.exceptions.application_exceptions import EntityNotFoundException
+from app.domain.repositories.lote_importacao_repository import ILoteImportacaoRepository
+
+
+class DesfazerImportacaoUseCase:
+    """
+    Caso de uso para remover um lote de importação e tudo que ele criou.
+    
+    Responsabilidades:
+    - Validar que o lote existe
+    - Remover lote, transações e associações de tags (set-based no repositório)
+    """
+    
+    def __init__(self, lote_repository: ILoteImportacaoRepository):
+        self._lote_repository = lote_repository
+    
+    def execute(self, lote_id: int) -> None:
+        """
+        Executa o caso de uso.
+        
+        Args:
+            lote_id: ID do lote de importação
+            
+        Raises:
+            EntityNotFoundException: Se o lote não existir
+        """
+        if not self._lote_repository.deletar(lote_id):
+            raise EntityNotFoundException("LoteImportacao", lote_id)
@@ -8,19 +8,44 @@ Fluxo:
 1. Detecta qual parser usar pelo nome do arquivo
 2. Parser lê arquivo e retorna DataFrame normalizado
 3. ImportacaoService processa DataFrame e salva transações
+4. Lote de importação registra o arquivo (permite desfazer a importação)
+
+Arquivos grandes de parsers que suportam leitura em blocos são processados
+bloco a bloco, com um commit por bloco.
 """
-from typing import BinaryIO
+import hashlib
+import io
+import time
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterable, List
 
 from app.application.dto.importacao_dto import ResultadoImportacaoDTO
 from app.application.exceptions import ValidationException
-from app.application.services.detector_tipo_arquivo import DetectorTipoArquivo
-from app.application.services.importacao_service import ImportacaoService
+from app.application.services.detector_tipo_arquivo import TAMANHO_CABECALHO, DetectorTipoArquivo
+from app.application.services.contexto_importacao import ContextoImportacao
+from app.domain.entities.lote_importacao import LoteImportacao
+from app.domain.parsers.extrato_parser import (
+    IExtratoParser,
+    IExtratoParserEmBlocos,
+    IExtratoParserRegistros,
+)
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
+from app.domain.repositories.importacao_em_massa_repository import IImportacaoEmMassaRepository
+from app.domain.repositories.lote_importacao_repository import ILoteImportacaoRepository
 from app.domain.repositories.regra_repository import IRegraRepository
 from app.domain.repositories.tag_repository import ITagRepository
 from app.domain.repositories.transacao_repository import ITransacaoRepository
 from app.domain.repositories.usuario_repository import IUsuarioRepository
+from app.infrastructure.observabilidade.metricas import registrar_importacao
 from app.infrastructure.parsers.extrato_parser_registry import obter_registry
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from app.application.services.importacao_service import ImportacaoService
+
+# Parsers cujos arquivos podem ser grandes o bastante para a importação em massa
+PARSERS_IMPORTACAO_EM_MASSA = {"arquivo_tratado"}
+
 
 class ImportarArquivoUseCase:
     """
@@ -36,7 +61,13 @@ class ImportarArquivoUseCase:
         transacao_repo: ITransacaoRepository,
         tag_repo: ITagRepository,
         regra_repo: IRegraRepository,
-        usuario_repo: IUsuarioRepository
+        usuario_repo: IUsuarioRepository,
+        estatistica_repo: IEstatisticaRegraRepository | None = None,
+        lote_repo: ILoteImportacaoRepository | None = None,
+        importacao_em_massa_repo: IImportacaoEmMassaRepository | None = None,
+        min_linhas_importacao_em_massa: int = 5000,
+        tamanho_bloco_linhas: int = 50_000,
+        min_bytes_leitura_em_blocos: int = 20 * 1024 * 1024
     ):
         self._detector = DetectorTipoArquivo()
         self._parser_registry = obter_registry()
@@ -44,22 +75,31 @@ class ImportarArquivoUseCase:
         self._tag_repo = tag_repo
         self._regra_repo = regra_repo
         self._usuario_repo = usuario_repo
+        self._estatistica_repo = estatistica_repo
+        self._lote_repo = lote_repo
+        self._importacao_em_massa_repo = importacao_em_massa_repo
+        self._min_linhas_importacao_em_massa = min_linhas_importacao_em_massa
+        self._tamanho_bloco_linhas = tamanho_bloco_linhas
+        self._min_bytes_leitura_em_blocos = min_bytes_leitura_em_blocos
     
     def execute(
         self,
         arquivo: BinaryIO,
         nome_arquivo: str,
         usuario_id: int = 1,
-        password: str | None = None
+        password: str | None = None,
+        contexto: ContextoImportacao | None = None
     ) -> ResultadoImportacaoDTO:
         """
         Importa arquivo detectando automaticamente o tipo.
         
         Args:
-            arquivo: Conteúdo do arquivo (bytes)
+            arquivo: Conteúdo do arquivo (bytes ou stream posicionável)
             nome_arquivo: Nome do arquivo
             usuario_id: ID do usuário responsável pelas transações
             password: Senha para arquivos protegidos (opcional)
+            contexto: Contexto compartilhado entre arquivos do mesmo envio
+                      (opcional; sem ele, é resolvido para este arquivo)
             
         Returns:
             ResultadoImportacaoDTO com resultado da importação
@@ -67,38 +107,249 @@ class ImportarArquivoUseCase:
         Raises:
             ValidationException: Se tipo não suportado ou dados inválidos
         """
+        inicio = time.perf_counter()
+        
+        # 1. Detectar qual parser usar pelo nome e cabeçalho (rejeita sem parse completo)
+        parser_id = self._detector.detectar(nome_arquivo, ler_cabecalho(arquivo))
+        
+        # Hash calculado antes do parser consumir o conteúdo
+        hash_arquivo = calcular_hash_arquivo(arquivo)
+        
+        # Reenvio do mesmo arquivo: devolve resultado anterior sem reprocessar
+        if self._lote_repo is not None:
+            lote_anterior = self._lote_repo.buscar_por_hash(usuario_id, hash_arquivo)
+            if lote_anterior is not None:
+                return self._resultado_replay(lote_anterior)
+        
+        # Contexto compartilhado (lote de arquivos) ou resolvido só para este arquivo
+        if contexto is None:
+            contexto = self.criar_contexto(usuario_id)
+        elif contexto.usuario_id != usuario_id:
+            raise ValueError("Contexto de importação pertence a outro usuário")
+        
         # Criar service com usuario_id
-        service = ImportacaoService(
-            transacao_repo=self._transacao_repo,
-            tag_repo=self._tag_repo,
-            regra_repo=self._regra_repo,
-            usuario_repo=self._usuario_repo,
-            usuario_id=usuario_id
-        )
+        service = self._criar_service(usuario_id, contexto)
         
-        # Se não foi fornecida senha, tentar obter CPF do usuário
+        # Se não foi fornecida senha, usar CPF do usuário
         if password is None:
             password = service.obter_cpf_usuario()
         
-        # 1. Detectar qual parser usar pelo nome
-        parser_id = self._detector.detectar(nome_arquivo)
+        # 2. Obter parser apropriado (reaproveitado pelo contexto)
+        parser = contexto.parsers.get(parser_id)
+        if parser is None:
+            parser = self._parser_registry.obter_parser(parser_id)
+            contexto.parsers[parser_id] = parser
+        
+        # 3. Parser lê arquivo e retorna DataFrame(s) normalizado(s)
+        if self._usar_leitura_em_blocos(parser, arquivo):
+            # Arquivo grande: lido e importado bloco a bloco (memória constante)
+            lote = self._registrar_lote(hash_arquivo, nome_arquivo, parser_id, usuario_id)
+            blocos = parser.parse_em_blocos(
+                arquivo, nome_arquivo, self._tamanho_bloco_linhas, password=password
+            )
+            return self._importar_blocos(service, parser_id, blocos, lote, inicio)
         
-        # 2. Obter parser apropriado
-        parser = self._parser_registry.obter_parser(parser_id)
+        conteudo = arquivo if isinstance(arquivo, (bytes, bytearray)) else arquivo.read()
         
-        # 3. Parser lê arquivo e retorna DataFrame normalizado
-        df_normalizado = parser.parse(arquivo, nome_arquivo, password=password)
+        # Caminho rápido (csv da stdlib) para parsers que o suportam; pandas como alternativa
+        dados_normalizados = None
+        if isinstance(parser, IExtratoParserRegistros):
+            dados_normalizados = parser.parse_registros(conteudo, nome_arquivo, password=password)
+        if dados_normalizados is None:
+            dados_normalizados = parser.parse(conteudo, nome_arquivo, password=password)
         
-        # Validar que DataFrame tem dados
-        if df_normalizado.empty:
+        # Validar que há dados
+        if len(dados_normalizados) == 0:
             raise ValidationException(
                 f"Arquivo '{nome_arquivo}' não contém dados válidos"
             )
         
-        # 4. Service processa DataFrame e salva transações
-        resultado = service.importar(df_normalizado)
+        # 4. Registrar lote do arquivo e processar dados
+        lote = self._registrar_lote(hash_arquivo, nome_arquivo, parser_id, usuario_id)
+        return self._importar_blocos(service, parser_id, [dados_normalizados], lote, inicio)
+    
+    def criar_contexto(self, usuario_id: int) -> ContextoImportacao:
+        """
+        Resolve uma vez CPF, tag Rotina e regras ativas do usuário.
+        
+        O contexto pode ser passado a várias chamadas de execute do mesmo envio.
+        """
+        return self._criar_service(usuario_id).montar_contexto()
+    
+    def _criar_service(
+        self,
+        usuario_id: int,
+        contexto: ContextoImportacao | None = None
+    ) -> "ImportacaoService":
+        """Cria o service de importação para o usuário"""
+        # Import tardio: o service depende de pandas, que só deve ser
+        # carregado quando há importação (não no startup da API)
+        from app.application.services.importacao_service import ImportacaoService
+        
+        return ImportacaoService(
+            transacao_repo=self._transacao_repo,
+            tag_repo=self._tag_repo,
+            regra_repo=self._regra_repo,
+            usuario_repo=self._usuario_repo,
+            usuario_id=usuario_id,
+            estatistica_repo=self._estatistica_repo,
+            importacao_em_massa_repo=self._importacao_em_massa_repo,
+            contexto=contexto
+        )
+    
+    def _registrar_lote(
+        self,
+        hash_arquivo: str,
+        nome_arquivo: str,
+        parser_id: str,
+        usuario_id: int
+    ) -> LoteImportacao | None:
+        """Registra o lote do arquivo (se repositório disponível)"""
+        if self._lote_repo is None:
+            return None
+        return self._lote_repo.criar(LoteImportacao(
+            hash_arquivo=hash_arquivo,
+            nome_arquivo=nome_arquivo,
+            parser_id=parser_id,
+            usuario_id=usuario_id
+        ))
+    
+    def _importar_blocos(
+        self,
+        service: "ImportacaoService",
+        parser_id: str,
+        blocos: Iterable["pd.DataFrame | List[Dict[str, Any]]"],
+        lote: LoteImportacao | None,
+        inicio: float
+    ) -> ResultadoImportacaoDTO:
+        """
+        Service processa cada bloco (um commit por bloco) e consolida o resultado.
+        
+        Só contagens são acumuladas entre blocos: os IDs criados são devolvidos
+        apenas quando o arquivo cabe em um bloco. Em vários blocos, as
+        transações ficam acessíveis pelo lote (coluna lote_importacao_id).
+        
+        Se qualquer bloco falhar, o lote é removido junto com o que já foi
+        importado: um arquivo nunca fica parcialmente importado nem bloqueia
+        o reenvio.
+        
+        Linhas e duração desde `inicio` (parse + gravação) alimentam as
+        métricas de vazão por parser.
+        """
+        lote_id = lote.id if lote else None
+        total_linhas = 0
+        total_importado = 0
+        total_duplicadas = 0
+        total_blocos = 0
+        parcial: ResultadoImportacaoDTO | None = None
+        
+        try:
+            for bloco in blocos:
+                total_linhas += len(bloco)
+                if self._usar_importacao_em_massa(parser_id, len(bloco)):
+                    parcial = service.importar_em_massa(bloco, lote_importacao_id=lote_id)
+                else:
+                    parcial = service.importar(bloco, lote_importacao_id=lote_id)
+                total_importado += parcial.total_importado
+                total_duplicadas += parcial.total_duplicadas
+                total_blocos += 1
+        except Exception:
+            if lote is not None:
+                self._lote_repo.deletar(lote.id)
+            raise
+        
+        registrar_importacao(parser_id, total_linhas, time.perf_counter() - inicio)
+        
+        em_blocos = total_blocos != 1
+        if em_blocos:
+            transacoes_ids: List[int] = []
+            mensagem = f"{total_importado} transações importadas com sucesso em {total_blocos} blocos"
+            if total_duplicadas:
+                mensagem += f" ({total_duplicadas} duplicadas ignoradas)"
+        else:
+            transacoes_ids = parcial.transacoes_ids
+            mensagem = parcial.mensagem
         
-        # Adicionar contexto na mensagem
-        resultado.mensagem = f"{resultado.mensagem} (parser: {parser_id})"
+        resultado = ResultadoImportacaoDTO(
+            total_importado=total_importado,
+            transacoes_ids=transacoes_ids,
+            # Adicionar contexto na mensagem
+            mensagem=f"{mensagem} (parser: {parser_id})",
+            total_duplicadas=total_duplicadas
+        )
+        
+        if lote is not None:
+            lote.total_linhas = total_linhas
+            lote.total_importado = resultado.total_importado
+            lote.em_blocos = em_blocos
+            lote.mensagem = resultado.mensagem
+            self._lote_repo.atualizar(lote)
+            resultado.lote_id = lote.id
         
         return resultado
+    
+    def _usar_leitura_em_blocos(self, parser: IExtratoParser, arquivo: BinaryIO | bytes) -> bool:
+        """Arquivos grandes de parsers com suporte a blocos são lidos em streaming"""
+        return (
+            isinstance(parser, IExtratoParserEmBlocos)
+            and calcular_tamanho_arquivo(arquivo) >= self._min_bytes_leitura_em_blocos
+        )
+    
+    def _usar_importacao_em_massa(self, parser_id: str, total_linhas: int) -> bool:
+        """Cargas grandes de arquivos tratados vão pelo staging set-based"""
+        return (
+            self._importacao_em_massa_repo is not None
+            and parser_id in PARSERS_IMPORTACAO_EM_MASSA
+            and total_linhas >= self._min_linhas_importacao_em_massa
+        )
+    
+    def _resultado_replay(self, lote: LoteImportacao) -> ResultadoImportacaoDTO:
+        """
+        Monta resultado a partir de um lote já importado.
+        
+        Como na importação original, IDs só são devolvidos para arquivos
+        importados em um bloco; vêm da coluna lote_importacao_id.
+        """
+        transacoes_ids = [] if lote.em_blocos else self._transacao_repo.listar_ids_por_lote(lote.id)
+        return ResultadoImportacaoDTO(
+            total_importado=lote.total_importado,
+            transacoes_ids=transacoes_ids,
+            mensagem=f"Arquivo já importado em {lote.criado_em:%d/%m/%Y %H:%M}: {lote.mensagem}",
+            lote_id=lote.id,
+            replay=True
+        )
+
+
+def calcular_hash_arquivo(arquivo: BinaryIO | bytes) -> str:
+    """SHA-256 do conteúdo do arquivo (streams lidos em blocos, posição preservada)"""
+    if isinstance(arquivo, (bytes, bytearray)):
+        return hashlib.sha256(arquivo).hexdigest()
+    
+    posicao = arquivo.tell()
+    digest = hashlib.sha256()
+    for bloco in iter(lambda: arquivo.read(1024 * 1024), b""):
+        digest.update(bloco)
+    arquivo.seek(posicao)
+    return digest.hexdigest()
+
+
+def ler_cabecalho(arquivo: BinaryIO | bytes, tamanho: int = TAMANHO_CABECALHO) -> bytes:
+    """Primeiros bytes do arquivo (posição de streams preservada)"""
+    if isinstance(arquivo, (bytes, bytearray)):
+        return bytes(arquivo[:tamanho])
+    
+    posicao = arquivo.tell()
+    cabecalho = arquivo.read(tamanho)
+    arquivo.seek(posicao)
+    return cabecalho
+
+
+def calcular_tamanho_arquivo(arquivo: BinaryIO | bytes) -> int:
+    """Tamanho em bytes sem ler o conteúdo de streams"""
+    if isinstance(arquivo, (bytes, bytearray)):
+        return len(arquivo)
+    
+    posicao = arquivo.tell()
+    tamanho = arquivo.seek(0, io.SEEK_END)
+    arquivo.seek(posicao)
+    return tamanho
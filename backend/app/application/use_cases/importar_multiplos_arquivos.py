@@ -5,8 +5,8 @@ Processa múltiplos arquivos em uma única requisição.
 Cada arquivo é processado independentemente com seu próprio parser.
 
 Fluxo:
-1. Itera sobre cada arquivo
-2. Para cada arquivo, usa ImportarArquivoUseCase
+1. Resolve uma vez o contexto de importação (CPF, tag Rotina, regras, parsers)
+2. Para cada arquivo, usa ImportarArquivoUseCase com o contexto compartilhado
 3. Captura erros individuais sem interromper processamento
 4. Retorna relatório consolidado
 """
@@ -17,6 +17,9 @@ from app.application.dto.importacao_dto import (
     ResultadoImportacaoMultiplaDTO,
 )
 from app.application.use_cases.importar_arquivo import ImportarArquivoUseCase
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
+from app.domain.repositories.importacao_em_massa_repository import IImportacaoEmMassaRepository
+from app.domain.repositories.lote_importacao_repository import ILoteImportacaoRepository
 from app.domain.repositories.regra_repository import IRegraRepository
 from app.domain.repositories.tag_repository import ITagRepository
 from app.domain.repositories.transacao_repository import ITransacaoRepository
@@ -42,14 +45,26 @@ class ImportarMultiplosArquivosUseCase:
         transacao_repo: ITransacaoRepository,
         tag_repo: ITagRepository,
         regra_repo: IRegraRepository,
-        usuario_repo: IUsuarioRepository
+        usuario_repo: IUsuarioRepository,
+        estatistica_repo: IEstatisticaRegraRepository | None = None,
+        lote_repo: ILoteImportacaoRepository | None = None,
+        importacao_em_massa_repo: IImportacaoEmMassaRepository | None = None,
+        min_linhas_importacao_em_massa: int = 5000,
+        tamanho_bloco_linhas: int = 50_000,
+        min_bytes_leitura_em_blocos: int = 20 * 1024 * 1024
     ):
         # Compõe use case existente (reuso de código)
         self._importar_arquivo_use_case = ImportarArquivoUseCase(
             transacao_repo=transacao_repo,
             tag_repo=tag_repo,
             regra_repo=regra_repo,
-            usuario_repo=usuario_repo
+            usuario_repo=usuario_repo,
+            estatistica_repo=estatistica_repo,
+            lote_repo=lote_repo,
+            importacao_em_massa_repo=importacao_em_massa_repo,
+            min_linhas_importacao_em_massa=min_linhas_importacao_em_massa,
+            tamanho_bloco_linhas=tamanho_bloco_linhas,
+            min_bytes_leitura_em_blocos=min_bytes_leitura_em_blocos
         )
     
     def execute(
@@ -62,7 +77,7 @@ class ImportarMultiplosArquivosUseCase:
         
         Args:
             arquivos: Lista de tuplas (arquivo, nome_arquivo, password)
-                     - arquivo: Conteúdo do arquivo (bytes)
+                     - arquivo: Conteúdo do arquivo (bytes ou stream)
                      - nome_arquivo: Nome do arquivo
                      - password: Senha para arquivos protegidos (opcional)
             usuario_id: ID do usuário responsável pelas transações
@@ -78,6 +93,13 @@ class ImportarMultiplosArquivosUseCase:
         resultados: List[ResultadoArquivoDTO] = []
         total_transacoes = 0
         
+        # Configuração resolvida uma vez para todo o envio
+        try:
+            contexto = self._importar_arquivo_use_case.criar_contexto(usuario_id)
+        except Exception:
+            # Cada arquivo tenta resolver (e reporta) o próprio erro
+            contexto = None
+        
         # Processar cada arquivo individualmente
         for arquivo, nome_arquivo, password in arquivos:
             try:
@@ -86,7 +108,8 @@ class ImportarMultiplosArquivosUseCase:
                     arquivo=arquivo,
                     nome_arquivo=nome_arquivo,
                     usuario_id=usuario_id,
-                    password=password
+                    password=password,
+                    contexto=contexto
                 )
                 
                 # Sucesso: adicionar ao relatório
@@ -97,10 +120,14 @@ class ImportarMultiplosArquivosUseCase:
                         total_importado=resultado.total_importado,
                         transacoes_ids=resultado.transacoes_ids,
                         mensagem=resultado.mensagem,
-                        erro=None
+                        erro=None,
+                        lote_id=resultado.lote_id,
+                        replay=resultado.replay
                     )
                 )
-                total_transacoes += resultado.total_importado
+                # Reenvios não importam nada novo
+                if not resultado.replay:
+                    total_transacoes += resultado.total_importado
                 
             except Exception as e:
                 # Erro: registrar mas continuar processamento
@@ -1,9 +1,14 @@
 """
 Caso de uso: Listar Categorias Únicas
 """
-from typing import List
+from typing import List, Optional
 
-from app.domain.repositories.transacao_repository import ITransacaoRepository
+from app.domain.repositories.transacao_repository import ITransacaoRepository, ITransacaoRepositoryAsync
+
+
+def _ordenar_validas(categorias: List[Optional[str]]) -> List[str]:
+    """Remove categorias None/vazias e ordena alfabeticamente"""
+    return sorted(c for c in categorias if c)
 
 
 class ListarCategoriasUseCase:
@@ -27,9 +32,18 @@ class ListarCategoriasUseCase:
             Lista de categorias únicas ordenadas alfabeticamente
         """
         categorias = self._transacao_repository.listar_categorias()
-        
-        # Filtrar None e vazias
-        categorias_validas = [c for c in categorias if c]
-        
-        # Ordenar alfabeticamente
-        return sorted(categorias_validas)
+        return _ordenar_validas(categorias)
+
+
+class ListarCategoriasAsyncUseCase:
+    """
+    Versão async de ListarCategoriasUseCase, usada pela rota GET /transacoes/categorias.
+    """
+    
+    def __init__(self, transacao_repository: ITransacaoRepositoryAsync):
+        self._transacao_repository = transacao_repository
+    
+    async def execute(self) -> List[str]:
+        """Lista categorias únicas ordenadas alfabeticamente"""
+        categorias = await self._transacao_repository.listar_categorias()
+        return _ordenar_validas(categorias)
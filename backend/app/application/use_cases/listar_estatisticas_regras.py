@@ -0,0 +1,54 @@
+"""Caso de uso: Listar Estatísticas de Regras"""
+
+from typing import List
+
+from app.application.dto.regra_dto import EstatisticaRegraDTO
+from app.domain.entities.estatistica_regra import EstatisticaRegra
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
+from app.domain.repositories.regra_repository import IRegraRepository
+
+
+class ListarEstatisticasRegrasUseCase:
+    """
+    Caso de uso para listar estatísticas de execução das regras.
+    
+    Responsabilidades:
+    - Combinar regras cadastradas com seus contadores acumulados
+    - Incluir regras nunca avaliadas (contadores zerados), tornando
+      regras mortas visíveis
+    """
+    
+    def __init__(
+        self,
+        regra_repository: IRegraRepository,
+        estatistica_repository: IEstatisticaRegraRepository
+    ):
+        self._regra_repository = regra_repository
+        self._estatistica_repository = estatistica_repository
+    
+    def execute(self) -> List[EstatisticaRegraDTO]:
+        """
+        Executa o caso de uso.
+        
+        Returns:
+            Lista de EstatisticaRegraDTO ordenada por prioridade (maior primeiro)
+        """
+        regras = self._regra_repository.listar()
+        estatisticas = {e.regra_id: e for e in self._estatistica_repository.listar()}
+        
+        dtos = []
+        for regra in regras:
+            estatistica = estatisticas.get(regra.id) or EstatisticaRegra(regra_id=regra.id)
+            dtos.append(EstatisticaRegraDTO(
+                regra_id=regra.id,
+                nome=regra.nome,
+                ativo=regra.ativo,
+                prioridade=regra.prioridade,
+                total_avaliacoes=estatistica.total_avaliacoes,
+                total_correspondencias=estatistica.total_correspondencias,
+                total_aplicacoes=estatistica.total_aplicacoes,
+                tempo_total_ms=estatistica.tempo_total_ms,
+                tempo_medio_ms=estatistica.tempo_medio_ms
+            ))
+        
+        return dtos
@@ -4,7 +4,7 @@ from typing import List
 
 from app.application.dto.tag_dto import TagDTO
 from app.application.mappers.tag_mapper import TagMapper
-from app.domain.repositories.tag_repository import ITagRepository
+from app.domain.repositories.tag_repository import ITagRepository, ITagRepositoryAsync
 
 
 class ListarTagsUseCase:
@@ -37,3 +37,19 @@ class ListarTagsUseCase:
         dtos.sort(key=lambda t: t.nome)
         
         return dtos
+
+
+class ListarTagsAsyncUseCase:
+    """
+    Versão async de ListarTagsUseCase, usada pela rota GET /tags.
+    """
+    
+    def __init__(self, tag_repository: ITagRepositoryAsync):
+        self._tag_repository = tag_repository
+    
+    async def execute(self) -> List[TagDTO]:
+        """Lista TagDTOs ordenados por nome"""
+        tags = await self._tag_repository.listar()
+        dtos = [TagMapper.to_dto(tag) for tag in tags]
+        dtos.sort(key=lambda t: t.nome)
+        return dtos
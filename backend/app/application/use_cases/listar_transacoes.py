@@ -3,16 +3,71 @@ Caso de Uso: Listar Transações
 Orquestra a lógica de listagem de transações com filtros
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from app.application.dto.transacao_dto import FiltrosTransacaoDTO, TransacaoDTO
 from app.application.dto.usuario_dto import UsuarioDTO
 from app.application.mappers.tag_mapper import TagMapper
 from app.application.mappers.transacao_mapper import TransacaoMapper
-from app.domain.repositories.configuracao_repository import IConfiguracaoRepository
-from app.domain.repositories.tag_repository import ITagRepository
-from app.domain.repositories.transacao_repository import ITransacaoRepository
-from app.domain.repositories.usuario_repository import IUsuarioRepository
+from app.domain.entities.tag import Tag
+from app.domain.entities.transacao import Transacao
+from app.domain.entities.usuario import Usuario
+from app.domain.repositories.configuracao_repository import IConfiguracaoRepository, IConfiguracaoRepositoryAsync
+from app.domain.repositories.tag_repository import ITagRepository, ITagRepositoryAsync
+from app.domain.repositories.transacao_repository import ITransacaoRepository, ITransacaoRepositoryAsync
+from app.domain.repositories.usuario_repository import IUsuarioRepository, IUsuarioRepositoryAsync
+
+
+def _argumentos_listagem(filtros: FiltrosTransacaoDTO, criterio: str) -> Dict[str, Any]:
+    """Traduz os filtros do DTO para os argumentos de listar() do repositório"""
+    return dict(
+        mes=filtros.mes,
+        ano=filtros.ano,
+        data_inicio=filtros.data_inicio,
+        data_fim=filtros.data_fim,
+        categoria=filtros.categoria,
+        tipo=filtros.tipo,
+        tag_ids=filtros.tag_ids,
+        sem_tags=filtros.sem_tags,
+        sem_categoria=filtros.sem_categoria,
+        criterio_data=criterio,
+        usuario_id=filtros.usuario_id,
+    )
+
+
+def _usuario_to_dto(usuario: Optional[Usuario]) -> Optional[UsuarioDTO]:
+    """Converte usuário em DTO (None se inexistente)"""
+    if not usuario or usuario.id is None:
+        return None
+    return UsuarioDTO(
+        id=usuario.id,
+        nome=usuario.nome,
+        cpf=usuario.cpf,
+        criado_em=usuario.criado_em,
+        atualizado_em=usuario.atualizado_em,
+    )
+
+
+def _ids_tags(transacoes: List[Transacao]) -> List[int]:
+    return sorted({tag_id for t in transacoes for tag_id in t.tag_ids})
+
+
+def _ids_usuarios(transacoes: List[Transacao]) -> List[int]:
+    return sorted({t.usuario_id for t in transacoes if t.usuario_id is not None})
+
+
+def _montar_dtos(transacoes: List[Transacao], tags: List[Tag], usuarios: List[Usuario]) -> List[TransacaoDTO]:
+    """Converte transações em DTOs com tags e usuário já carregados"""
+    tags_por_id = {tag.id: TagMapper.to_dto(tag) for tag in tags}
+    usuarios_por_id = {usuario.id: _usuario_to_dto(usuario) for usuario in usuarios}
+    return [
+        TransacaoMapper.to_dto(
+            transacao,
+            tags=[tags_por_id[tag_id] for tag_id in transacao.tag_ids if tag_id in tags_por_id],
+            usuario=usuarios_por_id.get(transacao.usuario_id),
+        )
+        for transacao in transacoes
+    ]
 
 
 class ListarTransacoesUseCase:
@@ -51,45 +106,57 @@ class ListarTransacoesUseCase:
             raise ValueError("Configuração 'criterio_data_transacao' não encontrada.")
 
         # Busca transações no repositório
-        transacoes = self._transacao_repository.listar(
-            mes=filtros.mes,
-            ano=filtros.ano,
-            data_inicio=filtros.data_inicio,
-            data_fim=filtros.data_fim,
-            categoria=filtros.categoria,
-            tipo=filtros.tipo,
-            tag_ids=filtros.tag_ids,
-            sem_tags=filtros.sem_tags,
-            sem_categoria=filtros.sem_categoria,
-            criterio_data=criterio,
-            usuario_id=filtros.usuario_id,
-        )
+        transacoes = self._transacao_repository.listar(**_argumentos_listagem(filtros, criterio))
+
+        # Tags e usuários referenciados: uma consulta cada (evita N+1)
+        tags = []
+        if self._tag_repository:
+            tags = self._tag_repository.listar_por_ids(_ids_tags(transacoes))
+        usuarios = []
+        if self._usuario_repository:
+            usuarios = self._usuario_repository.listar_por_ids(_ids_usuarios(transacoes))
+
+        return _montar_dtos(transacoes, tags, usuarios)
+
+
+class ListarTransacoesAsyncUseCase:
+    """
+    Versão async de ListarTransacoesUseCase, usada pela rota GET /transacoes.
+
+    Tags e usuários das transações são carregados em uma consulta cada
+    (por lista de IDs) em vez de uma consulta por transação.
+    """
+
+    def __init__(
+        self,
+        transacao_repository: ITransacaoRepositoryAsync,
+        configuracao_repository: IConfiguracaoRepositoryAsync,
+        tag_repository: ITagRepositoryAsync,
+        usuario_repository: IUsuarioRepositoryAsync,
+    ):
+        self._transacao_repository = transacao_repository
+        self._configuracao_repository = configuracao_repository
+        self._tag_repository = tag_repository
+        self._usuario_repository = usuario_repository
+
+    async def execute(self, filtros: FiltrosTransacaoDTO) -> List[TransacaoDTO]:
+        """
+        Executa o caso de uso de listar transações.
+
+        Args:
+            filtros: Filtros de busca
+
+        Returns:
+            Lista de DTOs de transações
+        """
+        criterio = await self._configuracao_repository.obter("criterio_data_transacao")
+        if not criterio:
+            raise ValueError("Configuração 'criterio_data_transacao' não encontrada.")
+
+        transacoes = await self._transacao_repository.listar(**_argumentos_listagem(filtros, criterio))
+
+        # Carrega tags e usuários referenciados de uma só vez
+        tags = await self._tag_repository.listar_por_ids(_ids_tags(transacoes))
+        usuarios = await self._usuario_repository.listar_por_ids(_ids_usuarios(transacoes))
 
-        # Converte para DTOs usando mapper
-        dtos = []
-        for transacao in transacoes:
-            # Carregar tags completas se tag_repository estiver disponível
-            tags_completas = []
-            if self._tag_repository:
-                for tag_id in transacao.tag_ids:
-                    tag = self._tag_repository.buscar_por_id(tag_id)
-                    if tag:
-                        tags_completas.append(TagMapper.to_dto(tag))
-
-            # Carregar usuário se usuario_repository estiver disponível
-            usuario_dto = None
-            if self._usuario_repository:
-                usuario = self._usuario_repository.buscar_por_id(transacao.usuario_id)
-                if usuario and usuario.id is not None:
-                    usuario_dto = UsuarioDTO(
-                        id=usuario.id,
-                        nome=usuario.nome,
-                        cpf=usuario.cpf,
-                        criado_em=usuario.criado_em,
-                        atualizado_em=usuario.atualizado_em,
-                    )
-
-            # Converter transação para DTO com tags e usuario
-            dtos.append(TransacaoMapper.to_dto(transacao, tags=tags_completas, usuario=usuario_dto))
-
-        return dtos
+        return _montar_dtos(transacoes, tags, usuarios)
@@ -3,7 +3,7 @@ Use Case: Obter Configuração
 """
 from typing import Optional
 
-from app.domain.repositories.configuracao_repository import IConfiguracaoRepository
+from app.domain.repositories.configuracao_repository import IConfiguracaoRepository, IConfiguracaoRepositoryAsync
 from app.application.dto.configuracao_dto import ConfiguracaoDTO
 
 
@@ -31,3 +31,21 @@ class ObterConfiguracaoUseCase:
             return None
         
         return ConfiguracaoDTO(chave=chave, valor=valor)
+
+
+class ObterConfiguracaoAsyncUseCase:
+    """
+    Versão async de ObterConfiguracaoUseCase, usada pela rota GET /configuracoes/{chave}.
+    """
+    
+    def __init__(self, repository: IConfiguracaoRepositoryAsync):
+        self._repository = repository
+    
+    async def execute(self, chave: str) -> Optional[ConfiguracaoDTO]:
+        """Obtém configuração por chave (None se não existe)"""
+        valor = await self._repository.obter(chave)
+        
+        if valor is None:
+            return None
+        
+        return ConfiguracaoDTO(chave=chave, valor=valor)
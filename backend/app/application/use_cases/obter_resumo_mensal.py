@@ -6,8 +6,53 @@ from datetime import date
 from typing import Dict, List, Optional
 
 from app.application.dto.transacao_dto import ResumoMensalDTO
-from app.domain.repositories.configuracao_repository import IConfiguracaoRepository
-from app.domain.repositories.transacao_repository import ITransacaoRepository
+from app.domain.entities.transacao import Transacao
+from app.domain.repositories.configuracao_repository import IConfiguracaoRepository, IConfiguracaoRepositoryAsync
+from app.domain.repositories.transacao_repository import ITransacaoRepository, ITransacaoRepositoryAsync
+
+
+def _validar_periodo(
+    mes: Optional[int],
+    ano: Optional[int],
+    data_inicio: Optional[date],
+    data_fim: Optional[date],
+) -> None:
+    """Valida que ao menos um período (mes/ano ou data_inicio/data_fim) foi fornecido"""
+    from app.application.exceptions.application_exceptions import ValidationException
+
+    if not (data_inicio and data_fim) and not (mes and ano):
+        raise ValidationException("Forneça mes/ano ou data_inicio/data_fim")
+
+
+def _resumir(transacoes: List[Transacao], mes: Optional[int], ano: Optional[int]) -> ResumoMensalDTO:
+    """Agrupa as transações por categoria e tipo e calcula totais e saldo"""
+    # Agrupar por categoria e tipo
+    entradas_por_categoria: Dict[str, float] = {}
+    saidas_por_categoria: Dict[str, float] = {}
+    total_entradas = 0.0
+    total_saidas = 0.0
+
+    for transacao in transacoes:
+        categoria = transacao.categoria or "Sem categoria"
+        valor = transacao.valor
+
+        if transacao.tipo.value == "entrada":
+            entradas_por_categoria[categoria] = entradas_por_categoria.get(categoria, 0.0) + valor
+            total_entradas += valor
+        else:  # saida
+            saidas_por_categoria[categoria] = saidas_por_categoria.get(categoria, 0.0) + valor
+            total_saidas += valor
+
+    # Criar DTO de resumo
+    return ResumoMensalDTO(
+        mes=mes,
+        ano=ano,
+        total_entradas=total_entradas,
+        total_saidas=total_saidas,
+        saldo=total_entradas - total_saidas,
+        entradas_por_categoria=entradas_por_categoria,
+        saidas_por_categoria=saidas_por_categoria,
+    )
 
 
 class ObterResumoMensalUseCase:
@@ -52,11 +97,7 @@ class ObterResumoMensalUseCase:
         Raises:
             ValidationException: Se nem mes/ano nem data_inicio/data_fim fornecidos
         """
-        from app.application.exceptions.application_exceptions import ValidationException
-
-        # Validar que ao menos um período foi fornecido
-        if not (data_inicio and data_fim) and not (mes and ano):
-            raise ValidationException("Forneça mes/ano ou data_inicio/data_fim")
+        _validar_periodo(mes, ano, data_inicio, data_fim)
 
         # Obter critério de data configurado
         criterio = self._configuracao_repository.obter("criterio_data_transacao")
@@ -76,30 +117,54 @@ class ObterResumoMensalUseCase:
             usuario_id=usuario_id,
         )
 
-        # Agrupar por categoria e tipo
-        entradas_por_categoria: Dict[str, float] = {}
-        saidas_por_categoria: Dict[str, float] = {}
-        total_entradas = 0.0
-        total_saidas = 0.0
-
-        for transacao in transacoes:
-            categoria = transacao.categoria or "Sem categoria"
-            valor = transacao.valor
-
-            if transacao.tipo.value == "entrada":
-                entradas_por_categoria[categoria] = entradas_por_categoria.get(categoria, 0.0) + valor
-                total_entradas += valor
-            else:  # saida
-                saidas_por_categoria[categoria] = saidas_por_categoria.get(categoria, 0.0) + valor
-                total_saidas += valor
-
-        # Criar DTO de resumo
-        return ResumoMensalDTO(
+        return _resumir(transacoes, mes, ano)
+
+
+class ObterResumoMensalAsyncUseCase:
+    """
+    Versão async de ObterResumoMensalUseCase, usada pela rota GET /transacoes/resumo/mensal.
+    """
+
+    def __init__(
+        self,
+        transacao_repository: ITransacaoRepositoryAsync,
+        configuracao_repository: IConfiguracaoRepositoryAsync,
+    ):
+        self._transacao_repository = transacao_repository
+        self._configuracao_repository = configuracao_repository
+
+    async def execute(
+        self,
+        mes: Optional[int] = None,
+        ano: Optional[int] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        tag_ids: Optional[List[int]] = None,
+        sem_tags: bool = False,
+        usuario_id: Optional[int] = None,
+    ) -> ResumoMensalDTO:
+        """
+        Executa o caso de uso de resumo mensal (ver ObterResumoMensalUseCase.execute).
+
+        Raises:
+            ValidationException: Se nem mes/ano nem data_inicio/data_fim fornecidos
+        """
+        _validar_periodo(mes, ano, data_inicio, data_fim)
+
+        criterio = await self._configuracao_repository.obter("criterio_data_transacao")
+        if not criterio:
+            raise ValueError("Configuração 'criterio_data_transacao' não encontrada.")
+
+        transacoes = await self._transacao_repository.listar(
             mes=mes,
             ano=ano,
-            total_entradas=total_entradas,
-            total_saidas=total_saidas,
-            saldo=total_entradas - total_saidas,
-            entradas_por_categoria=entradas_por_categoria,
-            saidas_por_categoria=saidas_por_categoria,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+            tag_ids=tag_ids,
+            sem_tags=sem_tags,
+            sem_categoria=False,
+            criterio_data=criterio,
+            usuario_id=usuario_id,
         )
+
+        return _resumir(transacoes, mes, ano)
@@ -58,10 +58,11 @@ class ObterTransacaoUseCase:
         # Garantir que transação tem ID
         assert transacao.id is not None, "Transação retornada do repositório deve ter ID"
         
-        # Buscar tags completas
+        # Buscar tags completas (uma consulta para todas as tags)
         tags_completas = []
+        tags_por_id = {tag.id: tag for tag in self._tag_repo.listar_por_ids(transacao.tag_ids)}
         for tag_id in transacao.tag_ids:
-            tag = self._tag_repo.buscar_por_id(tag_id)
+            tag = tags_por_id.get(tag_id)
             if tag and tag.id is not None:  # Verificação adicional
                 tags_completas.append(TagDTO(
                     id=tag.id,
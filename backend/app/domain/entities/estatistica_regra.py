@@ -0,0 +1,41 @@
+"""
+Entidade de domínio - EstatisticaRegra
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class EstatisticaRegra:
+    """
+    Estatísticas acumuladas de execução de uma regra.
+    
+    Contadores são somados a cada importação e aplicação retroativa:
+    - total_avaliacoes: quantas transações a regra avaliou
+    - total_correspondencias: quantas corresponderam ao critério
+    - total_aplicacoes: quantas foram efetivamente alteradas pela ação
+    - tempo_total_ms: tempo acumulado de avaliação + aplicação
+    """
+    
+    regra_id: int
+    total_avaliacoes: int = 0
+    total_correspondencias: int = 0
+    total_aplicacoes: int = 0
+    tempo_total_ms: float = 0.0
+    atualizado_em: datetime = field(default_factory=datetime.now)
+    
+    @property
+    def tempo_medio_ms(self) -> float:
+        """Tempo médio por avaliação (0 se nunca avaliada)"""
+        if self.total_avaliacoes == 0:
+            return 0.0
+        return self.tempo_total_ms / self.total_avaliacoes
+    
+    def registrar_avaliacao(self, correspondeu: bool, aplicada: bool, tempo_ms: float) -> None:
+        """Acumula o resultado de uma avaliação da regra"""
+        self.total_avaliacoes += 1
+        if correspondeu:
+            self.total_correspondencias += 1
+        if aplicada:
+            self.total_aplicacoes += 1
+        self.tempo_total_ms += tempo_ms
@@ -0,0 +1,29 @@
+"""
+Entidade de domínio - LoteImportacao
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class LoteImportacao:
+    """
+    Registro de um arquivo processado pela importação.
+    
+    Toda transação importada referencia o lote de origem, permitindo
+    desfazer uma importação inteira de uma só vez. O resultado fica
+    guardado para responder reenvios do mesmo arquivo sem reprocessá-lo;
+    os IDs das transações não são guardados, vêm da coluna lote_importacao_id.
+    """
+    
+    id: Optional[int] = None
+    hash_arquivo: str = ""  # SHA-256 do conteúdo do arquivo
+    nome_arquivo: str = ""
+    parser_id: str = ""
+    usuario_id: int = 1
+    total_linhas: int = 0  # Linhas lidas pelo parser
+    total_importado: int = 0  # Transações efetivamente criadas
+    em_blocos: bool = False  # Importado em vários blocos (IDs não são devolvidos)
+    mensagem: str = ""
+    criado_em: datetime = field(default_factory=datetime.now)
@@ -76,6 +76,18 @@ class Regra:
         if not self.corresponde_criterio(transacao):
             return False
         
+        return self.executar_acao(transacao)
+    
+    def executar_acao(self, transacao: Transacao) -> bool:
+        """
+        Executa a ação desta regra sem verificar o critério.
+        
+        Usado por quem já avaliou corresponde_criterio separadamente
+        (ex: coleta de estatísticas de correspondência).
+        
+        Returns:
+            True se a ação foi aplicada, False caso contrário
+        """
         if self.tipo_acao == TipoAcao.ALTERAR_CATEGORIA:
             transacao.alterar_categoria(self.acao_valor)
             
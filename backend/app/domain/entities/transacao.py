@@ -4,7 +4,7 @@ Regras de negócio puras, sem dependências de frameworks
 """
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 
@@ -48,6 +48,7 @@ class Transacao:
     # Relacionamentos (IDs apenas - sem acoplamento com ORM)
     tag_ids: List[int] = field(default_factory=list)
     usuario_id: int = 1  # ID do usuário responsável (padrão: "Não definido")
+    lote_importacao_id: Optional[int] = None  # Lote de importação de origem (se importada)
     
     def __post_init__(self):
         """Valida regras de negócio após inicialização"""
@@ -117,3 +118,11 @@ class Transacao:
     def descricao_igual(self, texto: str) -> bool:
         """Verifica se a descrição é exatamente igual ao texto (case-insensitive)"""
         return self.descricao.lower() == texto.lower()
+    
+    def chave_importacao(self) -> Tuple[date, str, Optional[float], TipoTransacao, str]:
+        """
+        Identifica a mesma transação vinda de importações diferentes.
+        
+        Usa valor_original (o valor pode ter sido editado após a importação).
+        """
+        return (self.data, self.descricao, self.valor_original, self.tipo, self.origem)
@@ -2,9 +2,10 @@
 Interface para parsers de extrato bancário
 """
 from abc import ABC, abstractmethod
-from typing import BinaryIO
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, List, Optional
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class IExtratoParser(ABC):
@@ -52,7 +53,7 @@ class IExtratoParser(ABC):
         pass
     
     @abstractmethod
-    def parse(self, arquivo: BinaryIO, nome_arquivo: str, password: str | None = None) -> pd.DataFrame:
+    def parse(self, arquivo: BinaryIO, nome_arquivo: str, password: str | None = None) -> "pd.DataFrame":
         """
         Faz parsing do arquivo de extrato bruto do banco.
         
@@ -84,3 +85,71 @@ class IExtratoParser(ABC):
             True se formato suportado, False caso contrário
         """
         return any(nome_arquivo.lower().endswith(fmt) for fmt in self.formatos_suportados)
+
+
+class IExtratoParserEmBlocos(IExtratoParser):
+    """
+    Parser capaz de ler arquivos grandes em blocos.
+    
+    Cada bloco passa pelas mesmas validações e conversões de `parse`,
+    permitindo importar o arquivo com uso de memória constante.
+    """
+    
+    @abstractmethod
+    def parse_em_blocos(
+        self,
+        arquivo: BinaryIO,
+        nome_arquivo: str,
+        tamanho_bloco: int,
+        password: str | None = None
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Faz parsing do arquivo produzindo DataFrames normalizados.
+        
+        Args:
+            arquivo: Conteúdo do arquivo (bytes ou stream)
+            nome_arquivo: Nome do arquivo para determinar formato
+            tamanho_bloco: Linhas lidas por bloco
+            password: Senha para arquivos protegidos (opcional)
+            
+        Yields:
+            Blocos não vazios no mesmo formato retornado por `parse`
+            
+        Raises:
+            ValidationException: Se arquivo inválido ou sem nenhuma linha válida
+        """
+        pass
+
+
+class IExtratoParserRegistros(IExtratoParser):
+    """
+    Parser com caminho rápido que produz registros sem pandas.
+    
+    Indicado para arquivos pequenos de esquema fixo: evita construir
+    DataFrame e converter colunas com pandas. `parse` continua disponível
+    como alternativa quando o caminho rápido não se aplica.
+    """
+    
+    @abstractmethod
+    def parse_registros(
+        self,
+        arquivo: BinaryIO,
+        nome_arquivo: str,
+        password: str | None = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Faz parsing do arquivo em uma lista de registros normalizados.
+        
+        Args:
+            arquivo: Conteúdo do arquivo (bytes)
+            nome_arquivo: Nome do arquivo
+            password: Senha para arquivos protegidos (opcional)
+            
+        Returns:
+            Registros com as mesmas chaves e linhas que `parse` produziria
+            (datas como date), ou None se o conteúdo exigir o caminho com pandas
+            
+        Raises:
+            ValidationException: Se arquivo inválido ou formato incorreto
+        """
+        pass
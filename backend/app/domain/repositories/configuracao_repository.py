@@ -35,3 +35,14 @@ class IConfiguracaoRepository(ABC):
             valor: Valor a salvar
         """
         pass
+
+
+class IConfiguracaoRepositoryAsync(ABC):
+    """
+    Interface async com as operações de leitura de Configurações.
+    """
+    
+    @abstractmethod
+    async def obter(self, chave: str) -> Optional[str]:
+        """Obtém o valor de uma configuração ou None se não existe"""
+        pass
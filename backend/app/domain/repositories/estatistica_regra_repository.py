@@ -0,0 +1,30 @@
+"""
+Interface (Port) de Repositório de Estatísticas de Regras
+"""
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.domain.entities.estatistica_regra import EstatisticaRegra
+
+
+class IEstatisticaRegraRepository(ABC):
+    """
+    Interface abstrata para persistência de estatísticas de execução de regras.
+    
+    Princípio DIP: O domínio define a interface, a infraestrutura implementa.
+    """
+    
+    @abstractmethod
+    def registrar(self, estatisticas: List[EstatisticaRegra]) -> None:
+        """
+        Soma um lote de estatísticas aos contadores persistidos.
+        
+        Args:
+            estatisticas: Incrementos acumulados em memória (um por regra)
+        """
+        pass
+    
+    @abstractmethod
+    def listar(self) -> List[EstatisticaRegra]:
+        """Lista as estatísticas acumuladas de todas as regras"""
+        pass
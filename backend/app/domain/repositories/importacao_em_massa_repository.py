@@ -0,0 +1,56 @@
+"""
+Interface (Port) de Repositório de Importação em Massa
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional
+
+from app.domain.entities.estatistica_regra import EstatisticaRegra
+from app.domain.entities.regra import Regra
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass
+class ResultadoImportacaoEmMassa:
+    """Resultado de uma carga em massa"""
+    transacoes_ids: List[int] = field(default_factory=list)
+    total_duplicadas: int = 0  # Linhas ignoradas por já existirem no banco
+    estatisticas: List[EstatisticaRegra] = field(default_factory=list)
+
+
+class IImportacaoEmMassaRepository(ABC):
+    """
+    Interface para importação de grandes volumes sem materializar entidades.
+    
+    Implementações devem carregar as linhas em uma área de staging e
+    aplicar deduplicação, tag Rotina e regras com operações set-based. A
+    deduplicação segue a do caminho linha a linha (ImportacaoService.importar):
+    descarta linhas cuja Transacao.chave_importacao já existe para o usuário.
+    """
+    
+    @abstractmethod
+    def importar(
+        self,
+        linhas: "pd.DataFrame",
+        usuario_id: int,
+        tag_rotina_id: int,
+        regras: List[Regra],
+        lote_importacao_id: Optional[int] = None
+    ) -> ResultadoImportacaoEmMassa:
+        """
+        Importa linhas já normalizadas em uma única transação de banco.
+        
+        Args:
+            linhas: DataFrame com colunas data, descricao, valor (positivo),
+                    tipo (nome do enum), origem, categoria, banco, data_fatura
+            usuario_id: ID do usuário responsável
+            tag_rotina_id: ID da tag adicionada a todas as transações
+            regras: Regras ativas, em ordem de prioridade
+            lote_importacao_id: Lote carimbado nas transações criadas
+            
+        Returns:
+            IDs criados (na ordem das linhas), duplicadas e estatísticas por regra
+        """
+        pass
@@ -0,0 +1,54 @@
+"""
+Interface (Port) de Repositório de Lotes de Importação
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.entities.lote_importacao import LoteImportacao
+
+
+class ILoteImportacaoRepository(ABC):
+    """
+    Interface abstrata para persistência de lotes de importação.
+    
+    Princípio DIP: O domínio define a interface, a infraestrutura implementa.
+    """
+    
+    @abstractmethod
+    def criar(self, lote: LoteImportacao) -> LoteImportacao:
+        """Registra um novo lote e retorna com ID"""
+        pass
+    
+    @abstractmethod
+    def buscar_por_id(self, id: int) -> Optional[LoteImportacao]:
+        """Busca lote por ID"""
+        pass
+    
+    @abstractmethod
+    def buscar_por_hash(self, usuario_id: int, hash_arquivo: str) -> Optional[LoteImportacao]:
+        """
+        Busca o lote mais recente de um arquivo já importado pelo usuário.
+        
+        Args:
+            usuario_id: ID do usuário
+            hash_arquivo: SHA-256 do conteúdo do arquivo
+        """
+        pass
+    
+    @abstractmethod
+    def atualizar(self, lote: LoteImportacao) -> LoteImportacao:
+        """Atualiza contagens e resultado de um lote existente"""
+        pass
+    
+    @abstractmethod
+    def deletar(self, id: int) -> bool:
+        """
+        Remove o lote, suas transações e as tags associadas a elas.
+        
+        Args:
+            id: ID do lote
+            
+        Returns:
+            True se removido, False se não existir
+        """
+        pass
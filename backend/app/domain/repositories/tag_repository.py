@@ -83,3 +83,19 @@ class ITagRepository(ABC):
             Lista de tags encontradas
         """
         pass
+
+
+class ITagRepositoryAsync(ABC):
+    """
+    Interface async com as operações de leitura de Tags.
+    """
+    
+    @abstractmethod
+    async def listar(self) -> List[Tag]:
+        """Lista todas as tags"""
+        pass
+    
+    @abstractmethod
+    async def listar_por_ids(self, ids: List[int]) -> List[Tag]:
+        """Lista tags por múltiplos IDs"""
+        pass
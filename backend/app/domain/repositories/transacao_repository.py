@@ -4,9 +4,10 @@ Define o contrato que implementações concretas devem seguir
 """
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from app.domain.entities.transacao import Transacao
+from app.domain.value_objects.selecao_transacoes import SelecaoTransacoes
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 
 
@@ -118,6 +119,39 @@ class ITransacaoRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def listar_chaves_importacao(
+        self,
+        usuario_id: int,
+        data_inicio: date,
+        data_fim: date,
+        excluir_lote_id: Optional[int] = None
+    ) -> Set[Tuple[date, str, float, TipoTransacao, str]]:
+        """
+        Chaves de deduplicação (Transacao.chave_importacao) já gravadas.
+        
+        Args:
+            usuario_id: Usuário dono das transações
+            data_inicio: Primeira data do período (inclusive)
+            data_fim: Última data do período (inclusive)
+            excluir_lote_id: Lote cujas transações não contam (blocos anteriores
+                             do mesmo arquivo: linhas repetidas no arquivo são legítimas)
+            
+        Returns:
+            Conjunto de (data, descricao, valor_original, tipo, origem)
+        """
+        pass
+    
+    @abstractmethod
+    def listar_ids_por_lote(self, lote_importacao_id: int) -> List[int]:
+        """
+        Lista IDs das transações criadas por um lote de importação.
+        
+        Returns:
+            IDs em ordem crescente (ordem de criação)
+        """
+        pass
+    
     @abstractmethod
     def listar_categorias(self) -> List[str]:
         """
@@ -163,3 +197,69 @@ class ITransacaoRepository(ABC):
             tag_id: ID da tag
         """
         pass
+    
+    @abstractmethod
+    def atualizar_campos_em_lote(self, selecao: SelecaoTransacoes, campos: Dict[str, Any]) -> int:
+        """
+        Aplica os mesmos valores a várias transações de uma só vez.
+        
+        Args:
+            selecao: Transações alvo (IDs e/ou filtros)
+            campos: Nome do campo → novo valor
+            
+        Returns:
+            Quantidade de transações atualizadas
+        """
+        pass
+    
+    @abstractmethod
+    def atualizar_tags_em_lote(
+        self,
+        selecao: SelecaoTransacoes,
+        adicionar_tag_ids: List[int],
+        remover_tag_ids: List[int]
+    ) -> int:
+        """
+        Adiciona e remove tags de várias transações de uma só vez.
+        Associações já existentes são ignoradas.
+        
+        Args:
+            selecao: Transações alvo (IDs e/ou filtros)
+            adicionar_tag_ids: IDs das tags a adicionar
+            remover_tag_ids: IDs das tags a remover
+            
+        Returns:
+            Quantidade de transações selecionadas
+        """
+        pass
+
+
+class ITransacaoRepositoryAsync(ABC):
+    """
+    Interface async com as operações de leitura de Transações.
+    
+    Usada pelas rotas GET async; escritas continuam em ITransacaoRepository.
+    """
+    
+    @abstractmethod
+    async def listar(
+        self,
+        mes: Optional[int] = None,
+        ano: Optional[int] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        categoria: Optional[str] = None,
+        tipo: Optional[TipoTransacao] = None,
+        tag_ids: Optional[List[int]] = None,
+        sem_tags: bool = False,
+        sem_categoria: bool = False,
+        criterio_data: str = "data_transacao",
+        usuario_id: Optional[int] = None
+    ) -> List[Transacao]:
+        """Lista transações com filtros opcionais (mesma semântica de ITransacaoRepository.listar)"""
+        pass
+    
+    @abstractmethod
+    async def listar_categorias(self) -> List[str]:
+        """Lista todas as categorias únicas existentes nas transações (pode conter None)"""
+        pass
@@ -81,3 +81,27 @@ class IUsuarioRepository(ABC):
             ValueError: Se usuário não existe ou tem transações associadas
         """
         pass
+    
+    @abstractmethod
+    def listar_por_ids(self, ids: List[int]) -> List[Usuario]:
+        """
+        Lista usuários por múltiplos IDs.
+        
+        Args:
+            ids: Lista de identificadores
+            
+        Returns:
+            Lista de usuários encontrados
+        """
+        pass
+
+
+class IUsuarioRepositoryAsync(ABC):
+    """
+    Interface async com as operações de leitura de Usuarios.
+    """
+    
+    @abstractmethod
+    async def listar_por_ids(self, ids: List[int]) -> List[Usuario]:
+        """Lista usuários por múltiplos IDs"""
+        pass
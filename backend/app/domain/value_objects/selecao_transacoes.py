@@ -0,0 +1,50 @@
+"""
+Value Objects do domínio - Seleção de Transações
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional
+
+from app.domain.value_objects.tipo_transacao import TipoTransacao
+
+
+@dataclass(frozen=True)
+class SelecaoTransacoes:
+    """
+    Conjunto de transações alvo de uma operação em lote.
+    
+    Seleciona por lista de IDs e/ou pelos mesmos filtros de listagem
+    (combinados com AND). Usado por operações set-based no repositório,
+    que nunca carregam as transações selecionadas em memória.
+    """
+    ids: Optional[List[int]] = None
+    mes: Optional[int] = None
+    ano: Optional[int] = None
+    data_inicio: Optional[date] = None
+    data_fim: Optional[date] = None
+    categoria: Optional[str] = None
+    tipo: Optional[TipoTransacao] = None
+    tag_ids: Optional[List[int]] = None
+    sem_tags: bool = False
+    sem_categoria: bool = False
+    criterio_data: str = "data_transacao"
+    usuario_id: Optional[int] = None
+    
+    def vazia(self) -> bool:
+        """
+        True se nenhum critério foi informado.
+        
+        Uma seleção vazia abrangeria todas as transações; operações em
+        lote devem rejeitá-la explicitamente.
+        """
+        return (
+            self.ids is None
+            and not (self.mes and self.ano)
+            and not (self.data_inicio and self.data_fim)
+            and not self.categoria
+            and self.tipo is None
+            and not self.tag_ids
+            and not self.sem_tags
+            and not self.sem_categoria
+            and self.usuario_id is None
+        )
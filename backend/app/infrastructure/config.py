@@ -10,6 +10,44 @@ class Settings(BaseSettings):
     )
     # Valor default para permitir importação em testes sem .env
     DATABASE_URL: str = "sqlite:///:memory:"
+    # URL do engine async (rotas de leitura); se ausente, derivada de DATABASE_URL
+    DATABASE_ASYNC_URL: Optional[str] = None
+    # Réplica de leitura (opcional) para as rotas GET
+    DATABASE_READ_URL: Optional[str] = None
+    # Após uma escrita, o cliente lê do primário por esta janela (read-your-writes)
+    LEITURA_PRIMARIO_APOS_ESCRITA_SEGUNDOS: float = 5.0
+    # Pool de conexões (ignorado para SQLite em memória)
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # segundos aguardando conexão livre
+    DB_POOL_RECYCLE: int = 1800  # segundos até reciclar uma conexão (-1 desativa)
+    DB_POOL_PRE_PING: bool = True
+    # Tempo máximo por statement no PostgreSQL (ms); None = sem limite
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    # Statements acima deste tempo (ms) vão para o log de consultas lentas; None desativa
+    DB_SLOW_QUERY_MS: Optional[float] = 500
+    DB_SLOW_QUERY_EXPLAIN: bool = False  # captura EXPLAIN das consultas lentas
+    DB_SLOW_QUERY_BUFFER: int = 100  # consultas lentas mantidas em GET /interno/consultas-lentas
+    # Token exigido (header X-Admin-Token) por recursos administrativos; None desativa todos
+    ADMIN_TOKEN: Optional[str] = None
+    # Perfilamento sob demanda (header X-Profile: 1 + token administrativo)
+    PERFILAMENTO_HABILITADO: bool = False
+    PERFILAMENTO_INTERVALO_MS: float = 2.0  # intervalo entre amostras de pilha
+    PERFILAMENTO_MAX_PERFIS: int = 20  # perfis mantidos para download
+    # Perfil SQLite (aplicado a cada conexão quando DATABASE_URL é um arquivo SQLite)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    # Validade do cache de regras ativas por processo (escritas de outros workers
+    # aparecem em até este tempo); 0 desativa o cache
+    REGRAS_ATIVAS_CACHE_TTL_SEGUNDOS: float = 5.0
+    # Arquivos tratados com pelo menos esta quantidade de linhas usam a importação em massa
+    IMPORTACAO_EM_MASSA_MIN_LINHAS: int = 5000
+    # Arquivos (com parser que suporta blocos) a partir deste tamanho são lidos em blocos
+    IMPORTACAO_EM_BLOCOS_MIN_BYTES: int = 20 * 1024 * 1024
+    IMPORTACAO_BLOCO_LINHAS: int = 50_000
 
 
 _settings: Optional[Settings] = None
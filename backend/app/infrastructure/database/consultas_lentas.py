@@ -0,0 +1,183 @@
+"""
+Log de consultas lentas - Camada de Infraestrutura
+
+Statements acima de DB_SLOW_QUERY_MS são registrados no log com SQL,
+parâmetros (valores textuais mascarados), duração e o use case que os
+originou. Com DB_SLOW_QUERY_EXPLAIN, o plano (EXPLAIN, ou EXPLAIN QUERY
+PLAN no SQLite) é capturado junto. Os registros mais recentes ficam num
+buffer circular lido por GET /interno/consultas-lentas.
+"""
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Deque, List, Optional
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PACOTE_USE_CASES = "app.application.use_cases"
+# Apenas leituras têm o plano capturado (EXPLAIN sem ANALYZE não executa, mas
+# evita-se preparar escritas na mesma transação)
+PREFIXOS_EXPLAIN = ("SELECT", "WITH")
+
+
+@dataclass
+class ConsultaLenta:
+    """Statement que excedeu o limite configurado"""
+    sql: str
+    parametros: Any
+    duracao_ms: float
+    origem: Optional[str]
+    plano: Optional[List[str]] = None
+    registrada_em: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class BufferConsultasLentas:
+    """Últimas N consultas lentas (thread-safe, em memória do processo)"""
+
+    def __init__(self, capacidade: int):
+        self._lock = threading.Lock()
+        self._itens: Deque[ConsultaLenta] = deque(maxlen=capacidade)
+
+    def adicionar(self, consulta: ConsultaLenta) -> None:
+        with self._lock:
+            self._itens.append(consulta)
+
+    def listar(self, limite: Optional[int] = None) -> List[ConsultaLenta]:
+        """Mais recentes primeiro"""
+        with self._lock:
+            itens = list(reversed(self._itens))
+        return itens[:limite] if limite is not None else itens
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._itens.clear()
+
+
+_buffer: Optional[BufferConsultasLentas] = None
+
+
+def get_buffer_consultas_lentas() -> BufferConsultasLentas:
+    """Singleton lazy do buffer (capacidade em DB_SLOW_QUERY_BUFFER)"""
+    global _buffer
+    if _buffer is None:
+        _buffer = BufferConsultasLentas(get_settings().DB_SLOW_QUERY_BUFFER)
+    return _buffer
+
+
+def mascarar_parametros(parametros: Any) -> Any:
+    """
+    Mascara valores textuais e binários (descrições, nomes, CPF), mantendo
+    números, datas e nulos, que ajudam a entender a seletividade do filtro.
+    """
+    if isinstance(parametros, dict):
+        return {chave: mascarar_parametros(valor) for chave, valor in parametros.items()}
+    if isinstance(parametros, (list, tuple)):
+        return [mascarar_parametros(valor) for valor in parametros]
+    if parametros is None or isinstance(parametros, (bool, int, float, Decimal)):
+        return parametros
+    if isinstance(parametros, (date, datetime)):
+        return parametros.isoformat()
+    if isinstance(parametros, (bytes, bytearray, memoryview)):
+        return f"<bytes:{len(parametros)}>"
+    return f"<texto:{len(str(parametros))}>"
+
+
+def _frames_chamadores():
+    """
+    Frames da pilha atual e, nas sessões async, da pilha do greenlet pai
+    (onde estão as corrotinas do use case que aguardam o statement).
+    """
+    frame = sys._getframe(1)
+    atual = greenlet.getcurrent()
+    while True:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        atual = atual.parent
+        if atual is None:
+            return
+        frame = atual.gr_frame
+
+
+def identificar_origem() -> Optional[str]:
+    """Use case (Classe.método) que originou o statement, se houver"""
+    for frame in _frames_chamadores():
+        if frame.f_globals.get("__name__", "").startswith(PACOTE_USE_CASES):
+            instancia = frame.f_locals.get("self")
+            if instancia is not None:
+                return f"{type(instancia).__name__}.{frame.f_code.co_name}"
+            return f"{frame.f_globals['__name__']}.{frame.f_code.co_name}"
+    return None
+
+
+def _comando_explain(engine: Engine, statement: str) -> str:
+    if engine.dialect.name == "sqlite":
+        return f"EXPLAIN QUERY PLAN {statement}"
+    return f"EXPLAIN {statement}"
+
+
+def capturar_plano(conn, statement: str, parametros: Any) -> Optional[List[str]]:
+    """
+    Plano da consulta, executado num cursor DBAPI cru da mesma conexão
+    (não dispara eventos do engine nem entra na contagem de consultas).
+    """
+    if not statement.lstrip().upper().startswith(PREFIXOS_EXPLAIN):
+        return None
+    try:
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(_comando_explain(conn.engine, statement), parametros)
+            return [" | ".join(str(coluna) for coluna in linha) for linha in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception as erro:  # plano é diagnóstico: nunca derruba a consulta original
+        return [f"EXPLAIN indisponível: {erro}"]
+
+
+def _antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+    context._inicio_consulta_lenta = time.perf_counter()
+
+
+def _depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+    inicio = getattr(context, "_inicio_consulta_lenta", None)
+    if inicio is None:
+        return
+    duracao_ms = (time.perf_counter() - inicio) * 1000
+    settings = get_settings()
+    if settings.DB_SLOW_QUERY_MS is None or duracao_ms < settings.DB_SLOW_QUERY_MS:
+        return
+
+    consulta = ConsultaLenta(
+        sql=statement,
+        parametros=mascarar_parametros(parameters),
+        duracao_ms=round(duracao_ms, 3),
+        origem=identificar_origem(),
+    )
+    if settings.DB_SLOW_QUERY_EXPLAIN and not executemany:
+        consulta.plano = capturar_plano(conn, statement, parameters)
+
+    logger.warning(
+        "Consulta lenta (%.1f ms) em %s: %s | parâmetros=%s",
+        consulta.duracao_ms,
+        consulta.origem or "origem desconhecida",
+        consulta.sql,
+        consulta.parametros,
+    )
+    get_buffer_consultas_lentas().adicionar(consulta)
+
+
+def monitorar_consultas_lentas(engine: Engine) -> None:
+    """Registra no engine a medição de statements lentos (limite lido a cada statement)"""
+    event.listen(engine, "before_cursor_execute", _antes_de_executar)
+    event.listen(engine, "after_cursor_execute", _depois_de_executar)
@@ -2,13 +2,28 @@
 Configuração do Engine SQLModel - Camada de Infraestrutura
 Engine com Lazy Initialization para suportar testes
 """
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from sqlmodel import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from app.infrastructure.config import get_settings
+from app.infrastructure.database.consultas_lentas import monitorar_consultas_lentas
+from app.infrastructure.database.pool import AsyncAdaptedQueuePoolMonitorado, QueuePoolMonitorado
 
 
 _engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_read_engine: Optional[Engine] = None
+_async_read_engine: Optional[AsyncEngine] = None
+
+# Driver síncrono → driver async equivalente
+DRIVERS_ASYNC = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
 
 
 def get_engine() -> Engine:
@@ -19,5 +34,154 @@ def get_engine() -> Engine:
     global _engine
     if _engine is None:
         settings = get_settings()
-        _engine = create_engine(settings.DATABASE_URL, echo=False)
+        _engine = criar_engine(settings.DATABASE_URL)
     return _engine
+
+
+def get_read_engine() -> Engine:
+    """
+    Retorna engine síncrono da réplica de leitura (DATABASE_READ_URL).
+    Sem réplica configurada, retorna o engine principal.
+    """
+    global _read_engine
+    settings = get_settings()
+    if not settings.DATABASE_READ_URL:
+        return get_engine()
+    if _read_engine is None:
+        _read_engine = criar_engine(settings.DATABASE_READ_URL, somente_leitura=True)
+    return _read_engine
+
+
+def criar_engine(url: str, somente_leitura: bool = False) -> Engine:
+    """Cria engine síncrono com pool, perfil SQLite e log de consultas lentas"""
+    engine = create_engine(url, **argumentos_engine(url))
+    configurar_sqlite(engine, somente_leitura=somente_leitura)
+    monitorar_consultas_lentas(engine)
+    return engine
+
+
+def criar_engine_async(url: str) -> AsyncEngine:
+    """
+    Cria engine async das rotas de leitura. Em SQLite suas conexões são
+    somente leitura (query_only), formando um pool separado do de escrita.
+    """
+    engine = create_async_engine(url, **argumentos_engine(url, assincrono=True))
+    configurar_sqlite(engine.sync_engine, somente_leitura=True)
+    monitorar_consultas_lentas(engine.sync_engine)
+    return engine
+
+
+def _e_sqlite_em_memoria(url_sa) -> bool:
+    return url_sa.get_backend_name() == "sqlite" and url_sa.database in (None, "", ":memory:")
+
+
+def _usa_pool_de_fila(url: str) -> bool:
+    """SQLite em memória usa pool próprio do dialeto (conexão única); os demais usam QueuePool"""
+    return not _e_sqlite_em_memoria(make_url(url))
+
+
+def pragmas_sqlite(somente_leitura: bool = False) -> List[str]:
+    """
+    Perfil de produção do SQLite: WAL (leitores não bloqueiam escritor),
+    synchronous=NORMAL (sem fsync a cada commit em WAL), mmap, cache e
+    busy_timeout para esperar o lock em vez de falhar com "database is locked".
+    """
+    settings = get_settings()
+    pragmas = [
+        f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+    ]
+    if somente_leitura:
+        pragmas.append("PRAGMA query_only=ON")
+    return pragmas
+
+
+def configurar_sqlite(engine: Engine, somente_leitura: bool = False) -> None:
+    """Aplica pragmas_sqlite() a cada nova conexão de engines SQLite em arquivo"""
+    if engine.url.get_backend_name() != "sqlite" or _e_sqlite_em_memoria(engine.url):
+        return
+    pragmas = pragmas_sqlite(somente_leitura)
+
+    @event.listens_for(engine, "connect")
+    def _aplicar_pragmas(conexao_dbapi, _registro):
+        cursor = conexao_dbapi.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _argumentos_conexao(url: str, statement_timeout_ms: Optional[int]) -> Dict[str, Any]:
+    """connect_args com o statement timeout no formato de cada driver PostgreSQL"""
+    url_sa = make_url(url)
+    if not statement_timeout_ms or url_sa.get_backend_name() != "postgresql":
+        return {}
+    if url_sa.get_driver_name() == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(statement_timeout_ms)}}
+    return {"options": f"-c statement_timeout={statement_timeout_ms}"}
+
+
+def argumentos_engine(url: str, assincrono: bool = False) -> Dict[str, Any]:
+    """
+    Argumentos de create_engine/create_async_engine conforme Settings:
+    tamanho/overflow/timeout/recycle/pre-ping do pool e statement timeout.
+    """
+    settings = get_settings()
+    argumentos: Dict[str, Any] = {"echo": False}
+    if _usa_pool_de_fila(url):
+        argumentos.update(
+            poolclass=AsyncAdaptedQueuePoolMonitorado if assincrono else QueuePoolMonitorado,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+    connect_args = _argumentos_conexao(url, settings.DB_STATEMENT_TIMEOUT_MS)
+    if connect_args:
+        argumentos["connect_args"] = connect_args
+    return argumentos
+
+
+def converter_url_async(url: str) -> str:
+    """
+    Converte a URL do banco para o driver async equivalente
+    (aiosqlite para SQLite, asyncpg para PostgreSQL).
+    URLs que já usam um driver async são mantidas.
+    """
+    url_sa = make_url(url)
+    if url_sa.drivername in DRIVERS_ASYNC.values():
+        return url
+    driver = DRIVERS_ASYNC.get(url_sa.drivername)
+    if driver is None:
+        raise ValueError(f"Sem driver async conhecido para '{url_sa.drivername}'")
+    return url_sa.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Retorna engine async (singleton com lazy initialization) usado pelas rotas de leitura.
+    Usa DATABASE_ASYNC_URL quando definida; senão deriva de DATABASE_URL.
+    """
+    global _async_engine
+    if _async_engine is None:
+        settings = get_settings()
+        url = settings.DATABASE_ASYNC_URL or converter_url_async(settings.DATABASE_URL)
+        _async_engine = criar_engine_async(url)
+    return _async_engine
+
+
+def get_async_read_engine() -> AsyncEngine:
+    """
+    Retorna engine async da réplica de leitura (DATABASE_READ_URL com driver async).
+    Sem réplica configurada, retorna get_async_engine().
+    """
+    global _async_read_engine
+    settings = get_settings()
+    if not settings.DATABASE_READ_URL:
+        return get_async_engine()
+    if _async_read_engine is None:
+        _async_read_engine = criar_engine_async(converter_url_async(settings.DATABASE_READ_URL))
+    return _async_read_engine
@@ -0,0 +1,68 @@
+"""
+Contagem de consultas por requisição - Camada de Infraestrutura
+
+Eventos do SQLAlchemy (registrados em Engine, valendo para todos os
+engines, inclusive o síncrono interno dos engines async) acumulam a
+quantidade de statements e o tempo gasto no banco na medição ativa do
+contexto atual (ContextVar), aberta por requisição pelo middleware.
+"""
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class MetricasConsultas:
+    """Statements executados e tempo acumulado no banco"""
+    total_consultas: int = 0
+    tempo_total_s: float = 0.0
+
+    @property
+    def tempo_total_ms(self) -> float:
+        return self.tempo_total_s * 1000
+
+
+_medicao_atual: ContextVar[Optional[MetricasConsultas]] = ContextVar("medicao_consultas", default=None)
+_instalado = False
+
+
+def iniciar_medicao() -> Token:
+    """Abre uma medição no contexto atual; devolve o token para encerrar_medicao()"""
+    return _medicao_atual.set(MetricasConsultas())
+
+
+def medicao_atual() -> Optional[MetricasConsultas]:
+    return _medicao_atual.get()
+
+
+def encerrar_medicao(token: Token) -> None:
+    _medicao_atual.reset(token)
+
+
+def _antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+    if _medicao_atual.get() is not None:
+        context._inicio_consulta = time.perf_counter()
+
+
+def _depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+    metricas = _medicao_atual.get()
+    if metricas is None:
+        return
+    inicio = getattr(context, "_inicio_consulta", None)
+    if inicio is not None:
+        metricas.tempo_total_s += time.perf_counter() - inicio
+    metricas.total_consultas += 1
+
+
+def instalar_contagem_consultas() -> None:
+    """Registra os eventos de contagem (idempotente)"""
+    global _instalado
+    if _instalado:
+        return
+    event.listen(Engine, "before_cursor_execute", _antes_de_executar)
+    event.listen(Engine, "after_cursor_execute", _depois_de_executar)
+    _instalado = True
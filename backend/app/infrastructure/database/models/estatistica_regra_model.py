@@ -0,0 +1,25 @@
+"""
+SQLModel Model para Estatísticas de Regras
+"""
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Integer
+from sqlmodel import Column, Field, SQLModel
+
+
+class EstatisticaRegraModel(SQLModel, table=True):
+    """
+    Model SQLModel para contadores acumulados de execução de regras.
+    
+    IMPORTANTE: Model de infraestrutura, NÃO entidade de domínio.
+    """
+    
+    __tablename__ = "regraestatistica"  # type: ignore
+    __table_args__ = {'extend_existing': True}  # type: ignore
+    
+    regra_id: int = Field(sa_column=Column(Integer, ForeignKey("regra.id", ondelete="CASCADE"), primary_key=True))
+    total_avaliacoes: int = Field(default=0, description="Transações avaliadas pela regra")
+    total_correspondencias: int = Field(default=0, description="Transações que corresponderam ao critério")
+    total_aplicacoes: int = Field(default=0, description="Transações alteradas pela ação da regra")
+    tempo_total_ms: float = Field(default=0.0, description="Tempo acumulado de avaliação (ms)")
+    atualizado_em: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,28 @@
+"""
+SQLModel Model para Lotes de Importação
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlmodel import Field, SQLModel
+
+
+class LoteImportacaoModel(SQLModel, table=True):
+    """
+    Model SQLModel para arquivos processados pela importação.
+    
+    IMPORTANTE: Model de infraestrutura, NÃO entidade de domínio.
+    """
+    
+    __tablename__ = "importacao_lote"  # type: ignore
+    __table_args__ = {'extend_existing': True}  # type: ignore
+    
+    id: Optional[int] = Field(default=None, primary_key=True)
+    hash_arquivo: str = Field(max_length=64, index=True, description="SHA-256 do conteúdo do arquivo")
+    nome_arquivo: str = Field(description="Nome do arquivo enviado")
+    parser_id: str = Field(description="Parser usado na importação")
+    usuario_id: int = Field(foreign_key="usuario.id", index=True, description="ID do usuário responsável")
+    total_linhas: int = Field(default=0, description="Linhas lidas pelo parser")
+    total_importado: int = Field(default=0, description="Transações criadas")
+    resultado: Optional[str] = Field(default=None, description="JSON com mensagem da importação e se foi lida em blocos")
+    criado_em: datetime = Field(default_factory=datetime.now)
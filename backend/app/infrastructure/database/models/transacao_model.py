@@ -6,6 +6,7 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING, List, Optional
 
 from pydantic import field_validator
+from sqlalchemy import Enum
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -29,7 +30,11 @@ class TransacaoModel(SQLModel, table=True):
     descricao: str = Field(description="Descrição da transação")
     valor: float = Field(description="Valor da transação")
     valor_original: Optional[float] = Field(default=None, description="Valor original antes de edições")
-    tipo: str = Field(description="Tipo: entrada ou saida")
+    # ENUM tipotransacao no PostgreSQL (ver migração 448cceacb835); VARCHAR no SQLite
+    tipo: str = Field(
+        sa_type=Enum("ENTRADA", "SAIDA", name="tipotransacao"),
+        description="Tipo: ENTRADA ou SAIDA (nome de TipoTransacao)"
+    )
     categoria: Optional[str] = Field(default=None, description="Categoria")
     origem: str = Field(default="manual", description="Origem: manual, extrato_bancario, fatura_cartao")
     banco: Optional[str] = Field(default=None, description="Banco de origem (btg, nubank, inter, etc.)")
@@ -41,6 +46,14 @@ class TransacaoModel(SQLModel, table=True):
     # FK para usuário
     usuario_id: int = Field(foreign_key="usuario.id", description="ID do usuário responsável")
     
+    # FK para lote de importação (None para transações manuais)
+    lote_importacao_id: Optional[int] = Field(
+        default=None,
+        foreign_key="importacao_lote.id",
+        index=True,
+        description="ID do lote de importação de origem"
+    )
+    
     # Relacionamentos
     tags: List["TransacaoTagModel"] = Relationship(
         back_populates="transacao",
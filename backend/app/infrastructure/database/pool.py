@@ -0,0 +1,95 @@
+"""
+Pool de conexões monitorado - Camada de Infraestrutura
+
+QueuePool que mede quanto tempo cada checkout esperou por uma conexão,
+para distinguir requisições enfileiradas no banco de requisições presas em CPU.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class EstatisticasEspera:
+    """Acumula tempos de espera por conexão (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total_checkouts = 0
+        self.total_timeouts = 0
+        self.tempo_espera_total_s = 0.0
+        self.tempo_espera_max_s = 0.0
+
+    def registrar(self, segundos: float, timeout: bool = False) -> None:
+        with self._lock:
+            self.total_checkouts += 1
+            self.tempo_espera_total_s += segundos
+            self.tempo_espera_max_s = max(self.tempo_espera_max_s, segundos)
+            if timeout:
+                self.total_timeouts += 1
+
+    def como_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            medio = self.tempo_espera_total_s / self.total_checkouts if self.total_checkouts else 0.0
+            return {
+                "total_checkouts": self.total_checkouts,
+                "total_timeouts": self.total_timeouts,
+                "espera_total_ms": round(self.tempo_espera_total_s * 1000, 3),
+                "espera_media_ms": round(medio * 1000, 3),
+                "espera_max_ms": round(self.tempo_espera_max_s * 1000, 3),
+            }
+
+
+class _MedicaoEsperaMixin:
+    """Mede o tempo gasto em _do_get (espera por conexão livre ou nova conexão)"""
+
+    @property
+    def estatisticas_espera(self) -> EstatisticasEspera:
+        if not hasattr(self, "_estatisticas_espera"):
+            self._estatisticas_espera = EstatisticasEspera()
+        return self._estatisticas_espera
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            conexao = super()._do_get()
+        except PoolTimeoutError:
+            self.estatisticas_espera.registrar(time.perf_counter() - inicio, timeout=True)
+            raise
+        self.estatisticas_espera.registrar(time.perf_counter() - inicio)
+        return conexao
+
+
+class QueuePoolMonitorado(_MedicaoEsperaMixin, QueuePool):
+    """QueuePool com medição de espera por conexão"""
+
+
+class AsyncAdaptedQueuePoolMonitorado(_MedicaoEsperaMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool com medição de espera por conexão"""
+
+
+def obter_estatisticas_pool(engine: Union[Engine, AsyncEngine]) -> Dict[str, Any]:
+    """
+    Retorna o estado atual do pool do engine.
+
+    Pools de fila informam conexões em uso, ociosas e overflow; pools
+    monitorados incluem também os tempos de espera por conexão.
+    """
+    pool: Pool = engine.pool
+    estatisticas: Dict[str, Any] = {"classe": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        estatisticas.update(
+            tamanho=pool.size(),
+            em_uso=pool.checkedout(),
+            ociosas=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    espera: Optional[EstatisticasEspera] = getattr(pool, "estatisticas_espera", None)
+    if espera is not None:
+        estatisticas.update(espera.como_dict())
+    return estatisticas
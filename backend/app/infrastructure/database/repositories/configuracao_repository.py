@@ -5,8 +5,9 @@ from datetime import datetime
 from typing import Optional
 
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.domain.repositories.configuracao_repository import IConfiguracaoRepository
+from app.domain.repositories.configuracao_repository import IConfiguracaoRepository, IConfiguracaoRepositoryAsync
 from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel
 
 
@@ -43,3 +44,17 @@ class ConfiguracaoRepository(IConfiguracaoRepository):
             self._session.add(model)
         
         self._session.commit()
+
+
+class ConfiguracaoRepositoryAsync(IConfiguracaoRepositoryAsync):
+    """
+    Implementação async das leituras de configurações (rotas GET).
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def obter(self, chave: str) -> Optional[str]:
+        """Obtém valor de uma configuração"""
+        query = select(ConfiguracaoModel.valor).where(ConfiguracaoModel.chave == chave)
+        return (await self._session.exec(query)).first()
@@ -0,0 +1,97 @@
+"""
+Implementação concreta do repositório de Estatísticas de Regras usando SQLModel
+"""
+from datetime import datetime
+from typing import List
+
+from sqlalchemy.dialects.postgresql import insert as insert_postgresql
+from sqlalchemy.dialects.sqlite import insert as insert_sqlite
+from sqlmodel import Session, select
+
+from app.domain.entities.estatistica_regra import EstatisticaRegra
+from app.domain.repositories.estatistica_regra_repository import IEstatisticaRegraRepository
+from app.infrastructure.database.models.estatistica_regra_model import EstatisticaRegraModel
+from app.infrastructure.database.models.regra_model import RegraModel
+
+
+class EstatisticaRegraRepository(IEstatisticaRegraRepository):
+    """
+    Implementação concreta de IEstatisticaRegraRepository usando SQLModel.
+    
+    Os contadores chegam agregados por execução (importação ou aplicação
+    retroativa) e são gravados em um único commit, nunca por transação.
+    A soma é feita no banco (INSERT ... ON CONFLICT DO UPDATE): execuções
+    concorrentes não perdem incrementos nem disputam a criação da linha.
+    """
+    
+    def __init__(self, session: Session):
+        self._session = session
+    
+    def registrar(self, estatisticas: List[EstatisticaRegra]) -> None:
+        """
+        Soma incrementos aos contadores existentes (upsert atômico em lote).
+        
+        Em caso de falha, desfaz a transação da sessão antes de propagar o erro.
+        """
+        if not estatisticas:
+            return
+        
+        # Ignora regras deletadas durante a execução
+        query = select(RegraModel.id).where(RegraModel.id.in_([e.regra_id for e in estatisticas]))
+        regras_existentes = set(self._session.exec(query).all())
+        
+        agora = datetime.now()
+        linhas = [
+            {
+                "regra_id": e.regra_id,
+                "total_avaliacoes": e.total_avaliacoes,
+                "total_correspondencias": e.total_correspondencias,
+                "total_aplicacoes": e.total_aplicacoes,
+                "tempo_total_ms": e.tempo_total_ms,
+                "atualizado_em": agora,
+            }
+            for e in estatisticas
+            if e.regra_id in regras_existentes
+        ]
+        if not linhas:
+            return
+        
+        # PostgreSQL e SQLite têm a mesma sintaxe de upsert
+        dialeto = self._session.get_bind().dialect.name
+        insert = insert_postgresql if dialeto == "postgresql" else insert_sqlite
+        tabela = EstatisticaRegraModel.__table__
+        stmt = insert(tabela).values(linhas)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tabela.c.regra_id],
+            set_={
+                "total_avaliacoes": tabela.c.total_avaliacoes + stmt.excluded.total_avaliacoes,
+                "total_correspondencias": tabela.c.total_correspondencias + stmt.excluded.total_correspondencias,
+                "total_aplicacoes": tabela.c.total_aplicacoes + stmt.excluded.total_aplicacoes,
+                "tempo_total_ms": tabela.c.tempo_total_ms + stmt.excluded.tempo_total_ms,
+                "atualizado_em": stmt.excluded.atualizado_em,
+            }
+        )
+        try:
+            self._session.exec(stmt)
+            self._session.commit()
+        except Exception:
+            # A sessão é a mesma da importação: sem rollback ela ficaria inutilizável
+            # (PendingRollbackError) para a gravação do lote e os arquivos seguintes
+            self._session.rollback()
+            raise
+    
+    def listar(self) -> List[EstatisticaRegra]:
+        """Lista estatísticas de todas as regras que já foram avaliadas"""
+        models = self._session.exec(select(EstatisticaRegraModel)).all()
+        return [self._to_entity(m) for m in models]
+    
+    def _to_entity(self, model: EstatisticaRegraModel) -> EstatisticaRegra:
+        """Converte SQLModel → Entidade de Domínio"""
+        return EstatisticaRegra(
+            regra_id=model.regra_id,
+            total_avaliacoes=model.total_avaliacoes,
+            total_correspondencias=model.total_correspondencias,
+            total_aplicacoes=model.total_aplicacoes,
+            tempo_total_ms=model.tempo_total_ms,
+            atualizado_em=model.atualizado_em
+        )
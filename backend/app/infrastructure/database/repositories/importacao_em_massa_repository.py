@@ -0,0 +1,307 @@
+"""
+Implementação da importação em massa via tabelas de staging temporárias
+"""
+from datetime import datetime
+from time import perf_counter
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    cast,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy import delete as sa_delete
+from sqlmodel import Session
+
+from app.domain.entities.estatistica_regra import EstatisticaRegra
+from app.domain.entities.regra import Regra
+from app.domain.repositories.importacao_em_massa_repository import (
+    IImportacaoEmMassaRepository,
+    ResultadoImportacaoEmMassa,
+)
+from app.domain.value_objects.regra_enums import CriterioTipo, TipoAcao
+from app.infrastructure.database.models.tag_model import TagModel, TransacaoTagModel
+from app.infrastructure.database.models.transacao_model import TransacaoModel
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Linhas por INSERT executemany na carga do staging
+TAMANHO_LOTE_STAGING = 10_000
+
+# Metadata própria: tabelas temporárias nunca entram no create_all/alembic
+_metadata_staging = MetaData()
+
+_staging = Table(
+    "staging_importacao",
+    _metadata_staging,
+    Column("linha", Integer, primary_key=True),
+    Column("transacao_id", Integer),
+    Column("data", Date, nullable=False),
+    Column("descricao", String, nullable=False),
+    Column("descricao_busca", String, nullable=False),  # descricao.lower() calculado em Python
+    Column("valor", Float, nullable=False),
+    Column("valor_original", Float, nullable=False),
+    # VARCHAR: um ENUM aqui faria o drop_all do staging remover o tipo tipotransacao
+    Column("tipo", String, nullable=False),
+    Column("categoria", String),
+    Column("categoria_busca", String),
+    Column("origem", String, nullable=False),
+    Column("banco", String),
+    Column("data_fatura", Date),
+    prefixes=["TEMPORARY"],
+)
+
+_staging_tag = Table(
+    "staging_importacao_tag",
+    _metadata_staging,
+    Column("linha", Integer, primary_key=True),
+    Column("tag_id", Integer, primary_key=True),
+    prefixes=["TEMPORARY"],
+)
+
+
+class ImportacaoEmMassaRepository(IImportacaoEmMassaRepository):
+    """
+    Importação set-based: as linhas vão para tabelas temporárias em lote e
+    todo o resto (deduplicação, regras, tags, inserção final) é feito com
+    UPDATE/DELETE/INSERT ... SELECT, sem criar uma entidade por linha.
+    
+    Comparações case-insensitive usam colunas *_busca já em minúsculas
+    (str.lower do Python), mantendo a mesma semântica das entidades mesmo
+    no SQLite, cujo lower() só trata ASCII.
+    """
+    
+    def __init__(self, session: Session):
+        self._session = session
+    
+    def importar(
+        self,
+        linhas: "pd.DataFrame",
+        usuario_id: int,
+        tag_rotina_id: int,
+        regras: List[Regra],
+        lote_importacao_id: Optional[int] = None
+    ) -> ResultadoImportacaoEmMassa:
+        """Importa linhas normalizadas via staging em uma única transação"""
+        conexao = self._session.connection()
+        _metadata_staging.drop_all(conexao, checkfirst=True)
+        _metadata_staging.create_all(conexao)
+        
+        try:
+            self._carregar_staging(linhas)
+            total_duplicadas = self._remover_duplicadas(usuario_id, lote_importacao_id)
+            estatisticas = self._aplicar_regras(regras)
+            self._adicionar_tag(_staging.c.linha.isnot(None), [tag_rotina_id])
+            transacoes_ids = self._inserir_transacoes(usuario_id, lote_importacao_id)
+        except Exception:
+            self._session.rollback()
+            raise
+        
+        _metadata_staging.drop_all(conexao, checkfirst=True)
+        self._session.commit()
+        
+        return ResultadoImportacaoEmMassa(
+            transacoes_ids=transacoes_ids,
+            total_duplicadas=total_duplicadas,
+            estatisticas=estatisticas
+        )
+    
+    def _carregar_staging(self, linhas: "pd.DataFrame") -> None:
+        """Carrega o DataFrame no staging com INSERTs executemany em blocos"""
+        # pandas só é carregado por quem importa (fora do caminho de leitura da API)
+        import pandas as pd
+        
+        df = pd.DataFrame({
+            "linha": range(1, len(linhas) + 1),
+            "data": linhas["data"].values,
+            "descricao": linhas["descricao"].astype(str).values,
+            "valor": linhas["valor"].astype(float).values,
+            "tipo": linhas["tipo"].values,
+            "origem": linhas["origem"].values,
+        })
+        df["descricao_busca"] = df["descricao"].str.lower()
+        df["valor_original"] = df["valor"]
+        for coluna in ("categoria", "banco", "data_fatura"):
+            valores = linhas[coluna] if coluna in linhas.columns else pd.Series([None] * len(linhas))
+            df[coluna] = valores.astype(object).where(pd.notna(valores), None).values
+        df["categoria_busca"] = [c.lower() if c else c for c in df["categoria"]]
+        
+        for inicio in range(0, len(df), TAMANHO_LOTE_STAGING):
+            bloco = df.iloc[inicio:inicio + TAMANHO_LOTE_STAGING]
+            self._session.exec(insert(_staging), params=bloco.to_dict("records"))
+    
+    def _remover_duplicadas(self, usuario_id: int, lote_importacao_id: Optional[int]) -> int:
+        """
+        Remove do staging linhas que já existem no banco para o usuário.
+        
+        Mesma chave de Transacao.chave_importacao, antes das regras: regras,
+        tags e reserva de IDs só veem as linhas que serão inseridas.
+        Transações do próprio lote (blocos anteriores do mesmo arquivo) não
+        contam como duplicadas: linhas repetidas dentro de um arquivo são legítimas.
+        """
+        existente = (
+            select(TransacaoModel.id)
+            .where(
+                TransacaoModel.usuario_id == usuario_id,
+                TransacaoModel.data == _staging.c.data,
+                TransacaoModel.descricao == _staging.c.descricao,
+                TransacaoModel.valor_original == _staging.c.valor_original,
+                # ENUM no PostgreSQL: sem o cast, tipotransacao = character varying falha
+                TransacaoModel.tipo == cast(_staging.c.tipo, TransacaoModel.__table__.c.tipo.type),
+                TransacaoModel.origem == _staging.c.origem
+            )
+        )
+        if lote_importacao_id is not None:
+            existente = existente.where(or_(
+                TransacaoModel.lote_importacao_id.is_(None),
+                TransacaoModel.lote_importacao_id != lote_importacao_id
+            ))
+        resultado = self._session.exec(sa_delete(_staging).where(existente.exists()))
+        return resultado.rowcount
+    
+    def _aplicar_regras(self, regras: List[Regra]) -> List[EstatisticaRegra]:
+        """
+        Aplica as regras em ordem de prioridade, um statement por regra.
+        
+        Cada regra enxerga o resultado das anteriores (ex: uma regra de
+        critério categoria após uma regra que alterou categorias).
+        """
+        total_linhas = self._session.exec(select(func.count()).select_from(_staging)).one()[0]
+        estatisticas = []
+        
+        for regra in regras:
+            inicio = perf_counter()
+            condicao = self._condicao_regra(regra)
+            correspondencias = self._session.exec(
+                select(func.count()).select_from(_staging).where(condicao)
+            ).one()[0]
+            aplicacoes = correspondencias
+            
+            if correspondencias:
+                if regra.tipo_acao == TipoAcao.ALTERAR_CATEGORIA:
+                    self._session.exec(
+                        update(_staging)
+                        .where(condicao)
+                        .values(categoria=regra.acao_valor, categoria_busca=regra.acao_valor.lower())
+                    )
+                elif regra.tipo_acao == TipoAcao.ADICIONAR_TAGS:
+                    self._adicionar_tag(condicao, regra.tag_ids)
+                elif regra.tipo_acao == TipoAcao.ALTERAR_VALOR:
+                    percentual = self._percentual(regra.acao_valor)
+                    if percentual is None:
+                        aplicacoes = 0
+                    else:
+                        self._session.exec(
+                            update(_staging)
+                            .where(condicao)
+                            .values(valor=_staging.c.valor * (percentual / 100))
+                        )
+            
+            if regra.id is not None:
+                estatisticas.append(EstatisticaRegra(
+                    regra_id=regra.id,
+                    total_avaliacoes=total_linhas,
+                    total_correspondencias=correspondencias,
+                    total_aplicacoes=aplicacoes,
+                    tempo_total_ms=(perf_counter() - inicio) * 1000
+                ))
+        
+        return estatisticas
+    
+    def _condicao_regra(self, regra: Regra):
+        """Traduz o critério da regra para uma condição sobre o staging"""
+        valor = regra.criterio_valor.lower()
+        if regra.criterio_tipo == CriterioTipo.DESCRICAO_EXATA:
+            return _staging.c.descricao_busca == valor
+        if regra.criterio_tipo == CriterioTipo.DESCRICAO_CONTEM:
+            return _staging.c.descricao_busca.contains(valor, autoescape=True)
+        if regra.criterio_tipo == CriterioTipo.CATEGORIA:
+            return and_(_staging.c.categoria_busca != "", _staging.c.categoria_busca == valor)
+        return literal(False)
+    
+    def _percentual(self, acao_valor: str) -> Optional[float]:
+        """Percentual válido de ALTERAR_VALOR (mesma validação de Regra.executar_acao)"""
+        try:
+            percentual = float(acao_valor)
+        except (ValueError, TypeError):
+            return None
+        return percentual if 0 <= percentual <= 100 else None
+    
+    def _adicionar_tag(self, condicao, tag_ids: List[int]) -> None:
+        """Associa tags existentes às linhas do staging que atendem a condição"""
+        if not tag_ids:
+            return
+        ja_associada = exists().where(
+            _staging_tag.c.linha == _staging.c.linha,
+            _staging_tag.c.tag_id == TagModel.id
+        )
+        origem = (
+            select(_staging.c.linha, TagModel.id)
+            .select_from(_staging)
+            .join(TagModel, TagModel.id.in_(tag_ids))
+            .where(condicao, ~ja_associada)
+        )
+        self._session.exec(insert(_staging_tag).from_select(["linha", "tag_id"], origem))
+    
+    def _inserir_transacoes(self, usuario_id: int, lote_importacao_id: Optional[int]) -> List[int]:
+        """Reserva IDs, insere transações e tags com INSERT ... SELECT"""
+        if self._session.get_bind().dialect.name == "postgresql":
+            proximo_id = func.nextval(func.pg_get_serial_sequence(TransacaoModel.__tablename__, "id"))
+            self._session.exec(update(_staging).values(transacao_id=proximo_id))
+        else:
+            # Dentro da transação de escrita: MAX(id) + linha é único
+            base = self._session.exec(select(func.coalesce(func.max(TransacaoModel.id), 0))).one()[0]
+            self._session.exec(update(_staging).values(transacao_id=_staging.c.linha + base))
+        
+        agora = datetime.now()
+        tabela = TransacaoModel.__table__
+        origem = select(
+            _staging.c.transacao_id,
+            _staging.c.data,
+            _staging.c.descricao,
+            _staging.c.valor,
+            _staging.c.valor_original,
+            # ENUM no PostgreSQL: INSERT ... SELECT não converte VARCHAR implicitamente
+            cast(_staging.c.tipo, tabela.c.tipo.type),
+            _staging.c.categoria,
+            _staging.c.origem,
+            _staging.c.banco,
+            _staging.c.data_fatura,
+            literal(agora, DateTime),
+            literal(agora, DateTime),
+            literal(usuario_id, Integer),
+            literal(lote_importacao_id, Integer),
+        )
+        self._session.exec(insert(tabela).from_select([
+            "id", "data", "descricao", "valor", "valor_original", "tipo", "categoria",
+            "origem", "banco", "data_fatura", "criado_em", "atualizado_em",
+            "usuario_id", "lote_importacao_id",
+        ], origem))
+        
+        tags = (
+            select(_staging.c.transacao_id, _staging_tag.c.tag_id, literal(agora, DateTime))
+            .select_from(_staging_tag)
+            .join(_staging, _staging.c.linha == _staging_tag.c.linha)
+        )
+        self._session.exec(
+            insert(TransacaoTagModel.__table__).from_select(["transacao_id", "tag_id", "criado_em"], tags)
+        )
+        
+        return list(self._session.exec(
+            select(_staging.c.transacao_id).order_by(_staging.c.linha)
+        ).scalars())
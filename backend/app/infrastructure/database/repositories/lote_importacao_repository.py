@@ -0,0 +1,129 @@
+"""
+Implementação concreta do repositório de Lotes de Importação usando SQLModel
+"""
+import json
+from typing import Optional
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.domain.entities.lote_importacao import LoteImportacao
+from app.domain.repositories.lote_importacao_repository import ILoteImportacaoRepository
+from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel
+from app.infrastructure.database.models.tag_model import TransacaoTagModel
+from app.infrastructure.database.models.transacao_model import TransacaoModel
+
+
+class LoteImportacaoRepository(ILoteImportacaoRepository):
+    """
+    Implementação concreta de ILoteImportacaoRepository usando SQLModel.
+    """
+    
+    def __init__(self, session: Session):
+        self._session = session
+    
+    def criar(self, lote: LoteImportacao) -> LoteImportacao:
+        """Registra um novo lote"""
+        model = self._to_model(lote)
+        self._session.add(model)
+        self._session.commit()
+        self._session.refresh(model)
+        return self._to_entity(model)
+    
+    def buscar_por_id(self, id: int) -> Optional[LoteImportacao]:
+        """Busca lote por ID"""
+        model = self._session.get(LoteImportacaoModel, id)
+        if not model:
+            return None
+        return self._to_entity(model)
+    
+    def buscar_por_hash(self, usuario_id: int, hash_arquivo: str) -> Optional[LoteImportacao]:
+        """Busca lote mais recente pelo hash do arquivo (coluna indexada)"""
+        query = (
+            select(LoteImportacaoModel)
+            .where(
+                LoteImportacaoModel.hash_arquivo == hash_arquivo,
+                LoteImportacaoModel.usuario_id == usuario_id
+            )
+            .order_by(LoteImportacaoModel.id.desc())
+            .limit(1)
+        )
+        model = self._session.exec(query).first()
+        if not model:
+            return None
+        return self._to_entity(model)
+    
+    def atualizar(self, lote: LoteImportacao) -> LoteImportacao:
+        """Atualiza contagens e resultado do lote"""
+        if not lote.id:
+            raise ValueError("Lote deve ter ID para atualizar")
+        
+        model = self._session.get(LoteImportacaoModel, lote.id)
+        if not model:
+            raise ValueError(f"Lote {lote.id} não encontrado")
+        
+        model.total_linhas = lote.total_linhas
+        model.total_importado = lote.total_importado
+        model.resultado = self._serializar_resultado(lote)
+        
+        self._session.commit()
+        self._session.refresh(model)
+        return self._to_entity(model)
+    
+    def deletar(self, id: int) -> bool:
+        """
+        Remove o lote com três DELETEs set-based em uma única transação:
+        tags das transações do lote, transações do lote e o próprio lote.
+        """
+        model = self._session.get(LoteImportacaoModel, id)
+        if not model:
+            return False
+        
+        transacoes_do_lote = select(TransacaoModel.id).where(TransacaoModel.lote_importacao_id == id)
+        self._session.exec(
+            delete(TransacaoTagModel)
+            .where(TransacaoTagModel.transacao_id.in_(transacoes_do_lote))
+            .execution_options(synchronize_session=False)
+        )
+        self._session.exec(
+            delete(TransacaoModel)
+            .where(TransacaoModel.lote_importacao_id == id)
+            .execution_options(synchronize_session=False)
+        )
+        self._session.delete(model)
+        self._session.commit()
+        return True
+    
+    def _serializar_resultado(self, lote: LoteImportacao) -> str:
+        """Serializa resultado da importação como JSON"""
+        return json.dumps({"mensagem": lote.mensagem, "em_blocos": lote.em_blocos})
+    
+    def _to_entity(self, model: LoteImportacaoModel) -> LoteImportacao:
+        """Converte SQLModel → Entidade de Domínio"""
+        resultado = json.loads(model.resultado) if model.resultado else {}
+        return LoteImportacao(
+            id=model.id,
+            hash_arquivo=model.hash_arquivo,
+            nome_arquivo=model.nome_arquivo,
+            parser_id=model.parser_id,
+            usuario_id=model.usuario_id,
+            total_linhas=model.total_linhas,
+            total_importado=model.total_importado,
+            em_blocos=resultado.get("em_blocos", False),
+            mensagem=resultado.get("mensagem", ""),
+            criado_em=model.criado_em
+        )
+    
+    def _to_model(self, entity: LoteImportacao) -> LoteImportacaoModel:
+        """Converte Entidade de Domínio → SQLModel"""
+        return LoteImportacaoModel(
+            id=entity.id,
+            hash_arquivo=entity.hash_arquivo,
+            nome_arquivo=entity.nome_arquivo,
+            parser_id=entity.parser_id,
+            usuario_id=entity.usuario_id,
+            total_linhas=entity.total_linhas,
+            total_importado=entity.total_importado,
+            resultado=self._serializar_resultado(entity),
+            criado_em=entity.criado_em
+        )
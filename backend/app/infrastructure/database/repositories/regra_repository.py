@@ -1,17 +1,48 @@
 """
 Implementação concreta do repositório de Regras usando SQLModel
 """
-from typing import List, Optional
-import json
+import threading
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
+from sqlalchemy import case, update
+from sqlalchemy.engine import Engine
 from sqlmodel import Session, select, func
 
 from app.domain.entities.regra import Regra
 from app.domain.repositories.regra_repository import IRegraRepository
 from app.domain.value_objects.regra_enums import TipoAcao, CriterioTipo
+from app.infrastructure.config import get_settings
 from app.infrastructure.database.models.regra_model import RegraModel, RegraTagModel
 
 
+# Cache por processo da lista de regras ativas, indexado pelo engine da sessão.
+# listar(apenas_ativas=True) é chamado em toda importação e aplicação retroativa;
+# qualquer escrita em regras invalida o cache (ver invalidar_cache_regras_ativas).
+# Escritas feitas por outros workers não invalidam este processo: o cache expira
+# após REGRAS_ATIVAS_CACHE_TTL_SEGUNDOS, que limita por quanto tempo ficam visíveis
+# regras desatualizadas.
+_cache_regras_ativas: "WeakKeyDictionary[Engine, Tuple[float, List[Regra]]]" = WeakKeyDictionary()
+_cache_lock = threading.Lock()
+_cache_geracao = 0
+_relogio = time.monotonic
+
+
+def invalidar_cache_regras_ativas() -> None:
+    """
+    Descarta o cache de regras ativas do processo.
+    
+    Chamado após criar, atualizar, deletar ou reordenar regras, e após
+    deletar tags (as associações regra-tag são removidas em cascata).
+    """
+    global _cache_geracao
+    with _cache_lock:
+        _cache_geracao += 1
+        _cache_regras_ativas.clear()
+
+
 class RegraRepository(IRegraRepository):
     """
     Implementação concreta de IRegraRepository usando SQLModel.
@@ -45,6 +76,7 @@ class RegraRepository(IRegraRepository):
         if regra.tipo_acao == TipoAcao.ADICIONAR_TAGS and regra.tag_ids:
             self._sincronizar_tags(model.id, regra.tag_ids)
         
+        invalidar_cache_regras_ativas()
         return self._to_entity(model)
     
     def buscar_por_id(self, id: int) -> Optional[Regra]:
@@ -66,16 +98,41 @@ class RegraRepository(IRegraRepository):
         """
         Lista regras ordenadas por prioridade (maior primeiro).
         
+        As tags de todas as regras são carregadas em uma única query.
+        A lista de regras ativas é mantida em cache por processo, por até
+        REGRAS_ATIVAS_CACHE_TTL_SEGUNDOS.
+        
         Args:
             apenas_ativas: Se True, retorna apenas regras ativas
         """
+        if apenas_ativas:
+            engine = self._session.get_bind()
+            with _cache_lock:
+                em_cache = _cache_regras_ativas.get(engine)
+                geracao = _cache_geracao
+            if em_cache is not None and em_cache[0] > _relogio():
+                return [self._copiar(r) for r in em_cache[1]]
+        
         query = select(RegraModel).order_by(RegraModel.prioridade.desc())
         
         if apenas_ativas:
             query = query.where(RegraModel.ativo == True)
         
         models = self._session.exec(query).all()
-        return [self._to_entity(m) for m in models]
+        tag_ids_por_regra = self._carregar_tag_ids(models)
+        regras = [self._to_entity(m, tag_ids_por_regra.get(m.id, [])) for m in models]
+        
+        ttl_segundos = get_settings().REGRAS_ATIVAS_CACHE_TTL_SEGUNDOS
+        if apenas_ativas and ttl_segundos > 0:
+            with _cache_lock:
+                # Só popula se nenhuma escrita invalidou o cache durante a leitura
+                if geracao == _cache_geracao:
+                    _cache_regras_ativas[engine] = (
+                        _relogio() + ttl_segundos,
+                        [self._copiar(r) for r in regras],
+                    )
+        
+        return regras
     
     def atualizar(self, regra: Regra) -> Regra:
         """Atualiza regra existente"""
@@ -112,6 +169,7 @@ class RegraRepository(IRegraRepository):
         
         self._session.refresh(model)
         
+        invalidar_cache_regras_ativas()
         return self._to_entity(model)
     
     def deletar(self, id: int) -> bool:
@@ -122,6 +180,7 @@ class RegraRepository(IRegraRepository):
         
         self._session.delete(model)
         self._session.commit()
+        invalidar_cache_regras_ativas()
         return True
     
     def obter_proxima_prioridade(self) -> int:
@@ -134,32 +193,45 @@ class RegraRepository(IRegraRepository):
         """
         Reordena regras baseado em lista de IDs.
         
+        Executa uma query de validação e dois UPDATEs em lote:
+        1. prioridade = -(prioridade final) via CASE, evitando conflitos com a
+           UNIQUE constraint (prioridades válidas nunca são negativas)
+        2. prioridade = -prioridade, chegando aos valores finais
+        
         Args:
             nova_ordem: Lista de IDs na ordem desejada (índice 0 = maior prioridade)
         """
-        # Valida que todos os IDs existem
+        # Valida que todos os IDs existem (uma única query)
+        query = select(RegraModel.id).where(RegraModel.id.in_(nova_ordem))
+        ids_existentes = set(self._session.exec(query).all())
         for regra_id in nova_ordem:
-            if not self._session.get(RegraModel, regra_id):
+            if regra_id not in ids_existentes:
                 raise ValueError(f"Regra {regra_id} não encontrada")
         
-        # Primeiro, define todas as prioridades como negativas temporariamente
-        # para evitar conflitos de UNIQUE constraint
-        for regra_id in nova_ordem:
-            model = self._session.get(RegraModel, regra_id)
-            if model:
-                model.prioridade = -regra_id  # Prioridade temporária negativa
-        
-        self._session.flush()  # Commit das prioridades temporárias
+        if not nova_ordem:
+            return True
         
-        # Agora atualiza com as prioridades finais
+        # Prioridade decrescente: primeiro item = maior prioridade
         max_prioridade = len(nova_ordem)
-        for idx, regra_id in enumerate(nova_ordem):
-            model = self._session.get(RegraModel, regra_id)
-            if model:
-                # Prioridade decrescente: primeiro item = maior prioridade
-                model.prioridade = max_prioridade - idx
+        prioridades_temporarias = {
+            regra_id: -(max_prioridade - idx) for idx, regra_id in enumerate(nova_ordem)
+        }
         
-        self._session.commit()
+        self._session.exec(
+            update(RegraModel)
+            .where(RegraModel.id.in_(nova_ordem))
+            .values(prioridade=case(prioridades_temporarias, value=RegraModel.id))
+            .execution_options(synchronize_session=False)
+        )
+        self._session.exec(
+            update(RegraModel)
+            .where(RegraModel.id.in_(nova_ordem))
+            .values(prioridade=-RegraModel.prioridade)
+            .execution_options(synchronize_session=False)
+        )
+        
+        self._session.commit()  # Commit expira models em memória com prioridades antigas
+        invalidar_cache_regras_ativas()
         return True
     
     def _sincronizar_tags(self, regra_id: int, tag_ids: List[int]):
@@ -204,13 +276,41 @@ class RegraRepository(IRegraRepository):
         count = self._session.exec(query).one()
         return count > 0
     
-    def _to_entity(self, model: RegraModel) -> Regra:
-        """Converte SQLModel → Entidade de Domínio"""
-        # Carrega tag_ids se tipo_acao for ADICIONAR_TAGS
-        tag_ids = []
-        if model.tipo_acao == TipoAcao.ADICIONAR_TAGS.name:  # Comparar com UPPERCASE
-            query = select(RegraTagModel.tag_id).where(RegraTagModel.regra_id == model.id)
-            tag_ids = list(self._session.exec(query).all())
+    def _carregar_tag_ids(self, models: List[RegraModel]) -> Dict[int, List[int]]:
+        """
+        Carrega, em uma única query, os tag_ids das regras ADICIONAR_TAGS.
+        
+        Returns:
+            Mapa regra_id → lista de tag_ids
+        """
+        ids = [m.id for m in models if m.tipo_acao == TipoAcao.ADICIONAR_TAGS.name]
+        if not ids:
+            return {}
+        
+        query = select(RegraTagModel.regra_id, RegraTagModel.tag_id).where(
+            RegraTagModel.regra_id.in_(ids)
+        )
+        tag_ids_por_regra: Dict[int, List[int]] = {}
+        for regra_id, tag_id in self._session.exec(query).all():
+            tag_ids_por_regra.setdefault(regra_id, []).append(tag_id)
+        return tag_ids_por_regra
+    
+    @staticmethod
+    def _copiar(regra: Regra) -> Regra:
+        """Cópia independente de uma regra (o cache nunca é exposto diretamente)"""
+        return replace(regra, tag_ids=list(regra.tag_ids))
+    
+    def _to_entity(self, model: RegraModel, tag_ids: Optional[List[int]] = None) -> Regra:
+        """
+        Converte SQLModel → Entidade de Domínio
+        
+        Args:
+            model: Model a converter
+            tag_ids: tag_ids já carregados (ver _carregar_tag_ids). Se None,
+                     são buscados individualmente para regras ADICIONAR_TAGS.
+        """
+        if tag_ids is None:
+            tag_ids = self._carregar_tag_ids([model]).get(model.id, [])
         
         return Regra(
             id=model.id,
@@ -4,10 +4,12 @@ Implementação concreta do repositório de Tags usando SQLModel
 from typing import List, Optional
 
 from sqlmodel import Session, select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.domain.entities.tag import Tag
-from app.domain.repositories.tag_repository import ITagRepository
+from app.domain.repositories.tag_repository import ITagRepository, ITagRepositoryAsync
 from app.infrastructure.database.models.tag_model import TagModel
+from app.infrastructure.database.repositories.regra_repository import invalidar_cache_regras_ativas
 
 
 class TagRepository(ITagRepository):
@@ -81,13 +83,14 @@ class TagRepository(ITagRepository):
         return self._to_entity(model)
     
     def deletar(self, id: int) -> bool:
-        """Deleta tag"""
+        """Deleta tag (associações com regras são removidas em cascata)"""
         model = self._session.get(TagModel, id)
         if not model:
             return False
         
         self._session.delete(model)
         self._session.commit()
+        invalidar_cache_regras_ativas()
         return True
     
     def nome_existe(self, nome: str, excluir_id: Optional[int] = None) -> bool:
@@ -132,3 +135,29 @@ class TagRepository(ITagRepository):
             criado_em=entity.criado_em,
             atualizado_em=entity.atualizado_em
         )
+
+
+class TagRepositoryAsync(ITagRepositoryAsync):
+    """
+    Implementação async das leituras de tags (rotas GET).
+    """
+    
+    _to_entity = TagRepository._to_entity
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def listar(self) -> List[Tag]:
+        """Lista todas as tags ordenadas por nome"""
+        query = select(TagModel).order_by(TagModel.nome)
+        models = (await self._session.exec(query)).all()
+        return [self._to_entity(m) for m in models]
+    
+    async def listar_por_ids(self, ids: List[int]) -> List[Tag]:
+        """Lista tags por múltiplos IDs"""
+        if not ids:
+            return []
+        
+        query = select(TagModel).where(TagModel.id.in_(ids))
+        models = (await self._session.exec(query)).all()
+        return [self._to_entity(model) for model in models]
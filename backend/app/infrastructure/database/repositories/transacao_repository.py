@@ -1,15 +1,19 @@
 """
 Implementação concreta do repositório de Transações usando SQLModel
 """
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from sqlalchemy import DateTime, delete, insert, literal, true, update
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, func, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.domain.entities.transacao import Transacao
-from app.domain.repositories.transacao_repository import ITransacaoRepository
+from app.domain.repositories.transacao_repository import ITransacaoRepository, ITransacaoRepositoryAsync
+from app.domain.value_objects.selecao_transacoes import SelecaoTransacoes
 from app.domain.value_objects.tipo_transacao import TipoTransacao
-from app.infrastructure.database.models.tag_model import TransacaoTagModel
+from app.infrastructure.database.models.tag_model import TagModel, TransacaoTagModel
 from app.infrastructure.database.models.transacao_model import TransacaoModel
 
 
@@ -64,9 +68,42 @@ class TransacaoRepository(ITransacaoRepository):
         criterio_data: str = "data_transacao",
         usuario_id: Optional[int] = None
     ) -> List[Transacao]:
-        """Lista transações com filtros"""
-        query = select(TransacaoModel)
-        
+        """Lista transações com filtros (tags carregadas em uma consulta extra, sem N+1)"""
+        query = self._aplicar_filtros(
+            select(TransacaoModel).options(selectinload(TransacaoModel.tags)),
+            mes=mes,
+            ano=ano,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+            categoria=categoria,
+            tipo=tipo,
+            tag_ids=tag_ids,
+            sem_tags=sem_tags,
+            sem_categoria=sem_categoria,
+            criterio_data=criterio_data,
+            usuario_id=usuario_id
+        )
+        # Ordena por data DESC
+        query = query.order_by(TransacaoModel.data.desc())
+        models = self._session.exec(query).all()
+        return [self._to_entity(m) for m in models]
+    
+    def _aplicar_filtros(
+        self,
+        query,
+        mes: Optional[int] = None,
+        ano: Optional[int] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        categoria: Optional[str] = None,
+        tipo: Optional[TipoTransacao] = None,
+        tag_ids: Optional[List[int]] = None,
+        sem_tags: bool = False,
+        sem_categoria: bool = False,
+        criterio_data: str = "data_transacao",
+        usuario_id: Optional[int] = None
+    ):
+        """Aplica os filtros de listagem em uma query sobre TransacaoModel"""
         # Filtro de período
         if data_inicio and data_fim:
             query = self._aplicar_filtro_data(query, data_inicio, data_fim, criterio_data)
@@ -86,7 +123,8 @@ class TransacaoRepository(ITransacaoRepository):
         
         # Filtro de tipo
         if tipo:
-            query = query.where(TransacaoModel.tipo == tipo.name)  # UPPERCASE
+            # UPPERCASE; o bind usa o tipo ENUM da coluna (asyncpg não converte VARCHAR)
+            query = query.where(TransacaoModel.tipo == tipo.name)
         
         # Filtro de tags (OR lógico)
         if tag_ids or sem_tags:
@@ -104,10 +142,33 @@ class TransacaoRepository(ITransacaoRepository):
         # Filtro por usuário
         if usuario_id is not None:
             query = query.where(TransacaoModel.usuario_id == usuario_id)
-        # Ordena por data DESC
-        query = query.order_by(TransacaoModel.data.desc())
-        models = self._session.exec(query).all()
-        return [self._to_entity(m) for m in models]
+        return query
+    
+    def _selecionar_ids(self, selecao: SelecaoTransacoes):
+        """
+        Subquery com os IDs das transações de uma seleção.
+        
+        Não correlacionada: pode ser usada em UPDATE/DELETE/INSERT ... SELECT
+        sobre as próprias tabelas transacao e transacaotag.
+        """
+        query = select(TransacaoModel.id)
+        if selecao.ids is not None:
+            query = query.where(TransacaoModel.id.in_(selecao.ids))
+        query = self._aplicar_filtros(
+            query,
+            mes=selecao.mes,
+            ano=selecao.ano,
+            data_inicio=selecao.data_inicio,
+            data_fim=selecao.data_fim,
+            categoria=selecao.categoria,
+            tipo=selecao.tipo,
+            tag_ids=selecao.tag_ids,
+            sem_tags=selecao.sem_tags,
+            sem_categoria=selecao.sem_categoria,
+            criterio_data=selecao.criterio_data,
+            usuario_id=selecao.usuario_id
+        )
+        return query.correlate(None)
     
     def atualizar(self, transacao: Transacao) -> Transacao:
         """Atualiza transação existente"""
@@ -132,17 +193,8 @@ class TransacaoRepository(ITransacaoRepository):
         model.atualizado_em = transacao.atualizado_em
         model.usuario_id = transacao.usuario_id
         
-        # Atualiza tags (remove antigas e adiciona novas)
-        # Remove tags existentes
-        stmt = select(TransacaoTagModel).where(TransacaoTagModel.transacao_id == transacao.id)
-        existing_tags = self._session.exec(stmt).all()
-        for tag_rel in existing_tags:
-            self._session.delete(tag_rel)
-        
-        # Adiciona novas tags
-        for tag_id in transacao.tag_ids:
-            tag_rel = TransacaoTagModel(transacao_id=transacao.id, tag_id=tag_id)
-            self._session.add(tag_rel)
+        # Sincroniza tags por diferença (sem escrita quando o conjunto não mudou)
+        self._sincronizar_tags(transacao.id, transacao.tag_ids)
         
         self._session.commit()
         self._session.refresh(model)
@@ -202,6 +254,44 @@ class TransacaoRepository(ITransacaoRepository):
                 TransacaoModel.data <= data_fim
             )
     
+    def listar_chaves_importacao(
+        self,
+        usuario_id: int,
+        data_inicio: date,
+        data_fim: date,
+        excluir_lote_id: Optional[int] = None
+    ) -> Set[Tuple[date, str, float, TipoTransacao, str]]:
+        """Chaves de deduplicação do período (uma consulta, só as colunas da chave)"""
+        query = select(
+            TransacaoModel.data,
+            TransacaoModel.descricao,
+            TransacaoModel.valor_original,
+            TransacaoModel.tipo,
+            TransacaoModel.origem
+        ).where(
+            TransacaoModel.usuario_id == usuario_id,
+            TransacaoModel.data >= data_inicio,
+            TransacaoModel.data <= data_fim
+        )
+        if excluir_lote_id is not None:
+            query = query.where(or_(
+                TransacaoModel.lote_importacao_id.is_(None),
+                TransacaoModel.lote_importacao_id != excluir_lote_id
+            ))
+        return {
+            (data, descricao, valor_original, TipoTransacao[tipo], origem)
+            for data, descricao, valor_original, tipo, origem in self._session.exec(query).all()
+        }
+    
+    def listar_ids_por_lote(self, lote_importacao_id: int) -> List[int]:
+        """Lista IDs das transações do lote (só a coluna id, ordem de criação)"""
+        query = (
+            select(TransacaoModel.id)
+            .where(TransacaoModel.lote_importacao_id == lote_importacao_id)
+            .order_by(TransacaoModel.id)
+        )
+        return list(self._session.exec(query).all())
+    
     def listar_categorias(self) -> List[str]:
         """Lista todas as categorias únicas"""
         query = select(TransacaoModel.categoria).distinct()
@@ -216,7 +306,6 @@ class TransacaoRepository(ITransacaoRepository):
         
         # Restaurar valor
         model.valor = model.valor_original
-        from datetime import datetime
         model.atualizado_em = datetime.now()
         
         self._session.add(model)
@@ -245,7 +334,6 @@ class TransacaoRepository(ITransacaoRepository):
         # Atualiza timestamp da transação
         transacao = self._session.get(TransacaoModel, transacao_id)
         if transacao:
-            from datetime import datetime
             transacao.atualizado_em = datetime.now()
             self._session.add(transacao)
         
@@ -270,12 +358,118 @@ class TransacaoRepository(ITransacaoRepository):
         # Atualiza timestamp da transação
         transacao = self._session.get(TransacaoModel, transacao_id)
         if transacao:
-            from datetime import datetime
             transacao.atualizado_em = datetime.now()
             self._session.add(transacao)
         
         self._session.commit()
     
+    def atualizar_campos_em_lote(self, selecao: SelecaoTransacoes, campos: Dict[str, Any]) -> int:
+        """Aplica os mesmos valores de campos a todas as transações de uma seleção (um único UPDATE)"""
+        resultado = self._session.exec(
+            update(TransacaoModel)
+            .where(TransacaoModel.id.in_(self._selecionar_ids(selecao)))
+            .values(**campos, atualizado_em=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        self._session.commit()
+        return resultado.rowcount
+    
+    def atualizar_tags_em_lote(
+        self,
+        selecao: SelecaoTransacoes,
+        adicionar_tag_ids: List[int],
+        remover_tag_ids: List[int]
+    ) -> int:
+        """
+        Adiciona e remove tags de todas as transações de uma seleção.
+        
+        Executa apenas statements set-based, nesta ordem:
+        1. UPDATE do atualizado_em (antes das tags mudarem, pois filtros
+           por tag dependem do estado atual)
+        2. INSERT ... SELECT ignorando associações já existentes
+        3. DELETE ... WHERE IN
+        """
+        ids_selecionados = self._selecionar_ids(selecao)
+        agora = datetime.now()
+        
+        resultado = self._session.exec(
+            update(TransacaoModel)
+            .where(TransacaoModel.id.in_(ids_selecionados))
+            .values(atualizado_em=agora)
+            .execution_options(synchronize_session=False)
+        )
+        total_afetado = resultado.rowcount
+        
+        if adicionar_tag_ids:
+            ja_associada = (
+                select(TransacaoTagModel.transacao_id)
+                .where(
+                    TransacaoTagModel.transacao_id == TransacaoModel.id,
+                    TransacaoTagModel.tag_id == TagModel.id
+                )
+                .exists()
+            )
+            origem = (
+                select(TransacaoModel.id, TagModel.id, literal(agora, DateTime))
+                .select_from(TransacaoModel)
+                .join(TagModel, true())
+                .where(
+                    TransacaoModel.id.in_(ids_selecionados),
+                    TagModel.id.in_(adicionar_tag_ids),
+                    ~ja_associada
+                )
+            )
+            self._session.exec(
+                insert(TransacaoTagModel).from_select(["transacao_id", "tag_id", "criado_em"], origem)
+            )
+        
+        if remover_tag_ids:
+            self._session.exec(
+                delete(TransacaoTagModel)
+                .where(
+                    TransacaoTagModel.transacao_id.in_(ids_selecionados),
+                    TransacaoTagModel.tag_id.in_(remover_tag_ids)
+                )
+                .execution_options(synchronize_session=False)
+            )
+        
+        self._session.commit()
+        return total_afetado
+    
+    def _sincronizar_tags(self, transacao_id: int, tag_ids: List[int]) -> None:
+        """
+        Sincroniza associações de tags de uma transação por diferença de conjuntos.
+        
+        Emite no máximo um DELETE e um INSERT em lote; nenhum se o
+        conjunto de tags não mudou. Não faz commit.
+        """
+        stmt = select(TransacaoTagModel.tag_id).where(TransacaoTagModel.transacao_id == transacao_id)
+        atuais = set(self._session.exec(stmt).all())
+        novas = set(tag_ids)
+        
+        remover = atuais - novas
+        adicionar = novas - atuais
+        
+        if remover:
+            self._session.exec(
+                delete(TransacaoTagModel)
+                .where(
+                    TransacaoTagModel.transacao_id == transacao_id,
+                    TransacaoTagModel.tag_id.in_(remover)
+                )
+                .execution_options(synchronize_session=False)
+            )
+        
+        if adicionar:
+            agora = datetime.now()
+            self._session.exec(
+                insert(TransacaoTagModel),
+                params=[
+                    {"transacao_id": transacao_id, "tag_id": tag_id, "criado_em": agora}
+                    for tag_id in adicionar
+                ]
+            )
+    
     def _to_entity(self, model: TransacaoModel) -> Transacao:
         """Converte SQLModel → Entidade de Domínio"""
         # Busca IDs de tags
@@ -296,7 +490,8 @@ class TransacaoRepository(ITransacaoRepository):
             criado_em=model.criado_em,
             atualizado_em=model.atualizado_em,
             tag_ids=tag_ids,
-            usuario_id=model.usuario_id
+            usuario_id=model.usuario_id,
+            lote_importacao_id=model.lote_importacao_id
         )
     
     def _to_model(self, entity: Transacao) -> TransacaoModel:
@@ -315,5 +510,62 @@ class TransacaoRepository(ITransacaoRepository):
             data_fatura=entity.data_fatura,
             criado_em=entity.criado_em,
             atualizado_em=entity.atualizado_em,
-            usuario_id=entity.usuario_id
+            usuario_id=entity.usuario_id,
+            lote_importacao_id=entity.lote_importacao_id
+        )
+
+
+class TransacaoRepositoryAsync(ITransacaoRepositoryAsync):
+    """
+    Implementação async das leituras de transações (rotas GET).
+    
+    Reaproveita filtros e conversões de TransacaoRepository; as tags são
+    carregadas com selectinload, já que lazy loading não é permitido em
+    sessões async.
+    """
+    
+    _aplicar_filtros = TransacaoRepository._aplicar_filtros
+    _aplicar_filtro_data = TransacaoRepository._aplicar_filtro_data
+    _to_entity = TransacaoRepository._to_entity
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def listar(
+        self,
+        mes: Optional[int] = None,
+        ano: Optional[int] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        categoria: Optional[str] = None,
+        tipo: Optional[TipoTransacao] = None,
+        tag_ids: Optional[List[int]] = None,
+        sem_tags: bool = False,
+        sem_categoria: bool = False,
+        criterio_data: str = "data_transacao",
+        usuario_id: Optional[int] = None
+    ) -> List[Transacao]:
+        """Lista transações com filtros"""
+        query = self._aplicar_filtros(
+            select(TransacaoModel).options(selectinload(TransacaoModel.tags)),
+            mes=mes,
+            ano=ano,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+            categoria=categoria,
+            tipo=tipo,
+            tag_ids=tag_ids,
+            sem_tags=sem_tags,
+            sem_categoria=sem_categoria,
+            criterio_data=criterio_data,
+            usuario_id=usuario_id
         )
+        query = query.order_by(TransacaoModel.data.desc())
+        models = (await self._session.exec(query)).all()
+        return [self._to_entity(m) for m in models]
+    
+    async def listar_categorias(self) -> List[str]:
+        """Lista todas as categorias únicas"""
+        query = select(TransacaoModel.categoria).distinct()
+        categorias = (await self._session.exec(query)).all()
+        return list(categorias)
@@ -4,9 +4,10 @@ Implementação concreta do repositório de Usuarios usando SQLModel
 from typing import List, Optional
 
 from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.domain.entities.usuario import Usuario
-from app.domain.repositories.usuario_repository import IUsuarioRepository
+from app.domain.repositories.usuario_repository import IUsuarioRepository, IUsuarioRepositoryAsync
 from app.infrastructure.database.models.usuario_model import UsuarioModel
 
 
@@ -108,6 +109,15 @@ class UsuarioRepository(IUsuarioRepository):
         count = self._session.exec(query).one()
         return count > 0
     
+    def listar_por_ids(self, ids: List[int]) -> List[Usuario]:
+        """Lista usuários por múltiplos IDs"""
+        if not ids:
+            return []
+        
+        query = select(UsuarioModel).where(UsuarioModel.id.in_(ids))
+        models = self._session.exec(query).all()
+        return [self._to_entity(model) for model in models]
+    
     def _to_entity(self, model: UsuarioModel) -> Usuario:
         """Converte SQLModel → Entidade de Domínio"""
         return Usuario(
@@ -127,3 +137,23 @@ class UsuarioRepository(IUsuarioRepository):
             criado_em=entity.criado_em,
             atualizado_em=entity.atualizado_em
         )
+
+
+class UsuarioRepositoryAsync(IUsuarioRepositoryAsync):
+    """
+    Implementação async das leituras de usuários (rotas GET).
+    """
+    
+    _to_entity = UsuarioRepository._to_entity
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def listar_por_ids(self, ids: List[int]) -> List[Usuario]:
+        """Lista usuários por múltiplos IDs"""
+        if not ids:
+            return []
+        
+        query = select(UsuarioModel).where(UsuarioModel.id.in_(ids))
+        models = (await self._session.exec(query)).all()
+        return [self._to_entity(model) for model in models]
@@ -0,0 +1,55 @@
+"""
+Roteamento de leituras para a réplica - Camada de Infraestrutura
+
+Com DATABASE_READ_URL definida, as sessões de leitura vão para a réplica.
+Um cliente que acabou de escrever continua lendo do primário durante uma
+janela curta, para enxergar as próprias escritas apesar do atraso de
+replicação (read-your-writes).
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from app.infrastructure.config import get_settings
+
+
+class RegistroEscritas:
+    """
+    Momento da última escrita de cada cliente (thread-safe, em memória do processo).
+    Entradas expiradas são descartadas ao registrar novas escritas.
+    """
+
+    def __init__(self, janela_segundos: float, relogio: Callable[[], float] = time.monotonic):
+        self._janela = janela_segundos
+        self._relogio = relogio
+        self._lock = threading.Lock()
+        self._ultima_escrita: Dict[str, float] = {}
+
+    def registrar_escrita(self, cliente: str) -> None:
+        agora = self._relogio()
+        with self._lock:
+            expirados = [c for c, momento in self._ultima_escrita.items() if agora - momento >= self._janela]
+            for c in expirados:
+                del self._ultima_escrita[c]
+            self._ultima_escrita[cliente] = agora
+
+    def escreveu_recentemente(self, cliente: str) -> bool:
+        with self._lock:
+            momento = self._ultima_escrita.get(cliente)
+        return momento is not None and self._relogio() - momento < self._janela
+
+
+_registro: Optional[RegistroEscritas] = None
+
+
+def get_registro_escritas() -> RegistroEscritas:
+    """Singleton lazy do registro de escritas (janela em LEITURA_PRIMARIO_APOS_ESCRITA_SEGUNDOS)"""
+    global _registro
+    if _registro is None:
+        _registro = RegistroEscritas(get_settings().LEITURA_PRIMARIO_APOS_ESCRITA_SEGUNDOS)
+    return _registro
+
+
+def usar_replica(cliente: str) -> bool:
+    """Leituras do cliente devem ir para a réplica?"""
+    return bool(get_settings().DATABASE_READ_URL) and not get_registro_escritas().escreveu_recentemente(cliente)
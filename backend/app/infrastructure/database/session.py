@@ -1,10 +1,27 @@
 """
 Gerenciamento de Sessões - Camada de Infraestrutura
 """
-from typing import Generator
+from typing import AsyncGenerator, Generator
+
+from fastapi import Depends, Request
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.infrastructure.database.engine import (
+    get_async_engine,
+    get_async_read_engine,
+    get_engine,
+    get_read_engine,
+)
+from app.infrastructure.database.roteamento_leitura import usar_replica
 
-from app.infrastructure.database.engine import get_engine
+
+def identificar_cliente(request: Request) -> str:
+    """Identifica o cliente para a janela de leitura após escrita (X-Client-Id ou IP)"""
+    cliente = request.headers.get("X-Client-Id")
+    if cliente:
+        return cliente
+    return request.client.host if request.client else "desconhecido"
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -17,3 +34,37 @@ def get_session() -> Generator[Session, None, None]:
     engine = get_engine()  # Lazy initialization - só cria quando necessário
     with Session(engine) as session:
         yield session
+
+
+def get_read_session(
+    request: Request,
+    sessao_principal: Session = Depends(get_session),
+) -> Generator[Session, None, None]:
+    """
+    Dependency que fornece sessão somente leitura.
+    
+    Usa a réplica (DATABASE_READ_URL) quando configurada, exceto para
+    clientes que escreveram há pouco; nesses casos, e sem réplica, usa a
+    sessão principal.
+    """
+    if not usar_replica(identificar_cliente(request)):
+        yield sessao_principal
+        return
+    with Session(get_read_engine()) as session:
+        yield session
+
+
+async def get_async_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency que fornece uma sessão SQLModel async (somente leitura).
+    
+    Usada pelas rotas GET de maior tráfego para não ocupar threads do
+    threadpool enquanto aguardam o banco. Segue o mesmo roteamento de
+    get_read_session (réplica, salvo logo após escrita do cliente).
+    """
+    if usar_replica(identificar_cliente(request)):
+        engine = get_async_read_engine()
+    else:
+        engine = get_async_engine()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
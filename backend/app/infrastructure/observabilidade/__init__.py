@@ -0,0 +1,3 @@
+"""
+Observabilidade da aplicação (métricas e perfilamento de requisições)
+"""
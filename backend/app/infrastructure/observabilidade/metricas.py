@@ -0,0 +1,130 @@
+"""
+Métricas da aplicação expostas em /metrics
+
+Separam onde o tempo é gasto sob carga real: latência por rota (HTTP),
+vazão de importação por parser, duração da aplicação retroativa de regras
+e estado dos pools de conexão do banco.
+"""
+from typing import Dict, Union
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.database.engine import (
+    get_async_engine,
+    get_async_read_engine,
+    get_engine,
+    get_read_engine,
+)
+from app.infrastructure.database.pool import obter_estatisticas_pool
+from app.infrastructure.observabilidade.prometheus import RegistroMetricas
+
+# Operações longas (importação, retroativas) passam de segundos para minutos
+BUCKETS_OPERACOES_LONGAS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+registro = RegistroMetricas()
+
+requisicoes_duracao = registro.histograma(
+    "http_requisicao_duracao_segundos",
+    "Latência das requisições HTTP por rota (template) e status",
+    rotulos=("metodo", "rota", "status"),
+)
+requisicoes_em_andamento = registro.gauge(
+    "http_requisicoes_em_andamento",
+    "Requisições HTTP sendo processadas no momento",
+)
+importacao_linhas = registro.contador(
+    "importacao_linhas_total",
+    "Linhas de arquivo processadas pela importação, por parser",
+    rotulos=("parser_id",),
+)
+importacao_duracao = registro.histograma(
+    "importacao_duracao_segundos",
+    "Duração da importação de um arquivo (parse + gravação), por parser",
+    rotulos=("parser_id",),
+    buckets=BUCKETS_OPERACOES_LONGAS,
+)
+importacao_vazao = registro.gauge(
+    "importacao_linhas_por_segundo",
+    "Vazão (linhas/s) da última importação de cada parser",
+    rotulos=("parser_id",),
+)
+retroativas_duracao = registro.histograma(
+    "regras_retroativas_duracao_segundos",
+    "Duração da aplicação retroativa de regras (escopo: regra ou todas)",
+    rotulos=("escopo",),
+    buckets=BUCKETS_OPERACOES_LONGAS,
+)
+retroativas_transacoes = registro.contador(
+    "regras_retroativas_transacoes_total",
+    "Transações avaliadas pela aplicação retroativa de regras",
+    rotulos=("escopo",),
+)
+pool_conexoes = registro.gauge(
+    "db_pool_conexoes",
+    "Conexões do pool por estado (em_uso, ociosas, overflow)",
+    rotulos=("engine", "estado"),
+)
+pool_tamanho = registro.gauge(
+    "db_pool_tamanho",
+    "Tamanho configurado do pool",
+    rotulos=("engine",),
+)
+pool_espera_media = registro.gauge(
+    "db_pool_espera_media_segundos",
+    "Espera média por uma conexão do pool",
+    rotulos=("engine",),
+)
+pool_espera_max = registro.gauge(
+    "db_pool_espera_max_segundos",
+    "Maior espera por uma conexão do pool",
+    rotulos=("engine",),
+)
+pool_timeouts = registro.gauge(
+    "db_pool_timeouts",
+    "Checkouts que expiraram esperando conexão desde o início do processo",
+    rotulos=("engine",),
+)
+
+
+def registrar_importacao(parser_id: str, total_linhas: int, duracao_s: float) -> None:
+    """Registra um arquivo importado (linhas lidas e duração total)"""
+    importacao_linhas.inc(total_linhas, parser_id=parser_id)
+    importacao_duracao.observar(duracao_s, parser_id=parser_id)
+    if duracao_s > 0:
+        importacao_vazao.set(total_linhas / duracao_s, parser_id=parser_id)
+
+
+def registrar_retroativa(escopo: str, total_processado: int, duracao_s: float) -> None:
+    """Registra uma aplicação retroativa de regras"""
+    retroativas_duracao.observar(duracao_s, escopo=escopo)
+    retroativas_transacoes.inc(total_processado, escopo=escopo)
+
+
+def _engines() -> Dict[str, Union[Engine, AsyncEngine]]:
+    engines: Dict[str, Union[Engine, AsyncEngine]] = {
+        "sincrono": get_engine(),
+        "assincrono": get_async_engine(),
+    }
+    if get_settings().DATABASE_READ_URL:
+        engines["replica_sincrono"] = get_read_engine()
+        engines["replica_assincrono"] = get_async_read_engine()
+    return engines
+
+
+def _coletar_pools() -> None:
+    """Atualiza os gauges de pool a partir do estado atual de cada engine"""
+    for nome, engine in _engines().items():
+        estatisticas = obter_estatisticas_pool(engine)
+        if "tamanho" in estatisticas:
+            pool_tamanho.set(estatisticas["tamanho"], engine=nome)
+            for estado in ("em_uso", "ociosas", "overflow"):
+                pool_conexoes.set(estatisticas[estado], engine=nome, estado=estado)
+        if "total_checkouts" in estatisticas:
+            pool_espera_media.set(estatisticas["espera_media_ms"] / 1000, engine=nome)
+            pool_espera_max.set(estatisticas["espera_max_ms"] / 1000, engine=nome)
+            pool_timeouts.set(estatisticas["total_timeouts"], engine=nome)
+
+
+registro.adicionar_coletor(_coletar_pools)
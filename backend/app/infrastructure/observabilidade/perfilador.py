@@ -0,0 +1,184 @@
+"""
+Perfilador por amostragem de requisições individuais
+
+Uma thread amostra periodicamente as pilhas (sys._current_frames) das
+threads que servem a requisição enquanto ela executa: o event loop, onde
+rodam middlewares e rotas async, e as threads do threadpool registradas
+pela própria requisição (registrar_thread_atual, chamada por uma
+dependência das rotas síncronas). As demais requisições concorrentes não
+entram no perfil. Threads ociosas (esperando em selectors/threading/queue
+sem código da aplicação na pilha) são descartadas.
+
+O resultado é exportado em "folded stacks" (uma linha `a;b;c N` por pilha),
+formato aceito por flamegraph.pl, speedscope e inferno.
+"""
+import sys
+import threading
+import uuid
+from collections import Counter, OrderedDict
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+
+from app.infrastructure.config import get_settings
+
+PACOTE_APLICACAO = "app."
+# Módulos onde uma thread sem trabalho fica bloqueada
+MODULOS_OCIOSOS = {"selectors", "threading", "queue", "concurrent.futures.thread"}
+
+
+@dataclass
+class PerfilRequisicao:
+    """Amostras de pilha coletadas durante uma requisição"""
+    metodo: str
+    caminho: str
+    duracao_ms: float
+    intervalo_ms: float
+    pilhas: Dict[str, int]
+    threads: List[str] = field(default_factory=list)  # Threads amostradas ("nome (ident)")
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    criado_em: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def total_amostras(self) -> int:
+        return sum(self.pilhas.values())
+
+    def como_folded(self) -> str:
+        """Pilhas no formato folded (mais amostradas primeiro)"""
+        linhas = sorted(self.pilhas.items(), key=lambda item: (-item[1], item[0]))
+        return "".join(f"{pilha} {amostras}\n" for pilha, amostras in linhas)
+
+
+_threads_requisicao: ContextVar[Optional[Set[int]]] = ContextVar("threads_perfiladas", default=None)
+
+
+def iniciar_registro_threads() -> Token:
+    """
+    Abre o conjunto de threads da requisição no contexto atual, já com a
+    thread chamadora (o event loop, quando chamado pelo middleware).
+    
+    O contexto é copiado para o threadpool, então registrar_thread_atual()
+    chamada lá alimenta o mesmo conjunto.
+    """
+    return _threads_requisicao.set({threading.get_ident()})
+
+
+def threads_registradas() -> Optional[Set[int]]:
+    return _threads_requisicao.get()
+
+
+def encerrar_registro_threads(token: Token) -> None:
+    _threads_requisicao.reset(token)
+
+
+def registrar_thread_atual() -> None:
+    """Inclui a thread atual no perfil da requisição em andamento (se houver)"""
+    threads = _threads_requisicao.get()
+    if threads is not None:
+        threads.add(threading.get_ident())
+
+
+def _nome_frame(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}"
+
+
+def _pilha_ociosa(frames: List) -> bool:
+    """Folha bloqueada em espera e nenhum código da aplicação na pilha"""
+    folha = frames[-1]
+    if folha.f_globals.get("__name__") not in MODULOS_OCIOSOS:
+        return False
+    return not any(f.f_globals.get("__name__", "").startswith(PACOTE_APLICACAO) for f in frames)
+
+
+class PerfiladorAmostragem:
+    """
+    Amostrador de pilhas de um conjunto de threads.
+
+    `threads` é lido a cada amostra: threads registradas durante a
+    requisição passam a ser amostradas a partir daí. Sem `threads`,
+    amostra todas as threads do processo.
+
+    Uso:
+        perfilador = PerfiladorAmostragem(intervalo_s=0.002, threads=threads_registradas())
+        perfilador.iniciar()
+        ...
+        pilhas = perfilador.parar()  # {"MainThread;mod.f;mod.g": 12, ...}
+        perfilador.threads_amostradas  # ["AnyIO worker thread (1401)", "MainThread (1399)"]
+    """
+
+    def __init__(self, intervalo_s: float, threads: Optional[Set[int]] = None):
+        self._intervalo_s = intervalo_s
+        self._threads = threads
+        self._amostras: Counter = Counter()
+        self._nomes_amostrados: Dict[int, str] = {}
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def threads_amostradas(self) -> List[str]:
+        """Threads com ao menos uma pilha registrada (workers do threadpool têm o mesmo nome)"""
+        return sorted(f"{nome} ({ident})" for ident, nome in self._nomes_amostrados.items())
+
+    def iniciar(self) -> None:
+        self._thread = threading.Thread(target=self._executar, name="perfilador", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> Dict[str, int]:
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+        return dict(self._amostras)
+
+    def _executar(self) -> None:
+        while not self._parar.wait(self._intervalo_s):
+            self.amostrar()
+
+    def amostrar(self) -> None:
+        """Registra a pilha atual de cada thread acompanhada (exceto a do perfilador)"""
+        nomes = {thread.ident: thread.name for thread in threading.enumerate()}
+        proprio = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == proprio or (self._threads is not None and ident not in self._threads):
+                continue
+            frames = []
+            while frame is not None:
+                frames.append(frame)
+                frame = frame.f_back
+            frames.reverse()
+            if not frames or _pilha_ociosa(frames):
+                continue
+            nome = nomes.get(ident, str(ident))
+            self._nomes_amostrados[ident] = nome
+            pilha = ";".join([nome] + [_nome_frame(f) for f in frames])
+            self._amostras[pilha] += 1
+
+
+class ArmazemPerfis:
+    """Últimos N perfis por id (thread-safe, em memória do processo)"""
+
+    def __init__(self, capacidade: int):
+        self._capacidade = capacidade
+        self._lock = threading.Lock()
+        self._perfis: "OrderedDict[str, PerfilRequisicao]" = OrderedDict()
+
+    def guardar(self, perfil: PerfilRequisicao) -> None:
+        with self._lock:
+            self._perfis[perfil.id] = perfil
+            while len(self._perfis) > self._capacidade:
+                self._perfis.popitem(last=False)
+
+    def obter(self, perfil_id: str) -> Optional[PerfilRequisicao]:
+        with self._lock:
+            return self._perfis.get(perfil_id)
+
+
+_armazem: Optional[ArmazemPerfis] = None
+
+
+def get_armazem_perfis() -> ArmazemPerfis:
+    """Singleton lazy do armazém (capacidade em PERFILAMENTO_MAX_PERFIS)"""
+    global _armazem
+    if _armazem is None:
+        _armazem = ArmazemPerfis(get_settings().PERFILAMENTO_MAX_PERFIS)
+    return _armazem
@@ -0,0 +1,205 @@
+"""
+Métricas no formato de exposição texto do Prometheus (0.0.4)
+
+Implementação mínima, sem dependências, de contadores, gauges e
+histogramas com rótulos, mantidos em memória do processo.
+"""
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+TIPO_CONTEUDO = "text/plain; version=0.0.4; charset=utf-8"
+
+# Buckets padrão de latência (segundos)
+BUCKETS_LATENCIA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Rotulos = Tuple[Tuple[str, str], ...]
+
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _formatar_rotulos(rotulos: Rotulos) -> str:
+    if not rotulos:
+        return ""
+    return "{" + ",".join(f'{nome}="{_escapar(valor)}"' for nome, valor in rotulos) + "}"
+
+
+def _formatar_valor(valor: float) -> str:
+    if math.isinf(valor):
+        return "+Inf" if valor > 0 else "-Inf"
+    if float(valor).is_integer():
+        return str(int(valor))
+    return repr(float(valor))
+
+
+class _Metrica:
+    """Base: nome, ajuda, nomes de rótulos e lock"""
+    tipo = ""
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.nomes_rotulos = tuple(rotulos)
+        self._lock = threading.Lock()
+
+    def _chave(self, rotulos: Dict[str, object]) -> Rotulos:
+        if set(rotulos) != set(self.nomes_rotulos):
+            raise ValueError(f"Rótulos de {self.nome} devem ser {self.nomes_rotulos}, recebido {tuple(rotulos)}")
+        return tuple((nome, str(rotulos[nome])) for nome in self.nomes_rotulos)
+
+    def _amostras(self) -> Iterable[Tuple[str, Rotulos, float]]:
+        raise NotImplementedError
+
+    def exportar(self) -> List[str]:
+        linhas = [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} {self.tipo}"]
+        for nome, rotulos, valor in self._amostras():
+            linhas.append(f"{nome}{_formatar_rotulos(rotulos)} {_formatar_valor(valor)}")
+        return linhas
+
+
+class Contador(_Metrica):
+    """Valor que só cresce (ex: total de linhas importadas)"""
+    tipo = "counter"
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()):
+        super().__init__(nome, ajuda, rotulos)
+        self._valores: Dict[Rotulos, float] = {}
+
+    def inc(self, valor: float = 1, **rotulos) -> None:
+        if valor < 0:
+            raise ValueError("Contador não pode decrescer")
+        chave = self._chave(rotulos)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0.0) + valor
+
+    def valor(self, **rotulos) -> float:
+        with self._lock:
+            return self._valores.get(self._chave(rotulos), 0.0)
+
+    def _amostras(self):
+        with self._lock:
+            itens = sorted(self._valores.items())
+        for chave, valor in itens:
+            yield self.nome, chave, valor
+
+
+class Gauge(_Metrica):
+    """Valor que sobe e desce (ex: requisições em andamento)"""
+    tipo = "gauge"
+
+    def __init__(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()):
+        super().__init__(nome, ajuda, rotulos)
+        self._valores: Dict[Rotulos, float] = {}
+
+    def inc(self, valor: float = 1, **rotulos) -> None:
+        chave = self._chave(rotulos)
+        with self._lock:
+            self._valores[chave] = self._valores.get(chave, 0.0) + valor
+
+    def dec(self, valor: float = 1, **rotulos) -> None:
+        self.inc(-valor, **rotulos)
+
+    def set(self, valor: float, **rotulos) -> None:
+        chave = self._chave(rotulos)
+        with self._lock:
+            self._valores[chave] = valor
+
+    def valor(self, **rotulos) -> float:
+        with self._lock:
+            return self._valores.get(self._chave(rotulos), 0.0)
+
+    def _amostras(self):
+        with self._lock:
+            itens = sorted(self._valores.items())
+        for chave, valor in itens:
+            yield self.nome, chave, valor
+
+
+class Histograma(_Metrica):
+    """Distribuição de observações em buckets cumulativos, com soma e contagem"""
+    tipo = "histogram"
+
+    def __init__(
+        self,
+        nome: str,
+        ajuda: str,
+        rotulos: Sequence[str] = (),
+        buckets: Sequence[float] = BUCKETS_LATENCIA
+    ):
+        super().__init__(nome, ajuda, rotulos)
+        self.buckets = tuple(sorted(buckets))
+        # Por combinação de rótulos: contagem por bucket (não cumulativa), soma e total
+        self._series: Dict[Rotulos, Tuple[List[int], List[float]]] = {}
+
+    def observar(self, valor: float, **rotulos) -> None:
+        chave = self._chave(rotulos)
+        with self._lock:
+            contagens, soma = self._series.setdefault(chave, ([0] * (len(self.buckets) + 1), [0.0]))
+            for i, limite in enumerate(self.buckets):
+                if valor <= limite:
+                    contagens[i] += 1
+                    break
+            else:
+                contagens[-1] += 1
+            soma[0] += valor
+
+    def contagem(self, **rotulos) -> int:
+        with self._lock:
+            serie = self._series.get(self._chave(rotulos))
+            return sum(serie[0]) if serie else 0
+
+    def _amostras(self):
+        with self._lock:
+            itens = sorted((chave, (list(contagens), soma[0])) for chave, (contagens, soma) in self._series.items())
+        for chave, (contagens, soma) in itens:
+            acumulado = 0
+            for limite, contagem in zip(self.buckets + (math.inf,), contagens):
+                acumulado += contagem
+                yield f"{self.nome}_bucket", chave + (("le", _formatar_valor(limite)),), acumulado
+            yield f"{self.nome}_sum", chave, soma
+            yield f"{self.nome}_count", chave, acumulado
+
+
+class RegistroMetricas:
+    """
+    Conjunto de métricas exportadas juntas.
+
+    Coletores são chamados a cada exportação para atualizar métricas
+    lidas sob demanda (ex: estado dos pools de conexão).
+    """
+
+    def __init__(self):
+        self._metricas: List[_Metrica] = []
+        self._coletores: List[Callable[[], None]] = []
+
+    def registrar(self, metrica: "_Metrica") -> "_Metrica":
+        self._metricas.append(metrica)
+        return metrica
+
+    def contador(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()) -> Contador:
+        return self.registrar(Contador(nome, ajuda, rotulos))
+
+    def gauge(self, nome: str, ajuda: str, rotulos: Sequence[str] = ()) -> Gauge:
+        return self.registrar(Gauge(nome, ajuda, rotulos))
+
+    def histograma(
+        self,
+        nome: str,
+        ajuda: str,
+        rotulos: Sequence[str] = (),
+        buckets: Optional[Sequence[float]] = None
+    ) -> Histograma:
+        return self.registrar(Histograma(nome, ajuda, rotulos, buckets or BUCKETS_LATENCIA))
+
+    def adicionar_coletor(self, coletor: Callable[[], None]) -> None:
+        self._coletores.append(coletor)
+
+    def exportar(self) -> str:
+        for coletor in self._coletores:
+            coletor()
+        linhas: List[str] = []
+        for metrica in self._metricas:
+            linhas.extend(metrica.exportar())
+        return "\n".join(linhas) + "\n"
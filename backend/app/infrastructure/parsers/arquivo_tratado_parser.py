@@ -5,15 +5,15 @@ Este parser lê arquivos que já estão no formato esperado,
 sem necessidade de transformações complexas.
 """
 from io import BytesIO
-from typing import BinaryIO
+from typing import BinaryIO, Iterator
 
 import pandas as pd
 
 from app.application.exceptions import ValidationException
-from app.domain.parsers.extrato_parser import IExtratoParser
+from app.domain.parsers.extrato_parser import IExtratoParserEmBlocos
 
 
-class ArquivoTratadoParser(IExtratoParser):
+class ArquivoTratadoParser(IExtratoParserEmBlocos):
     """
     Parser para arquivos já normalizados.
     
@@ -21,6 +21,8 @@ class ArquivoTratadoParser(IExtratoParser):
     - CSV ou Excel com colunas obrigatórias: data, descricao, valor, origem
     - Colunas opcionais: categoria, banco, data_fatura
     - Valores já no formato correto (datas, números)
+    
+    CSVs grandes podem ser lidos em blocos com `parse_em_blocos`.
     """
     
     @property
@@ -81,35 +83,7 @@ class ArquivoTratadoParser(IExtratoParser):
                     f"Use {', '.join(self.formatos_suportados)}"
                 )
             
-            # Normalizar nomes de colunas
-            df.columns = df.columns.str.lower().str.strip()
-            
-            # Validar colunas obrigatórias
-            colunas_obrigatorias = ['data', 'descricao', 'valor', 'origem']
-            colunas_faltando = [col for col in colunas_obrigatorias if col not in df.columns]
-            
-            if colunas_faltando:
-                raise ValidationException(
-                    f"Colunas obrigatórias faltando: {', '.join(colunas_faltando)}. "
-                    f"Arquivo tratado deve ter: {', '.join(colunas_obrigatorias)}"
-                )
-            
-            # Converter tipos
-            # Para datas, tentar múltiplos formatos (brasileiro e ISO)
-            df['data'] = pd.to_datetime(df['data'], dayfirst=True, errors='coerce')
-            df['valor'] = pd.to_numeric(df['valor'], errors='coerce')
-            
-            # Converter data_fatura se existir
-            if 'data_fatura' in df.columns:
-                df['data_fatura'] = pd.to_datetime(df['data_fatura'], dayfirst=True, errors='coerce')
-            
-            # Remover linhas inválidas
-            df = df.dropna(subset=['data', 'valor', 'descricao'])
-            
-            # Garantir que origem está em formato correto
-            df['origem'] = df['origem'].str.lower().str.strip()
-            valores_validos = ['fatura_cartao', 'extrato_bancario']
-            df = df[df['origem'].isin(valores_validos)]
+            df = self._validar_e_converter(df)
             
             if df.empty:
                 raise ValidationException(
@@ -126,6 +100,85 @@ class ArquivoTratadoParser(IExtratoParser):
                 f"Erro ao processar arquivo tratado: {str(e)}"
             )
     
+    def parse_em_blocos(
+        self,
+        arquivo: BinaryIO,
+        nome_arquivo: str,
+        tamanho_bloco: int,
+        password: str | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lê CSV em blocos de `tamanho_bloco` linhas, aplicando as mesmas
+        validações e conversões de `parse` a cada bloco.
+        
+        Excel não suporta leitura incremental: é lido de uma vez e
+        devolvido como um único bloco.
+        
+        Raises:
+            ValidationException: Se faltarem colunas obrigatórias ou se
+                nenhum bloco tiver linhas válidas
+        """
+        if self._obter_extensao(nome_arquivo) != '.csv':
+            yield self.parse(arquivo, nome_arquivo, password=password)
+            return
+        
+        fonte = BytesIO(arquivo) if isinstance(arquivo, bytes) else arquivo
+        total_validas = 0
+        
+        try:
+            for bloco in pd.read_csv(fonte, chunksize=tamanho_bloco):
+                bloco = self._validar_e_converter(bloco)
+                if bloco.empty:
+                    continue
+                total_validas += len(bloco)
+                yield bloco
+        except ValidationException:
+            raise
+        except Exception as e:
+            raise ValidationException(
+                f"Erro ao processar arquivo tratado: {str(e)}"
+            )
+        
+        if total_validas == 0:
+            raise ValidationException(
+                "Nenhuma linha válida encontrada. "
+                "Verifique se 'origem' é 'fatura_cartao' ou 'extrato_bancario'"
+            )
+    
+    def _validar_e_converter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Valida colunas obrigatórias, converte tipos e remove linhas inválidas"""
+        # Normalizar nomes de colunas
+        df.columns = df.columns.str.lower().str.strip()
+        
+        # Validar colunas obrigatórias
+        colunas_obrigatorias = ['data', 'descricao', 'valor', 'origem']
+        colunas_faltando = [col for col in colunas_obrigatorias if col not in df.columns]
+        
+        if colunas_faltando:
+            raise ValidationException(
+                f"Colunas obrigatórias faltando: {', '.join(colunas_faltando)}. "
+                f"Arquivo tratado deve ter: {', '.join(colunas_obrigatorias)}"
+            )
+        
+        # Converter tipos
+        # Para datas, tentar múltiplos formatos (brasileiro e ISO)
+        df['data'] = pd.to_datetime(df['data'], dayfirst=True, errors='coerce')
+        df['valor'] = pd.to_numeric(df['valor'], errors='coerce')
+        
+        # Converter data_fatura se existir
+        if 'data_fatura' in df.columns:
+            df['data_fatura'] = pd.to_datetime(df['data_fatura'], dayfirst=True, errors='coerce')
+        
+        # Remover linhas inválidas
+        df = df.dropna(subset=['data', 'valor', 'descricao'])
+        
+        # Garantir que origem está em formato correto
+        df['origem'] = df['origem'].astype(str).str.lower().str.strip()
+        valores_validos = ['fatura_cartao', 'extrato_bancario']
+        df = df[df['origem'].isin(valores_validos)]
+        
+        return df
+    
     def _obter_extensao(self, nome_arquivo: str) -> str:
         """Retorna extensão do arquivo em lowercase"""
         for ext in self.formatos_suportados:
@@ -1,7 +1,9 @@
 """
 Parser de fatura de cartão de crédito do BTG Pactual
 """
+import hashlib
 import io
+from dataclasses import dataclass
 from typing import BinaryIO, Optional
 
 import msoffcrypto
@@ -10,6 +12,50 @@ from pandas import DateOffset
 
 from app.application.exceptions import ValidationException
 from app.domain.parsers.extrato_parser import IExtratoParser
+from app.infrastructure.parsers.cache_lru import CacheLRU
+
+# Planilhas descriptografadas (e senhas erradas) por (hash do conteúdo, hash da senha)
+_planilhas_descriptografadas = CacheLRU(max_itens=32, max_bytes=64 * 1024 * 1024, ttl_segundos=300)
+
+# Chaves derivadas por (hash da senha, parâmetros de criptografia do arquivo)
+_chaves_derivadas = CacheLRU(max_itens=256, max_bytes=1024 * 1024, ttl_segundos=300)
+
+
+@dataclass(frozen=True)
+class _FalhaDescriptografia:
+    """Tentativa com senha errada, guardada para não repetir a derivação"""
+    mensagem: str
+
+
+class _SenhaIncorreta(Exception):
+    """Descriptografia concluída, mas com a senha errada"""
+
+
+def _hash(conteudo: bytes) -> str:
+    return hashlib.sha256(conteudo).hexdigest()
+
+
+def _parametros_chave(office_file) -> Optional[tuple]:
+    """Parâmetros que determinam a chave OOXML (None se o formato não permitir reuso)"""
+    if getattr(office_file, "format", None) != "ooxml":
+        return None
+    
+    info = getattr(office_file, "info", None)
+    try:
+        if office_file.type == "agile":
+            return (
+                "agile", info["passwordSalt"], info["passwordHashAlgorithm"],
+                info["encryptedKeyValue"], info["spinValue"], info["passwordKeyBits"],
+            )
+        if office_file.type == "standard":
+            header, verifier = info["header"], info["verifier"]
+            return (
+                "standard", header["algId"], header["algIdHash"], header["providerType"],
+                header["keySize"], verifier["saltSize"], verifier["salt"],
+            )
+    except (KeyError, TypeError):
+        pass
+    return None
 
 
 class BTGFaturaParser(IExtratoParser):
@@ -49,6 +95,9 @@ class BTGFaturaParser(IExtratoParser):
         """
         Lê arquivo Excel protegido por senha.
         
+        A planilha descriptografada fica em cache (por conteúdo e senha) por
+        alguns minutos: reenvios e novas tentativas não repetem a descriptografia.
+        
         Args:
             arquivo: Conteúdo do arquivo Excel
             password: Senha para descriptografar o arquivo
@@ -60,29 +109,79 @@ class BTGFaturaParser(IExtratoParser):
         Raises:
             ValidationException: Se erro ao descriptografar ou ler arquivo
         """
+        arquivo_bytes = arquivo if isinstance(arquivo, bytes) else arquivo.read()
+        workbook = self._descriptografar(arquivo_bytes, password)
+        
+        try:
+            return pd.read_excel(io.BytesIO(workbook), **kwargs)
+        except Exception as e:
+            raise ValidationException(
+                f"Erro ao descriptografar ou ler arquivo Excel: {str(e)}. "
+                "Verifique se a senha está correta."
+            )
+    
+    def _descriptografar(self, arquivo_bytes: bytes, password: str) -> bytes:
+        """
+        Descriptografa a planilha, consultando o cache antes.
+        
+        Senha errada também fica em cache, para que a mesma tentativa não
+        repita a derivação de chave. Outras falhas (ex: memória, erro de
+        leitura) não são guardadas: uma nova tentativa pode ter sucesso.
+        """
+        chave = (_hash(arquivo_bytes), _hash(password.encode()))
+        guardado = _planilhas_descriptografadas.obter(chave)
+        
+        if isinstance(guardado, _FalhaDescriptografia):
+            raise ValidationException(guardado.mensagem)
+        if guardado is not None:
+            return guardado
+        
         try:
-            decrypted_workbook = io.BytesIO()
-            
             # msoffcrypto precisa de um arquivo seekable
-            arquivo_bytes = arquivo if isinstance(arquivo, bytes) else arquivo.read()
-            file_obj = io.BytesIO(arquivo_bytes)
+            office_file = msoffcrypto.OfficeFile(io.BytesIO(arquivo_bytes))
+            self._carregar_chave(office_file, password)
             
-            # Criar objeto OfficeFile e descriptografar
-            office_file = msoffcrypto.OfficeFile(file_obj)
-            office_file.load_key(password=password)
+            decrypted_workbook = io.BytesIO()
             office_file.decrypt(decrypted_workbook)
+            workbook = decrypted_workbook.getvalue()
             
-            # Voltar ao início do stream
-            decrypted_workbook.seek(0)
-            
-            df = pd.read_excel(decrypted_workbook, **kwargs)
-            return df
+            # Senha errada em OOXML não falha na descriptografia: gera bytes inválidos
+            if getattr(office_file, "format", None) == "ooxml" and not workbook.startswith(b"PK\x03\x04"):
+                raise _SenhaIncorreta("conteúdo descriptografado inválido")
             
         except Exception as e:
-            raise ValidationException(
+            mensagem = (
                 f"Erro ao descriptografar ou ler arquivo Excel: {str(e)}. "
                 "Verifique se a senha está correta."
             )
+            if isinstance(e, (_SenhaIncorreta, msoffcrypto.exceptions.InvalidKeyError)):
+                _planilhas_descriptografadas.guardar(chave, _FalhaDescriptografia(mensagem))
+            raise ValidationException(mensagem)
+        
+        _planilhas_descriptografadas.guardar(chave, workbook, tamanho=len(workbook))
+        return workbook
+    
+    def _carregar_chave(self, office_file, password: str) -> None:
+        """
+        Carrega a chave no arquivo, reaproveitando chave já derivada.
+        
+        Em OOXML a chave depende só da senha e dos parâmetros de criptografia
+        (salt, algoritmo, iterações); arquivos com os mesmos parâmetros
+        reutilizam a derivação, que é a parte cara.
+        """
+        parametros = _parametros_chave(office_file)
+        if parametros is None:
+            office_file.load_key(password=password)
+            return
+        
+        chave = (_hash(password.encode()), parametros)
+        secret_key = _chaves_derivadas.obter(chave)
+        
+        if secret_key is None:
+            office_file.load_key(password=password)
+            _chaves_derivadas.guardar(chave, office_file.secret_key, tamanho=len(office_file.secret_key))
+        else:
+            office_file.load_key(secret_key=secret_key)
     
     def _extract_data_fatura(self, nome_arquivo: str) -> pd.Timestamp:
         """
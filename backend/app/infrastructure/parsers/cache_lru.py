@@ -0,0 +1,88 @@
+"""
+Cache LRU em memória com validade (TTL) e limite de bytes.
+
+Usado pelos parsers para evitar repetir trabalho caro (ex: descriptografia
+de planilhas) em reenvios e tentativas próximas dentro do mesmo processo.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class CacheLRU:
+    """
+    Cache LRU thread-safe limitado por quantidade de itens, bytes e tempo.
+    
+    - Itens expiram `ttl_segundos` após gravados
+    - Ao exceder `max_itens` ou `max_bytes`, descarta os menos usados
+    - Itens maiores que `max_bytes` não são guardados
+    
+    Uso:
+        cache = CacheLRU(max_itens=32, max_bytes=64 * 1024 * 1024, ttl_segundos=300)
+        cache.guardar(chave, conteudo, tamanho=len(conteudo))
+        conteudo = cache.obter(chave)
+    """
+    
+    def __init__(
+        self,
+        max_itens: int,
+        max_bytes: int,
+        ttl_segundos: float,
+        relogio: Callable[[], float] = time.monotonic
+    ):
+        self._max_itens = max_itens
+        self._max_bytes = max_bytes
+        self._ttl_segundos = ttl_segundos
+        self._relogio = relogio
+        self._itens: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    def obter(self, chave: Hashable) -> Optional[Any]:
+        """Retorna o valor guardado (ou None se ausente/expirado)"""
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is None:
+                return None
+            
+            valor, _, expira_em = item
+            if expira_em <= self._relogio():
+                self._remover(chave)
+                return None
+            
+            self._itens.move_to_end(chave)
+            return valor
+    
+    def guardar(self, chave: Hashable, valor: Any, tamanho: int = 0) -> None:
+        """Guarda o valor, descartando os itens menos usados se necessário"""
+        if tamanho > self._max_bytes:
+            return
+        
+        with self._lock:
+            if chave in self._itens:
+                self._remover(chave)
+            
+            self._itens[chave] = (valor, tamanho, self._relogio() + self._ttl_segundos)
+            self._total_bytes += tamanho
+            
+            while len(self._itens) > self._max_itens or self._total_bytes > self._max_bytes:
+                self._remover(next(iter(self._itens)))
+    
+    def limpar(self) -> None:
+        """Remove todos os itens"""
+        with self._lock:
+            self._itens.clear()
+            self._total_bytes = 0
+    
+    @property
+    def total_bytes(self) -> int:
+        """Bytes ocupados pelos itens guardados"""
+        return self._total_bytes
+    
+    def __len__(self) -> int:
+        return len(self._itens)
+    
+    def _remover(self, chave: Hashable) -> None:
+        _, tamanho, _ = self._itens.pop(chave)
+        self._total_bytes -= tamanho
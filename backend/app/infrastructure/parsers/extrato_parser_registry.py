@@ -3,7 +3,13 @@ Registry de parsers de extrato bancário.
 
 Gerencia o registro e seleção de parsers para diferentes bancos,
 seguindo o padrão Factory/Registry.
+
+Parsers são registrados pelo caminho "modulo:Classe" e só importados (e
+instanciados) no primeiro uso: pandas, openpyxl e msoffcrypto não entram
+no startup da API nem em workers que só atendem leituras.
 """
+import threading
+from importlib import import_module
 from typing import Dict, List, Optional
 
 from app.application.exceptions import ValidationException
@@ -15,18 +21,21 @@ class ExtratoParserRegistry:
     Registry para parsers de extrato bancário.
     
     Responsabilidades:
-    - Registrar parsers disponíveis
+    - Registrar parsers disponíveis (instância ou caminho de import)
     - Selecionar parser correto baseado no parser_id
     - Listar parsers suportados
     
     Uso:
         registry = ExtratoParserRegistry()
         registry.registrar(BTGExtratoParser())
+        registry.registrar_caminho('btg_fatura', 'app.infrastructure.parsers.btg_fatura_parser:BTGFaturaParser')
         parser = registry.obter_parser('btg_extrato')
     """
     
     def __init__(self):
         self._parsers: Dict[str, IExtratoParser] = {}
+        self._caminhos: Dict[str, str] = {}
+        self._lock_carga = threading.Lock()
     
     def registrar(self, parser: IExtratoParser) -> None:
         """
@@ -39,13 +48,34 @@ class ExtratoParserRegistry:
             ValueError: Se parser_id já registrado
         """
         parser_id = parser.parser_id
+        self._verificar_nao_registrado(parser_id)
+        self._parsers[parser_id] = parser
+    
+    def registrar_caminho(self, parser_id: str, caminho: str) -> None:
+        """
+        Registra um parser para ser importado apenas no primeiro uso.
+        
+        Args:
+            parser_id: Identificador do parser
+            caminho: Classe do parser no formato "pacote.modulo:Classe"
+            
+        Raises:
+            ValueError: Se parser_id já registrado ou caminho mal formado
+        """
+        if ":" not in caminho:
+            raise ValueError(
+                f"Caminho '{caminho}' deve ter o formato 'modulo:Classe'"
+            )
         
-        if parser_id in self._parsers:
+        self._verificar_nao_registrado(parser_id)
+        self._caminhos[parser_id] = caminho
+    
+    def _verificar_nao_registrado(self, parser_id: str) -> None:
+        """Impede registrar o mesmo parser_id duas vezes"""
+        if parser_id in self._parsers or parser_id in self._caminhos:
             raise ValueError(
                 f"Parser '{parser_id}' já registrado"
             )
-        
-        self._parsers[parser_id] = parser
     
     def obter_parser(self, parser_id: str) -> IExtratoParser:
         """
@@ -60,7 +90,7 @@ class ExtratoParserRegistry:
         Raises:
             ValidationException: Se parser não encontrado
         """
-        parser = self._parsers.get(parser_id)
+        parser = self._parsers.get(parser_id) or self._carregar(parser_id)
         
         if not parser:
             parsers_disponiveis = self.listar_parsers_disponiveis()
@@ -71,6 +101,32 @@ class ExtratoParserRegistry:
         
         return parser
     
+    def _carregar(self, parser_id: str) -> Optional[IExtratoParser]:
+        """
+        Importa e instancia o parser registrado por caminho (None se não há).
+        
+        Sob lock: requisições concorrentes criam uma única instância. O
+        caminho só sai do registro depois que o parser foi carregado e
+        validado, então um import que falhou pode ser tentado de novo.
+        """
+        with self._lock_carga:
+            parser = self._parsers.get(parser_id)
+            if parser or parser_id not in self._caminhos:
+                return parser
+            
+            modulo, classe = self._caminhos[parser_id].split(":", 1)
+            parser = getattr(import_module(modulo), classe)()
+            
+            if parser.parser_id != parser_id:
+                raise ValueError(
+                    f"Parser '{modulo}:{classe}' tem parser_id '{parser.parser_id}', "
+                    f"mas foi registrado como '{parser_id}'"
+                )
+            
+            self._parsers[parser_id] = parser
+            del self._caminhos[parser_id]
+            return parser
+    
     def listar_parsers_disponiveis(self) -> List[str]:
         """
         Lista IDs dos parsers registrados.
@@ -78,12 +134,14 @@ class ExtratoParserRegistry:
         Returns:
             Lista de parser_ids disponíveis
         """
-        return list(self._parsers.keys())
+        return list(self._parsers.keys()) + list(self._caminhos.keys())
     
     def listar_parsers(self) -> List[Dict[str, any]]:
         """
         Lista informações de todos os parsers registrados.
         
+        Carrega os parsers ainda não importados (metadados vêm da instância).
+        
         Returns:
             Lista de dicts com info dos parsers:
             - parser_id: str (identificador único)
@@ -98,10 +156,22 @@ class ExtratoParserRegistry:
                 "nome_banco": parser.nome_banco,
                 "formatos_suportados": parser.formatos_suportados
             }
-            for parser in self._parsers.values()
+            for parser in map(self.obter_parser, self.listar_parsers_disponiveis())
         ]
 
 
+# Parsers de bancos e parser genérico para arquivos tratados (parser_id -> "modulo:Classe").
+# Futuros parsers serão adicionados aqui:
+# "inter_extrato": "app.infrastructure.parsers.inter_extrato_parser:InterExtratoParser"
+PARSERS_DISPONIVEIS: Dict[str, str] = {
+    "btg_extrato": "app.infrastructure.parsers.btg_extrato_parser:BTGExtratoParser",
+    "btg_fatura": "app.infrastructure.parsers.btg_fatura_parser:BTGFaturaParser",
+    "nubank_extrato": "app.infrastructure.parsers.nubank_extrato_parser:NubankExtratoParser",
+    "nubank_fatura": "app.infrastructure.parsers.nubank_fatura_parser:NubankFaturaParser",
+    "arquivo_tratado": "app.infrastructure.parsers.arquivo_tratado_parser:ArquivoTratadoParser",
+}
+
+
 # Instância singleton do registry
 _registry_instance: Optional[ExtratoParserRegistry] = None
 
@@ -124,27 +194,10 @@ def obter_registry() -> ExtratoParserRegistry:
 
 def _inicializar_parsers(registry: ExtratoParserRegistry) -> None:
     """
-    Inicializa registry com parsers disponíveis.
+    Inicializa registry com parsers disponíveis (importados sob demanda).
     
     Args:
         registry: Registry a inicializar
     """
-    # Importar e registrar parsers
-    from app.infrastructure.parsers.arquivo_tratado_parser import ArquivoTratadoParser
-    from app.infrastructure.parsers.btg_extrato_parser import BTGExtratoParser
-    from app.infrastructure.parsers.btg_fatura_parser import BTGFaturaParser
-    from app.infrastructure.parsers.nubank_extrato_parser import NubankExtratoParser
-    from app.infrastructure.parsers.nubank_fatura_parser import NubankFaturaParser
-    
-    # Registrar parsers de bancos
-    registry.registrar(BTGExtratoParser())
-    registry.registrar(BTGFaturaParser())
-    registry.registrar(NubankExtratoParser())
-    registry.registrar(NubankFaturaParser())
-    
-    # Registrar parser genérico para arquivos tratados
-    registry.registrar(ArquivoTratadoParser())
-    
-    # Futuros parsers serão adicionados aqui:
-    # registry.registrar(InterExtratoParser())
-
+    for parser_id, caminho in PARSERS_DISPONIVEIS.items():
+        registry.registrar_caminho(parser_id, caminho)
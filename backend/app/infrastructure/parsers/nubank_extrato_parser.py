@@ -1,16 +1,22 @@
 """
 Parser de extrato bancário do Nubank
 """
-from io import BytesIO
-from typing import BinaryIO, Optional
+import csv
+import re
+from datetime import date
+from io import BytesIO, StringIO
+from typing import Any, BinaryIO, Dict, List, Optional
 
 import pandas as pd
 
 from app.application.exceptions import ValidationException
-from app.domain.parsers.extrato_parser import IExtratoParser
+from app.domain.parsers.extrato_parser import IExtratoParserRegistros
 
+# Datas do extrato: DD/MM/YYYY
+_PADRAO_DATA = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
 
-class NubankExtratoParser(IExtratoParser):
+
+class NubankExtratoParser(IExtratoParserRegistros):
     """
     Parser para extratos bancários do Nubank.
     
@@ -20,6 +26,9 @@ class NubankExtratoParser(IExtratoParser):
       Exemplo: NU_454757980_01NOV2025_30NOV2025.csv
     - Colunas: Data, Valor, Descrição
     - Encoding: UTF-8
+    
+    `parse_registros` lê o CSV com o módulo csv da stdlib (caminho rápido);
+    `parse` usa pandas.
     """
     
     @property
@@ -76,25 +85,14 @@ class NubankExtratoParser(IExtratoParser):
         Raises:
             ValidationException: Se o arquivo for inválido
         """
-        if not self.validar_formato(arquivo, nome_arquivo):
-            raise ValidationException(
-                f"Arquivo '{nome_arquivo}' não é um extrato Nubank válido. "
-                f"Formato esperado: NU_NNNNNN_DDMMMYYYY_DDMMMYYYY.csv"
-            )
+        self._validar_arquivo(arquivo, nome_arquivo)
         
         try:
             # Ler CSV
             df = pd.read_csv(BytesIO(arquivo), encoding='utf-8')
             
             # Validar colunas obrigatórias
-            colunas_esperadas = ['Data', 'Valor', 'Descrição']
-            colunas_faltando = [col for col in colunas_esperadas if col not in df.columns]
-            
-            if colunas_faltando:
-                raise ValidationException(
-                    f"Colunas faltando no extrato Nubank: {', '.join(colunas_faltando)}. "
-                    f"Esperado: {', '.join(colunas_esperadas)}"
-                )
+            self._validar_colunas(df.columns)
             
             # Selecionar e renomear colunas
             df = df[['Data', 'Descrição', 'Valor']].copy()
@@ -125,9 +123,99 @@ class NubankExtratoParser(IExtratoParser):
                 f"Erro ao processar extrato Nubank: {str(e)}"
             )
     
+    def parse_registros(
+        self,
+        arquivo: BinaryIO,
+        nome_arquivo: str,
+        password: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Caminho rápido: mesmo resultado de `parse` como lista de registros.
+        
+        Returns:
+            Registros com data (date), descricao, valor, origem, banco;
+            None se o conteúdo não for UTF-8 (usar `parse`)
+            
+        Raises:
+            ValidationException: Se o arquivo for inválido
+        """
+        self._validar_arquivo(arquivo, nome_arquivo)
+        
+        try:
+            texto = bytes(arquivo).decode('utf-8-sig')
+        except UnicodeDecodeError:
+            return None
+        
+        leitor = csv.reader(StringIO(texto))
+        cabecalho = next(leitor, [])
+        self._validar_colunas(cabecalho)
+        i_data = cabecalho.index('Data')
+        i_valor = cabecalho.index('Valor')
+        i_descricao = cabecalho.index('Descrição')
+        
+        registros = []
+        for linha in leitor:
+            if len(linha) < len(cabecalho):
+                continue
+            data = _converter_data(linha[i_data])
+            valor = _converter_valor(linha[i_valor])
+            descricao = linha[i_descricao]
+            # Mesmo critério do dropna do caminho com pandas
+            if data is None or valor is None or not descricao:
+                continue
+            registros.append({
+                'data': data,
+                'descricao': descricao,
+                'valor': valor,
+                'origem': 'extrato_bancario',
+                'banco': self.banco_id,
+            })
+        
+        return registros
+    
+    def _validar_arquivo(self, arquivo: BinaryIO, nome_arquivo: str) -> None:
+        """Rejeita arquivos fora do padrão de extrato Nubank"""
+        if not self.validar_formato(arquivo, nome_arquivo):
+            raise ValidationException(
+                f"Arquivo '{nome_arquivo}' não é um extrato Nubank válido. "
+                f"Formato esperado: NU_NNNNNN_DDMMMYYYY_DDMMMYYYY.csv"
+            )
+    
+    def _validar_colunas(self, colunas) -> None:
+        """Valida colunas obrigatórias do extrato"""
+        colunas_esperadas = ['Data', 'Valor', 'Descrição']
+        colunas_faltando = [col for col in colunas_esperadas if col not in colunas]
+        
+        if colunas_faltando:
+            raise ValidationException(
+                f"Colunas faltando no extrato Nubank: {', '.join(colunas_faltando)}. "
+                f"Esperado: {', '.join(colunas_esperadas)}"
+            )
+    
     def _obter_extensao(self, nome_arquivo: str) -> str:
         """Retorna extensão do arquivo em lowercase"""
         for ext in self.formatos_suportados:
             if nome_arquivo.lower().endswith(ext):
                 return ext
         return ''
+
+
+def _converter_data(valor: str) -> date | None:
+    """DD/MM/YYYY → date (None se inválida, como errors='coerce')"""
+    correspondencia = _PADRAO_DATA.match(valor)
+    if not correspondencia:
+        return None
+    dia, mes, ano = correspondencia.groups()
+    try:
+        return date(int(ano), int(mes), int(dia))
+    except ValueError:
+        return None
+
+
+def _converter_valor(valor: str) -> float | None:
+    """Texto numérico → float (None se inválido, como errors='coerce')"""
+    try:
+        numero = float(valor)
+    except ValueError:
+        return None
+    return None if numero != numero else numero  # NaN
@@ -1,16 +1,22 @@
 """
 Parser de fatura de cartão de crédito do Nubank
 """
-from io import BytesIO
-from typing import BinaryIO, Optional
+import csv
+import re
+from datetime import date, datetime
+from io import BytesIO, StringIO
+from typing import Any, BinaryIO, Dict, List, Optional
 
 import pandas as pd
 
 from app.application.exceptions import ValidationException
-from app.domain.parsers.extrato_parser import IExtratoParser
+from app.domain.parsers.extrato_parser import IExtratoParserRegistros
 
+# Datas da fatura exportada pelo Nubank: YYYY-MM-DD
+_PADRAO_DATA_ISO = re.compile(r'^\d{4}-\d{2}-\d{2}$')
 
-class NubankFaturaParser(IExtratoParser):
+
+class NubankFaturaParser(IExtratoParserRegistros):
     """
     Parser para faturas de cartão de crédito do Nubank.
     
@@ -20,6 +26,9 @@ class NubankFaturaParser(IExtratoParser):
     - Colunas: date, title, amount
     - Data da fatura extraída do nome do arquivo
     - Adiciona prefixo "[Nubank] " nas descrições
+    
+    `parse_registros` lê o CSV com o módulo csv da stdlib (caminho rápido)
+    quando as datas estão em YYYY-MM-DD; `parse` usa pandas.
     """
     
     @property
@@ -63,7 +72,7 @@ class NubankFaturaParser(IExtratoParser):
                 raise ValueError("Formato inválido")
             
             data_str = partes[1]
-            return pd.to_datetime(data_str, format="%Y-%m-%d")
+            return pd.Timestamp(datetime.strptime(data_str, "%Y-%m-%d"))
             
         except (IndexError, ValueError) as e:
             raise ValidationException(
@@ -100,14 +109,7 @@ class NubankFaturaParser(IExtratoParser):
             df = pd.read_csv(BytesIO(arquivo_bytes))
             
             # Validar colunas esperadas
-            colunas_esperadas = ['date', 'title', 'amount']
-            colunas_faltando = [col for col in colunas_esperadas if col not in df.columns]
-            
-            if colunas_faltando:
-                raise ValidationException(
-                    f"Colunas obrigatórias faltando: {', '.join(colunas_faltando)}. "
-                    f"Arquivo de fatura Nubank deve ter: {', '.join(colunas_esperadas)}"
-                )
+            self._validar_colunas(df.columns)
             
             # Selecionar e renomear colunas
             df = df[['date', 'title', 'amount']].copy()
@@ -144,3 +146,83 @@ class NubankFaturaParser(IExtratoParser):
             raise ValidationException(
                 f"Erro ao processar fatura Nubank: {str(e)}"
             )
+    
+    def parse_registros(
+        self,
+        arquivo: BinaryIO,
+        nome_arquivo: str,
+        password: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Caminho rápido: mesmo resultado de `parse` como lista de registros.
+        
+        Returns:
+            Registros com data (date), descricao, valor, data_fatura (date),
+            origem, banco; None se houver datas fora de YYYY-MM-DD ou conteúdo
+            não UTF-8 (usar `parse`)
+            
+        Raises:
+            ValidationException: Se nome ou colunas inválidos
+        """
+        data_fatura = self._extract_data_fatura(nome_arquivo).date()
+        
+        try:
+            arquivo_bytes = arquivo if isinstance(arquivo, (bytes, bytearray)) else arquivo.read()
+            texto = bytes(arquivo_bytes).decode('utf-8-sig')
+        except UnicodeDecodeError:
+            return None
+        
+        leitor = csv.reader(StringIO(texto))
+        cabecalho = next(leitor, [])
+        self._validar_colunas(cabecalho)
+        i_data = cabecalho.index('date')
+        i_descricao = cabecalho.index('title')
+        i_valor = cabecalho.index('amount')
+        
+        registros = []
+        for linha in leitor:
+            if len(linha) < len(cabecalho):
+                continue
+            texto_data = linha[i_data]
+            if texto_data and not _PADRAO_DATA_ISO.match(texto_data):
+                # Outros formatos de data: deixar a inferência do pandas decidir
+                return None
+            valor = _converter_valor(linha[i_valor])
+            descricao = linha[i_descricao]
+            # Mesmo critério do dropna do caminho com pandas
+            if not texto_data or valor is None or not descricao:
+                continue
+            try:
+                data = date.fromisoformat(texto_data)
+            except ValueError:
+                continue
+            registros.append({
+                'data': data,
+                'descricao': descricao,
+                'valor': valor,
+                'data_fatura': data_fatura,
+                'origem': 'fatura_cartao',
+                'banco': self.banco_id,
+            })
+        
+        return registros
+    
+    def _validar_colunas(self, colunas) -> None:
+        """Valida colunas obrigatórias da fatura"""
+        colunas_esperadas = ['date', 'title', 'amount']
+        colunas_faltando = [col for col in colunas_esperadas if col not in colunas]
+        
+        if colunas_faltando:
+            raise ValidationException(
+                f"Colunas obrigatórias faltando: {', '.join(colunas_faltando)}. "
+                f"Arquivo de fatura Nubank deve ter: {', '.join(colunas_esperadas)}"
+            )
+
+
+def _converter_valor(valor: str) -> float | None:
+    """Texto numérico → float (None se inválido, como errors='coerce')"""
+    try:
+        numero = float(valor)
+    except ValueError:
+        return None
+    return None if numero != numero else numero  # NaN
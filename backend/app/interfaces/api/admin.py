@@ -0,0 +1,31 @@
+"""
+Proteção de endpoints administrativos
+
+Exige o header X-Admin-Token igual a ADMIN_TOKEN. Sem ADMIN_TOKEN
+configurado, nenhuma requisição é considerada administrativa.
+"""
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from app.infrastructure.config import get_settings
+
+HEADER_TOKEN_ADMIN = "X-Admin-Token"
+
+
+def token_admin_valido(token: Optional[str]) -> bool:
+    """Compara o token recebido com ADMIN_TOKEN em tempo constante"""
+    esperado = get_settings().ADMIN_TOKEN
+    if not esperado or not token:
+        return False
+    return hmac.compare_digest(token.encode(), esperado.encode())
+
+
+def exigir_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Dependency: rejeita com 403 requisições sem token administrativo válido"""
+    if not token_admin_valido(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Token administrativo ausente ou inválido"
+        )
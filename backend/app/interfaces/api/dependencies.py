@@ -6,6 +6,7 @@ from typing import Generator
 
 from fastapi import Depends
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.application.use_cases.atualizar_regra import AtualizarRegraUseCase
 from app.application.use_cases.criar_regra import CriarRegraUseCase
@@ -20,14 +21,24 @@ from app.application.use_cases.listar_tags import ListarTagsUseCase
 from app.application.use_cases.listar_transacoes import ListarTransacoesUseCase
 from app.application.use_cases.obter_configuracao import ObterConfiguracaoUseCase
 from app.application.use_cases.salvar_configuracao import SalvarConfiguracaoUseCase
-from app.infrastructure.database.repositories.configuracao_repository import ConfiguracaoRepository
+from app.infrastructure.config import get_settings
+from app.infrastructure.database.repositories.configuracao_repository import (
+    ConfiguracaoRepository,
+    ConfiguracaoRepositoryAsync,
+)
+from app.infrastructure.database.repositories.estatistica_regra_repository import EstatisticaRegraRepository
+from app.infrastructure.database.repositories.importacao_em_massa_repository import ImportacaoEmMassaRepository
+from app.infrastructure.database.repositories.lote_importacao_repository import LoteImportacaoRepository
 from app.infrastructure.database.repositories.regra_repository import RegraRepository
-from app.infrastructure.database.repositories.tag_repository import TagRepository
+from app.infrastructure.database.repositories.tag_repository import TagRepository, TagRepositoryAsync
 
 # Repositórios
-from app.infrastructure.database.repositories.transacao_repository import TransacaoRepository
-from app.infrastructure.database.repositories.usuario_repository import UsuarioRepository
-from app.infrastructure.database.session import get_session
+from app.infrastructure.database.repositories.transacao_repository import (
+    TransacaoRepository,
+    TransacaoRepositoryAsync,
+)
+from app.infrastructure.database.repositories.usuario_repository import UsuarioRepository, UsuarioRepositoryAsync
+from app.infrastructure.database.session import get_async_session, get_read_session, get_session
 
 # ===== REPOSITÓRIOS =====
 
@@ -59,6 +70,27 @@ def get_regra_repository(
     yield RegraRepository(session)
 
 
+def get_estatistica_regra_repository(
+    session: Session = Depends(get_session)
+) -> Generator[EstatisticaRegraRepository, None, None]:
+    """Fornece repositório de estatísticas de regras"""
+    yield EstatisticaRegraRepository(session)
+
+
+def get_lote_importacao_repository(
+    session: Session = Depends(get_session)
+) -> Generator[LoteImportacaoRepository, None, None]:
+    """Fornece repositório de lotes de importação"""
+    yield LoteImportacaoRepository(session)
+
+
+def get_importacao_em_massa_repository(
+    session: Session = Depends(get_session)
+) -> Generator[ImportacaoEmMassaRepository, None, None]:
+    """Fornece repositório de importação em massa (staging)"""
+    yield ImportacaoEmMassaRepository(session)
+
+
 def get_usuario_repository(
     session: Session = Depends(get_session)
 ) -> Generator[UsuarioRepository, None, None]:
@@ -71,6 +103,73 @@ def get_db_session(session: Session = Depends(get_session)) -> Session:
     return session
 
 
+# ===== REPOSITÓRIOS DE LEITURA (réplica quando configurada) =====
+
+def get_transacao_repository_leitura(
+    session: Session = Depends(get_read_session)
+) -> Generator[TransacaoRepository, None, None]:
+    """Fornece repositório de transações para casos de uso somente leitura"""
+    yield TransacaoRepository(session)
+
+
+def get_tag_repository_leitura(
+    session: Session = Depends(get_read_session)
+) -> Generator[TagRepository, None, None]:
+    """Fornece repositório de tags para casos de uso somente leitura"""
+    yield TagRepository(session)
+
+
+def get_configuracao_repository_leitura(
+    session: Session = Depends(get_read_session)
+) -> Generator[ConfiguracaoRepository, None, None]:
+    """Fornece repositório de configurações para casos de uso somente leitura"""
+    yield ConfiguracaoRepository(session)
+
+
+def get_usuario_repository_leitura(
+    session: Session = Depends(get_read_session)
+) -> Generator[UsuarioRepository, None, None]:
+    """Fornece repositório de usuários para casos de uso somente leitura"""
+    yield UsuarioRepository(session)
+
+
+def get_regra_repository_leitura(
+    session: Session = Depends(get_read_session)
+) -> Generator[RegraRepository, None, None]:
+    """Fornece repositório de regras para casos de uso somente leitura"""
+    yield RegraRepository(session)
+
+
+# ===== REPOSITÓRIOS ASYNC (somente leitura) =====
+
+def get_transacao_repository_async(
+    session: AsyncSession = Depends(get_async_session)
+) -> TransacaoRepositoryAsync:
+    """Fornece leituras async de transações"""
+    return TransacaoRepositoryAsync(session)
+
+
+def get_tag_repository_async(
+    session: AsyncSession = Depends(get_async_session)
+) -> TagRepositoryAsync:
+    """Fornece leituras async de tags"""
+    return TagRepositoryAsync(session)
+
+
+def get_configuracao_repository_async(
+    session: AsyncSession = Depends(get_async_session)
+) -> ConfiguracaoRepositoryAsync:
+    """Fornece leituras async de configurações"""
+    return ConfiguracaoRepositoryAsync(session)
+
+
+def get_usuario_repository_async(
+    session: AsyncSession = Depends(get_async_session)
+) -> UsuarioRepositoryAsync:
+    """Fornece leituras async de usuários"""
+    return UsuarioRepositoryAsync(session)
+
+
 # ===== CASOS DE USO =====
 
 def get_criar_transacao_use_case(
@@ -81,15 +180,26 @@ def get_criar_transacao_use_case(
 
 
 def get_listar_transacoes_use_case(
-    transacao_repo: TransacaoRepository = Depends(get_transacao_repository),
-    config_repo: ConfiguracaoRepository = Depends(get_configuracao_repository),
-    tag_repo: TagRepository = Depends(get_tag_repository),
-    usuario_repo: UsuarioRepository = Depends(get_usuario_repository)
+    transacao_repo: TransacaoRepository = Depends(get_transacao_repository_leitura),
+    config_repo: ConfiguracaoRepository = Depends(get_configuracao_repository_leitura),
+    tag_repo: TagRepository = Depends(get_tag_repository_leitura),
+    usuario_repo: UsuarioRepository = Depends(get_usuario_repository_leitura)
 ) -> ListarTransacoesUseCase:
     """Fornece caso de uso de listar transações com tags e usuario"""
     return ListarTransacoesUseCase(transacao_repo, config_repo, tag_repo, usuario_repo)
 
 
+def get_listar_transacoes_async_use_case(
+    transacao_repo: TransacaoRepositoryAsync = Depends(get_transacao_repository_async),
+    config_repo: ConfiguracaoRepositoryAsync = Depends(get_configuracao_repository_async),
+    tag_repo: TagRepositoryAsync = Depends(get_tag_repository_async),
+    usuario_repo: UsuarioRepositoryAsync = Depends(get_usuario_repository_async)
+):
+    """Fornece caso de uso async de listar transações (rota GET)"""
+    from app.application.use_cases.listar_transacoes import ListarTransacoesAsyncUseCase
+    return ListarTransacoesAsyncUseCase(transacao_repo, config_repo, tag_repo, usuario_repo)
+
+
 def get_atualizar_transacao_use_case(
     transacao_repo: TransacaoRepository = Depends(get_transacao_repository)
 ):
@@ -98,9 +208,19 @@ def get_atualizar_transacao_use_case(
     return AtualizarTransacaoUseCase(transacao_repo)
 
 
-def get_obter_resumo_mensal_use_case(
+def get_atualizar_transacoes_em_lote_use_case(
     transacao_repo: TransacaoRepository = Depends(get_transacao_repository),
+    usuario_repo: UsuarioRepository = Depends(get_usuario_repository),
     config_repo: ConfiguracaoRepository = Depends(get_configuracao_repository)
+):
+    """Fornece caso de uso de atualizar transações em lote"""
+    from app.application.use_cases.atualizar_transacoes_em_lote import AtualizarTransacoesEmLoteUseCase
+    return AtualizarTransacoesEmLoteUseCase(transacao_repo, usuario_repo, config_repo)
+
+
+def get_obter_resumo_mensal_use_case(
+    transacao_repo: TransacaoRepository = Depends(get_transacao_repository_leitura),
+    config_repo: ConfiguracaoRepository = Depends(get_configuracao_repository_leitura)
 ):
     """Fornece caso de uso de obter resumo mensal"""
     from app.application.use_cases.obter_resumo_mensal import ObterResumoMensalUseCase
@@ -108,13 +228,30 @@ def get_obter_resumo_mensal_use_case(
 
 
 def get_listar_categorias_use_case(
-    transacao_repo: TransacaoRepository = Depends(get_transacao_repository)
+    transacao_repo: TransacaoRepository = Depends(get_transacao_repository_leitura)
 ):
     """Fornece caso de uso de listar categorias"""
     from app.application.use_cases.listar_categorias import ListarCategoriasUseCase
     return ListarCategoriasUseCase(transacao_repo)
 
 
+def get_obter_resumo_mensal_async_use_case(
+    transacao_repo: TransacaoRepositoryAsync = Depends(get_transacao_repository_async),
+    config_repo: ConfiguracaoRepositoryAsync = Depends(get_configuracao_repository_async)
+):
+    """Fornece caso de uso async de obter resumo mensal (rota GET)"""
+    from app.application.use_cases.obter_resumo_mensal import ObterResumoMensalAsyncUseCase
+    return ObterResumoMensalAsyncUseCase(transacao_repo, config_repo)
+
+
+def get_listar_categorias_async_use_case(
+    transacao_repo: TransacaoRepositoryAsync = Depends(get_transacao_repository_async)
+):
+    """Fornece caso de uso async de listar categorias (rota GET)"""
+    from app.application.use_cases.listar_categorias import ListarCategoriasAsyncUseCase
+    return ListarCategoriasAsyncUseCase(transacao_repo)
+
+
 def get_obter_transacao_use_case(
     transacao_repo: TransacaoRepository = Depends(get_transacao_repository),
     tag_repo: TagRepository = Depends(get_tag_repository),
@@ -142,6 +279,16 @@ def get_adicionar_tag_transacao_use_case(
     return AdicionarTagTransacaoUseCase(transacao_repo, tag_repo)
 
 
+def get_atualizar_tags_em_lote_use_case(
+    transacao_repo: TransacaoRepository = Depends(get_transacao_repository),
+    tag_repo: TagRepository = Depends(get_tag_repository),
+    config_repo: ConfiguracaoRepository = Depends(get_configuracao_repository)
+):
+    """Fornece caso de uso de adicionar/remover tags em lote"""
+    from app.application.use_cases.atualizar_tags_em_lote import AtualizarTagsEmLoteUseCase
+    return AtualizarTagsEmLoteUseCase(transacao_repo, tag_repo, config_repo)
+
+
 def get_remover_tag_transacao_use_case(
     transacao_repo: TransacaoRepository = Depends(get_transacao_repository)
 ):
@@ -169,12 +316,20 @@ def get_criar_tag_use_case(
 
 
 def get_listar_tags_use_case(
-    tag_repo: TagRepository = Depends(get_tag_repository)
+    tag_repo: TagRepository = Depends(get_tag_repository_leitura)
 ) -> ListarTagsUseCase:
     """Fornece caso de uso de listar tags"""
     return ListarTagsUseCase(tag_repo)
 
 
+def get_listar_tags_async_use_case(
+    tag_repo: TagRepositoryAsync = Depends(get_tag_repository_async)
+):
+    """Fornece caso de uso async de listar tags (rota GET)"""
+    from app.application.use_cases.listar_tags import ListarTagsAsyncUseCase
+    return ListarTagsAsyncUseCase(tag_repo)
+
+
 def get_deletar_tag_use_case(
     tag_repo: TagRepository = Depends(get_tag_repository)
 ) -> DeletarTagUseCase:
@@ -192,7 +347,7 @@ def get_criar_regra_use_case(
 
 
 def get_listar_regras_use_case(
-    regra_repo: RegraRepository = Depends(get_regra_repository)
+    regra_repo: RegraRepository = Depends(get_regra_repository_leitura)
 ) -> ListarRegrasUseCase:
     """Fornece caso de uso de listar regras"""
     return ListarRegrasUseCase(regra_repo)
@@ -214,20 +369,31 @@ def get_deletar_regra_use_case(
 
 def get_aplicar_regra_retroativa_use_case(
     transacao_repo: TransacaoRepository = Depends(get_transacao_repository),
-    regra_repo: RegraRepository = Depends(get_regra_repository)
+    regra_repo: RegraRepository = Depends(get_regra_repository),
+    estatistica_repo: EstatisticaRegraRepository = Depends(get_estatistica_regra_repository)
 ):
     """Fornece caso de uso de aplicar regra retroativamente"""
     from app.application.use_cases.aplicar_regra_retroativa import AplicarRegraRetroativamenteUseCase
-    return AplicarRegraRetroativamenteUseCase(transacao_repo, regra_repo)
+    return AplicarRegraRetroativamenteUseCase(transacao_repo, regra_repo, estatistica_repo)
 
 
 def get_aplicar_todas_regras_retroativa_use_case(
     transacao_repo: TransacaoRepository = Depends(get_transacao_repository),
-    regra_repo: RegraRepository = Depends(get_regra_repository)
+    regra_repo: RegraRepository = Depends(get_regra_repository),
+    estatistica_repo: EstatisticaRegraRepository = Depends(get_estatistica_regra_repository)
 ):
     """Fornece caso de uso de aplicar todas as regras retroativamente"""
     from app.application.use_cases.aplicar_todas_regras_retroativa import AplicarTodasRegrasRetroativaUseCase
-    return AplicarTodasRegrasRetroativaUseCase(transacao_repo, regra_repo)
+    return AplicarTodasRegrasRetroativaUseCase(transacao_repo, regra_repo, estatistica_repo)
+
+
+def get_listar_estatisticas_regras_use_case(
+    regra_repo: RegraRepository = Depends(get_regra_repository),
+    estatistica_repo: EstatisticaRegraRepository = Depends(get_estatistica_regra_repository)
+):
+    """Fornece caso de uso de listar estatísticas de regras"""
+    from app.application.use_cases.listar_estatisticas_regras import ListarEstatisticasRegrasUseCase
+    return ListarEstatisticasRegrasUseCase(regra_repo, estatistica_repo)
 
 
 # ===== CONFIGURAÇÕES =====
@@ -239,6 +405,14 @@ def get_obter_configuracao_use_case(
     return ObterConfiguracaoUseCase(config_repo)
 
 
+def get_obter_configuracao_async_use_case(
+    config_repo: ConfiguracaoRepositoryAsync = Depends(get_configuracao_repository_async)
+):
+    """Fornece caso de uso async de obter configuração (rota GET)"""
+    from app.application.use_cases.obter_configuracao import ObterConfiguracaoAsyncUseCase
+    return ObterConfiguracaoAsyncUseCase(config_repo)
+
+
 def get_salvar_configuracao_use_case(
     config_repo: ConfiguracaoRepository = Depends(get_configuracao_repository)
 ) -> SalvarConfiguracaoUseCase:
@@ -252,11 +426,28 @@ def get_importar_multiplos_arquivos_use_case(
     transacao_repo: TransacaoRepository = Depends(get_transacao_repository),
     tag_repo: TagRepository = Depends(get_tag_repository),
     regra_repo: RegraRepository = Depends(get_regra_repository),
-    usuario_repo: UsuarioRepository = Depends(get_usuario_repository)
+    usuario_repo: UsuarioRepository = Depends(get_usuario_repository),
+    estatistica_repo: EstatisticaRegraRepository = Depends(get_estatistica_regra_repository),
+    lote_repo: LoteImportacaoRepository = Depends(get_lote_importacao_repository),
+    importacao_em_massa_repo: ImportacaoEmMassaRepository = Depends(get_importacao_em_massa_repository)
 ):
     """Fornece caso de uso de importar arquivos (um ou múltiplos)"""
     from app.application.use_cases.importar_multiplos_arquivos import ImportarMultiplosArquivosUseCase
-    return ImportarMultiplosArquivosUseCase(transacao_repo, tag_repo, regra_repo, usuario_repo)
+    return ImportarMultiplosArquivosUseCase(
+        transacao_repo, tag_repo, regra_repo, usuario_repo, estatistica_repo, lote_repo,
+        importacao_em_massa_repo=importacao_em_massa_repo,
+        min_linhas_importacao_em_massa=get_settings().IMPORTACAO_EM_MASSA_MIN_LINHAS,
+        tamanho_bloco_linhas=get_settings().IMPORTACAO_BLOCO_LINHAS,
+        min_bytes_leitura_em_blocos=get_settings().IMPORTACAO_EM_BLOCOS_MIN_BYTES
+    )
+
+
+def get_desfazer_importacao_use_case(
+    lote_repo: LoteImportacaoRepository = Depends(get_lote_importacao_repository)
+):
+    """Fornece caso de uso de desfazer importação (remover lote)"""
+    from app.application.use_cases.desfazer_importacao import DesfazerImportacaoUseCase
+    return DesfazerImportacaoUseCase(lote_repo)
 
 
 # Você pode adicionar mais factories de casos de uso aqui conforme necessário
@@ -0,0 +1,3 @@
+"""
+Middlewares HTTP da API
+"""
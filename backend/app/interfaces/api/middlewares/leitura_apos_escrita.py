@@ -0,0 +1,22 @@
+"""
+Middleware de leitura após escrita
+
+Registra as escritas de cada cliente para que suas leituras seguintes
+usem o primário durante a janela configurada (ver roteamento_leitura).
+"""
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.infrastructure.database.roteamento_leitura import get_registro_escritas
+from app.infrastructure.database.session import identificar_cliente
+
+METODOS_SOMENTE_LEITURA = {"GET", "HEAD", "OPTIONS"}
+
+
+class LeituraAposEscritaMiddleware(BaseHTTPMiddleware):
+    """Marca o cliente como 'escreveu recentemente' após requisições de escrita"""
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        if request.method not in METODOS_SOMENTE_LEITURA:
+            get_registro_escritas().registrar_escrita(identificar_cliente(request))
+        return response
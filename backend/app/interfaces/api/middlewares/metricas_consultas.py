@@ -0,0 +1,36 @@
+"""
+Middleware de métricas de banco por requisição
+
+Expõe nos headers X-DB-Queries e X-DB-Time-ms quantos statements a
+requisição executou e quanto tempo passou no banco.
+"""
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.infrastructure.database.metricas_consultas import (
+    encerrar_medicao,
+    iniciar_medicao,
+    instalar_contagem_consultas,
+    medicao_atual,
+)
+
+HEADER_CONSULTAS = "X-DB-Queries"
+HEADER_TEMPO = "X-DB-Time-ms"
+
+
+class MetricasConsultasMiddleware(BaseHTTPMiddleware):
+    """Conta statements e tempo de banco de cada requisição"""
+
+    def __init__(self, app):
+        super().__init__(app)
+        instalar_contagem_consultas()
+
+    async def dispatch(self, request, call_next):
+        token = iniciar_medicao()
+        try:
+            metricas = medicao_atual()
+            response = await call_next(request)
+        finally:
+            encerrar_medicao(token)
+        response.headers[HEADER_CONSULTAS] = str(metricas.total_consultas)
+        response.headers[HEADER_TEMPO] = f"{metricas.tempo_total_ms:.2f}"
+        return response
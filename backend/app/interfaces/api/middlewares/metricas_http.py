@@ -0,0 +1,41 @@
+"""
+Middleware de métricas HTTP
+
+Mede a latência de cada requisição rotulada pelo template da rota
+(ex: /transacoes/{transacao_id}), nunca pelo caminho concreto, para manter
+a cardinalidade das séries limitada.
+"""
+import time
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.infrastructure.observabilidade.metricas import requisicoes_duracao, requisicoes_em_andamento
+
+ROTA_DESCONHECIDA = "desconhecida"
+
+
+def template_rota(request) -> str:
+    """Template da rota que atendeu a requisição (disponível após o roteamento)"""
+    rota = request.scope.get("route")
+    return getattr(rota, "path", ROTA_DESCONHECIDA)
+
+
+class MetricasHTTPMiddleware(BaseHTTPMiddleware):
+    """Registra duração por rota/status e requisições em andamento"""
+
+    async def dispatch(self, request, call_next):
+        requisicoes_em_andamento.inc()
+        inicio = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            requisicoes_duracao.observar(
+                time.perf_counter() - inicio,
+                metodo=request.method,
+                rota=template_rota(request),
+                status=status,
+            )
+            requisicoes_em_andamento.dec()
@@ -0,0 +1,90 @@
+"""
+Middleware de perfilamento sob demanda
+
+Com PERFILAMENTO_HABILITADO, uma requisição com `X-Profile: 1` e token
+administrativo válido é executada sob o perfilador por amostragem. O perfil
+fica guardado em memória e seu id volta no header X-Profile-Id, para
+download em GET /interno/perfis/{id} (folded stacks, para flamegraph).
+Só as threads da requisição são amostradas: o event loop e as threads do
+threadpool registradas pela dependência registrar_thread_perfilada.
+Um perfil por vez: enquanto outro está em andamento, a requisição segue
+sem perfilamento.
+"""
+import asyncio
+import threading
+import time
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.observabilidade.perfilador import (
+    PerfiladorAmostragem,
+    PerfilRequisicao,
+    encerrar_registro_threads,
+    get_armazem_perfis,
+    iniciar_registro_threads,
+    registrar_thread_atual,
+    threads_registradas,
+)
+from app.interfaces.api.admin import HEADER_TOKEN_ADMIN, token_admin_valido
+
+HEADER_PERFIL = "X-Profile"
+HEADER_PERFIL_ID = "X-Profile-Id"
+
+_perfil_em_andamento = threading.Lock()
+
+
+def registrar_thread_perfilada(request: Request) -> None:
+    """
+    Dependência global: inclui no perfil a thread do threadpool da rota síncrona.
+    
+    O FastAPI executa dependências e endpoints síncronos no threadpool, que
+    reaproveita a worker liberada mais recentemente: o endpoint roda, em
+    geral, na mesma thread. Rotas async rodam no event loop, que o
+    middleware já registra. Fora de uma requisição perfilada, não faz nada.
+    """
+    rota = request.scope.get("route")
+    if rota is not None and not asyncio.iscoroutinefunction(rota.endpoint):
+        registrar_thread_atual()
+
+
+class PerfilamentoMiddleware(BaseHTTPMiddleware):
+    """Perfila a requisição quando solicitado por um administrador"""
+
+    async def dispatch(self, request, call_next):
+        settings = get_settings()
+        if not settings.PERFILAMENTO_HABILITADO or request.headers.get(HEADER_PERFIL) != "1":
+            return await call_next(request)
+        if not token_admin_valido(request.headers.get(HEADER_TOKEN_ADMIN)):
+            return JSONResponse(
+                status_code=403,
+                content={"detail": "Perfilamento exige token administrativo válido"},
+            )
+        if not _perfil_em_andamento.acquire(blocking=False):
+            return await call_next(request)
+
+        intervalo_ms = settings.PERFILAMENTO_INTERVALO_MS
+        token = iniciar_registro_threads()
+        perfilador = PerfiladorAmostragem(intervalo_s=intervalo_ms / 1000, threads=threads_registradas())
+        inicio = time.perf_counter()
+        perfilador.iniciar()
+        try:
+            response = await call_next(request)
+        finally:
+            pilhas = perfilador.parar()
+            encerrar_registro_threads(token)
+            _perfil_em_andamento.release()
+
+        perfil = PerfilRequisicao(
+            metodo=request.method,
+            caminho=request.url.path,
+            duracao_ms=round((time.perf_counter() - inicio) * 1000, 3),
+            intervalo_ms=intervalo_ms,
+            pilhas=pilhas,
+            threads=perfilador.threads_amostradas,
+        )
+        get_armazem_perfis().guardar(perfil)
+        response.headers[HEADER_PERFIL_ID] = perfil.id
+        return response
@@ -4,9 +4,9 @@ Router refatorado para Configurações usando Clean Architecture
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.application.dto.configuracao_dto import SalvarConfiguracaoDTO
-from app.application.use_cases.obter_configuracao import ObterConfiguracaoUseCase
+from app.application.use_cases.obter_configuracao import ObterConfiguracaoAsyncUseCase
 from app.application.use_cases.salvar_configuracao import SalvarConfiguracaoUseCase
-from app.interfaces.api.dependencies import get_obter_configuracao_use_case, get_salvar_configuracao_use_case
+from app.interfaces.api.dependencies import get_obter_configuracao_async_use_case, get_salvar_configuracao_use_case
 from app.interfaces.api.schemas.request_response import ConfiguracaoRequest, ConfiguracaoResponse
 
 router = APIRouter(
@@ -16,9 +16,9 @@ router = APIRouter(
 
 
 @router.get("/{chave}", response_model=ConfiguracaoResponse)
-def obter_configuracao(
+async def obter_configuracao(
     chave: str,
-    use_case: ObterConfiguracaoUseCase = Depends(get_obter_configuracao_use_case)
+    use_case: ObterConfiguracaoAsyncUseCase = Depends(get_obter_configuracao_async_use_case)
 ):
     """
     Obtém uma configuração específica por chave.
@@ -32,7 +32,7 @@ def obter_configuracao(
     Raises:
         404: Configuração não encontrada
     """
-    dto = use_case.execute(chave)
+    dto = await use_case.execute(chave)
     
     if not dto:
         raise HTTPException(
@@ -5,10 +5,15 @@ Endpoint único que aceita um ou múltiplos arquivos naturalmente.
 """
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 
+from app.application.exceptions.application_exceptions import EntityNotFoundException
+from app.application.use_cases.desfazer_importacao import DesfazerImportacaoUseCase
 from app.application.use_cases.importar_multiplos_arquivos import ImportarMultiplosArquivosUseCase
-from app.interfaces.api.dependencies import get_importar_multiplos_arquivos_use_case
+from app.interfaces.api.dependencies import (
+    get_desfazer_importacao_use_case,
+    get_importar_multiplos_arquivos_use_case,
+)
 from app.interfaces.api.schemas.request_response import (
     ResultadoArquivoResponse,
     ResultadoImportacaoMultiplaResponse,
@@ -20,8 +25,10 @@ router = APIRouter(
 )
 
 
+# def (não async): parse e gravação são síncronos e rodam no threadpool,
+# sem bloquear o event loop durante a importação
 @router.post("", response_model=ResultadoImportacaoMultiplaResponse)
-async def importar_arquivos(
+def importar_arquivos(
     arquivos: List[UploadFile] = File(..., description="Um ou múltiplos arquivos para importação"),
     usuario_id: int = Form(1, description="ID do usuário responsável pelas transações"),
     passwords: Optional[str] = Form(None, description="Senhas separadas por vírgula (opcional)"),
@@ -46,6 +53,7 @@ async def importar_arquivos(
     - Tag Rotina adicionada
     - Regras ativas aplicadas
     - Duplicatas ignoradas
+    - Reenvio de arquivo idêntico devolve o resultado anterior (replay=true)
     
     Args:
         arquivos: Um ou mais arquivos a serem importados
@@ -80,12 +88,12 @@ async def importar_arquivos(
         senha_lista.append(None)
     
     # Preparar lista de arquivos para processamento
+    # (streams já em disco/memória temporária: arquivos grandes não são copiados para bytes)
     arquivos_para_processar = []
     for idx, arquivo in enumerate(arquivos):
-        conteudo = await arquivo.read()
         senha = senha_lista[idx] if idx < len(senha_lista) else None
         arquivos_para_processar.append(
-            (conteudo, arquivo.filename or f"arquivo_{idx+1}", senha)
+            (arquivo.file, arquivo.filename or f"arquivo_{idx+1}", senha)
         )
     
     # Executar caso de uso
@@ -104,10 +112,30 @@ async def importar_arquivos(
                 total_importado=r.total_importado,
                 transacoes_ids=r.transacoes_ids,
                 mensagem=r.mensagem,
-                erro=r.erro
+                erro=r.erro,
+                lote_id=r.lote_id,
+                replay=r.replay
             )
             for r in resultado.resultados
         ]
     )
 
 
+@router.delete("/lotes/{lote_id}", status_code=status.HTTP_204_NO_CONTENT)
+def desfazer_importacao(
+    lote_id: int,
+    use_case: DesfazerImportacaoUseCase = Depends(get_desfazer_importacao_use_case)
+):
+    """
+    Desfaz uma importação: remove o lote, suas transações e as tags associadas.
+    
+    O `lote_id` é retornado por arquivo no resultado da importação.
+    """
+    try:
+        use_case.execute(lote_id)
+        return None
+        
+    except EntityNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -0,0 +1,75 @@
+"""
+Router Interno - diagnóstico operacional (não exposto na documentação)
+
+Todos os endpoints exigem X-Admin-Token: SQL, parâmetros e planos de
+execução não devem ficar abertos a qualquer cliente da API.
+"""
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.infrastructure.database.consultas_lentas import get_buffer_consultas_lentas
+from app.infrastructure.database.engine import get_async_engine, get_engine
+from app.infrastructure.database.pool import obter_estatisticas_pool
+from app.infrastructure.observabilidade.perfilador import get_armazem_perfis
+from app.interfaces.api.admin import exigir_admin
+from app.interfaces.api.schemas.request_response import (
+    ConsultaLentaResponse,
+    EstatisticasPoolResponse,
+    PoolConexoesResponse,
+)
+
+router = APIRouter(
+    prefix="/interno",
+    tags=["Interno"],
+    include_in_schema=False,
+    dependencies=[Depends(exigir_admin)],
+)
+
+
+@router.get("/pool", response_model=PoolConexoesResponse)
+def obter_estado_pool():
+    """
+    Estado atual dos pools de conexão.
+    
+    Conexões em uso próximas de tamanho + max_overflow e espera média
+    crescente indicam requisições enfileiradas aguardando o banco.
+    """
+    return PoolConexoesResponse(
+        sincrono=EstatisticasPoolResponse(**obter_estatisticas_pool(get_engine())),
+        assincrono=EstatisticasPoolResponse(**obter_estatisticas_pool(get_async_engine())),
+    )
+
+
+@router.get("/consultas-lentas", response_model=List[ConsultaLentaResponse])
+def listar_consultas_lentas(limite: int = Query(50, ge=1, le=1000)):
+    """
+    Consultas lentas mais recentes (acima de DB_SLOW_QUERY_MS).
+    
+    Inclui SQL, parâmetros mascarados, duração, use case de origem e,
+    com DB_SLOW_QUERY_EXPLAIN, o plano de execução.
+    """
+    return get_buffer_consultas_lentas().listar(limite)
+
+
+@router.get("/perfis/{perfil_id}", response_class=PlainTextResponse)
+def obter_perfil(perfil_id: str):
+    """
+    Perfil de uma requisição (header X-Profile-Id) em folded stacks.
+    
+    Cada linha é `thread;modulo.funcao;... amostras`, pronta para
+    flamegraph.pl, speedscope ou inferno.
+    """
+    perfil = get_armazem_perfis().obter(perfil_id)
+    if perfil is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Perfil não encontrado")
+    return PlainTextResponse(
+        perfil.como_folded(),
+        headers={
+            "X-Profile-Path": f"{perfil.metodo} {perfil.caminho}",
+            "X-Profile-Duration-ms": str(perfil.duracao_ms),
+            "X-Profile-Samples": str(perfil.total_amostras),
+            "X-Profile-Threads": ", ".join(perfil.threads),
+        },
+    )
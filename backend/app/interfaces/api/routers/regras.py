@@ -19,10 +19,16 @@ from app.interfaces.api.dependencies import (
     get_atualizar_regra_use_case,
     get_criar_regra_use_case,
     get_deletar_regra_use_case,
+    get_listar_estatisticas_regras_use_case,
     get_listar_regras_use_case,
     get_regra_repository,
 )
-from app.interfaces.api.schemas.request_response import RegraCreateRequest, RegraResponse, RegraUpdateRequest
+from app.interfaces.api.schemas.request_response import (
+    EstatisticaRegraResponse,
+    RegraCreateRequest,
+    RegraResponse,
+    RegraUpdateRequest,
+)
 
 router = APIRouter(prefix="/regras", tags=["Regras"])
 
@@ -51,6 +57,43 @@ def listar_regras(
         )
 
 
+@router.get("/estatisticas", response_model=List[EstatisticaRegraResponse])
+def listar_estatisticas_regras(
+    use_case = Depends(get_listar_estatisticas_regras_use_case)
+):
+    """
+    Lista estatísticas de execução de cada regra.
+    
+    Contadores acumulados em importações e aplicações retroativas:
+    avaliações, correspondências, aplicações e tempo (total e médio).
+    Regras nunca avaliadas aparecem com contadores zerados.
+    
+    Returns:
+        Lista de estatísticas ordenada por prioridade (maior primeiro)
+    """
+    try:
+        dtos = use_case.execute()
+        return [
+            EstatisticaRegraResponse(
+                regra_id=dto.regra_id,
+                nome=dto.nome,
+                ativo=dto.ativo,
+                prioridade=dto.prioridade,
+                total_avaliacoes=dto.total_avaliacoes,
+                total_correspondencias=dto.total_correspondencias,
+                total_aplicacoes=dto.total_aplicacoes,
+                tempo_total_ms=dto.tempo_total_ms,
+                tempo_medio_ms=dto.tempo_medio_ms
+            )
+            for dto in dtos
+        ]
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
 @router.get("/{regra_id}", response_model=RegraResponse)
 def obter_regra(
     regra_id: int,
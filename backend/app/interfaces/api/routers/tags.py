@@ -9,16 +9,20 @@ from app.application.dto.tag_dto import CriarTagDTO
 from app.application.exceptions.application_exceptions import EntityNotFoundException, ValidationException
 from app.application.use_cases.criar_tag import CriarTagUseCase
 from app.application.use_cases.deletar_tag import DeletarTagUseCase
-from app.application.use_cases.listar_tags import ListarTagsUseCase
-from app.interfaces.api.dependencies import get_criar_tag_use_case, get_deletar_tag_use_case, get_listar_tags_use_case
+from app.application.use_cases.listar_tags import ListarTagsAsyncUseCase
+from app.interfaces.api.dependencies import (
+    get_criar_tag_use_case,
+    get_deletar_tag_use_case,
+    get_listar_tags_async_use_case,
+)
 from app.interfaces.api.schemas.request_response import TagCreateRequest, TagResponse
 
 router = APIRouter(prefix="/tags", tags=["Tags"])
 
 
 @router.get("", response_model=List[TagResponse])
-def listar_tags(
-    use_case: ListarTagsUseCase = Depends(get_listar_tags_use_case)
+async def listar_tags(
+    use_case: ListarTagsAsyncUseCase = Depends(get_listar_tags_async_use_case)
 ):
     """
     Lista todas as tags disponíveis ordenadas por nome.
@@ -27,7 +31,7 @@ def listar_tags(
         Lista de tags
     """
     try:
-        dtos = use_case.execute()
+        dtos = await use_case.execute()
         return [_dto_to_response(dto) for dto in dtos]
     except Exception as e:
         raise HTTPException(
@@ -8,41 +8,51 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.application.dto.transacao_dto import (
+    AtualizarTagsEmLoteDTO,
     AtualizarTransacaoDTO,
+    AtualizarTransacoesEmLoteDTO,
     CriarTransacaoDTO,
     FiltrosTransacaoDTO,
     TransacaoDTO,
 )
 from app.application.exceptions.application_exceptions import EntityNotFoundException, ValidationException
 from app.application.use_cases.adicionar_tag_transacao import AdicionarTagTransacaoUseCase
+from app.application.use_cases.atualizar_tags_em_lote import AtualizarTagsEmLoteUseCase
 from app.application.use_cases.atualizar_transacao import AtualizarTransacaoUseCase
+from app.application.use_cases.atualizar_transacoes_em_lote import AtualizarTransacoesEmLoteUseCase
 from app.application.use_cases.criar_transacao import CriarTransacaoUseCase
-from app.application.use_cases.listar_categorias import ListarCategoriasUseCase
+from app.application.use_cases.listar_categorias import ListarCategoriasAsyncUseCase
 from app.application.use_cases.listar_tags_transacao import ListarTagsTransacaoUseCase
-from app.application.use_cases.listar_transacoes import ListarTransacoesUseCase
-from app.application.use_cases.obter_resumo_mensal import ObterResumoMensalUseCase
+from app.application.use_cases.listar_transacoes import ListarTransacoesAsyncUseCase
+from app.application.use_cases.obter_resumo_mensal import ObterResumoMensalAsyncUseCase
 from app.application.use_cases.obter_transacao import ObterTransacaoUseCase
 from app.application.use_cases.remover_tag_transacao import RemoverTagTransacaoUseCase
 from app.application.use_cases.restaurar_valor_original import RestaurarValorOriginalUseCase
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 from app.interfaces.api.dependencies import (
     get_adicionar_tag_transacao_use_case,
+    get_atualizar_tags_em_lote_use_case,
     get_atualizar_transacao_use_case,
+    get_atualizar_transacoes_em_lote_use_case,
     get_criar_transacao_use_case,
-    get_listar_categorias_use_case,
+    get_listar_categorias_async_use_case,
     get_listar_tags_transacao_use_case,
-    get_listar_transacoes_use_case,
-    get_obter_resumo_mensal_use_case,
+    get_listar_transacoes_async_use_case,
+    get_obter_resumo_mensal_async_use_case,
     get_obter_transacao_use_case,
     get_remover_tag_transacao_use_case,
     get_restaurar_valor_original_use_case,
 )
 from app.interfaces.api.schemas.request_response import (
+    FiltrosTransacaoRequest,
+    OperacaoEmLoteResponse,
     ResumoMensalResponse,
     TagResponse,
+    TagsEmLoteRequest,
     TransacaoCreateRequest,
     TransacaoResponse,
     TransacaoUpdateRequest,
+    TransacoesEmLoteUpdateRequest,
     UsuarioResponse,
 )
 
@@ -91,7 +101,7 @@ def criar_transacao(
 
 
 @router.get("", response_model=List[TransacaoResponse])
-def listar_transacoes(
+async def listar_transacoes(
     mes: Optional[int] = Query(None, ge=1, le=12),
     ano: Optional[int] = Query(None, ge=2000),
     data_inicio: Optional[date] = None,
@@ -102,7 +112,7 @@ def listar_transacoes(
     sem_tags: bool = Query(False, description="Filtrar apenas transações sem tags"),
     sem_categoria: bool = Query(False, description="Filtrar apenas transações sem categoria"),
     usuario_id: Optional[int] = Query(None, description="Filtrar por ID do usuário"),
-    use_case: ListarTransacoesUseCase = Depends(get_listar_transacoes_use_case)
+    use_case: ListarTransacoesAsyncUseCase = Depends(get_listar_transacoes_async_use_case)
 ):
     """
     Lista transações com filtros opcionais.
@@ -138,7 +148,7 @@ def listar_transacoes(
         )
         
         # Executa caso de uso
-        resultados = use_case.execute(filtros)
+        resultados = await use_case.execute(filtros)
         
         # Converte DTOs → Responses
         return [_dto_to_response(dto) for dto in resultados]
@@ -147,9 +157,68 @@ def listar_transacoes(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.patch("", response_model=OperacaoEmLoteResponse)
+def atualizar_transacoes_em_lote(
+    request: TransacoesEmLoteUpdateRequest,
+    use_case: AtualizarTransacoesEmLoteUseCase = Depends(get_atualizar_transacoes_em_lote_use_case)
+):
+    """
+    Atualiza categoria, observações e/ou usuário de várias transações.
+    
+    As transações são selecionadas por `transacao_ids` e/ou pelos mesmos
+    `filtros` da listagem. Executado como um único UPDATE.
+    """
+    try:
+        campos = {"categoria", "observacoes", "usuario_id"} & request.model_fields_set
+        dto = AtualizarTransacoesEmLoteDTO(
+            transacao_ids=request.transacao_ids,
+            filtros=_filtros_request_to_dto(request.filtros),
+            alteracoes={campo: getattr(request, campo) for campo in campos}
+        )
+        total = use_case.execute(dto)
+        return OperacaoEmLoteResponse(total_afetado=total)
+        
+    except EntityNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.post("/tags", response_model=OperacaoEmLoteResponse)
+def atualizar_tags_em_lote(
+    request: TagsEmLoteRequest,
+    use_case: AtualizarTagsEmLoteUseCase = Depends(get_atualizar_tags_em_lote_use_case)
+):
+    """
+    Adiciona e/ou remove tags de várias transações de uma vez.
+    
+    As transações são selecionadas por `transacao_ids` e/ou pelos mesmos
+    `filtros` da listagem (combinados com AND). Associações já existentes
+    são ignoradas.
+    """
+    try:
+        dto = AtualizarTagsEmLoteDTO(
+            transacao_ids=request.transacao_ids,
+            filtros=_filtros_request_to_dto(request.filtros),
+            adicionar_tag_ids=request.adicionar,
+            remover_tag_ids=request.remover
+        )
+        total = use_case.execute(dto)
+        return OperacaoEmLoteResponse(total_afetado=total)
+        
+    except EntityNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationException as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @router.get("/categorias", response_model=List[str])
-def listar_categorias(
-    use_case: ListarCategoriasUseCase = Depends(get_listar_categorias_use_case)
+async def listar_categorias(
+    use_case: ListarCategoriasAsyncUseCase = Depends(get_listar_categorias_async_use_case)
 ):
     """
     Lista todas as categorias únicas existentes nas transações.
@@ -158,13 +227,13 @@ def listar_categorias(
         Lista de strings com categorias ordenadas alfabeticamente
     """
     try:
-        return use_case.execute()
+        return await use_case.execute()
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
 @router.get("/resumo/mensal", response_model=ResumoMensalResponse)
-def obter_resumo_mensal(
+async def obter_resumo_mensal(
     mes: Optional[int] = Query(None, ge=1, le=12),
     ano: Optional[int] = Query(None, ge=2000),
     data_inicio: Optional[date] = None,
@@ -172,7 +241,7 @@ def obter_resumo_mensal(
     tags: Optional[str] = Query(None, description="IDs separados por vírgula"),
     sem_tags: bool = Query(False, description="Filtrar apenas transações sem tags"),
     usuario_id: Optional[int] = Query(None, description="Filtrar por ID do usuário"),
-    use_case: ObterResumoMensalUseCase = Depends(get_obter_resumo_mensal_use_case)
+    use_case: ObterResumoMensalAsyncUseCase = Depends(get_obter_resumo_mensal_async_use_case)
 ):
     """
     Retorna resumo mensal de entradas/saídas agrupadas por categoria.
@@ -192,7 +261,7 @@ def obter_resumo_mensal(
             tag_ids = [int(t) for t in tags.split(",")]
         
         # Executar caso de uso
-        resultado = use_case.execute(
+        resultado = await use_case.execute(
             mes=mes,
             ano=ano,
             data_inicio=data_inicio,
@@ -369,6 +438,24 @@ def listar_tags_transacao(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+def _filtros_request_to_dto(filtros: Optional[FiltrosTransacaoRequest]) -> Optional[FiltrosTransacaoDTO]:
+    """Converte filtros do request → DTO de filtros"""
+    if filtros is None:
+        return None
+    return FiltrosTransacaoDTO(
+        mes=filtros.mes,
+        ano=filtros.ano,
+        data_inicio=filtros.data_inicio,
+        data_fim=filtros.data_fim,
+        categoria=filtros.categoria,
+        tipo=TipoTransacao(filtros.tipo) if filtros.tipo else None,
+        tag_ids=filtros.tag_ids,
+        sem_tags=filtros.sem_tags,
+        sem_categoria=filtros.sem_categoria,
+        usuario_id=filtros.usuario_id
+    )
+
+
 def _dto_to_response(dto: TransacaoDTO) -> TransacaoResponse:
     """Converte DTO de aplicação → Response de apresentação"""
     # Converte TagDTOs → TagResponses
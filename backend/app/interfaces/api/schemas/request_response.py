@@ -3,7 +3,7 @@ Schemas Pydantic para API - Camada de Apresentação
 Modelos de request/response para FastAPI
 """
 from datetime import date, datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -56,6 +56,47 @@ class TransacaoResponse(BaseModel):
         from_attributes = True
 
 
+class FiltrosTransacaoRequest(BaseModel):
+    """Schema com os filtros de listagem, usado para selecionar transações em lote"""
+    mes: Optional[int] = Field(None, ge=1, le=12)
+    ano: Optional[int] = Field(None, ge=2000)
+    data_inicio: Optional[date] = None
+    data_fim: Optional[date] = None
+    categoria: Optional[str] = None
+    tipo: Optional[str] = Field(None, pattern="^(entrada|saida)$")
+    tag_ids: Optional[List[int]] = None
+    sem_tags: bool = False
+    sem_categoria: bool = False
+    usuario_id: Optional[int] = None
+
+
+class TransacoesEmLoteUpdateRequest(BaseModel):
+    """
+    Schema para atualização de campos de várias transações.
+    
+    Apenas os campos enviados são alterados; enviar `null` limpa
+    categoria/observacoes.
+    """
+    transacao_ids: Optional[List[int]] = None
+    filtros: Optional[FiltrosTransacaoRequest] = None
+    categoria: Optional[str] = None
+    observacoes: Optional[str] = None
+    usuario_id: Optional[int] = None
+
+
+class TagsEmLoteRequest(BaseModel):
+    """Schema para adicionar/remover tags de várias transações"""
+    transacao_ids: Optional[List[int]] = None
+    filtros: Optional[FiltrosTransacaoRequest] = None
+    adicionar: List[int] = []
+    remover: List[int] = []
+
+
+class OperacaoEmLoteResponse(BaseModel):
+    """Schema para response de operações em lote"""
+    total_afetado: int
+
+
 class ResumoMensalResponse(BaseModel):
     """Schema para response de resumo mensal"""
     mes: Optional[int]
@@ -155,6 +196,19 @@ class RegraResponse(BaseModel):
         from_attributes = True
 
 
+class EstatisticaRegraResponse(BaseModel):
+    """Schema para response de estatísticas de execução de regra"""
+    regra_id: int
+    nome: str
+    ativo: bool
+    prioridade: int
+    total_avaliacoes: int
+    total_correspondencias: int
+    total_aplicacoes: int
+    tempo_total_ms: float
+    tempo_medio_ms: float
+
+
 # ===== USUARIO =====
 
 class UsuarioResponse(BaseModel):
@@ -176,9 +230,11 @@ class ResultadoArquivoResponse(BaseModel):
     nome_arquivo: str
     sucesso: bool
     total_importado: int
-    transacoes_ids: List[int]
+    transacoes_ids: List[int]  # Vazio para arquivos importados em vários blocos (usar lote_id)
     mensagem: str
     erro: Optional[str] = None
+    lote_id: Optional[int] = None  # Usado para desfazer a importação
+    replay: bool = False  # Arquivo já importado anteriormente (resultado reaproveitado)
 
 
 class ResultadoImportacaoMultiplaResponse(BaseModel):
@@ -190,5 +246,41 @@ class ResultadoImportacaoMultiplaResponse(BaseModel):
     resultados: List[ResultadoArquivoResponse]
 
 
+# ===== INTERNO =====
+
+class EstatisticasPoolResponse(BaseModel):
+    """Schema para o estado de um pool de conexões"""
+    classe: str
+    tamanho: Optional[int] = None
+    em_uso: Optional[int] = None  # Conexões em checkout
+    ociosas: Optional[int] = None
+    overflow: Optional[int] = None  # Conexões abertas além de tamanho
+    max_overflow: Optional[int] = None
+    total_checkouts: Optional[int] = None
+    total_timeouts: Optional[int] = None
+    espera_total_ms: Optional[float] = None
+    espera_media_ms: Optional[float] = None
+    espera_max_ms: Optional[float] = None
+
+
+class PoolConexoesResponse(BaseModel):
+    """Schema para response do estado dos pools (engines síncrono e async)"""
+    sincrono: EstatisticasPoolResponse
+    assincrono: EstatisticasPoolResponse
+
+
+class ConsultaLentaResponse(BaseModel):
+    """Schema para uma consulta lenta registrada (parâmetros textuais mascarados)"""
+    sql: str
+    parametros: Any
+    duracao_ms: float
+    origem: Optional[str] = None  # Use case que executou o statement
+    plano: Optional[List[str]] = None  # EXPLAIN, quando DB_SLOW_QUERY_EXPLAIN está ativo
+    registrada_em: datetime
+
+    class Config:
+        from_attributes = True
+
+
 # Rebuild models para resolver forward references
 TransacaoResponse.model_rebuild()
@@ -9,16 +9,24 @@ Estrutura:
 - interfaces/api/: Routers FastAPI, Schemas Pydantic, Dependency Injection
 """
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
-from app.interfaces.api.routers import configuracoes, importacao, regras, tags, transacoes, usuarios
+from app.infrastructure.observabilidade.metricas import registro as registro_metricas
+from app.infrastructure.observabilidade.prometheus import TIPO_CONTEUDO
+from app.interfaces.api.middlewares.leitura_apos_escrita import LeituraAposEscritaMiddleware
+from app.interfaces.api.middlewares.metricas_consultas import MetricasConsultasMiddleware
+from app.interfaces.api.middlewares.metricas_http import MetricasHTTPMiddleware
+from app.interfaces.api.middlewares.perfilamento import PerfilamentoMiddleware, registrar_thread_perfilada
+from app.interfaces.api.routers import configuracoes, importacao, interno, regras, tags, transacoes, usuarios
 
 app = FastAPI(
     title="Finanças Pessoais API",
     description="API para gerenciamento de finanças pessoais",
     version="2.0.0",
-    redirect_slashes=False  # Desabilita redirect automático de trailing slashes
+    redirect_slashes=False,  # Desabilita redirect automático de trailing slashes
+    dependencies=[Depends(registrar_thread_perfilada)],  # Threads amostradas no perfilamento
 )
 
 # CORS
@@ -28,7 +36,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Queries", "X-DB-Time-ms", "X-Profile-Id"],
 )
+app.add_middleware(LeituraAposEscritaMiddleware)
+app.add_middleware(MetricasConsultasMiddleware)
+app.add_middleware(MetricasHTTPMiddleware)
+app.add_middleware(PerfilamentoMiddleware)
 
 app.include_router(transacoes.router)
 app.include_router(tags.router)
@@ -36,6 +49,7 @@ app.include_router(regras.router)
 app.include_router(configuracoes.router)
 app.include_router(importacao.router)
 app.include_router(usuarios.router)
+app.include_router(interno.router)
 
 
 @app.get("/")
@@ -50,3 +64,9 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Métricas no formato texto do Prometheus (latência por rota, importação, regras, pools)"""
+    return Response(content=registro_metricas.exportar(), media_type=TIPO_CONTEUDO)
@@ -0,0 +1,3 @@
+"""
+Benchmarks do backend (executados manualmente, fora da suíte de testes)
+"""
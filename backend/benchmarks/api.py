@@ -0,0 +1,250 @@
+"""
+Benchmark ponta a ponta dos endpoints quentes da API
+
+Para cada banco (SQLite; PostgreSQL quando --postgres-url/BENCH_POSTGRES_URL
+estiver definida) e escala (10k, 100k, 1M transações), popula uma base
+sintética (benchmarks.dados_sinteticos) e mede, via TestClient (pilha
+ASGI completa, sem rede):
+- GET /transacoes com cada combinação de filtros
+- GET /transacoes/resumo/mensal, /transacoes/categorias e /transacoes/{id}
+- POST /regras/aplicar-todas (retroativa)
+
+O resultado é um JSON (stdout ou --saida) com mediana/p95/min/max por
+endpoint, consultas ao banco (X-DB-Queries) e o commit medido, para
+comparação entre commits com benchmarks.comparar.
+
+Uso (a partir de backend/):
+    uv run python -m benchmarks.api
+    uv run python -m benchmarks.api --escala 10k --escala 100k --saida bench.json
+    BENCH_POSTGRES_URL=postgresql://u:s@localhost:5432/bench uv run python -m benchmarks.api --escala 1M
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.dados_sinteticos import GeradorBaseSintetica, ResumoBase
+
+DIRETORIO_BACKEND = Path(__file__).resolve().parent.parent
+ESCALAS = {"10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+# Listagem sem filtro devolve a base inteira: medida só até esta escala
+MAX_TRANSACOES_SEM_FILTRO = 100_000
+
+
+def interpretar_escala(valor: str) -> int:
+    """'10k', '1M' ou número inteiro"""
+    if valor in ESCALAS:
+        return ESCALAS[valor]
+    sufixos = {"k": 1_000, "K": 1_000, "m": 1_000_000, "M": 1_000_000}
+    if valor[-1] in sufixos:
+        return int(float(valor[:-1]) * sufixos[valor[-1]])
+    return int(valor)
+
+
+def commit_atual() -> Optional[str]:
+    try:
+        saida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=DIRETORIO_BACKEND, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return saida.stdout.strip() or None
+
+
+def cenarios(resumo: ResumoBase) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+    """(nome, método, rota, parâmetros) de cada medição"""
+    ano, mes = (int(parte) for parte in resumo.meses[-2].split("-"))
+    periodo = {"mes": mes, "ano": ano}
+    inicio_trimestre = f"{resumo.meses[-4]}-01"
+    fim_trimestre = f"{resumo.meses[-2]}-28"
+    tags = ",".join(str(tag_id) for tag_id in resumo.tags_mais_usadas)
+
+    listagens = [
+        ("listar_mes", periodo),
+        ("listar_intervalo_datas", {"data_inicio": inicio_trimestre, "data_fim": fim_trimestre}),
+        ("listar_mes_categoria", {**periodo, "categoria": resumo.categoria_mais_comum}),
+        ("listar_mes_tipo", {**periodo, "tipo": "saida"}),
+        ("listar_mes_tags", {**periodo, "tags": tags}),
+        ("listar_mes_sem_tags", {**periodo, "sem_tags": "true"}),
+        ("listar_mes_tags_ou_sem_tags", {**periodo, "tags": tags, "sem_tags": "true"}),
+        ("listar_mes_sem_categoria", {**periodo, "sem_categoria": "true"}),
+        ("listar_mes_usuario", {**periodo, "usuario_id": 1}),
+        ("listar_combinado", {**periodo, "tipo": "saida", "tags": tags, "usuario_id": 1}),
+    ]
+    if resumo.total_transacoes <= MAX_TRANSACOES_SEM_FILTRO:
+        listagens.insert(0, ("listar_sem_filtros", {}))
+
+    return [
+        *[(nome, "GET", "/transacoes", parametros) for nome, parametros in listagens],
+        ("resumo_mensal", "GET", "/transacoes/resumo/mensal", periodo),
+        ("resumo_mensal_tags", "GET", "/transacoes/resumo/mensal", {**periodo, "tags": tags}),
+        ("resumo_intervalo_datas", "GET", "/transacoes/resumo/mensal",
+         {"data_inicio": inicio_trimestre, "data_fim": fim_trimestre}),
+        ("categorias", "GET", "/transacoes/categorias", {}),
+        ("obter_transacao", "GET", f"/transacoes/{resumo.transacao_exemplo_id}", {}),
+    ]
+
+
+def medir(
+    client, metodo: str, rota: str, parametros: Dict[str, Any], repeticoes: int, aquecer: bool = True
+) -> Dict[str, Any]:
+    """
+    Executa a requisição `repeticoes` vezes e resume os tempos. Leituras têm
+    uma execução de aquecimento descartada; operações caras que alteram a
+    base (retroativa) são medidas desde a primeira execução.
+    """
+    if aquecer:
+        client.request(metodo, rota, params=parametros)
+    tempos_ms, tempos_db_ms = [], []
+    resposta = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resposta = client.request(metodo, rota, params=parametros)
+        tempos_ms.append((time.perf_counter() - inicio) * 1000)
+        tempos_db_ms.append(float(resposta.headers.get("X-DB-Time-ms", 0)))
+    return _resumir_tempos(resposta, tempos_ms, tempos_db_ms)
+
+
+def _resumir_tempos(resposta, tempos_ms: List[float], tempos_db_ms: List[float]) -> Dict[str, Any]:
+    ordenados = sorted(tempos_ms)
+    corpo = resposta.json() if resposta.headers.get("content-type", "").startswith("application/json") else None
+    return {
+        "status": resposta.status_code,
+        "itens": len(corpo) if isinstance(corpo, list) else None,
+        "repeticoes": len(tempos_ms),
+        "mediana_ms": round(statistics.median(tempos_ms), 2),
+        "p95_ms": round(ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))], 2),
+        "min_ms": round(ordenados[0], 2),
+        "max_ms": round(ordenados[-1], 2),
+        "db_mediana_ms": round(statistics.median(tempos_db_ms), 2),
+        "consultas_db": int(resposta.headers.get("X-DB-Queries", 0)),
+    }
+
+
+def _apontar_aplicacao(url: str) -> None:
+    """Aponta settings e engines (singletons lazy) da aplicação para o banco do benchmark"""
+    from app.infrastructure.config import get_settings
+    from app.infrastructure.database import engine as engine_module
+
+    settings = get_settings()
+    settings.DATABASE_URL = url
+    settings.DATABASE_ASYNC_URL = None
+    settings.DATABASE_READ_URL = None
+    # Mede a aplicação, não o log: statements lentos são esperados nas escalas maiores
+    settings.DB_SLOW_QUERY_MS = None
+    _descartar_engines()
+    engine_module._engine = None
+    engine_module._async_engine = None
+    engine_module._read_engine = None
+    engine_module._async_read_engine = None
+
+
+def _descartar_engines() -> None:
+    from app.infrastructure.database import engine as engine_module
+
+    for engine in (engine_module._engine, engine_module._read_engine):
+        if engine is not None:
+            engine.dispose()
+
+    async def descartar_async():
+        for engine in (engine_module._async_engine, engine_module._async_read_engine):
+            if engine is not None:
+                await engine.dispose()
+
+    asyncio.run(descartar_async())
+
+
+def executar(banco: str, url: str, total_transacoes: int, repeticoes: int, repeticoes_retroativa: int) -> Dict[str, Any]:
+    """Popula a base, mede todos os cenários e devolve o resultado da execução"""
+    from fastapi.testclient import TestClient
+
+    from app.infrastructure.database.engine import criar_engine
+    from app.main import app
+
+    print(f"[{banco}] populando {total_transacoes} transações...", file=sys.stderr)
+    engine_carga = criar_engine(url)
+    inicio = time.perf_counter()
+    resumo = GeradorBaseSintetica(total_transacoes).popular(engine_carga)
+    tempo_carga_s = time.perf_counter() - inicio
+    engine_carga.dispose()
+
+    _apontar_aplicacao(url)
+    app.dependency_overrides.clear()
+    endpoints = []
+    try:
+        with TestClient(app) as client:
+            for nome, metodo, rota, parametros in cenarios(resumo):
+                print(f"[{banco} {total_transacoes}] {nome}", file=sys.stderr)
+                endpoints.append({
+                    "nome": nome, "metodo": metodo, "rota": rota, "parametros": parametros,
+                    **medir(client, metodo, rota, parametros, repeticoes),
+                })
+            print(f"[{banco} {total_transacoes}] aplicar_todas_regras", file=sys.stderr)
+            endpoints.append({
+                "nome": "aplicar_todas_regras", "metodo": "POST", "rota": "/regras/aplicar-todas", "parametros": {},
+                **medir(client, "POST", "/regras/aplicar-todas", {}, repeticoes_retroativa, aquecer=False),
+            })
+    finally:
+        _descartar_engines()
+
+    return {
+        "banco": banco,
+        "escala": total_transacoes,
+        "tempo_carga_s": round(tempo_carga_s, 2),
+        "base": resumo.como_dict(),
+        "endpoints": endpoints,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--escala", action="append", dest="escalas",
+                        help="Transações na base: 10k, 100k, 1M ou número (pode repetir; padrão: 10k)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Execuções medidas por endpoint de leitura")
+    parser.add_argument("--repeticoes-retroativa", type=int, default=1,
+                        help="Execuções de POST /regras/aplicar-todas")
+    parser.add_argument("--postgres-url", default=os.environ.get("BENCH_POSTGRES_URL"),
+                        help="Banco PostgreSQL descartável (será recriado!); padrão: BENCH_POSTGRES_URL")
+    parser.add_argument("--sem-sqlite", action="store_true", help="Mede apenas o PostgreSQL")
+    parser.add_argument("--saida", type=Path, help="Arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args()
+
+    escalas = [interpretar_escala(escala) for escala in (args.escalas or ["10k"])]
+    execucoes = []
+    with tempfile.TemporaryDirectory(prefix="bench_api_") as diretorio:
+        for total in escalas:
+            if not args.sem_sqlite:
+                url = f"sqlite:///{Path(diretorio) / f'bench_{total}.db'}"
+                execucoes.append(executar("sqlite", url, total, args.repeticoes, args.repeticoes_retroativa))
+            if args.postgres_url:
+                execucoes.append(
+                    executar("postgresql", args.postgres_url, total, args.repeticoes, args.repeticoes_retroativa)
+                )
+
+    resultado = {
+        "benchmark": "api",
+        "gerado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit_atual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "execucoes": execucoes,
+    }
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida:
+        args.saida.write_text(texto + "\n", encoding="utf-8")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Gerador de arquivos sintéticos para os benchmarks de parsers e importação
+
+Produz, para cada parser, um arquivo no formato do banco (nome, layout de
+colunas, linhas de cabeçalho e linhas que o parser descarta), com o
+número pedido de transações válidas:
+- btg_extrato: planilha com título, cabeçalho "Data e hora" e uma linha
+  "Saldo Diário" por dia (colunas B, C, D, G, K)
+- btg_fatura: planilha protegida por senha (CPF do titular da base
+  sintética), seções por cartão, linha de benefício do cartão e ~20% de
+  compras parceladas "(N/T)" (colunas B, C, E, F)
+- nubank_extrato: CSV Data, Valor, Identificador, Descrição
+- nubank_fatura: CSV date, title, amount com parcelas e pagamento recebido
+- arquivo_tratado: CSV data, descricao, valor, origem, categoria, banco,
+  data_fatura misturando extrato e fatura
+
+Descrições e categorias vêm dos estabelecimentos da base sintética
+(benchmarks.dados_sinteticos), para que as regras da base casem com as
+transações importadas. A geração é determinística por (semente, parser,
+linhas).
+
+Nota: o extrato BTG é gerado como .xlsx (o parser aceita .xls e .xlsx):
+não há dependência do projeto capaz de gravar .xls.
+"""
+import csv
+import io
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from msoffcrypto.format.ooxml import OOXMLFile
+from openpyxl import Workbook
+
+from benchmarks.dados_sinteticos import ESTABELECIMENTOS_ENTRADA, ESTABELECIMENTOS_SAIDA, USUARIOS
+
+PARSERS = ("btg_extrato", "btg_fatura", "nubank_extrato", "nubank_fatura", "arquivo_tratado")
+
+# A importação usa o CPF do usuário como senha padrão da fatura BTG
+SENHA_FATURA = USUARIOS[0][1]
+
+MESES_NUBANK = ["JAN", "FEV", "MAR", "ABR", "MAI", "JUN", "JUL", "AGO", "SET", "OUT", "NOV", "DEZ"]
+TRANSACOES_EXTRATO_BTG = {
+    "saida": ["Pix enviado", "Compra no débito", "Pagamento de boleto", "TED enviada"],
+    "entrada": ["Pix recebido", "TED recebida", "Rendimento"],
+}
+BENEFICIO_CARTAO_BTG = "Benefício do cartão BTG Pactual"
+PROPORCAO_PARCELADAS = 0.2
+
+# (data e hora, descrição, categoria, valor com sinal)
+Lancamento = Tuple[datetime, str, Optional[str], float]
+
+
+@dataclass
+class ArquivoSintetico:
+    """Arquivo gerado e o que se espera dele"""
+    parser_id: str
+    nome: str
+    conteudo: bytes
+    linhas: int  # transações válidas (o parser deve devolver exatamente estas)
+    senha: Optional[str] = None
+
+    @property
+    def tamanho_bytes(self) -> int:
+        return len(self.conteudo)
+
+
+class GeradorArquivosSinteticos:
+    """
+    Gera arquivos de importação no formato de cada parser.
+
+    Uso:
+        arquivo = GeradorArquivosSinteticos().gerar("btg_fatura", linhas=10_000)
+        parser.parse(arquivo.conteudo, arquivo.nome, password=arquivo.senha)
+    """
+
+    def __init__(self, semente: int = 42, hoje: date | None = None):
+        self._semente = semente
+        self._hoje = hoje or date.today()
+        self._geradores: Dict[str, Callable[[int], ArquivoSintetico]] = {
+            "btg_extrato": self.btg_extrato,
+            "btg_fatura": self.btg_fatura,
+            "nubank_extrato": self.nubank_extrato,
+            "nubank_fatura": self.nubank_fatura,
+            "arquivo_tratado": self.arquivo_tratado,
+        }
+
+    def gerar(self, parser_id: str, linhas: int) -> ArquivoSintetico:
+        if parser_id not in self._geradores:
+            raise ValueError(f"Parser sem gerador: {parser_id}. Disponíveis: {', '.join(PARSERS)}")
+        return self._geradores[parser_id](linhas)
+
+    # ===== Formatos =====
+
+    def btg_extrato(self, linhas: int) -> ArquivoSintetico:
+        aleatorio = self._aleatorio("btg_extrato", linhas)
+        inicio, fim = self._periodo(linhas)
+
+        planilha = Workbook(write_only=True)
+        aba = planilha.create_sheet("Extrato")
+        aba.append([None, "Extrato de conta corrente"])
+        aba.append([None, f"Período: {inicio:%d/%m/%Y} a {fim:%d/%m/%Y}"])
+        aba.append([])
+        aba.append([None, "Data e hora", "Categoria", "Transação", None, None, "Descrição", None, None, None, "Valor"])
+
+        saldo = round(aleatorio.uniform(2_000, 20_000), 2)
+        dia_atual = None
+        for momento, descricao, categoria, valor in self._lancamentos(aleatorio, linhas, inicio, fim, 0.15):
+            if dia_atual is not None and momento.date() != dia_atual:
+                aba.append(_linha_saldo_btg(saldo))
+            dia_atual = momento.date()
+            saldo = round(saldo + valor, 2)
+            transacao = aleatorio.choice(TRANSACOES_EXTRATO_BTG["entrada" if valor > 0 else "saida"])
+            aba.append([
+                None, f"{momento:%d/%m/%Y %H:%M}", categoria or "Outros", transacao,
+                None, None, descricao, None, None, None, valor,
+            ])
+        if dia_atual is not None:
+            aba.append(_linha_saldo_btg(saldo))
+
+        nome = f"Extrato_{inicio:%Y-%m-%d}_a_{fim:%Y-%m-%d}_{aleatorio.randint(1000, 9999)}.xlsx"
+        return ArquivoSintetico("btg_extrato", nome, _gravar_planilha(planilha), linhas)
+
+    def btg_fatura(self, linhas: int, senha: str = SENHA_FATURA) -> ArquivoSintetico:
+        aleatorio = self._aleatorio("btg_fatura", linhas)
+        data_fatura = self._hoje.replace(day=1)
+        inicio, fim = data_fatura - timedelta(days=35), data_fatura - timedelta(days=5)
+        cartoes = [f"{aleatorio.randint(1000, 9999)}" for _ in range(2)]
+
+        planilha = Workbook(write_only=True)
+        aba = planilha.create_sheet("Fatura")
+        aba.append([None, "Fatura do cartão BTG Pactual"])
+        aba.append([None, f"Vencimento: {data_fatura + timedelta(days=9):%d/%m/%Y}"])
+        aba.append([])
+
+        lancamentos = list(self._lancamentos(aleatorio, linhas, inicio, fim, 0.0))
+        por_cartao = [lancamentos[i::len(cartoes)] for i in range(len(cartoes))]
+        for cartao, lancamentos_cartao in zip(cartoes, por_cartao):
+            aba.append([None, f"Cartão final {cartao}"])
+            aba.append([None, "Data", "Descrição", "Cartão", "Valor", "Tipo de compra"])
+            for momento, descricao, _, valor in lancamentos_cartao:
+                valor = -valor  # compras positivas na fatura
+                data_compra, tipo_compra = momento.date(), "À vista"
+                if aleatorio.random() < PROPORCAO_PARCELADAS:
+                    total = aleatorio.choice([2, 3, 4, 6, 10, 12])
+                    parcela = aleatorio.randint(1, total)
+                    descricao = f"{descricao} ({parcela}/{total})"
+                    tipo_compra = "Parcelado"
+                    # Na fatura a data é a da compra original; o parser soma (parcela - 1) meses
+                    data_compra = _somar_meses(data_compra, -(parcela - 1))
+                    valor = round(valor / total, 2) or 0.01
+                aba.append([None, f"{data_compra:%d/%m/%Y}", descricao, f"final {cartao}", valor, tipo_compra])
+            aba.append([None, f"{fim:%d/%m/%Y}", BENEFICIO_CARTAO_BTG, f"final {cartao}", -1.99, "Benefício"])
+
+        criptografado = io.BytesIO()
+        OOXMLFile(io.BytesIO(_gravar_planilha(planilha))).encrypt(senha, criptografado)
+        nome = f"{data_fatura:%Y-%m-%d}_Fatura_TITULAR_{cartoes[0]}_BTG.xlsx"
+        return ArquivoSintetico("btg_fatura", nome, criptografado.getvalue(), linhas, senha=senha)
+
+    def nubank_extrato(self, linhas: int) -> ArquivoSintetico:
+        aleatorio = self._aleatorio("nubank_extrato", linhas)
+        inicio, fim = self._periodo(linhas)
+
+        def registros() -> Iterator[List[str]]:
+            yield ["Data", "Valor", "Identificador", "Descrição"]
+            for momento, descricao, _, valor in self._lancamentos(aleatorio, linhas, inicio, fim, 0.15):
+                prefixo = "Transferência recebida pelo Pix" if valor > 0 else "Compra no débito"
+                yield [
+                    f"{momento:%d/%m/%Y}", f"{valor:.2f}",
+                    str(uuid.UUID(int=aleatorio.getrandbits(128))), f"{prefixo} - {descricao}",
+                ]
+
+        nome = (
+            f"NU_{aleatorio.randint(100_000_000, 999_999_999)}_"
+            f"{_data_nubank(inicio)}_{_data_nubank(fim)}.csv"
+        )
+        return ArquivoSintetico("nubank_extrato", nome, _gravar_csv(registros()), linhas)
+
+    def nubank_fatura(self, linhas: int) -> ArquivoSintetico:
+        aleatorio = self._aleatorio("nubank_fatura", linhas)
+        data_fatura = self._hoje.replace(day=6)
+        inicio, fim = data_fatura - timedelta(days=38), data_fatura - timedelta(days=8)
+
+        def registros() -> Iterator[List[str]]:
+            yield ["date", "title", "amount"]
+            # Pagamento da fatura anterior (valor negativo)
+            yield [f"{inicio:%Y-%m-%d}", "Pagamento recebido", f"{-aleatorio.uniform(500, 5000):.2f}"]
+            for momento, descricao, _, valor in self._lancamentos(aleatorio, linhas - 1, inicio, fim, 0.0):
+                if aleatorio.random() < PROPORCAO_PARCELADAS:
+                    total = aleatorio.choice([2, 3, 4, 6, 10, 12])
+                    descricao = f"{descricao} - Parcela {aleatorio.randint(1, total)}/{total}"
+                yield [f"{momento:%Y-%m-%d}", descricao.title(), f"{-valor:.2f}"]
+
+        nome = f"Nubank_{data_fatura:%Y-%m-%d}.csv"
+        return ArquivoSintetico("nubank_fatura", nome, _gravar_csv(registros()), max(linhas, 1))
+
+    def arquivo_tratado(self, linhas: int) -> ArquivoSintetico:
+        aleatorio = self._aleatorio("arquivo_tratado", linhas)
+        inicio, fim = self._periodo(linhas)
+
+        def registros() -> Iterator[List[str]]:
+            yield ["data", "descricao", "valor", "origem", "categoria", "banco", "data_fatura"]
+            for momento, descricao, categoria, valor in self._lancamentos(aleatorio, linhas, inicio, fim, 0.15):
+                if valor < 0 and aleatorio.random() < 0.4:
+                    vencimento = _somar_meses(momento.date(), 1).replace(day=10)
+                    yield [
+                        f"{momento:%d/%m/%Y}", descricao, f"{-valor:.2f}", "fatura_cartao",
+                        categoria or "", "nubank", f"{vencimento:%d/%m/%Y}",
+                    ]
+                else:
+                    yield [
+                        f"{momento:%d/%m/%Y}", descricao, f"{valor:.2f}", "extrato_bancario",
+                        categoria or "", "btg", "",
+                    ]
+
+        return ArquivoSintetico("arquivo_tratado", f"transacoes_tratadas_{linhas}.csv", _gravar_csv(registros()), linhas)
+
+    # ===== Auxiliares =====
+
+    def _aleatorio(self, parser_id: str, linhas: int) -> random.Random:
+        return random.Random(f"{self._semente}:{parser_id}:{linhas}")
+
+    def _periodo(self, linhas: int) -> Tuple[date, date]:
+        """Um mês para arquivos pequenos; ~30 lançamentos por dia nos grandes (até 3 anos)"""
+        dias = min(3 * 365, max(30, linhas // 30))
+        return self._hoje - timedelta(days=dias), self._hoje - timedelta(days=1)
+
+    def _lancamentos(
+        self, aleatorio: random.Random, total: int, inicio: date, fim: date, proporcao_entradas: float
+    ) -> Iterator[Lancamento]:
+        """Lançamentos em ordem cronológica; saídas com valor negativo"""
+        dias = (fim - inicio).days + 1
+        momentos = sorted(
+            datetime.combine(inicio, datetime.min.time())
+            + timedelta(days=aleatorio.randrange(dias), minutes=aleatorio.randrange(6 * 60, 24 * 60))
+            for _ in range(total)
+        )
+        saidas = [item[:2] for item in ESTABELECIMENTOS_SAIDA]
+        pesos_saidas = [item[2] for item in ESTABELECIMENTOS_SAIDA]
+        entradas = [item[:2] for item in ESTABELECIMENTOS_ENTRADA]
+        pesos_entradas = [item[2] for item in ESTABELECIMENTOS_ENTRADA]
+
+        for momento in momentos:
+            if aleatorio.random() < proporcao_entradas:
+                descricao, categoria = aleatorio.choices(entradas, pesos_entradas)[0]
+                valor = round(aleatorio.lognormvariate(7.0, 0.9), 2)
+            else:
+                descricao, categoria = aleatorio.choices(saidas, pesos_saidas)[0]
+                valor = -round(aleatorio.lognormvariate(4.0, 1.0), 2) or -0.01
+            yield momento, descricao, categoria, valor
+
+
+def _linha_saldo_btg(saldo: float) -> list:
+    return [None, "Saldo Diário", None, None, None, None, "Saldo Diário", None, None, None, saldo]
+
+
+def _somar_meses(dia: date, meses: int) -> date:
+    indice = dia.year * 12 + dia.month - 1 + meses
+    ano, mes = divmod(indice, 12)
+    return dia.replace(year=ano, month=mes + 1, day=min(dia.day, 28))
+
+
+def _data_nubank(dia: date) -> str:
+    """01NOV2025"""
+    return f"{dia.day:02d}{MESES_NUBANK[dia.month - 1]}{dia.year}"
+
+
+def _gravar_planilha(planilha: Workbook) -> bytes:
+    saida = io.BytesIO()
+    planilha.save(saida)
+    return saida.getvalue()
+
+
+def _gravar_csv(registros: Iterator[List[str]]) -> bytes:
+    saida = io.StringIO()
+    csv.writer(saida, lineterminator="\n").writerows(registros)
+    return saida.getvalue().encode("utf-8")
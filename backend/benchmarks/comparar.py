@@ -0,0 +1,62 @@
+"""
+Compara dois resultados JSON de benchmarks (ex: antes/depois de um commit)
+
+Aceita a saída de benchmarks.api e de benchmarks.importacao. Casa as
+medições por banco, escala e nome e mostra a variação da mediana e das
+consultas ao banco. Com --limite-regressao, termina com código 1 se
+alguma mediana piorar mais que o percentual informado.
+
+Uso (a partir de backend/):
+    uv run python -m benchmarks.comparar base.json novo.json
+    uv run python -m benchmarks.comparar base.json novo.json --limite-regressao 15
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+Chave = Tuple[str, int, str]
+
+
+def indexar(resultado: Dict[str, Any]) -> Dict[Chave, Dict[str, Any]]:
+    """(banco, escala, nome) → medição (endpoints da API ou medições da importação)"""
+    return {
+        (execucao["banco"], execucao["escala"], medicao["nome"]): medicao
+        for execucao in resultado["execucoes"]
+        for medicao in execucao.get("endpoints", execucao.get("medicoes", []))
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base", type=Path)
+    parser.add_argument("novo", type=Path)
+    parser.add_argument("--limite-regressao", type=float,
+                        help="Percentual máximo de piora aceito na mediana")
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text(encoding="utf-8"))
+    novo = json.loads(args.novo.read_text(encoding="utf-8"))
+    medicoes_base, medicoes_novo = indexar(base), indexar(novo)
+
+    print(f"base: {base.get('commit')}  novo: {novo.get('commit')}")
+    print(f"{'banco':<11}{'escala':>9}  {'medição':<30}{'base ms':>11}{'novo ms':>11}{'var %':>9}{'consultas':>13}")
+    regressoes = []
+    for chave in sorted(medicoes_base.keys() & medicoes_novo.keys()):
+        antes, depois = medicoes_base[chave], medicoes_novo[chave]
+        variacao = (depois["mediana_ms"] - antes["mediana_ms"]) / antes["mediana_ms"] * 100 if antes["mediana_ms"] else 0.0
+        banco, escala, nome = chave
+        consultas = f"{antes.get('consultas_db')}→{depois.get('consultas_db')}"
+        print(f"{banco:<11}{escala:>9}  {nome:<30}{antes['mediana_ms']:>11.2f}{depois['mediana_ms']:>11.2f}"
+              f"{variacao:>+9.1f}{consultas:>13}")
+        if args.limite_regressao is not None and variacao > args.limite_regressao:
+            regressoes.append((chave, variacao))
+
+    if regressoes:
+        print(f"\n{len(regressoes)} medição(ões) pioraram mais de {args.limite_regressao}%", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
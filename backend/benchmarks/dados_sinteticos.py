@@ -0,0 +1,274 @@
+"""
+Gerador de base sintética para os benchmarks da API
+
+Popula um banco vazio com usuários, tags, regras e transações com
+distribuições próximas às de uso real:
+- 3 usuários (titular concentra a maior parte das transações)
+- ~60 estabelecimentos recorrentes com categoria; ~15% sem categoria
+- 85% saídas com valores log-normais; entradas maiores e mais raras
+- 36 meses de histórico; faturas de cartão com data_fatura no mês seguinte
+- 0 a 3 tags por transação, popularidade das tags decrescente (Zipf)
+- 60 regras: categoria, tags e (poucas) de valor; 90% ativas
+
+Inserções em massa via SQLAlchemy Core, em blocos, com IDs explícitos
+(sequências do PostgreSQL ajustadas ao final). Enums são gravados pelo
+nome, como fazem os repositórios.
+"""
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.engine import Engine
+from sqlmodel import SQLModel
+
+from app.domain.value_objects.regra_enums import CriterioTipo, TipoAcao
+from app.domain.value_objects.tipo_transacao import TipoTransacao
+from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel
+from app.infrastructure.database.models.estatistica_regra_model import EstatisticaRegraModel  # noqa: F401
+from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel  # noqa: F401
+from app.infrastructure.database.models.regra_model import RegraModel, RegraTagModel
+from app.infrastructure.database.models.tag_model import TagModel, TransacaoTagModel
+from app.infrastructure.database.models.transacao_model import TransacaoModel
+from app.infrastructure.database.models.usuario_model import UsuarioModel
+
+TAMANHO_BLOCO = 10_000
+MESES_HISTORICO = 36
+TOTAL_TAGS = 40
+TOTAL_REGRAS = 60
+
+USUARIOS = [("Titular", "11111111111", 0.6), ("Cônjuge", "22222222222", 0.3), ("Dependente", None, 0.1)]
+
+# (descrição base, categoria, peso) — saídas recorrentes
+ESTABELECIMENTOS_SAIDA = [
+    ("MERCADO EXTRA", "Mercado", 12), ("PAO DE ACUCAR", "Mercado", 8), ("CARREFOUR", "Mercado", 7),
+    ("ASSAI ATACADISTA", "Mercado", 4), ("HORTIFRUTI", "Mercado", 3), ("PADARIA REAL", "Padaria", 9),
+    ("IFOOD", "Delivery", 14), ("RAPPI", "Delivery", 4), ("UBER TRIP", "Transporte", 12),
+    ("99 APP", "Transporte", 5), ("POSTO SHELL", "Combustível", 6), ("POSTO IPIRANGA", "Combustível", 5),
+    ("SEM PARAR", "Transporte", 3), ("DROGASIL", "Farmácia", 5), ("DROGA RAIA", "Farmácia", 4),
+    ("NETFLIX.COM", "Assinaturas", 2), ("SPOTIFY", "Assinaturas", 2), ("AMAZON PRIME", "Assinaturas", 1),
+    ("APPLE.COM/BILL", "Assinaturas", 2), ("AMAZON MARKETPLACE", "Compras", 6), ("MERCADOLIVRE", "Compras", 6),
+    ("SHOPEE", "Compras", 4), ("MAGALU", "Compras", 2), ("RENNER", "Vestuário", 2), ("ZARA", "Vestuário", 1),
+    ("CENTAURO", "Esporte", 1), ("SMARTFIT", "Academia", 2), ("RESTAURANTE OUTBACK", "Restaurante", 2),
+    ("RESTAURANTE MADERO", "Restaurante", 2), ("STARBUCKS", "Café", 3), ("CINEMARK", "Lazer", 1),
+    ("INGRESSO.COM", "Lazer", 1), ("ENEL ENERGIA", "Contas", 2), ("SABESP", "Contas", 2),
+    ("VIVO FIBRA", "Contas", 2), ("CLARO MOVEL", "Contas", 2), ("CONDOMINIO", "Moradia", 2),
+    ("ALUGUEL", "Moradia", 2), ("IPTU", "Impostos", 1), ("IPVA", "Impostos", 1),
+    ("PET SHOP COBASI", "Pets", 2), ("PETZ", "Pets", 2), ("LIVRARIA CULTURA", "Educação", 1),
+    ("UDEMY", "Educação", 1), ("ESCOLA", "Educação", 2), ("HOSPITAL", "Saúde", 1),
+    ("LABORATORIO FLEURY", "Saúde", 1), ("DENTISTA", "Saúde", 1), ("AIRBNB", "Viagem", 1),
+    ("LATAM AIRLINES", "Viagem", 1), ("BOOKING.COM", "Viagem", 1), ("PIX ENVIADO", None, 8),
+    ("TED ENVIADA", None, 2), ("SAQUE 24H", None, 2), ("TARIFA BANCARIA", "Tarifas", 2),
+    ("IOF", "Tarifas", 2), ("PAGAMENTO FATURA", None, 3), ("LOJA DIVERSOS", None, 4),
+]
+ESTABELECIMENTOS_ENTRADA = [
+    ("SALARIO", "Salário", 10), ("PIX RECEBIDO", None, 8), ("TED RECEBIDA", None, 2),
+    ("RENDIMENTO CDB", "Investimentos", 3), ("REEMBOLSO", "Reembolso", 2), ("ESTORNO", None, 2),
+]
+CORES = ["#E57373", "#64B5F6", "#81C784", "#FFB74D", "#BA68C8", "#4DB6AC", "#F06292", "#A1887F"]
+
+
+@dataclass
+class ResumoBase:
+    """O que foi gerado; orienta a escolha de parâmetros dos benchmarks"""
+    total_transacoes: int
+    total_tags: int
+    total_regras: int
+    total_usuarios: int
+    meses: List[str] = field(default_factory=list)  # "AAAA-MM", do mais antigo ao mais recente
+    tags_mais_usadas: List[int] = field(default_factory=list)
+    categoria_mais_comum: str = ""
+    transacao_exemplo_id: int = 1
+
+    def como_dict(self) -> Dict[str, Any]:
+        return {
+            "total_transacoes": self.total_transacoes,
+            "total_tags": self.total_tags,
+            "total_regras": self.total_regras,
+            "total_usuarios": self.total_usuarios,
+            "primeiro_mes": self.meses[0] if self.meses else None,
+            "ultimo_mes": self.meses[-1] if self.meses else None,
+        }
+
+
+def _meses(hoje: date) -> List[date]:
+    """Primeiro dia de cada um dos últimos MESES_HISTORICO meses (mais antigo primeiro)"""
+    inicio_mes = hoje.replace(day=1)
+    meses = []
+    for _ in range(MESES_HISTORICO):
+        meses.append(inicio_mes)
+        inicio_mes = (inicio_mes - timedelta(days=1)).replace(day=1)
+    return list(reversed(meses))
+
+
+def _mes_seguinte(dia: date) -> date:
+    return (dia.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _blocos(linhas: Iterator[Dict[str, Any]], tamanho: int = TAMANHO_BLOCO) -> Iterator[List[Dict[str, Any]]]:
+    bloco: List[Dict[str, Any]] = []
+    for linha in linhas:
+        bloco.append(linha)
+        if len(bloco) >= tamanho:
+            yield bloco
+            bloco = []
+    if bloco:
+        yield bloco
+
+
+class GeradorBaseSintetica:
+    """
+    Gera e grava a base sintética.
+
+    Uso:
+        resumo = GeradorBaseSintetica(total_transacoes=100_000).popular(engine)
+    """
+
+    def __init__(self, total_transacoes: int, semente: int = 42, hoje: date | None = None):
+        self.total_transacoes = total_transacoes
+        self._aleatorio = random.Random(semente)
+        self._meses = _meses(hoje or date.today())
+        self._agora = datetime.now()
+        # Pesos Zipf: a tag 1 é a mais usada
+        self._pesos_tags = [1 / posicao for posicao in range(1, TOTAL_TAGS + 1)]
+
+    def popular(self, engine: Engine) -> ResumoBase:
+        """Recria o schema e grava todos os dados"""
+        SQLModel.metadata.drop_all(engine)
+        SQLModel.metadata.create_all(engine)
+
+        with engine.begin() as conexao:
+            conexao.execute(insert(ConfiguracaoModel), [{
+                "chave": "criterio_data_transacao", "valor": "data_transacao",
+                "criado_em": self._agora, "atualizado_em": self._agora,
+            }])
+            conexao.execute(insert(UsuarioModel), [
+                {"id": i, "nome": nome, "cpf": cpf, "criado_em": self._agora, "atualizado_em": self._agora}
+                for i, (nome, cpf, _) in enumerate(USUARIOS, start=1)
+            ])
+            conexao.execute(insert(TagModel), [
+                {"id": i, "nome": f"Tag {i:02d}", "cor": CORES[i % len(CORES)],
+                 "criado_em": self._agora, "atualizado_em": self._agora}
+                for i in range(1, TOTAL_TAGS + 1)
+            ])
+            regras, regras_tags = self._regras()
+            conexao.execute(insert(RegraModel), regras)
+            conexao.execute(insert(RegraTagModel), regras_tags)
+
+        for bloco in _blocos(self._transacoes()):
+            tags = [linha.pop("_tags") for linha in bloco]
+            with engine.begin() as conexao:
+                conexao.execute(insert(TransacaoModel), bloco)
+                vinculos = [
+                    {"transacao_id": linha["id"], "tag_id": tag_id, "criado_em": self._agora}
+                    for linha, tag_ids in zip(bloco, tags) for tag_id in tag_ids
+                ]
+                if vinculos:
+                    conexao.execute(insert(TransacaoTagModel), vinculos)
+
+        self._ajustar_sequencias(engine)
+        return self._resumir(engine)
+
+    def _regras(self):
+        aleatorio = self._aleatorio
+        regras, regras_tags = [], []
+        for i in range(1, TOTAL_REGRAS + 1):
+            descricao, categoria, _ = aleatorio.choice(ESTABELECIMENTOS_SAIDA)
+            sorteio = aleatorio.random()
+            if sorteio < 0.5:
+                tipo_acao, acao_valor = TipoAcao.ALTERAR_CATEGORIA, categoria or "Outros"
+            elif sorteio < 0.9:
+                tipo_acao, acao_valor = TipoAcao.ADICIONAR_TAGS, "tags"
+                for tag_id in aleatorio.sample(range(1, TOTAL_TAGS + 1), k=aleatorio.randint(1, 2)):
+                    regras_tags.append({"regra_id": i, "tag_id": tag_id})
+            else:
+                tipo_acao, acao_valor = TipoAcao.ALTERAR_VALOR, "100"
+            criterio_tipo = aleatorio.choices(
+                [CriterioTipo.DESCRICAO_CONTEM, CriterioTipo.DESCRICAO_EXATA, CriterioTipo.CATEGORIA], weights=[7, 1, 2]
+            )[0]
+            criterio_valor = (categoria or "Outros") if criterio_tipo == CriterioTipo.CATEGORIA else descricao
+            regras.append({
+                "id": i, "nome": f"Regra {i:02d} {descricao.title()}", "tipo_acao": tipo_acao.name,
+                "criterio_tipo": criterio_tipo.name, "criterio_valor": criterio_valor, "acao_valor": acao_valor,
+                "prioridade": i, "ativo": aleatorio.random() < 0.9,
+                "criado_em": self._agora, "atualizado_em": self._agora,
+            })
+        return regras, regras_tags
+
+    def _transacoes(self) -> Iterator[Dict[str, Any]]:
+        aleatorio = self._aleatorio
+        pesos_saida = [peso for *_, peso in ESTABELECIMENTOS_SAIDA]
+        pesos_entrada = [peso for *_, peso in ESTABELECIMENTOS_ENTRADA]
+        pesos_usuarios = [peso for *_, peso in USUARIOS]
+        for transacao_id in range(1, self.total_transacoes + 1):
+            entrada = aleatorio.random() < 0.15
+            if entrada:
+                descricao, categoria, _ = aleatorio.choices(ESTABELECIMENTOS_ENTRADA, weights=pesos_entrada)[0]
+                valor = round(aleatorio.lognormvariate(7.0, 1.0), 2)
+                origem = "extrato_bancario"
+            else:
+                descricao, categoria, _ = aleatorio.choices(ESTABELECIMENTOS_SAIDA, weights=pesos_saida)[0]
+                valor = round(aleatorio.lognormvariate(4.0, 1.0), 2)
+                origem = aleatorio.choices(["extrato_bancario", "fatura_cartao", "manual"], weights=[45, 40, 15])[0]
+            if categoria is not None and aleatorio.random() < 0.05:
+                categoria = None
+            mes = aleatorio.choice(self._meses)
+            dia = mes + timedelta(days=aleatorio.randrange(28))
+            total_tags = aleatorio.choices([0, 1, 2, 3], weights=[35, 40, 20, 5])[0]
+            tags = set(aleatorio.choices(range(1, TOTAL_TAGS + 1), weights=self._pesos_tags, k=total_tags))
+            yield {
+                "id": transacao_id,
+                "data": dia,
+                "descricao": f"{descricao} {aleatorio.randint(1000, 9999)}",
+                "valor": valor,
+                "valor_original": None,
+                "tipo": (TipoTransacao.ENTRADA if entrada else TipoTransacao.SAIDA).name,
+                "categoria": categoria,
+                "origem": origem,
+                "banco": aleatorio.choice(["btg", "nubank"]),
+                "observacoes": None,
+                "data_fatura": _mes_seguinte(dia).replace(day=10) if origem == "fatura_cartao" else None,
+                "criado_em": self._agora,
+                "atualizado_em": self._agora,
+                "usuario_id": aleatorio.choices(range(1, len(USUARIOS) + 1), weights=pesos_usuarios)[0],
+                "lote_importacao_id": None,
+                "_tags": sorted(tags),
+            }
+
+    def _ajustar_sequencias(self, engine: Engine) -> None:
+        """IDs explícitos não avançam as sequências do PostgreSQL"""
+        if engine.dialect.name != "postgresql":
+            return
+        with engine.begin() as conexao:
+            for tabela in ("usuario", "tag", "regra", "transacao"):
+                conexao.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{tabela}', 'id'), "
+                    f"(SELECT COALESCE(MAX(id), 1) FROM {tabela}))"
+                ))
+
+    def _resumir(self, engine: Engine) -> ResumoBase:
+        with engine.connect() as conexao:
+            tags_mais_usadas = conexao.execute(
+                select(TransacaoTagModel.tag_id)
+                .group_by(TransacaoTagModel.tag_id)
+                .order_by(func.count().desc())
+                .limit(2)
+            ).scalars().all()
+            categoria = conexao.execute(
+                select(TransacaoModel.categoria)
+                .where(TransacaoModel.categoria.is_not(None))
+                .group_by(TransacaoModel.categoria)
+                .order_by(func.count().desc())
+                .limit(1)
+            ).scalar()
+        return ResumoBase(
+            total_transacoes=self.total_transacoes,
+            total_tags=TOTAL_TAGS,
+            total_regras=TOTAL_REGRAS,
+            total_usuarios=len(USUARIOS),
+            meses=[f"{mes:%Y-%m}" for mes in self._meses],
+            tags_mais_usadas=list(tags_mais_usadas),
+            categoria_mais_comum=categoria or "",
+            transacao_exemplo_id=max(1, self.total_transacoes // 2),
+        )
@@ -0,0 +1,263 @@
+"""
+Benchmark dos parsers e da importação de arquivos
+
+Para cada parser e escala (1k, 10k, 100k transações), gera um arquivo
+sintético no formato do banco (benchmarks.arquivos_sinteticos) e mede:
+- parse: `parser.parse` (DataFrame), tempo e pico de memória (tracemalloc)
+- parse_registros: caminho rápido com csv da stdlib, nos parsers que o têm
+- importar: `ImportarArquivoUseCase.execute` ponta a ponta (detecção, parse,
+  regras, gravação e lote) sobre uma base sintética recém-populada, com
+  linhas por segundo e consultas ao banco
+
+Os caches da fatura BTG (planilha descriptografada e chave derivada) são
+limpos antes de cada medição: os tempos são de um arquivo nunca visto.
+O pico de memória vem de uma execução à parte, para que o tracemalloc não
+distorça os tempos.
+
+O resultado é um JSON (stdout ou --saida) no mesmo formato de
+benchmarks.api, comparável entre commits com benchmarks.comparar.
+
+Uso (a partir de backend/):
+    uv run python -m benchmarks.importacao
+    uv run python -m benchmarks.importacao --escala 100k --parser btg_fatura --saida importacao.json
+    BENCH_POSTGRES_URL=postgresql://u:s@localhost:5432/bench uv run python -m benchmarks.importacao --sem-sqlite
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.api import commit_atual, interpretar_escala
+from benchmarks.arquivos_sinteticos import PARSERS, ArquivoSintetico, GeradorArquivosSinteticos
+from benchmarks.dados_sinteticos import GeradorBaseSintetica
+
+
+def _limpar_caches_parsers() -> None:
+    from app.infrastructure.parsers import btg_fatura_parser
+
+    btg_fatura_parser._planilhas_descriptografadas.limpar()
+    btg_fatura_parser._chaves_derivadas.limpar()
+
+
+def resumir_tempos(tempos_ms: List[float]) -> Dict[str, Any]:
+    ordenados = sorted(tempos_ms)
+    return {
+        "repeticoes": len(tempos_ms),
+        "mediana_ms": round(statistics.median(tempos_ms), 2),
+        "p95_ms": round(ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))], 2),
+        "min_ms": round(ordenados[0], 2),
+        "max_ms": round(ordenados[-1], 2),
+    }
+
+
+def medir_parse(funcao: Callable[[], Any], linhas: int, repeticoes: int) -> Dict[str, Any]:
+    """Tempos de `repeticoes` execuções e pico de memória de uma execução extra"""
+    tempos_ms = []
+    resultado = None
+    for _ in range(repeticoes):
+        _limpar_caches_parsers()
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos_ms.append((time.perf_counter() - inicio) * 1000)
+
+    _limpar_caches_parsers()
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    resumo = resumir_tempos(tempos_ms)
+    return {
+        "itens": len(resultado),
+        **resumo,
+        "linhas_por_segundo": round(linhas / (resumo["mediana_ms"] / 1000)) if resumo["mediana_ms"] else None,
+        "pico_memoria_mb": round(pico / (1024 * 1024), 2),
+    }
+
+
+def medir_importacao(url: str, arquivo: ArquivoSintetico, total_base: int, repeticoes: int) -> Dict[str, Any]:
+    """
+    Importa o arquivo `repeticoes` vezes, cada uma numa base recém-populada
+    (o mesmo arquivo numa base já importada seria apenas um replay do lote).
+    """
+    from sqlmodel import Session
+
+    from app.application.use_cases.importar_arquivo import ImportarArquivoUseCase
+    from app.infrastructure.config import get_settings
+    from app.infrastructure.database.engine import criar_engine
+    from app.infrastructure.database.metricas_consultas import (
+        encerrar_medicao,
+        iniciar_medicao,
+        instalar_contagem_consultas,
+        medicao_atual,
+    )
+    from app.infrastructure.database.repositories.estatistica_regra_repository import EstatisticaRegraRepository
+    from app.infrastructure.database.repositories.importacao_em_massa_repository import ImportacaoEmMassaRepository
+    from app.infrastructure.database.repositories.lote_importacao_repository import LoteImportacaoRepository
+    from app.infrastructure.database.repositories.regra_repository import RegraRepository
+    from app.infrastructure.database.repositories.tag_repository import TagRepository
+    from app.infrastructure.database.repositories.transacao_repository import TransacaoRepository
+    from app.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+
+    settings = get_settings()
+    instalar_contagem_consultas()
+    engine = criar_engine(url)
+    tempos_ms, tempos_db_ms = [], []
+    resultado, consultas = None, 0
+    try:
+        for _ in range(repeticoes):
+            GeradorBaseSintetica(total_base).popular(engine)
+            _limpar_caches_parsers()
+            with Session(engine) as session:
+                use_case = ImportarArquivoUseCase(
+                    TransacaoRepository(session), TagRepository(session), RegraRepository(session),
+                    UsuarioRepository(session), EstatisticaRegraRepository(session),
+                    LoteImportacaoRepository(session),
+                    importacao_em_massa_repo=ImportacaoEmMassaRepository(session),
+                    min_linhas_importacao_em_massa=settings.IMPORTACAO_EM_MASSA_MIN_LINHAS,
+                    tamanho_bloco_linhas=settings.IMPORTACAO_BLOCO_LINHAS,
+                    min_bytes_leitura_em_blocos=settings.IMPORTACAO_EM_BLOCOS_MIN_BYTES
+                )
+                token = iniciar_medicao()
+                metricas = medicao_atual()
+                inicio = time.perf_counter()
+                try:
+                    resultado = use_case.execute(arquivo.conteudo, arquivo.nome, usuario_id=1)
+                    tempos_ms.append((time.perf_counter() - inicio) * 1000)
+                finally:
+                    encerrar_medicao(token)
+                tempos_db_ms.append(metricas.tempo_total_ms)
+                consultas = metricas.total_consultas
+    finally:
+        engine.dispose()
+
+    resumo = resumir_tempos(tempos_ms)
+    return {
+        "itens": resultado.total_importado,
+        **resumo,
+        "linhas_por_segundo": round(resultado.total_importado / (resumo["mediana_ms"] / 1000))
+        if resumo["mediana_ms"] else None,
+        "db_mediana_ms": round(statistics.median(tempos_db_ms), 2),
+        "consultas_db": consultas,
+    }
+
+
+def executar(
+    bancos: List[Tuple[str, str]], parser_id: str, linhas: int, total_base: int,
+    repeticoes: int, repeticoes_importacao: int, gerador: GeradorArquivosSinteticos
+) -> List[Dict[str, Any]]:
+    """
+    Gera o arquivo, mede o parse (uma vez) e a importação em cada banco;
+    devolve uma execução por banco, todas com as mesmas medições de parse
+    """
+    from app.domain.parsers.extrato_parser import IExtratoParserRegistros
+    from app.infrastructure.parsers.extrato_parser_registry import obter_registry
+
+    print(f"[{parser_id} {linhas}] gerando arquivo...", file=sys.stderr)
+    inicio = time.perf_counter()
+    arquivo = gerador.gerar(parser_id, linhas)
+    tempo_geracao_s = time.perf_counter() - inicio
+
+    parser = obter_registry().obter_parser(parser_id)
+    medicoes_parse = []
+
+    print(f"[{parser_id} {linhas}] parse", file=sys.stderr)
+    medicoes_parse.append({
+        "nome": f"{parser_id}.parse",
+        **medir_parse(lambda: parser.parse(arquivo.conteudo, arquivo.nome, password=arquivo.senha),
+                      arquivo.linhas, repeticoes),
+    })
+    if isinstance(parser, IExtratoParserRegistros):
+        print(f"[{parser_id} {linhas}] parse_registros", file=sys.stderr)
+        medicoes_parse.append({
+            "nome": f"{parser_id}.parse_registros",
+            **medir_parse(lambda: parser.parse_registros(arquivo.conteudo, arquivo.nome, password=arquivo.senha),
+                          arquivo.linhas, repeticoes),
+        })
+
+    execucoes = []
+    for banco, url in bancos:
+        print(f"[{banco} {parser_id} {linhas}] importar", file=sys.stderr)
+        medicoes = [*medicoes_parse, {
+            "nome": f"{parser_id}.importar",
+            **medir_importacao(url, arquivo, total_base, repeticoes_importacao),
+        }]
+        for medicao in medicoes:
+            if medicao["itens"] != arquivo.linhas:
+                print(f"[{banco} {parser_id} {linhas}] {medicao['nome']}: {medicao['itens']} linhas "
+                      f"(esperadas {arquivo.linhas})", file=sys.stderr)
+        execucoes.append({
+            "banco": banco,
+            "escala": linhas,
+            "parser_id": parser_id,
+            "arquivo": {"nome": arquivo.nome, "tamanho_bytes": arquivo.tamanho_bytes, "linhas": arquivo.linhas},
+            "tempo_geracao_s": round(tempo_geracao_s, 2),
+            "medicoes": medicoes,
+        })
+    return execucoes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--escala", action="append", dest="escalas",
+                        help="Transações por arquivo: 1k, 10k, 100k ou número (pode repetir; padrão: 1k e 10k)")
+    parser.add_argument("--parser", action="append", dest="parsers", choices=PARSERS,
+                        help="Parser a medir (pode repetir; padrão: todos)")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Execuções medidas de cada parse")
+    parser.add_argument("--repeticoes-importacao", type=int, default=1,
+                        help="Importações medidas (cada uma repopula a base)")
+    parser.add_argument("--base", type=int, default=1_000,
+                        help="Transações já existentes na base sintética antes da importação")
+    parser.add_argument("--postgres-url", default=os.environ.get("BENCH_POSTGRES_URL"),
+                        help="Banco PostgreSQL descartável (será recriado!); padrão: BENCH_POSTGRES_URL")
+    parser.add_argument("--sem-sqlite", action="store_true", help="Importa apenas no PostgreSQL")
+    parser.add_argument("--saida", type=Path, help="Arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args()
+
+    from app.infrastructure.config import get_settings
+
+    # Mede a importação, não o log: statements lentos são esperados nas escalas maiores
+    get_settings().DB_SLOW_QUERY_MS = None
+
+    escalas = [interpretar_escala(escala) for escala in (args.escalas or ["1k", "10k"])]
+    gerador = GeradorArquivosSinteticos()
+    execucoes = []
+    with tempfile.TemporaryDirectory(prefix="bench_importacao_") as diretorio:
+        bancos: List[Tuple[str, str]] = []
+        if not args.sem_sqlite:
+            bancos.append(("sqlite", f"sqlite:///{Path(diretorio) / 'bench_importacao.db'}"))
+        if args.postgres_url:
+            bancos.append(("postgresql", args.postgres_url))
+        for total in escalas:
+            for parser_id in args.parsers or PARSERS:
+                execucoes.extend(executar(
+                    bancos, parser_id, total, args.base, args.repeticoes, args.repeticoes_importacao, gerador
+                ))
+
+    resultado = {
+        "benchmark": "importacao",
+        "gerado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit_atual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "execucoes": execucoes,
+    }
+    texto = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida:
+        args.saida.write_text(texto + "\n", encoding="utf-8")
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
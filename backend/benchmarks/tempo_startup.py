@@ -0,0 +1,74 @@
+"""
+Benchmark de tempo de import (cold start) da API
+
+Mede, em processos novos, quanto tempo leva importar os módulos de entrada
+e quais dependências pesadas (pandas, openpyxl, msoffcrypto) foram
+carregadas no caminho.
+
+Uso (a partir de backend/):
+    uv run python -m benchmarks.tempo_startup
+    uv run python -m benchmarks.tempo_startup --repeticoes 10 --modulo app.main
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+DIRETORIO_BACKEND = Path(__file__).resolve().parent.parent
+MODULOS_PESADOS = ("pandas", "numpy", "openpyxl", "msoffcrypto", "xlrd")
+
+_SCRIPT_MEDICAO = """
+import json, sys, time
+inicio = time.perf_counter()
+import {modulo}
+tempo_ms = (time.perf_counter() - inicio) * 1000
+print(json.dumps({{
+    "tempo_ms": tempo_ms,
+    "carregados": [m for m in {pesados!r} if m in sys.modules],
+}}))
+"""
+
+
+def medir(modulo: str, repeticoes: int) -> dict:
+    """Importa o módulo em `repeticoes` processos novos e resume os tempos"""
+    script = _SCRIPT_MEDICAO.format(modulo=modulo, pesados=MODULOS_PESADOS)
+    amostras = []
+    carregados = []
+    
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=DIRETORIO_BACKEND,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        medicao = json.loads(saida.stdout.strip().splitlines()[-1])
+        amostras.append(medicao["tempo_ms"])
+        carregados = medicao["carregados"]
+    
+    return {
+        "modulo": modulo,
+        "repeticoes": repeticoes,
+        "mediana_ms": round(statistics.median(amostras), 1),
+        "min_ms": round(min(amostras), 1),
+        "max_ms": round(max(amostras), 1),
+        "dependencias_pesadas_carregadas": carregados,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modulo", action="append", dest="modulos",
+                        help="Módulo a importar (pode repetir; padrão: app.main)")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+    
+    resultados = [medir(modulo, args.repeticoes) for modulo in (args.modulos or ["app.main"])]
+    print(json.dumps(resultados, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,8 @@ def db_session():
     from app.infrastructure.database.models.tag_model import TagModel  # noqa: F401
     from app.infrastructure.database.models.regra_model import RegraModel  # noqa: F401
     from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa: F401
+    from app.infrastructure.database.models.estatistica_regra_model import EstatisticaRegraModel  # noqa: F401
+    from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel  # noqa: F401
 
     # Criar engine em memória com pool estático para evitar problemas de concorrência
     engine = create_engine(
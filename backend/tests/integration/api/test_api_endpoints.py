@@ -10,6 +10,8 @@ from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
+from tests.integration.sessao_async import criar_get_async_session
+
 
 @pytest.fixture(scope="function")
 def client():
@@ -35,8 +37,9 @@ def client():
         with Session(test_engine) as session:
             yield session
     
-    from app.infrastructure.database.session import get_session
+    from app.infrastructure.database.session import get_async_session, get_session
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = criar_get_async_session(test_engine)
     
     with TestClient(app) as test_client:
         yield test_client
@@ -172,3 +175,105 @@ class TestConfiguracoesAPI:
         
         # Assert
         assert response.status_code == 404
+
+
+@pytest.mark.integration
+class TestInternoAPI:
+    """Testes dos endpoints internos"""
+
+    TOKEN = "token-de-teste"
+
+    @pytest.fixture
+    def admin(self, monkeypatch):
+        """Configura ADMIN_TOKEN e devolve o header que o satisfaz"""
+        from app.infrastructure.config import get_settings
+        monkeypatch.setattr(get_settings(), "ADMIN_TOKEN", self.TOKEN)
+        return {"X-Admin-Token": self.TOKEN}
+
+    @pytest.mark.parametrize("caminho", ["/interno/pool", "/interno/consultas-lentas"])
+    def test_endpoints_internos_sem_token_valido_retornam_403(self, client, admin, caminho):
+        """Endpoints internos devem rejeitar requisições sem X-Admin-Token válido"""
+        assert client.get(caminho).status_code == 403
+        assert client.get(caminho, headers={"X-Admin-Token": "errado"}).status_code == 403
+
+    def test_endpoints_internos_sem_admin_token_configurado_retornam_403(self, client, monkeypatch):
+        """Sem ADMIN_TOKEN configurado, nenhum token abre os endpoints internos"""
+        from app.infrastructure.config import get_settings
+        monkeypatch.setattr(get_settings(), "ADMIN_TOKEN", None)
+
+        assert client.get("/interno/pool", headers={"X-Admin-Token": self.TOKEN}).status_code == 403
+
+    def test_estado_pool_retorna_200(self, client, admin):
+        """GET /interno/pool deve retornar o estado dos pools"""
+        response = client.get("/interno/pool", headers=admin)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "classe" in data["sincrono"]
+        assert "classe" in data["assincrono"]
+
+    def test_consultas_lentas_retorna_buffer_mais_recentes_primeiro(self, client, admin, monkeypatch):
+        """GET /interno/consultas-lentas deve expor o buffer de consultas lentas"""
+        # ARRANGE
+        from app.infrastructure.database import consultas_lentas
+        from app.infrastructure.database.consultas_lentas import BufferConsultasLentas, ConsultaLenta
+        buffer = BufferConsultasLentas(capacidade=10)
+        monkeypatch.setattr(consultas_lentas, "_buffer", buffer)
+        buffer.adicionar(ConsultaLenta(sql="SELECT 1", parametros=[], duracao_ms=600.0, origem=None))
+        buffer.adicionar(ConsultaLenta(
+            sql="SELECT * FROM transacao WHERE descricao LIKE ?",
+            parametros=["<texto:9>"],
+            duracao_ms=1200.0,
+            origem="ListarTransacoesUseCase.execute",
+            plano=["2 | 0 | 0 | SCAN transacao"],
+        ))
+
+        # ACT
+        response = client.get("/interno/consultas-lentas?limite=1", headers=admin)
+
+        # ASSERT
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["origem"] == "ListarTransacoesUseCase.execute"
+        assert data[0]["parametros"] == ["<texto:9>"]
+        assert data[0]["plano"] == ["2 | 0 | 0 | SCAN transacao"]
+
+
+@pytest.mark.integration
+class TestMetricsAPI:
+    """Testes do endpoint /metrics (formato Prometheus)"""
+
+    def test_metrics_expoe_latencia_por_template_de_rota(self, client):
+        """Requisições são rotuladas pelo template da rota, não pelo caminho concreto"""
+        # ARRANGE
+        from app.infrastructure.observabilidade.metricas import requisicoes_duracao
+        rotulos = {"metodo": "GET", "rota": "/transacoes/{transacao_id}", "status": "404"}
+        antes = requisicoes_duracao.contagem(**rotulos)
+
+        # ACT
+        client.get("/transacoes/999")
+        client.get("/transacoes/998")
+        response = client.get("/metrics")
+
+        # ASSERT
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert requisicoes_duracao.contagem(**rotulos) == antes + 2
+        assert 'rota="/transacoes/{transacao_id}"' in response.text
+        assert "/transacoes/999" not in response.text
+        assert "# TYPE http_requisicoes_em_andamento gauge" in response.text
+
+    def test_metrics_registra_duracao_de_regras_retroativas(self, client):
+        """POST /regras/aplicar-todas alimenta o histograma de retroativas"""
+        # ARRANGE
+        from app.infrastructure.observabilidade.metricas import retroativas_duracao
+        antes = retroativas_duracao.contagem(escopo="todas")
+
+        # ACT
+        client.post("/regras/aplicar-todas")
+        response = client.get("/metrics")
+
+        # ASSERT
+        assert retroativas_duracao.contagem(escopo="todas") == antes + 1
+        assert 'regras_retroativas_duracao_segundos_count{escopo="todas"}' in response.text
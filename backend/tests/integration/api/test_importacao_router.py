@@ -9,6 +9,8 @@ from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
+from tests.integration.sessao_async import criar_get_async_session
+
 
 @pytest.fixture(scope="function")
 def client():
@@ -34,8 +36,9 @@ def client():
         with Session(test_engine) as session:
             yield session
     
-    from app.infrastructure.database.session import get_session
+    from app.infrastructure.database.session import get_async_session, get_session
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = criar_get_async_session(test_engine)
     
     with TestClient(app) as test_client:
         yield test_client
@@ -267,6 +270,59 @@ class TestImportacaoRouter:
         assert len(transacoes) == 1
         assert transacoes[0]["categoria"] == "Renda"
     
+    def test_falha_ao_gravar_estatisticas_nao_interrompe_importacao(self, client):
+        """Commit das estatísticas que falha não deve afetar o arquivo nem os seguintes"""
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+        from sqlalchemy.exc import OperationalError
+        
+        # Arrange
+        client.post("/regras", json={
+            "nome": "Categorizar Mercado",
+            "tipo_acao": "alterar_categoria",
+            "criterio_tipo": "descricao_contem",
+            "criterio_valor": "Mercado",
+            "acao_valor": "Alimentação",
+            "ativo": True,
+            "prioridade": 100
+        })
+        
+        # Commit que inclui a gravação das estatísticas falha (ex: banco bloqueado)
+        def marcar_estatisticas(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT INTO regraestatistica"):
+                conn.info["falhar_commit"] = True
+        
+        def falhar_commit(conn):
+            if conn.info.pop("falhar_commit", False):
+                raise OperationalError("COMMIT", {}, Exception("database is locked"))
+        
+        event.listen(Engine, "before_cursor_execute", marcar_estatisticas)
+        event.listen(Engine, "commit", falhar_commit)
+        try:
+            # Act
+            response = client.post(
+                "/importacao",
+                files=[
+                    ("arquivos", ("extrato1.csv", BytesIO(
+                        "data,descricao,valor,origem\n15/01/2024,Mercado A,-10.00,extrato_bancario".encode()
+                    ), "text/csv")),
+                    ("arquivos", ("extrato2.csv", BytesIO(
+                        "data,descricao,valor,origem\n16/01/2024,Mercado B,-20.00,extrato_bancario".encode()
+                    ), "text/csv")),
+                ],
+                data={"usuario_id": "1"}
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", marcar_estatisticas)
+            event.remove(Engine, "commit", falhar_commit)
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["arquivos_sucesso"] == 2
+        assert data["total_transacoes_importadas"] == 2
+        assert all(r["lote_id"] is not None for r in data["resultados"])
+    
     def test_importar_extrato_formato_data_alternativo(self, client):
         """Deve aceitar formato de data YYYY-MM-DD"""
         csv_content = """data,descricao,valor,origem
@@ -341,3 +397,45 @@ class TestImportacaoRouter:
         assert "origem" in data["resultados"][0]["erro"].lower()
         assert "fatura_cartao" in data["resultados"][0]["erro"].lower() or "extrato_bancario" in data["resultados"][0]["erro"].lower()
 
+    
+    def test_desfazer_importacao_remove_transacoes_do_lote(self, client):
+        """Deve remover todas as transações de um lote importado"""
+        csv_content = """data,descricao,valor,origem
+15/01/2024,Salário,5000.00,extrato_bancario
+16/01/2024,Supermercado,-150.50,extrato_bancario"""
+        response = client.post(
+            "/importacao",
+            files={"arquivos": ("transacoes.csv", BytesIO(csv_content.encode('utf-8')), "text/csv")},
+            data={"usuario_id": "1"}
+        )
+        resultado = response.json()["resultados"][0]
+        
+        response_delete = client.delete(f"/importacao/lotes/{resultado['lote_id']}")
+        
+        assert resultado["lote_id"] is not None
+        assert response_delete.status_code == 204
+        for transacao_id in resultado["transacoes_ids"]:
+            assert client.get(f"/transacoes/{transacao_id}").status_code == 404
+        assert client.delete(f"/importacao/lotes/{resultado['lote_id']}").status_code == 404
+    
+    def test_reenvio_do_mesmo_arquivo_nao_reimporta(self, client):
+        """Reenvio de arquivo idêntico deve devolver o resultado anterior como replay"""
+        csv_content = """data,descricao,valor,origem
+15/01/2024,Salário,5000.00,extrato_bancario"""
+        
+        def enviar():
+            return client.post(
+                "/importacao",
+                files={"arquivos": ("transacoes.csv", BytesIO(csv_content.encode('utf-8')), "text/csv")},
+                data={"usuario_id": "1"}
+            ).json()
+        
+        primeiro = enviar()
+        segundo = enviar()
+        
+        assert primeiro["resultados"][0]["replay"] is False
+        assert segundo["resultados"][0]["replay"] is True
+        assert segundo["resultados"][0]["lote_id"] == primeiro["resultados"][0]["lote_id"]
+        assert segundo["resultados"][0]["transacoes_ids"] == primeiro["resultados"][0]["transacoes_ids"]
+        assert segundo["total_transacoes_importadas"] == 0
+        assert len(client.get("/transacoes").json()) == 1
@@ -0,0 +1,84 @@
+"""
+Testes de integração das rotas GET servidas pela sessão async
+Valida que as leituras async enxergam os dados gravados pela sessão síncrona
+"""
+import pytest
+
+
+@pytest.fixture
+def client_configurado(client):
+    """Cliente com o critério de data configurado"""
+    client.post("/configuracoes", json={"chave": "criterio_data_transacao", "valor": "data_transacao"})
+    return client
+
+
+@pytest.mark.integration
+class TestLeiturasAsync:
+    """Testes das rotas GET async"""
+
+    def test_listar_transacoes_carrega_tags_e_usuario(self, client_configurado):
+        """Deve listar transações com tags e usuário completos"""
+        # ARRANGE
+        client = client_configurado
+        tag = client.post("/tags", json={"nome": "Mercado", "cor": "#00FF00"}).json()
+        transacao = client.post("/transacoes", json={
+            "data": "2024-03-10",
+            "descricao": "Compra",
+            "valor": 50.0,
+            "tipo": "saida",
+            "categoria": "Alimentação"
+        }).json()
+        client.post(f"/transacoes/{transacao['id']}/tags/{tag['id']}")
+        client.post("/transacoes", json={
+            "data": "2024-03-11",
+            "descricao": "Salário",
+            "valor": 1000.0,
+            "tipo": "entrada"
+        })
+
+        # ACT
+        response = client.get("/transacoes", params={"mes": 3, "ano": 2024})
+
+        # ASSERT
+        assert response.status_code == 200
+        por_descricao = {t["descricao"]: t for t in response.json()}
+        assert set(por_descricao) == {"Compra", "Salário"}
+        assert [t["nome"] for t in por_descricao["Compra"]["tags"]] == ["Mercado"]
+        assert por_descricao["Salário"]["tags"] == []
+        assert por_descricao["Compra"]["usuario"]["id"] == 1
+
+    def test_resumo_mensal_e_categorias(self, client_configurado):
+        """Deve calcular resumo e listar categorias via sessão async"""
+        # ARRANGE
+        client = client_configurado
+        for descricao, valor, tipo, categoria in [
+            ("Aluguel", 800.0, "saida", "Moradia"),
+            ("Salário", 3000.0, "entrada", "Renda"),
+            ("Sem categoria", 20.0, "saida", None),
+        ]:
+            client.post("/transacoes", json={
+                "data": "2024-05-05",
+                "descricao": descricao,
+                "valor": valor,
+                "tipo": tipo,
+                "categoria": categoria
+            })
+
+        # ACT
+        resumo = client.get("/transacoes/resumo/mensal", params={"mes": 5, "ano": 2024})
+        categorias = client.get("/transacoes/categorias")
+
+        # ASSERT
+        assert resumo.status_code == 200
+        assert resumo.json()["saldo"] == 2180.0
+        assert resumo.json()["saidas_por_categoria"] == {"Moradia": 800.0, "Sem categoria": 20.0}
+        assert categorias.json() == ["Moradia", "Renda"]
+
+    def test_obter_configuracao_apos_gravacao(self, client_configurado):
+        """Deve ler a configuração gravada pela rota síncrona"""
+        # ACT
+        response = client_configurado.get("/configuracoes/criterio_data_transacao")
+
+        # ASSERT
+        assert response.status_code == 200
+        assert response.json()["valor"] == "data_transacao"
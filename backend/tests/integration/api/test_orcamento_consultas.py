@@ -0,0 +1,102 @@
+"""
+Orçamentos de consultas por endpoint (regressões N+1)
+"""
+import pytest
+
+from app.application.dto.transacao_dto import FiltrosTransacaoDTO
+from app.application.use_cases.listar_transacoes import ListarTransacoesUseCase
+from app.infrastructure.database.repositories.configuracao_repository import ConfiguracaoRepository
+from app.infrastructure.database.repositories.tag_repository import TagRepository
+from app.infrastructure.database.repositories.transacao_repository import TransacaoRepository
+from app.infrastructure.database.repositories.usuario_repository import UsuarioRepository
+from tests.integration.contagem_consultas import assert_max_consultas, max_consultas
+
+TOTAL_TRANSACOES = 20
+
+
+@pytest.fixture
+def client_com_dados(client):
+    """20 transações com 2 tags cada e 10 regras de adicionar tags"""
+    client.post("/configuracoes", json={"chave": "criterio_data_transacao", "valor": "data_transacao"})
+    tags = [client.post("/tags", json={"nome": f"Tag {i}", "cor": "#000000"}).json()["id"] for i in range(3)]
+    for i in range(TOTAL_TRANSACOES):
+        transacao = client.post("/transacoes", json={
+            "data": f"2024-02-{i + 1:02d}",
+            "descricao": f"Transação {i}",
+            "valor": 10.0 + i,
+            "tipo": "saida"
+        }).json()
+        for tag_id in (tags[i % 3], tags[(i + 1) % 3]):
+            client.post(f"/transacoes/{transacao['id']}/tags/{tag_id}")
+    for i in range(10):
+        client.post("/regras", json={
+            "nome": f"Regra {i}",
+            "tipo_acao": "adicionar_tags",
+            "criterio_tipo": "descricao_contem",
+            "criterio_valor": f"termo {i}",
+            "acao_valor": "tags",
+            "tag_ids": tags[:2],
+            "prioridade": i + 1
+        })
+    return client
+
+
+@pytest.mark.integration
+class TestOrcamentoConsultas:
+    """Cada endpoint deve executar um número de consultas que não cresce com os dados"""
+
+    def test_headers_de_metricas_em_toda_resposta(self, client):
+        response = client.get("/health")
+
+        assert response.headers["X-DB-Queries"] == "0"
+        assert float(response.headers["X-DB-Time-ms"]) == 0.0
+
+    def test_listar_transacoes(self, client_com_dados):
+        """config + transações + tags das transações + tags + usuários"""
+        response = client_com_dados.get("/transacoes", params={"mes": 2, "ano": 2024})
+
+        assert len(response.json()) == TOTAL_TRANSACOES
+        assert_max_consultas(response, 5)
+
+    def test_listar_transacoes_use_case_sincrono(self, client_com_dados, session):
+        """Versão síncrona do caso de uso mantém o mesmo orçamento"""
+        # ARRANGE
+        use_case = ListarTransacoesUseCase(
+            TransacaoRepository(session),
+            ConfiguracaoRepository(session),
+            TagRepository(session),
+            UsuarioRepository(session),
+        )
+
+        # ACT
+        with max_consultas(5):
+            dtos = use_case.execute(FiltrosTransacaoDTO(mes=2, ano=2024))
+
+        # ASSERT
+        assert len(dtos) == TOTAL_TRANSACOES
+        assert all(len(dto.tags) == 2 for dto in dtos)
+
+    def test_obter_transacao(self, client_com_dados):
+        """transação + tags da transação + tags + usuário, independente do nº de tags"""
+        transacao_id = client_com_dados.get("/transacoes", params={"mes": 2, "ano": 2024}).json()[0]["id"]
+
+        response = client_com_dados.get(f"/transacoes/{transacao_id}")
+
+        assert len(response.json()["tags"]) == 2
+        assert_max_consultas(response, 4)
+
+    def test_listar_regras(self, client_com_dados):
+        """regras + tags de todas as regras"""
+        response = client_com_dados.get("/regras")
+
+        assert len(response.json()) == 10
+        assert_max_consultas(response, 2)
+
+    def test_obter_regra(self, client_com_dados):
+        """RegraRepository._to_entity de uma regra: regra + suas tags"""
+        regra_id = client_com_dados.get("/regras").json()[0]["id"]
+
+        response = client_com_dados.get(f"/regras/{regra_id}")
+
+        assert response.json()["tag_ids"]
+        assert_max_consultas(response, 2)
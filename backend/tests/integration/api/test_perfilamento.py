@@ -0,0 +1,92 @@
+"""
+Testes de integração do perfilamento sob demanda (X-Profile + X-Admin-Token)
+"""
+import threading
+
+import pytest
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.observabilidade import perfilador
+
+TOKEN = "token-de-teste"
+
+
+def _ocupar_cpu(parar: threading.Event) -> None:
+    while not parar.is_set():
+        sum(range(1000))
+
+
+@pytest.fixture
+def perfilamento_ativo(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", TOKEN)
+    monkeypatch.setattr(settings, "PERFILAMENTO_HABILITADO", True)
+    monkeypatch.setattr(settings, "PERFILAMENTO_INTERVALO_MS", 0.5)
+    monkeypatch.setattr(perfilador, "_armazem", None)
+
+
+@pytest.mark.integration
+class TestPerfilamento:
+    """Testes do PerfilamentoMiddleware e de GET /interno/perfis/{id}"""
+
+    def test_requisicao_perfilada_devolve_id_e_perfil_folded(self, client, perfilamento_ativo):
+        """Com token válido, o perfil é guardado e baixado em folded stacks"""
+        # ARRANGE
+        headers = {"X-Profile": "1", "X-Admin-Token": TOKEN}
+
+        # ACT
+        response = client.get("/tags", headers=headers)
+        perfil = client.get(f"/interno/perfis/{response.headers['X-Profile-Id']}", headers={"X-Admin-Token": TOKEN})
+
+        # ASSERT
+        assert response.status_code == 200
+        assert perfil.status_code == 200
+        assert perfil.headers["X-Profile-Path"] == "GET /tags"
+        for linha in perfil.text.splitlines():
+            pilha, amostras = linha.rsplit(" ", 1)
+            assert ";" in pilha
+            assert int(amostras) > 0
+
+    def test_perfil_nao_inclui_threads_de_outras_requisicoes(self, client, perfilamento_ativo):
+        """Uma thread ocupada fora da requisição perfilada não aparece no perfil"""
+        # ARRANGE
+        parar = threading.Event()
+        outra = threading.Thread(target=_ocupar_cpu, args=(parar,), name="outra-requisicao")
+        outra.start()
+        headers = {"X-Profile": "1", "X-Admin-Token": TOKEN}
+
+        # ACT
+        try:
+            response = client.post("/tags", json={"nome": "Perfilada"}, headers=headers)
+        finally:
+            parar.set()
+            outra.join()
+        perfil = client.get(f"/interno/perfis/{response.headers['X-Profile-Id']}", headers={"X-Admin-Token": TOKEN})
+
+        # ASSERT
+        assert response.status_code == 201
+        threads = perfil.headers["X-Profile-Threads"]
+        assert "outra-requisicao" not in threads
+        assert not any(linha.startswith("outra-requisicao;") for linha in perfil.text.splitlines())
+        for linha in perfil.text.splitlines():
+            assert linha.split(";", 1)[0] in threads
+
+    def test_perfilamento_sem_token_valido_e_rejeitado(self, client, perfilamento_ativo):
+        response = client.get("/tags", headers={"X-Profile": "1", "X-Admin-Token": "errado"})
+
+        assert response.status_code == 403
+
+    def test_download_de_perfil_exige_token(self, client, perfilamento_ativo):
+        perfil_id = client.get("/tags", headers={"X-Profile": "1", "X-Admin-Token": TOKEN}).headers["X-Profile-Id"]
+
+        assert client.get(f"/interno/perfis/{perfil_id}").status_code == 403
+        assert client.get("/interno/perfis/inexistente", headers={"X-Admin-Token": TOKEN}).status_code == 404
+
+    def test_perfilamento_desabilitado_ignora_header(self, client, monkeypatch):
+        """Sem PERFILAMENTO_HABILITADO a requisição segue normalmente, sem perfil"""
+        monkeypatch.setattr(get_settings(), "ADMIN_TOKEN", TOKEN)
+
+        response = client.get("/tags", headers={"X-Profile": "1", "X-Admin-Token": TOKEN})
+
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response.headers
@@ -8,6 +8,8 @@ from app.main import app
 from sqlmodel import Session, SQLModel, create_engine
 from sqlalchemy.pool import StaticPool
 
+from tests.integration.sessao_async import criar_get_async_session
+
 
 @pytest.fixture(scope="function")
 def client():
@@ -33,8 +35,9 @@ def client():
         with Session(test_engine) as session:
             yield session
     
-    from app.infrastructure.database.session import get_session
+    from app.infrastructure.database.session import get_async_session, get_session
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = criar_get_async_session(test_engine)
     
     with TestClient(app) as test_client:
         yield test_client
@@ -165,3 +168,41 @@ class TestRegrasRouter:
         # Verificar que foi deletada
         get_response = client.get(f"/regras/{regra_id}")
         assert get_response.status_code == 404
+
+    def test_estatisticas_apos_aplicar_todas(self, client):
+        """Deve acumular estatísticas por regra após aplicação retroativa"""
+        # Criar regras: uma que corresponde e outra que nunca corresponde
+        client.post("/regras", json={
+            "nome": "Mercado",
+            "tipo_acao": "alterar_categoria",
+            "criterio_tipo": "descricao_contem",
+            "criterio_valor": "mercado",
+            "acao_valor": "Alimentação",
+            "prioridade": 2
+        })
+        client.post("/regras", json={
+            "nome": "Nunca",
+            "tipo_acao": "alterar_categoria",
+            "criterio_tipo": "descricao_exata",
+            "criterio_valor": "inexistente",
+            "acao_valor": "X",
+            "prioridade": 1
+        })
+        for descricao in ["Mercado Central", "Padaria"]:
+            client.post("/transacoes", json={
+                "data": "2026-01-10",
+                "descricao": descricao,
+                "valor": 50.0,
+                "tipo": "saida"
+            })
+        
+        client.post("/regras/aplicar-todas")
+        response = client.get("/regras/estatisticas")
+        
+        assert response.status_code == 200
+        estatisticas = {e["nome"]: e for e in response.json()}
+        assert estatisticas["Mercado"]["total_avaliacoes"] == 2
+        assert estatisticas["Mercado"]["total_correspondencias"] == 1
+        assert estatisticas["Mercado"]["total_aplicacoes"] == 1
+        assert estatisticas["Nunca"]["total_avaliacoes"] == 2
+        assert estatisticas["Nunca"]["total_aplicacoes"] == 0
@@ -0,0 +1,125 @@
+"""
+Testes de integração do roteamento de leituras para a réplica
+Usa dois arquivos SQLite: primário (DATABASE_URL) e réplica (DATABASE_READ_URL)
+"""
+import asyncio
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import SQLModel, create_engine
+
+from app.infrastructure.config import get_settings
+from app.infrastructure.database import engine as engine_module
+from app.infrastructure.database import roteamento_leitura
+from app.main import app
+
+
+@pytest.fixture
+def bancos(tmp_path, monkeypatch):
+    """Primário e réplica em arquivos separados, sem overrides de sessão"""
+    # Importar modelos
+    from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa: F401
+    from app.infrastructure.database.models.estatistica_regra_model import EstatisticaRegraModel  # noqa: F401
+    from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel  # noqa: F401
+    from app.infrastructure.database.models.regra_model import RegraModel  # noqa: F401
+    from app.infrastructure.database.models.tag_model import TagModel  # noqa: F401
+    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa: F401
+    from app.infrastructure.database.models.usuario_model import UsuarioModel  # noqa: F401
+
+    primario = tmp_path / "primario.db"
+    replica = tmp_path / "replica.db"
+    for caminho in (primario, replica):
+        engine = create_engine(f"sqlite:///{caminho}")
+        SQLModel.metadata.create_all(engine)
+        engine.dispose()
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite:///{primario}")
+    monkeypatch.setattr(settings, "DATABASE_READ_URL", f"sqlite:///{replica}")
+    monkeypatch.setattr(settings, "LEITURA_PRIMARIO_APOS_ESCRITA_SEGUNDOS", 60.0)
+    for nome in ("_engine", "_async_engine", "_read_engine", "_async_read_engine"):
+        monkeypatch.setattr(engine_module, nome, None)
+    monkeypatch.setattr(roteamento_leitura, "_registro", None)
+    app.dependency_overrides.clear()
+
+    yield primario, replica
+
+    for engine in (engine_module._engine, engine_module._read_engine):
+        if engine is not None:
+            engine.dispose()
+
+    async def descartar_engines_async():
+        for engine in (engine_module._async_engine, engine_module._async_read_engine):
+            if engine is not None:
+                await engine.dispose()
+
+    asyncio.run(descartar_engines_async())
+
+
+def _inserir_tag(caminho, nome):
+    with sqlite3.connect(caminho) as conexao:
+        conexao.execute(
+            "INSERT INTO tag (nome, cor, criado_em, atualizado_em) VALUES (?, '#000000', '2024-01-01', '2024-01-01')",
+            (nome,),
+        )
+
+
+@pytest.mark.integration
+class TestReplicaLeitura:
+    """Testes de roteamento primário/réplica"""
+
+    def test_leituras_vao_para_replica_exceto_apos_escrita(self, bancos):
+        """Cliente que escreveu lê do primário; os demais leem da réplica"""
+        # ARRANGE
+        _, replica = bancos
+        _inserir_tag(replica, "Só na réplica")
+        escritor = {"X-Client-Id": "escritor"}
+        leitor = {"X-Client-Id": "leitor"}
+
+        with TestClient(app) as client:
+            # ACT
+            criada = client.post("/tags", json={"nome": "Nova", "cor": "#FF0000"}, headers=escritor)
+            tags_escritor = client.get("/tags", headers=escritor).json()
+            tags_leitor = client.get("/tags", headers=leitor).json()
+
+        # ASSERT
+        assert criada.status_code == 201
+        assert [t["nome"] for t in tags_escritor] == ["Nova"]
+        assert [t["nome"] for t in tags_leitor] == ["Só na réplica"]
+
+    def test_listagem_de_regras_segue_roteamento(self, bancos):
+        """Rotas síncronas de leitura (get_read_session) também usam a réplica"""
+        # ARRANGE
+        regra = {
+            "nome": "Mercado",
+            "tipo_acao": "alterar_categoria",
+            "criterio_tipo": "descricao_contem",
+            "criterio_valor": "mercado",
+            "acao_valor": "Alimentação",
+            "prioridade": 10,
+        }
+
+        with TestClient(app) as client:
+            # ACT
+            client.post("/regras", json=regra, headers={"X-Client-Id": "escritor"})
+            regras_escritor = client.get("/regras", headers={"X-Client-Id": "escritor"}).json()
+            regras_leitor = client.get("/regras", headers={"X-Client-Id": "leitor"}).json()
+
+        # ASSERT
+        assert [r["nome"] for r in regras_escritor] == ["Mercado"]
+        assert regras_leitor == []
+
+    def test_janela_expirada_volta_para_replica(self, bancos, monkeypatch):
+        """Sem janela de leitura após escrita, o próprio escritor lê da réplica"""
+        # ARRANGE
+        monkeypatch.setattr(get_settings(), "LEITURA_PRIMARIO_APOS_ESCRITA_SEGUNDOS", 0.0)
+        headers = {"X-Client-Id": "escritor"}
+
+        with TestClient(app) as client:
+            # ACT
+            client.post("/tags", json={"nome": "Nova", "cor": "#FF0000"}, headers=headers)
+            tags = client.get("/tags", headers=headers).json()
+
+        # ASSERT
+        assert tags == []
@@ -7,6 +7,8 @@ from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
+from tests.integration.sessao_async import criar_get_async_session
+
 
 @pytest.fixture(scope="function")
 def client():
@@ -32,8 +34,9 @@ def client():
         with Session(test_engine) as session:
             yield session
     
-    from app.infrastructure.database.session import get_session
+    from app.infrastructure.database.session import get_async_session, get_session
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = criar_get_async_session(test_engine)
     
     with TestClient(app) as test_client:
         yield test_client
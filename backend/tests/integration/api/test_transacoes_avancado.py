@@ -9,6 +9,8 @@ from app.main import app
 from sqlmodel import Session, SQLModel, create_engine
 from sqlalchemy.pool import StaticPool
 
+from tests.integration.sessao_async import criar_get_async_session
+
 
 @pytest.fixture(scope="function")
 def client():
@@ -30,8 +32,9 @@ def client():
         with Session(test_engine) as session:
             yield session
     
-    from app.infrastructure.database.session import get_session
+    from app.infrastructure.database.session import get_async_session, get_session
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_async_session] = criar_get_async_session(test_engine)
     
     with TestClient(app) as test_client:
         yield test_client
@@ -377,4 +380,74 @@ class TestTransacoesRouterAvancado:
         assert "Alimentação" in resumo_filtered["saidas_por_categoria"]
         assert resumo_filtered["saidas_por_categoria"]["Alimentação"] == 300.0
         # Transporte não deve aparecer porque t3 não tem a tag "Importante"
-        assert "Transporte" not in resumo_filtered["saidas_por_categoria"]
\ No newline at end of file
+        assert "Transporte" not in resumo_filtered["saidas_por_categoria"]    
+    def test_atualizar_tags_em_lote(self, client):
+        """Deve adicionar e remover tags de várias transações por IDs"""
+        tag_nova = client.post("/tags", json={"nome": "Nova"}).json()
+        tag_velha = client.post("/tags", json={"nome": "Velha"}).json()
+        ids = []
+        for descricao in ["T1", "T2"]:
+            transacao = client.post("/transacoes", json={
+                "data": "2024-01-15",
+                "descricao": descricao,
+                "valor": 10.0,
+                "tipo": "saida"
+            }).json()
+            client.post(f"/transacoes/{transacao['id']}/tags/{tag_velha['id']}")
+            ids.append(transacao["id"])
+        
+        response = client.post("/transacoes/tags", json={
+            "transacao_ids": ids,
+            "adicionar": [tag_nova["id"]],
+            "remover": [tag_velha["id"]]
+        })
+        
+        assert response.status_code == 200
+        assert response.json() == {"total_afetado": 2}
+        for transacao_id in ids:
+            tags = client.get(f"/transacoes/{transacao_id}/tags").json()
+            assert [t["nome"] for t in tags] == ["Nova"]
+    
+    def test_atualizar_tags_em_lote_validacoes(self, client):
+        """Deve rejeitar seleção vazia e tags inexistentes"""
+        tag = client.post("/tags", json={"nome": "Tag"}).json()
+        
+        sem_selecao = client.post("/transacoes/tags", json={"adicionar": [tag["id"]]})
+        tag_inexistente = client.post("/transacoes/tags", json={
+            "filtros": {"categoria": "Lazer"},
+            "adicionar": [9999]
+        })
+        
+        assert sem_selecao.status_code == 400
+        assert tag_inexistente.status_code == 404
+    
+    def test_atualizar_transacoes_em_lote(self, client):
+        """Deve atualizar apenas os campos enviados das transações selecionadas"""
+        ids = []
+        for descricao in ["T1", "T2", "T3"]:
+            transacao = client.post("/transacoes", json={
+                "data": "2024-01-15",
+                "descricao": descricao,
+                "valor": 10.0,
+                "tipo": "saida",
+                "categoria": "Antiga",
+                "observacoes": "Manter"
+            }).json()
+            ids.append(transacao["id"])
+        
+        response = client.patch("/transacoes", json={
+            "transacao_ids": ids[:2],
+            "categoria": "Nova"
+        })
+        
+        assert response.status_code == 200
+        assert response.json() == {"total_afetado": 2}
+        atualizadas = [client.get(f"/transacoes/{i}").json() for i in ids]
+        assert [t["categoria"] for t in atualizadas] == ["Nova", "Nova", "Antiga"]
+        assert all(t["observacoes"] == "Manter" for t in atualizadas)
+    
+    def test_atualizar_transacoes_em_lote_sem_campos(self, client):
+        """Deve rejeitar patch em lote sem campos"""
+        response = client.patch("/transacoes", json={"transacao_ids": [1]})
+        
+        assert response.status_code == 400
@@ -1,13 +1,17 @@
 """
 Configurações para testes de integração
 """
+import os
+
 import pytest
-from app.interfaces.api.dependencies import get_session
+from app.interfaces.api.dependencies import get_async_session, get_session
 from app.main import app
 from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
+from tests.integration.sessao_async import criar_get_async_session
+
 
 @pytest.fixture(scope="function")
 def session():
@@ -17,6 +21,8 @@ def session():
     """
     # Importar modelos
     from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa: F401
+    from app.infrastructure.database.models.estatistica_regra_model import EstatisticaRegraModel  # noqa: F401
+    from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel  # noqa: F401
     from app.infrastructure.database.models.regra_model import RegraModel  # noqa: F401
     from app.infrastructure.database.models.tag_model import TagModel  # noqa: F401
     from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa: F401
@@ -55,6 +61,44 @@ def session():
     engine.dispose()
 
 
+@pytest.fixture(scope="function")
+def postgres_engine():
+    """
+    Engine de um PostgreSQL real (TEST_POSTGRES_URL), para o que o SQLite
+    não reproduz (ex: ENUM tipotransacao, tipos dos binds do asyncpg).
+    
+    O schema do banco apontado é recriado: use um banco descartável.
+    Sem a variável, o teste é pulado.
+    """
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL não definida")
+
+    # Importar modelos
+    from datetime import datetime
+
+    from app.infrastructure.database.models.configuracao_model import ConfiguracaoModel  # noqa: F401
+    from app.infrastructure.database.models.estatistica_regra_model import EstatisticaRegraModel  # noqa: F401
+    from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel  # noqa: F401
+    from app.infrastructure.database.models.regra_model import RegraModel  # noqa: F401
+    from app.infrastructure.database.models.tag_model import TagModel  # noqa: F401
+    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa: F401
+    from app.infrastructure.database.models.usuario_model import UsuarioModel
+
+    engine = create_engine(url)
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as sessao:
+        sessao.add(UsuarioModel(id=1, nome="Não definido", cpf=None,
+                                criado_em=datetime.now(), atualizado_em=datetime.now()))
+        sessao.commit()
+
+    yield engine
+
+    SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def client(session):
     """
@@ -65,6 +109,7 @@ def client(session):
 
     # Override da dependência
     app.dependency_overrides[get_session] = get_test_session
+    app.dependency_overrides[get_async_session] = criar_get_async_session(session.get_bind())
 
     with TestClient(app) as test_client:
         yield test_client
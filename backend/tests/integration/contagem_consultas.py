@@ -0,0 +1,43 @@
+"""
+Helpers de orçamento de consultas para testes de integração
+
+Usam os headers X-DB-Queries / X-DB-Time-ms emitidos pelo
+MetricasConsultasMiddleware para travar regressões N+1 por endpoint.
+"""
+from contextlib import contextmanager
+
+from app.infrastructure.database.metricas_consultas import (
+    encerrar_medicao,
+    iniciar_medicao,
+    instalar_contagem_consultas,
+    medicao_atual,
+)
+
+
+def total_consultas(response) -> int:
+    """Quantidade de statements executados pela requisição"""
+    return int(response.headers["X-DB-Queries"])
+
+
+def assert_max_consultas(response, maximo: int) -> None:
+    """Falha se a requisição executou mais statements que o orçamento"""
+    total = total_consultas(response)
+    assert total <= maximo, (
+        f"{response.request.method} {response.request.url.path} executou {total} consultas "
+        f"(orçamento: {maximo})"
+    )
+
+
+@contextmanager
+def max_consultas(maximo: int):
+    """Orçamento de consultas para código chamado fora de uma requisição HTTP"""
+    instalar_contagem_consultas()
+    token = iniciar_medicao()
+    metricas = medicao_atual()
+    try:
+        yield metricas
+    finally:
+        encerrar_medicao(token)
+    assert metricas.total_consultas <= maximo, (
+        f"Executou {metricas.total_consultas} consultas (orçamento: {maximo})"
+    )
@@ -0,0 +1,88 @@
+"""
+Testes de integração para EstatisticaRegraRepository
+Valida o upsert dos contadores com banco de dados real
+"""
+import pytest
+from sqlmodel import Session
+
+from app.domain.entities.estatistica_regra import EstatisticaRegra
+from app.domain.entities.regra import CriterioTipo, Regra, TipoAcao
+from app.infrastructure.database.repositories.estatistica_regra_repository import EstatisticaRegraRepository
+from app.infrastructure.database.repositories.regra_repository import RegraRepository
+
+
+def _criar_regra(session: Session, nome: str, prioridade: int) -> Regra:
+    return RegraRepository(session).criar(Regra(
+        nome=nome,
+        tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
+        criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+        criterio_valor=nome.lower(),
+        acao_valor="Categoria",
+        prioridade=prioridade
+    ))
+
+
+@pytest.mark.integration
+class TestEstatisticaRegraRepositoryIntegration:
+    """Testes de integração do repositório de estatísticas de regras"""
+
+    def test_registrar_cria_e_soma_contadores_em_sessoes_distintas(self, db_session: Session):
+        """
+        ARRANGE: Regra sem estatísticas
+        ACT: Registrar incrementos por duas sessões (duas execuções)
+        ASSERT: Primeira cria a linha, segunda soma no banco
+        """
+        # Arrange
+        regra = _criar_regra(db_session, "Uber", 1)
+
+        # Act
+        EstatisticaRegraRepository(db_session).registrar([EstatisticaRegra(
+            regra_id=regra.id, total_avaliacoes=3, total_correspondencias=2, total_aplicacoes=2, tempo_total_ms=1.5
+        )])
+        with Session(db_session.get_bind()) as outra_sessao:
+            EstatisticaRegraRepository(outra_sessao).registrar([EstatisticaRegra(
+                regra_id=regra.id, total_avaliacoes=4, total_correspondencias=1, total_aplicacoes=0, tempo_total_ms=0.5
+            )])
+
+        # Assert
+        [estatistica] = EstatisticaRegraRepository(db_session).listar()
+        assert estatistica.regra_id == regra.id
+        assert estatistica.total_avaliacoes == 7
+        assert estatistica.total_correspondencias == 3
+        assert estatistica.total_aplicacoes == 2
+        assert estatistica.tempo_total_ms == pytest.approx(2.0)
+
+    def test_registrar_ignora_regras_deletadas(self, db_session: Session):
+        """
+        ARRANGE: Uma regra existente e um id de regra já deletada
+        ACT: Registrar estatísticas das duas
+        ASSERT: Apenas a regra existente é gravada
+        """
+        # Arrange
+        regra = _criar_regra(db_session, "Mercado", 1)
+
+        # Act
+        EstatisticaRegraRepository(db_session).registrar([
+            EstatisticaRegra(regra_id=regra.id, total_avaliacoes=1),
+            EstatisticaRegra(regra_id=regra.id + 100, total_avaliacoes=1),
+        ])
+
+        # Assert
+        assert [e.regra_id for e in EstatisticaRegraRepository(db_session).listar()] == [regra.id]
+
+
+@pytest.mark.integration
+class TestEstatisticaRegraRepositoryPostgreSQL:
+    """Upsert no dialeto PostgreSQL (requer TEST_POSTGRES_URL)"""
+
+    def test_registrar_soma_contadores(self, postgres_engine):
+        with Session(postgres_engine) as sessao:
+            regra = _criar_regra(sessao, "Uber", 1)
+            repository = EstatisticaRegraRepository(sessao)
+
+            repository.registrar([EstatisticaRegra(regra_id=regra.id, total_avaliacoes=2, total_aplicacoes=1)])
+            repository.registrar([EstatisticaRegra(regra_id=regra.id, total_avaliacoes=3, total_aplicacoes=1)])
+
+            [estatistica] = repository.listar()
+            assert estatistica.total_avaliacoes == 5
+            assert estatistica.total_aplicacoes == 2
@@ -0,0 +1,144 @@
+"""
+Testes de integração para ImportacaoEmMassaRepository
+Valida a carga via staging e as operações set-based com banco de dados real
+"""
+from datetime import date
+
+import pandas as pd
+import pytest
+from sqlmodel import Session
+
+from app.domain.entities.regra import Regra
+from app.domain.entities.tag import Tag
+from app.domain.entities.transacao import TipoTransacao, Transacao
+from app.domain.value_objects.regra_enums import CriterioTipo, TipoAcao
+from app.infrastructure.database.repositories.importacao_em_massa_repository import ImportacaoEmMassaRepository
+from app.infrastructure.database.repositories.tag_repository import TagRepository
+from app.infrastructure.database.repositories.transacao_repository import TransacaoRepository
+
+
+def _linhas(*linhas):
+    """Monta DataFrame no formato esperado pelo repositório"""
+    return pd.DataFrame([
+        {
+            "data": data, "descricao": descricao, "valor": valor, "tipo": tipo,
+            "origem": "extrato_bancario", "categoria": categoria, "banco": None, "data_fatura": None
+        }
+        for data, descricao, valor, tipo, categoria in linhas
+    ])
+
+
+@pytest.mark.integration
+class TestImportacaoEmMassaRepositoryIntegration:
+    """Testes de integração da importação em massa"""
+    
+    def test_importar_aplica_rotina_regras_e_ignora_duplicadas(self, db_session: Session):
+        """
+        ARRANGE: Uma transação existente, regras de categoria, tag e valor
+        ACT: Importar três linhas (uma duplicada da existente)
+        ASSERT: Duas criadas com Rotina, regras aplicadas em ordem e duplicada ignorada
+        """
+        # Arrange
+        tag_repo = TagRepository(db_session)
+        rotina = tag_repo.criar(Tag(nome="Rotina"))
+        mercado = tag_repo.criar(Tag(nome="Mercado"))
+        transacao_repo = TransacaoRepository(db_session)
+        transacao_repo.criar(Transacao(
+            data=date(2025, 1, 5), descricao="Salário", valor=5000.0, tipo=TipoTransacao.ENTRADA,
+            origem="extrato_bancario"
+        ))
+        regras = [
+            Regra(id=1, nome="Categoria", criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+                  criterio_valor="são joão", tipo_acao=TipoAcao.ALTERAR_CATEGORIA, acao_valor="Alimentação"),
+            Regra(id=2, nome="Tag por categoria", criterio_tipo=CriterioTipo.CATEGORIA,
+                  criterio_valor="alimentação", tipo_acao=TipoAcao.ADICIONAR_TAGS, tag_ids=[mercado.id]),
+            Regra(id=3, nome="Metade", criterio_tipo=CriterioTipo.DESCRICAO_EXATA,
+                  criterio_valor="SUPERMERCADO SÃO JOÃO", tipo_acao=TipoAcao.ALTERAR_VALOR, acao_valor="50"),
+        ]
+        linhas = _linhas(
+            (date(2025, 1, 5), "Salário", 5000.0, "ENTRADA", None),
+            (date(2025, 1, 6), "SUPERMERCADO SÃO JOÃO", 100.0, "SAIDA", None),
+            (date(2025, 1, 7), "Posto", 80.0, "SAIDA", "Transporte"),
+        )
+        
+        # Act
+        resultado = ImportacaoEmMassaRepository(db_session).importar(
+            linhas, usuario_id=1, tag_rotina_id=rotina.id, regras=regras, lote_importacao_id=None
+        )
+        
+        # Assert
+        assert resultado.total_duplicadas == 1
+        assert len(resultado.transacoes_ids) == 2
+        mercado_importado = transacao_repo.buscar_por_id(resultado.transacoes_ids[0])
+        posto = transacao_repo.buscar_por_id(resultado.transacoes_ids[1])
+        assert mercado_importado.categoria == "Alimentação"
+        assert mercado_importado.valor == 50.0
+        assert mercado_importado.valor_original == 100.0
+        assert mercado_importado.tipo == TipoTransacao.SAIDA
+        assert sorted(mercado_importado.tag_ids) == sorted([rotina.id, mercado.id])
+        assert posto.categoria == "Transporte"
+        assert posto.tag_ids == [rotina.id]
+        estatisticas = {e.regra_id: e for e in resultado.estatisticas}
+        assert estatisticas[1].total_avaliacoes == 2
+        assert estatisticas[1].total_correspondencias == 1
+        assert estatisticas[2].total_aplicacoes == 1
+    
+    def test_importar_duas_vezes_reutiliza_staging(self, db_session: Session):
+        """
+        ARRANGE: Tag Rotina
+        ACT: Importar dois lotes distintos na mesma sessão
+        ASSERT: IDs novos e não sobrepostos
+        """
+        # Arrange
+        rotina = TagRepository(db_session).criar(Tag(nome="Rotina"))
+        repository = ImportacaoEmMassaRepository(db_session)
+        
+        # Act
+        primeiro = repository.importar(
+            _linhas((date(2025, 2, 1), "A", 10.0, "SAIDA", None)), 1, rotina.id, []
+        )
+        segundo = repository.importar(
+            _linhas((date(2025, 2, 2), "B", 20.0, "SAIDA", None)), 1, rotina.id, []
+        )
+        
+        # Assert
+        assert len(primeiro.transacoes_ids) == 1
+        assert len(segundo.transacoes_ids) == 1
+        assert segundo.transacoes_ids[0] > primeiro.transacoes_ids[0]
+
+
+@pytest.mark.integration
+class TestImportacaoEmMassaRepositoryPostgreSQL:
+    """Importação em massa no PostgreSQL (tipo é o ENUM tipotransacao)"""
+    
+    def test_importar_grava_tipo_no_enum(self, postgres_engine):
+        """
+        ARRANGE: Banco PostgreSQL com tag Rotina e regra de categoria
+        ACT: Importar entrada e saída via staging, depois reimportar as mesmas linhas
+        ASSERT: Tipo gravado no ENUM, regra aplicada e reimportação deduplicada
+        """
+        # Arrange
+        with Session(postgres_engine) as sessao:
+            rotina = TagRepository(sessao).criar(Tag(nome="Rotina"))
+            regras = [
+                Regra(id=1, nome="Categoria", criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+                      criterio_valor="mercado", tipo_acao=TipoAcao.ALTERAR_CATEGORIA, acao_valor="Alimentação"),
+            ]
+            linhas = _linhas(
+                (date(2025, 3, 1), "Salário", 5000.0, "ENTRADA", None),
+                (date(2025, 3, 2), "MERCADO EXTRA", 120.0, "SAIDA", None),
+            )
+            
+            # Act
+            resultado = ImportacaoEmMassaRepository(sessao).importar(linhas, 1, rotina.id, regras)
+            reimportacao = ImportacaoEmMassaRepository(sessao).importar(linhas, 1, rotina.id, regras)
+            
+            # Assert
+            transacao_repo = TransacaoRepository(sessao)
+            salario, mercado = (transacao_repo.buscar_por_id(i) for i in resultado.transacoes_ids)
+            assert salario.tipo == TipoTransacao.ENTRADA
+            assert mercado.tipo == TipoTransacao.SAIDA
+            assert mercado.categoria == "Alimentação"
+            assert mercado.tag_ids == [rotina.id]
+            assert reimportacao.transacoes_ids == []
+            assert reimportacao.total_duplicadas == 2
@@ -0,0 +1,87 @@
+"""
+Testes de integração para LoteImportacaoRepository
+Valida registro e remoção de lotes com banco de dados real
+"""
+from datetime import date
+
+import pytest
+from sqlmodel import Session
+
+from app.domain.entities.lote_importacao import LoteImportacao
+from app.domain.entities.tag import Tag
+from app.domain.entities.transacao import TipoTransacao, Transacao
+from app.infrastructure.database.repositories.lote_importacao_repository import LoteImportacaoRepository
+from app.infrastructure.database.repositories.tag_repository import TagRepository
+from app.infrastructure.database.repositories.transacao_repository import TransacaoRepository
+
+
+@pytest.mark.integration
+class TestLoteImportacaoRepositoryIntegration:
+    """Testes de integração do repositório de lotes de importação"""
+    
+    def test_criar_e_atualizar_contagens(self, db_session: Session):
+        """
+        ARRANGE: Lote recém-criado
+        ACT: Atualizar total importado e marcar como lido em blocos
+        ASSERT: Contagens e resultado persistidos
+        """
+        # Arrange
+        repository = LoteImportacaoRepository(db_session)
+        lote = repository.criar(LoteImportacao(
+            hash_arquivo="a" * 64, nome_arquivo="extrato.csv", parser_id="arquivo_tratado", total_linhas=3
+        ))
+        
+        # Act
+        lote.total_importado = 2
+        lote.em_blocos = True
+        lote.mensagem = "2 transações importadas com sucesso em 2 blocos"
+        repository.atualizar(lote)
+        
+        # Assert
+        lote_buscado = repository.buscar_por_id(lote.id)
+        assert lote_buscado.total_linhas == 3
+        assert lote_buscado.total_importado == 2
+        assert lote_buscado.em_blocos is True
+        assert lote_buscado.mensagem == "2 transações importadas com sucesso em 2 blocos"
+    
+    def test_deletar_remove_transacoes_e_tags_do_lote(self, db_session: Session):
+        """
+        ARRANGE: Lote com duas transações tagueadas e uma transação manual
+        ACT: Deletar o lote
+        ASSERT: Apenas transações do lote removidas; tag e transação manual preservadas
+        """
+        # Arrange
+        repository = LoteImportacaoRepository(db_session)
+        transacao_repo = TransacaoRepository(db_session)
+        tag = TagRepository(db_session).criar(Tag(nome="Rotina"))
+        lote = repository.criar(LoteImportacao(hash_arquivo="b" * 64, nome_arquivo="x.csv", parser_id="p"))
+        
+        importadas = []
+        for descricao in ["Importada 1", "Importada 2"]:
+            transacao = transacao_repo.criar(Transacao(
+                data=date(2025, 1, 10), descricao=descricao, valor=10.0,
+                tipo=TipoTransacao.SAIDA, lote_importacao_id=lote.id
+            ))
+            transacao_repo.adicionar_tag(transacao.id, tag.id)
+            importadas.append(transacao.id)
+        manual = transacao_repo.criar(Transacao(
+            data=date(2025, 1, 10), descricao="Manual", valor=10.0, tipo=TipoTransacao.SAIDA
+        ))
+        transacao_repo.adicionar_tag(manual.id, tag.id)
+        
+        # Act
+        removido = repository.deletar(lote.id)
+        
+        # Assert
+        assert removido is True
+        assert repository.buscar_por_id(lote.id) is None
+        assert all(transacao_repo.buscar_por_id(i) is None for i in importadas)
+        assert transacao_repo.buscar_por_id(manual.id).tag_ids == [tag.id]
+    
+    def test_deletar_lote_inexistente(self, db_session: Session):
+        """
+        ARRANGE: Nenhum lote
+        ACT: Deletar ID inexistente
+        ASSERT: Retorna False
+        """
+        assert LoteImportacaoRepository(db_session).deletar(999) is False
@@ -3,9 +3,11 @@ Testes de integração para RegraRepository
 Valida operações CRUD com banco de dados real
 """
 import pytest
+from sqlalchemy import update
 from sqlmodel import Session
 
 from app.domain.entities.regra import Regra, CriterioTipo, TipoAcao
+from app.infrastructure.database.models.regra_model import RegraModel
 from app.infrastructure.database.repositories.regra_repository import RegraRepository
 
 
@@ -355,3 +357,145 @@ class TestRegraRepositoryIntegration:
         assert r3_atualizada.prioridade == 3  # Primeira na lista -> maior prioridade
         assert r1_atualizada.prioridade == 2  # Segunda
         assert r2_atualizada.prioridade == 1  # Terceira -> menor prioridade
+    
+    def test_listar_carrega_tags_de_todas_as_regras(self, db_session: Session):
+        """
+        ARRANGE: 2 regras ADICIONAR_TAGS e 1 ALTERAR_CATEGORIA
+        ACT: Listar regras
+        ASSERT: tag_ids de cada regra são carregados corretamente
+        """
+        # Arrange
+        repository = RegraRepository(db_session)
+        repository.criar(Regra(
+            nome="Tags A",
+            tipo_acao=TipoAcao.ADICIONAR_TAGS,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="a",
+            acao_valor="[1, 2]",
+            prioridade=3,
+            tag_ids=[1, 2]
+        ))
+        repository.criar(Regra(
+            nome="Tags B",
+            tipo_acao=TipoAcao.ADICIONAR_TAGS,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="b",
+            acao_valor="[3]",
+            prioridade=2,
+            tag_ids=[3]
+        ))
+        repository.criar(Regra(
+            nome="Categoria C",
+            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="c",
+            acao_valor="C",
+            prioridade=1
+        ))
+        
+        # Act
+        regras = repository.listar()
+        
+        # Assert
+        assert [r.nome for r in regras] == ["Tags A", "Tags B", "Categoria C"]
+        assert sorted(regras[0].tag_ids) == [1, 2]
+        assert regras[1].tag_ids == [3]
+        assert regras[2].tag_ids == []
+    
+    def test_listar_apenas_ativas_usa_cache_e_invalida_em_escrita(self, db_session: Session):
+        """
+        ARRANGE: Regra ativa listada uma vez (popula cache)
+        ACT: Alterar cópia retornada, depois atualizar a regra no repositório
+        ASSERT: Cache não é afetado pela cópia e reflete a atualização
+        """
+        # Arrange
+        repository = RegraRepository(db_session)
+        criada = repository.criar(Regra(
+            nome="Regra Cache",
+            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="mercado",
+            acao_valor="Alimentação",
+            prioridade=1
+        ))
+        primeira = repository.listar(apenas_ativas=True)
+        
+        # Act - cópias retornadas são independentes do cache
+        primeira[0].acao_valor = "Modificada"
+        segunda = repository.listar(apenas_ativas=True)
+        
+        criada.acao_valor = "Mercado"
+        repository.atualizar(criada)
+        terceira = repository.listar(apenas_ativas=True)
+        
+        # Assert
+        assert segunda[0].acao_valor == "Alimentação"
+        assert terceira[0].acao_valor == "Mercado"
+    
+    def test_cache_de_regras_ativas_expira_apos_ttl(self, db_session: Session, monkeypatch):
+        """
+        ARRANGE: Regra ativa em cache; outro worker a desativa direto no banco
+        ACT: Listar antes e depois do TTL
+        ASSERT: Regra desatualizada só é servida até o cache expirar
+        """
+        # Arrange
+        from app.infrastructure.config import get_settings
+        from app.infrastructure.database.repositories import regra_repository
+        monkeypatch.setattr(get_settings(), "REGRAS_ATIVAS_CACHE_TTL_SEGUNDOS", 5.0)
+        agora = [1000.0]
+        monkeypatch.setattr(regra_repository, "_relogio", lambda: agora[0])
+        repository = RegraRepository(db_session)
+        criada = repository.criar(Regra(
+            nome="Regra Outro Worker",
+            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="mercado",
+            acao_valor="Alimentação",
+            prioridade=1
+        ))
+        assert len(repository.listar(apenas_ativas=True)) == 1
+        
+        # Escrita sem passar pelo repositório deste processo (não invalida o cache)
+        db_session.exec(update(RegraModel).where(RegraModel.id == criada.id).values(ativo=False))
+        db_session.commit()
+        
+        # Act
+        antes_do_ttl = repository.listar(apenas_ativas=True)
+        agora[0] += 5.1
+        apos_ttl = repository.listar(apenas_ativas=True)
+        
+        # Assert
+        assert len(antes_do_ttl) == 1
+        assert apos_ttl == []
+    
+    def test_reordenar_com_id_inexistente_nao_altera_prioridades(self, db_session: Session):
+        """
+        ARRANGE: 2 regras com prioridades 1 e 2
+        ACT: Reordenar incluindo um ID inexistente
+        ASSERT: ValueError e prioridades originais preservadas
+        """
+        # Arrange
+        repository = RegraRepository(db_session)
+        r1 = repository.criar(Regra(
+            nome="Regra 1",
+            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="a",
+            acao_valor="A",
+            prioridade=1
+        ))
+        r2 = repository.criar(Regra(
+            nome="Regra 2",
+            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="b",
+            acao_valor="B",
+            prioridade=2
+        ))
+        
+        # Act / Assert
+        with pytest.raises(ValueError, match="não encontrada"):
+            repository.reordenar([r1.id, 999, r2.id])
+        
+        assert repository.buscar_por_id(r1.id).prioridade == 1
+        assert repository.buscar_por_id(r2.id).prioridade == 2
@@ -2,12 +2,19 @@
 Testes de integração para TransacaoRepository
 Valida operações CRUD com banco de dados real
 """
+import asyncio
 from datetime import date
 
 import pytest
 from app.domain.entities.transacao import TipoTransacao, Transacao
-from app.infrastructure.database.repositories.transacao_repository import TransacaoRepository
+from app.infrastructure.database.engine import converter_url_async
+from app.infrastructure.database.repositories.transacao_repository import (
+    TransacaoRepository,
+    TransacaoRepositoryAsync,
+)
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 @pytest.mark.integration
@@ -445,4 +452,243 @@ class TestTransacaoRepositoryIntegration:
         assert "Sem tags" in descricoes
         assert "Tag 1" in descricoes
         assert "Tag 2" in descricoes
-        assert "Tag 3" not in descricoes
\ No newline at end of file
+        assert "Tag 3" not in descricoes    
+    def test_atualizar_sincroniza_tags_por_diferenca(self, db_session: Session):
+        """
+        ARRANGE: Transação com tags 1 e 2
+        ACT: Atualizar com tags 2 e 3, depois apenas observações
+        ASSERT: Tag 1 removida, 3 adicionada, 2 preservada (mesmo criado_em)
+        """
+        from app.infrastructure.database.models.tag_model import TransacaoTagModel
+        from sqlmodel import select
+        
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        transacao = repository.criar(Transacao(
+            data=date(2025, 1, 15),
+            descricao="Com tags",
+            valor=10.0,
+            tipo=TipoTransacao.SAIDA
+        ))
+        transacao.tag_ids = [1, 2]
+        transacao = repository.atualizar(transacao)
+        
+        def associacoes():
+            stmt = select(TransacaoTagModel).where(TransacaoTagModel.transacao_id == transacao.id)
+            return {a.tag_id: a.criado_em for a in db_session.exec(stmt).all()}
+        
+        criado_em_tag_2 = associacoes()[2]
+        
+        # Act
+        transacao.tag_ids = [2, 3]
+        transacao = repository.atualizar(transacao)
+        depois_diff = associacoes()
+        
+        transacao.observacoes = "Só observação"
+        transacao = repository.atualizar(transacao)
+        
+        # Assert
+        assert set(depois_diff) == {2, 3}
+        assert depois_diff[2] == criado_em_tag_2
+        assert sorted(transacao.tag_ids) == [2, 3]
+        assert associacoes() == depois_diff
+        assert transacao.observacoes == "Só observação"
+    
+    def test_atualizar_tags_em_lote_por_filtro(self, db_session: Session):
+        """
+        ARRANGE: Três transações de janeiro/fevereiro, uma já com a tag A
+        ACT: Adicionar A e B e remover C nas transações de janeiro
+        ASSERT: Só janeiro afetado, sem duplicar A, C removida
+        """
+        from app.domain.entities.tag import Tag
+        from app.domain.value_objects.selecao_transacoes import SelecaoTransacoes
+        from app.infrastructure.database.repositories.tag_repository import TagRepository
+        
+        # Arrange
+        tag_repo = TagRepository(db_session)
+        tag_a = tag_repo.criar(Tag(nome="A"))
+        tag_b = tag_repo.criar(Tag(nome="B"))
+        tag_c = tag_repo.criar(Tag(nome="C"))
+        repository = TransacaoRepository(db_session)
+        jan_1 = repository.criar(Transacao(
+            data=date(2025, 1, 10), descricao="Jan 1", valor=10.0, tipo=TipoTransacao.SAIDA
+        ))
+        jan_2 = repository.criar(Transacao(
+            data=date(2025, 1, 20), descricao="Jan 2", valor=20.0, tipo=TipoTransacao.SAIDA
+        ))
+        fev = repository.criar(Transacao(
+            data=date(2025, 2, 10), descricao="Fev", valor=30.0, tipo=TipoTransacao.SAIDA
+        ))
+        repository.adicionar_tag(jan_1.id, tag_a.id)
+        repository.adicionar_tag(jan_1.id, tag_c.id)
+        
+        # Act
+        total = repository.atualizar_tags_em_lote(
+            SelecaoTransacoes(mes=1, ano=2025, criterio_data="data_transacao"),
+            adicionar_tag_ids=[tag_a.id, tag_b.id],
+            remover_tag_ids=[tag_c.id]
+        )
+        
+        # Assert
+        assert total == 2
+        assert sorted(repository.buscar_por_id(jan_1.id).tag_ids) == [tag_a.id, tag_b.id]
+        assert sorted(repository.buscar_por_id(jan_2.id).tag_ids) == [tag_a.id, tag_b.id]
+        assert repository.buscar_por_id(fev.id).tag_ids == []
+    
+    def test_atualizar_tags_em_lote_por_ids_e_filtro_de_tag(self, db_session: Session):
+        """
+        ARRANGE: Duas transações, apenas uma com a tag A
+        ACT: Remover A das transações com tag A, restrito aos IDs informados
+        ASSERT: Apenas a transação com a tag é contada e alterada
+        """
+        from app.domain.entities.tag import Tag
+        from app.domain.value_objects.selecao_transacoes import SelecaoTransacoes
+        from app.infrastructure.database.repositories.tag_repository import TagRepository
+        
+        # Arrange
+        tag_a = TagRepository(db_session).criar(Tag(nome="A"))
+        repository = TransacaoRepository(db_session)
+        com_tag = repository.criar(Transacao(
+            data=date(2025, 1, 10), descricao="Com tag", valor=10.0, tipo=TipoTransacao.SAIDA
+        ))
+        sem_tag = repository.criar(Transacao(
+            data=date(2025, 1, 11), descricao="Sem tag", valor=10.0, tipo=TipoTransacao.SAIDA
+        ))
+        repository.adicionar_tag(com_tag.id, tag_a.id)
+        
+        # Act
+        total = repository.atualizar_tags_em_lote(
+            SelecaoTransacoes(ids=[com_tag.id, sem_tag.id], tag_ids=[tag_a.id]),
+            adicionar_tag_ids=[],
+            remover_tag_ids=[tag_a.id]
+        )
+        
+        # Assert
+        assert total == 1
+        assert repository.buscar_por_id(com_tag.id).tag_ids == []
+    
+    def test_atualizar_campos_em_lote(self, db_session: Session):
+        """
+        ARRANGE: Duas transações sem categoria e uma com categoria
+        ACT: Definir categoria das transações sem categoria
+        ASSERT: Apenas as duas sem categoria são atualizadas
+        """
+        from app.domain.value_objects.selecao_transacoes import SelecaoTransacoes
+        
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        sem_1 = repository.criar(Transacao(
+            data=date(2025, 1, 10), descricao="Sem 1", valor=10.0, tipo=TipoTransacao.SAIDA
+        ))
+        sem_2 = repository.criar(Transacao(
+            data=date(2025, 1, 11), descricao="Sem 2", valor=10.0, tipo=TipoTransacao.SAIDA
+        ))
+        com = repository.criar(Transacao(
+            data=date(2025, 1, 12), descricao="Com", valor=10.0, tipo=TipoTransacao.SAIDA,
+            categoria="Lazer"
+        ))
+        
+        # Act
+        total = repository.atualizar_campos_em_lote(
+            SelecaoTransacoes(sem_categoria=True),
+            {"categoria": "Mercado", "observacoes": "Recategorizado"}
+        )
+        
+        # Assert
+        assert total == 2
+        for transacao_id in (sem_1.id, sem_2.id):
+            transacao = repository.buscar_por_id(transacao_id)
+            assert transacao.categoria == "Mercado"
+            assert transacao.observacoes == "Recategorizado"
+        assert repository.buscar_por_id(com.id).categoria == "Lazer"
+    
+    def test_listar_ids_por_lote(self, db_session: Session):
+        """
+        ARRANGE: Duas transações de um lote, uma de outro lote e uma manual
+        ACT: Listar IDs do primeiro lote
+        ASSERT: Apenas os IDs do lote, em ordem de criação
+        """
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        ids = [
+            repository.criar(Transacao(
+                data=date(2025, 2, 1), descricao=descricao, valor=10.0, tipo=TipoTransacao.SAIDA,
+                lote_importacao_id=lote_id
+            )).id
+            for descricao, lote_id in (("A", 3), ("B", 4), ("C", 3), ("D", None))
+        ]
+        
+        # Act
+        ids_lote = repository.listar_ids_por_lote(3)
+        
+        # Assert
+        assert ids_lote == [ids[0], ids[2]]
+    
+    def test_listar_chaves_importacao(self, db_session: Session):
+        """
+        ARRANGE: Transações de dois usuários, dentro e fora do período, uma com valor editado
+                 e uma do próprio lote em importação
+        ACT: Listar chaves de importação do usuário no período, excluindo o lote
+        ASSERT: Só as chaves do usuário no período, com valor_original e sem o próprio lote
+        """
+        # Arrange
+        repository = TransacaoRepository(db_session)
+        editada = repository.criar(Transacao(
+            data=date(2025, 2, 1), descricao="Mercado", valor=100.0, tipo=TipoTransacao.SAIDA,
+            origem="extrato_bancario"
+        ))
+        editada.valor = 50.0
+        repository.atualizar(editada)
+        repository.criar(Transacao(
+            data=date(2025, 2, 2), descricao="Salário", valor=5000.0, tipo=TipoTransacao.ENTRADA,
+            origem="extrato_bancario", lote_importacao_id=7
+        ))
+        repository.criar(Transacao(
+            data=date(2025, 2, 3), descricao="Posto", valor=80.0, tipo=TipoTransacao.SAIDA,
+            origem="extrato_bancario", usuario_id=2
+        ))
+        repository.criar(Transacao(
+            data=date(2025, 3, 1), descricao="Fora", valor=10.0, tipo=TipoTransacao.SAIDA,
+            origem="extrato_bancario"
+        ))
+        
+        # Act
+        chaves = repository.listar_chaves_importacao(1, date(2025, 2, 1), date(2025, 2, 28), excluir_lote_id=7)
+        
+        # Assert
+        assert chaves == {(date(2025, 2, 1), "Mercado", 100.0, TipoTransacao.SAIDA, "extrato_bancario")}
+
+
+@pytest.mark.integration
+class TestTransacaoRepositoryAsyncPostgreSQL:
+    """Leituras async no PostgreSQL com asyncpg (tipo é o ENUM tipotransacao)"""
+    
+    def test_listar_filtrando_por_tipo(self, postgres_engine):
+        """
+        ARRANGE: Uma entrada e uma saída no PostgreSQL
+        ACT: Listar via asyncpg filtrando por tipo
+        ASSERT: Apenas a transação do tipo pedido
+        """
+        # Arrange
+        with Session(postgres_engine) as sessao:
+            repository = TransacaoRepository(sessao)
+            for descricao, tipo in (("Salário", TipoTransacao.ENTRADA), ("Mercado", TipoTransacao.SAIDA)):
+                repository.criar(Transacao(
+                    data=date(2025, 4, 10), descricao=descricao, valor=100.0, tipo=tipo, origem="manual"
+                ))
+        url_async = converter_url_async(postgres_engine.url.render_as_string(hide_password=False))
+        
+        async def listar_saidas():
+            engine = create_async_engine(url_async)
+            try:
+                async with AsyncSession(engine) as sessao:
+                    return await TransacaoRepositoryAsync(sessao).listar(tipo=TipoTransacao.SAIDA)
+            finally:
+                await engine.dispose()
+        
+        # Act
+        saidas = asyncio.run(listar_saidas())
+        
+        # Assert
+        assert [t.descricao for t in saidas] == ["Mercado"]
+        assert saidas[0].tipo == TipoTransacao.SAIDA
@@ -0,0 +1,46 @@
+"""
+Sessão async para testes de integração.
+
+As rotas GET usam get_async_session; para que enxerguem os dados gravados
+pelas rotas/fixtures síncronas, a sessão async de teste reutiliza a mesma
+conexão SQLite em memória do engine síncrono (StaticPool).
+"""
+import aiosqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class _ConexaoCompartilhada:
+    """Proxy da conexão sqlite3 do engine síncrono que ignora close()"""
+
+    def __init__(self, conexao):
+        object.__setattr__(self, "_conexao", conexao)
+
+    def __getattr__(self, nome):
+        return getattr(self._conexao, nome)
+
+    def __setattr__(self, nome, valor):
+        setattr(self._conexao, nome, valor)
+
+    def close(self):
+        pass
+
+
+def criar_get_async_session(engine: Engine):
+    """Cria override de get_async_session sobre a conexão do engine síncrono de teste"""
+    with engine.connect() as conexao:
+        conexao_sqlite = conexao.connection.driver_connection
+
+    async def conectar():
+        return await aiosqlite.Connection(lambda: _ConexaoCompartilhada(conexao_sqlite), iter_chunk_size=64)
+
+    # NullPool: cada sessão abre (e encerra) sua própria thread do aiosqlite
+    engine_async = create_async_engine("sqlite+aiosqlite://", async_creator=conectar, poolclass=NullPool)
+
+    async def get_async_session_teste():
+        async with AsyncSession(engine_async, expire_on_commit=False) as session:
+            yield session
+
+    return get_async_session_teste
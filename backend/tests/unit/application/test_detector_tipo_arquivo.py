@@ -0,0 +1,110 @@
+"""
+Testes para DetectorTipoArquivo (detecção por nome e cabeçalho)
+"""
+import pytest
+from app.application.exceptions import ValidationException
+from app.application.services.detector_tipo_arquivo import (
+    ASSINATURA_OLE2,
+    ASSINATURA_ZIP,
+    MARCADOR_CRIPTOGRAFIA,
+    TAMANHO_CABECALHO,
+    DetectorTipoArquivo,
+)
+
+
+class TestDetectorTipoArquivo:
+    """Testes para DetectorTipoArquivo"""
+    
+    @pytest.fixture
+    def detector(self):
+        return DetectorTipoArquivo()
+    
+    def test_sem_cabecalho_detecta_apenas_pelo_nome(self, detector):
+        """Sem conteúdo, mantém a detecção pelo nome"""
+        assert detector.detectar("Nubank_2026-01-06.csv") == "nubank_fatura"
+        assert detector.detectar("qualquer.csv") == "arquivo_tratado"
+    
+    def test_csv_renomeado_detectado_pelas_colunas(self, detector):
+        """CSV com nome genérico deve ser reconhecido pelo cabeçalho"""
+        # Arrange
+        extrato_nubank = "\ufeffData,Valor,Identificador,Descrição\n01/01/2026,-10.00,abc,Compra\n".encode("utf-8")
+        
+        # Act / Assert
+        assert detector.detectar("download.csv", extrato_nubank) == "nubank_extrato"
+        assert detector.detectar("download.csv", b"date,title,amount\n") == "nubank_fatura"
+        assert detector.detectar("Nubank_2026-01-06.csv", b"data,descricao,valor,origem\n") == "arquivo_tratado"
+    
+    def test_csv_latin1_com_ponto_e_virgula_detectado_pelas_colunas(self, detector):
+        """Exportação do Excel (Latin-1, ";") deve ser reconhecida, não rejeitada"""
+        # Arrange
+        extrato_nubank = "Data;Valor;Identificador;Descrição\r\n01/01/2026;-10,00;abc;Pão\r\n".encode("latin-1")
+        tratado = "data;descricao;valor;origem\n01/01/2026;Café;-5,00;nubank_fatura\n".encode("latin-1")
+        
+        # Act / Assert
+        assert detector.detectar("download.csv", extrato_nubank) == "nubank_extrato"
+        assert detector.detectar("planilha.csv", tratado) == "arquivo_tratado"
+        assert detector.detectar("planilha.csv", b"data\tdescricao\tvalor\torigem\n") == "arquivo_tratado"
+    
+    def test_cabecalho_truncado_no_meio_de_caractere_utf8(self, detector):
+        """Corte do cabeçalho após a primeira linha não deve afetar a detecção"""
+        cabecalho = "Data,Valor,Identificador,Descrição\n01/01/2026,-10.00,abc,Pão".encode("utf-8")[:-1]
+        
+        assert detector.detectar("download.csv", cabecalho) == "nubank_extrato"
+    
+    def test_csv_com_colunas_desconhecidas_rejeitado(self, detector):
+        """CSV sem colunas de nenhum formato deve ser rejeitado antes do parse"""
+        with pytest.raises(ValidationException, match="Colunas"):
+            detector.detectar("dados.csv", b"foo,bar\n1,2\n")
+    
+    def test_planilhas_identificadas_pela_assinatura(self, detector):
+        """Assinaturas XLSX/XLS mantêm o parser do nome quando compatível"""
+        xlsx = ASSINATURA_ZIP + b"\x14\x00" + b"[Content_Types].xml"
+        xls = ASSINATURA_OLE2 + b"\x00" * 64
+        
+        assert detector.detectar("Extrato_2025-01-01_a_2025-01-31_123.xls", xls) == "btg_extrato"
+        assert detector.detectar("2025-01-05_Fatura_FULANO_1234_BTG.xlsx", xlsx) == "btg_fatura"
+        # Planilha com nome de parser CSV cai no arquivo tratado
+        assert detector.detectar("Nubank_2026-01-06.xlsx", xlsx) == "arquivo_tratado"
+    
+    def test_planilha_criptografada(self, detector):
+        """Planilha protegida só é aceita com nome de fatura BTG"""
+        criptografada = ASSINATURA_OLE2 + b"\x00" * 64 + MARCADOR_CRIPTOGRAFIA
+        
+        assert detector.detectar("2025-01-05_Fatura_FULANO_1234_BTG.xlsx", criptografada) == "btg_fatura"
+        with pytest.raises(ValidationException, match="protegida"):
+            detector.detectar("planilha.xlsx", criptografada)
+    
+    def test_fatura_grande_com_diretorio_alem_do_cabecalho(self, detector):
+        """Fatura protegida cujo marcador fica além do cabeçalho continua no parser BTG"""
+        # Arrange
+        import os
+        from io import BytesIO
+
+        import openpyxl
+        from msoffcrypto.format.ooxml import OOXMLFile
+        
+        workbook = openpyxl.Workbook()
+        planilha = workbook.active
+        planilha.append([None, "Data", "Descrição", None, "Valor", "Tipo"])
+        for i in range(400):
+            # Texto aleatório (incompressível): o diretório CFB vai para depois de 8 KB
+            planilha.append([None, "05/01/2025", f"Compra {os.urandom(2048).hex()}", None, 10.0 + i, "Compra à vista"])
+        conteudo = BytesIO()
+        workbook.save(conteudo)
+        criptografado = BytesIO()
+        OOXMLFile(BytesIO(conteudo.getvalue())).encrypt("12345678901", criptografado)
+        fatura = criptografado.getvalue()
+        assert fatura.find(MARCADOR_CRIPTOGRAFIA) > TAMANHO_CABECALHO
+        
+        # Act
+        parser_id = detector.detectar("2025-01-05_Fatura_FULANO_1234_BTG.xlsx", fatura[:TAMANHO_CABECALHO])
+        
+        # Assert
+        assert parser_id == "btg_fatura"
+    
+    def test_conteudo_binario_ou_vazio_rejeitado(self, detector):
+        """Binário desconhecido e arquivo vazio devem ser rejeitados"""
+        with pytest.raises(ValidationException):
+            detector.detectar("foto.csv", b"\x89PNG\r\n\x1a\n\x00\x00")
+        with pytest.raises(ValidationException):
+            detector.detectar("vazio.csv", b"")
@@ -13,8 +13,10 @@ from app.domain.value_objects.tipo_transacao import TipoTransacao
 @pytest.fixture
 def mock_repos():
     """Cria mocks dos repositórios"""
+    transacao_repo = Mock()
+    transacao_repo.listar_chaves_importacao.return_value = set()  # Nenhuma transação já importada
     return {
-        'transacao_repo': Mock(),
+        'transacao_repo': transacao_repo,
         'tag_repo': Mock(),
         'regra_repo': Mock(),
         'usuario_repo': Mock()
@@ -64,6 +66,7 @@ class TestImportarArquivoUseCase:
         
         # Assert
         assert isinstance(resultado, ResultadoImportacaoDTO)
+        print("DBG", mock_repos["transacao_repo"].listar_chaves_importacao.call_args, [c.args[0].chave_importacao() for c in mock_repos["transacao_repo"].criar.call_args_list])
         assert resultado.total_importado == 1
         assert len(resultado.transacoes_ids) == 1
         assert resultado.transacoes_ids[0] == 123
@@ -76,6 +79,24 @@ class TestImportarArquivoUseCase:
         mock_transacao.adicionar_tag.assert_called_once_with(1)
         mock_repos['transacao_repo'].atualizar.assert_called()
     
+    def test_importacao_alimenta_metricas_de_vazao_por_parser(self, use_case, mock_repos):
+        """Linhas lidas e duração são registradas por parser_id"""
+        # Arrange
+        from app.infrastructure.observabilidade.metricas import importacao_duracao, importacao_linhas
+        csv_content = b"data,descricao,valor,origem\n2025-01-05,A,1.00,extrato_bancario\n2025-01-06,B,2.00,extrato_bancario"
+        mock_repos['tag_repo'].buscar_por_nome.return_value = Mock(id=1)
+        mock_repos['transacao_repo'].criar.side_effect = [Mock(id=1), Mock(id=2)]
+        mock_repos['regra_repo'].listar.return_value = []
+        linhas_antes = importacao_linhas.valor(parser_id="arquivo_tratado")
+        importacoes_antes = importacao_duracao.contagem(parser_id="arquivo_tratado")
+        
+        # Act
+        use_case.execute(csv_content, "metricas.csv")
+        
+        # Assert
+        assert importacao_linhas.valor(parser_id="arquivo_tratado") == linhas_antes + 2
+        assert importacao_duracao.contagem(parser_id="arquivo_tratado") == importacoes_antes + 1
+    
     def test_importar_arquivo_vazio_deve_falhar(self, use_case):
         """Deve lançar exceção se arquivo estiver vazio"""
         # Arrange
@@ -111,10 +132,12 @@ class TestImportarArquivoUseCase:
         resultado = use_case.execute(csv_content, nome_arquivo)
         
         # Assert
+        print("DBG", mock_repos["transacao_repo"].listar_chaves_importacao.call_args, [c.args[0].chave_importacao() for c in mock_repos["transacao_repo"].criar.call_args_list])
         assert resultado.total_importado == 1
         
-        # Verificar que regra foi aplicada
-        mock_regra.aplicar_em.assert_called_once_with(mock_transacao)
+        # Verificar que regra foi aplicada (critério avaliado e ação executada)
+        mock_regra.corresponde_criterio.assert_called_once_with(mock_transacao)
+        mock_regra.executar_acao.assert_called_once_with(mock_transacao)
         
         # Verificar que transação foi atualizada após aplicar regras
         assert mock_repos['transacao_repo'].atualizar.call_count >= 2  # Tag + Regras
@@ -145,6 +168,7 @@ class TestImportarArquivoUseCase:
         resultado = use_case.execute(csv_content, nome_arquivo)
         
         # Assert
+        print("DBG", mock_repos["transacao_repo"].listar_chaves_importacao.call_args, [c.args[0].chave_importacao() for c in mock_repos["transacao_repo"].criar.call_args_list])
         assert resultado.total_importado == 1
         assert transacao_criada.tipo == TipoTransacao.SAIDA
         assert transacao_criada.valor == 100.00  # Valor absoluto
@@ -187,3 +211,226 @@ class TestImportarArquivoUseCase:
         # Segunda transação (negativo) = SAIDA
         assert transacoes_criadas[1].tipo == TipoTransacao.SAIDA
         assert transacoes_criadas[1].valor == 150.00  # Valor absoluto
+    
+    def test_ignora_transacoes_ja_importadas(self, use_case, mock_repos):
+        """Linha com a mesma chave de importação de uma transação existente não é recriada"""
+        # Arrange
+        from datetime import date
+        
+        csv_data = "data,descricao,valor,origem\n"
+        csv_data += "2025-01-15,Salario,5000.00,extrato_bancario\n"
+        csv_data += "2025-01-16,Mercado,-150.00,extrato_bancario"
+        mock_repos['tag_repo'].buscar_por_nome.return_value = Mock(id=1)
+        mock_repos['transacao_repo'].listar_chaves_importacao.return_value = {
+            (date(2025, 1, 15), "Salario", 5000.00, TipoTransacao.ENTRADA, "extrato_bancario")
+        }
+        mock_repos['transacao_repo'].criar.side_effect = lambda transacao: Mock(id=2)
+        mock_repos['regra_repo'].listar.return_value = []
+        
+        # Act
+        resultado = use_case.execute(csv_data.encode('utf-8'), "extrato.csv")
+        
+        # Assert
+        assert resultado.total_importado == 1
+        assert "1 duplicadas ignoradas" in resultado.mensagem
+        [chamada] = mock_repos['transacao_repo'].criar.call_args_list
+        assert chamada.args[0].descricao == "Mercado"
+        args = mock_repos['transacao_repo'].listar_chaves_importacao.call_args
+        assert args.args[1:] == (date(2025, 1, 15), date(2025, 1, 16))
+    
+    def test_reenvio_de_arquivo_retorna_resultado_anterior(self, mock_repos):
+        """Arquivo já importado pelo usuário não deve passar pelo parser"""
+        # Arrange
+        from app.domain.entities.lote_importacao import LoteImportacao
+        
+        lote_repo = Mock()
+        lote_repo.buscar_por_hash.return_value = LoteImportacao(
+            id=7, total_importado=2, mensagem="2 transações importadas com sucesso"
+        )
+        mock_repos['transacao_repo'].listar_ids_por_lote.return_value = [10, 11]
+        use_case = ImportarArquivoUseCase(
+            transacao_repo=mock_repos['transacao_repo'],
+            tag_repo=mock_repos['tag_repo'],
+            regra_repo=mock_repos['regra_repo'],
+            usuario_repo=mock_repos['usuario_repo'],
+            lote_repo=lote_repo
+        )
+        
+        # Act
+        resultado = use_case.execute(b"data,descricao,valor,origem\n", "transacoes.csv", usuario_id=3)
+        
+        # Assert
+        assert resultado.replay is True
+        assert resultado.lote_id == 7
+        assert resultado.transacoes_ids == [10, 11]
+        mock_repos['transacao_repo'].listar_ids_por_lote.assert_called_once_with(7)
+        lote_repo.buscar_por_hash.assert_called_once()
+        assert lote_repo.buscar_por_hash.call_args.args[0] == 3
+        mock_repos['usuario_repo'].buscar_por_id.assert_not_called()
+        mock_repos['transacao_repo'].criar.assert_not_called()
+        lote_repo.criar.assert_not_called()
+    
+    def test_reenvio_de_arquivo_em_blocos_nao_lista_ids(self, mock_repos):
+        """Replay de arquivo importado em vários blocos devolve só as contagens"""
+        # Arrange
+        from app.domain.entities.lote_importacao import LoteImportacao
+        
+        lote_repo = Mock()
+        lote_repo.buscar_por_hash.return_value = LoteImportacao(
+            id=8, total_importado=50000, em_blocos=True,
+            mensagem="50000 transações importadas com sucesso em 5 blocos"
+        )
+        use_case = ImportarArquivoUseCase(
+            transacao_repo=mock_repos['transacao_repo'],
+            tag_repo=mock_repos['tag_repo'],
+            regra_repo=mock_repos['regra_repo'],
+            usuario_repo=mock_repos['usuario_repo'],
+            lote_repo=lote_repo
+        )
+        
+        # Act
+        resultado = use_case.execute(b"data,descricao,valor,origem\n", "historico.csv")
+        
+        # Assert
+        assert resultado.replay is True
+        assert resultado.total_importado == 50000
+        assert resultado.transacoes_ids == []
+        mock_repos['transacao_repo'].listar_ids_por_lote.assert_not_called()
+    
+    def test_arquivo_tratado_grande_usa_importacao_em_massa(self, mock_repos):
+        """Arquivo tratado acima do limiar deve ir para o repositório de importação em massa"""
+        # Arrange
+        from app.domain.repositories.importacao_em_massa_repository import ResultadoImportacaoEmMassa
+        
+        csv_content = (
+            b"data,descricao,valor,origem,data_fatura\n"
+            b"2025-01-05,Mercado,-50.00,extrato_bancario,\n"
+            b"2025-01-06,Salario,1000.00,extrato_bancario,\n"
+            b"2025-01-10,Compra,30.00,fatura_cartao,2025-01-01\n"
+        )
+        mock_tag = Mock()
+        mock_tag.id = 1
+        mock_repos['tag_repo'].buscar_por_nome.return_value = mock_tag
+        mock_repos['regra_repo'].listar.return_value = []
+        em_massa_repo = Mock()
+        em_massa_repo.importar.return_value = ResultadoImportacaoEmMassa(transacoes_ids=[1, 2], total_duplicadas=0)
+        use_case = ImportarArquivoUseCase(
+            transacao_repo=mock_repos['transacao_repo'],
+            tag_repo=mock_repos['tag_repo'],
+            regra_repo=mock_repos['regra_repo'],
+            usuario_repo=mock_repos['usuario_repo'],
+            importacao_em_massa_repo=em_massa_repo,
+            min_linhas_importacao_em_massa=2
+        )
+        
+        # Act
+        resultado = use_case.execute(csv_content, "historico.csv")
+        
+        # Assert
+        assert resultado.total_importado == 2
+        mock_repos['transacao_repo'].criar.assert_not_called()
+        linhas = em_massa_repo.importar.call_args.args[0]
+        assert list(linhas['tipo']) == [TipoTransacao.SAIDA.name, TipoTransacao.ENTRADA.name]
+        assert list(linhas['valor']) == [50.0, 1000.0]
+    
+    def test_arquivo_grande_importado_em_blocos(self, mock_repos):
+        """Arquivo acima do limiar de bytes deve ser lido e importado bloco a bloco"""
+        # Arrange
+        from io import BytesIO
+
+        from app.domain.entities.lote_importacao import LoteImportacao
+        
+        linhas = "".join(f"2025-01-{dia:02d},Compra {dia},-{dia}.00,extrato_bancario,\n" for dia in range(1, 6))
+        arquivo = BytesIO(("data,descricao,valor,origem,data_fatura\n" + linhas).encode())
+        mock_tag = Mock()
+        mock_tag.id = 1
+        mock_repos['tag_repo'].buscar_por_nome.return_value = mock_tag
+        mock_repos['regra_repo'].listar.return_value = []
+        ids = iter(range(1, 100))
+        mock_repos['transacao_repo'].criar.side_effect = lambda t: Mock(id=next(ids))
+        lote_repo = Mock()
+        lote_repo.buscar_por_hash.return_value = None
+        lote_repo.criar.side_effect = lambda lote: LoteImportacao(id=9, hash_arquivo=lote.hash_arquivo)
+        use_case = ImportarArquivoUseCase(
+            transacao_repo=mock_repos['transacao_repo'],
+            tag_repo=mock_repos['tag_repo'],
+            regra_repo=mock_repos['regra_repo'],
+            usuario_repo=mock_repos['usuario_repo'],
+            lote_repo=lote_repo,
+            tamanho_bloco_linhas=2,
+            min_bytes_leitura_em_blocos=1
+        )
+        
+        # Act
+        resultado = use_case.execute(arquivo, "historico.csv")
+        
+        # Assert
+        assert resultado.total_importado == 5
+        assert resultado.transacoes_ids == []
+        assert "em 3 blocos" in resultado.mensagem
+        assert resultado.lote_id == 9
+        lote_atualizado = lote_repo.atualizar.call_args.args[0]
+        assert lote_atualizado.total_linhas == 5
+        assert lote_atualizado.total_importado == 5
+        assert lote_atualizado.em_blocos is True
+        assert all(t.lote_importacao_id == 9 for t in (c.args[0] for c in mock_repos['transacao_repo'].criar.call_args_list))
+    
+    def test_falha_na_importacao_remove_lote(self, mock_repos):
+        """Erro durante a importação não deve deixar lote que bloqueie o reenvio"""
+        # Arrange
+        from app.domain.entities.lote_importacao import LoteImportacao
+        
+        csv_content = b"data,descricao,valor,origem,data_fatura\n2025-01-05,Mercado,-50.00,extrato_bancario,\n"
+        mock_tag = Mock()
+        mock_tag.id = 1
+        mock_repos['tag_repo'].buscar_por_nome.return_value = mock_tag
+        mock_repos['regra_repo'].listar.return_value = []
+        mock_repos['transacao_repo'].buscar_por_id.side_effect = RuntimeError("falha no banco")
+        lote_repo = Mock()
+        lote_repo.buscar_por_hash.return_value = None
+        lote_repo.criar.side_effect = lambda lote: LoteImportacao(id=4)
+        use_case = ImportarArquivoUseCase(
+            transacao_repo=mock_repos['transacao_repo'],
+            tag_repo=mock_repos['tag_repo'],
+            regra_repo=mock_repos['regra_repo'],
+            usuario_repo=mock_repos['usuario_repo'],
+            lote_repo=lote_repo
+        )
+        
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            use_case.execute(csv_content, "historico.csv")
+        lote_repo.deletar.assert_called_once_with(4)
+    
+    def test_multiplos_arquivos_resolvem_contexto_uma_vez(self, mock_repos):
+        """Tag Rotina, regras e CPF devem ser consultados uma vez por envio"""
+        # Arrange
+        from app.application.use_cases.importar_multiplos_arquivos import ImportarMultiplosArquivosUseCase
+        
+        mock_usuario = Mock()
+        mock_usuario.cpf = "12345678901"
+        mock_repos['usuario_repo'].buscar_por_id.return_value = mock_usuario
+        mock_tag = Mock()
+        mock_tag.id = 1
+        mock_repos['tag_repo'].buscar_por_nome.return_value = mock_tag
+        mock_repos['regra_repo'].listar.return_value = []
+        mock_repos['transacao_repo'].criar.side_effect = lambda t: Mock(id=1)
+        use_case = ImportarMultiplosArquivosUseCase(
+            transacao_repo=mock_repos['transacao_repo'],
+            tag_repo=mock_repos['tag_repo'],
+            regra_repo=mock_repos['regra_repo'],
+            usuario_repo=mock_repos['usuario_repo']
+        )
+        arquivos = [
+            (f"data,descricao,valor,origem\n2025-01-0{i},Compra {i},-{i}.00,extrato_bancario\n".encode(), f"arquivo_{i}.csv", None)
+            for i in range(1, 4)
+        ]
+        
+        # Act
+        resultado = use_case.execute(arquivos, usuario_id=1)
+        
+        # Assert
+        assert resultado.arquivos_sucesso == 3
+        assert mock_repos['regra_repo'].listar.call_count == 1
+        assert mock_repos['tag_repo'].buscar_por_nome.call_count == 1
+        assert mock_repos['usuario_repo'].buscar_por_id.call_count == 1
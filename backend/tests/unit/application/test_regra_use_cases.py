@@ -11,8 +11,13 @@ from app.application.exceptions.application_exceptions import EntityNotFoundExce
 from app.application.use_cases.atualizar_regra import AtualizarRegraUseCase
 from app.application.use_cases.criar_regra import CriarRegraUseCase
 from app.application.use_cases.deletar_regra import DeletarRegraUseCase
+from app.application.services.coletor_estatisticas_regras import ColetorEstatisticasRegras
+from app.application.use_cases.listar_estatisticas_regras import ListarEstatisticasRegrasUseCase
 from app.application.use_cases.listar_regras import ListarRegrasUseCase
+from app.domain.entities.estatistica_regra import EstatisticaRegra
 from app.domain.entities.regra import Regra
+from app.domain.entities.transacao import Transacao
+from app.domain.value_objects.tipo_transacao import TipoTransacao
 from app.domain.value_objects.regra_enums import CriterioTipo, TipoAcao
 
 
@@ -217,3 +222,97 @@ class TestDeletarRegraUseCase:
             use_case.execute(999)
         
         mock_repository.deletar.assert_not_called()
+
+
+@pytest.mark.unit
+class TestColetorEstatisticasRegras:
+    """Testes para ColetorEstatisticasRegras"""
+    
+    def test_acumula_em_memoria_e_grava_uma_vez(self):
+        """
+        ARRANGE: Regra de categoria e 3 transações (2 correspondem)
+        ACT: Aplicar regra em todas e descarregar
+        ASSERT: Contadores corretos gravados em uma única chamada
+        """
+        # Arrange
+        mock_repository = Mock()
+        coletor = ColetorEstatisticasRegras(mock_repository)
+        regra = Regra(
+            id=7,
+            nome="Uber",
+            tipo_acao=TipoAcao.ALTERAR_CATEGORIA,
+            criterio_tipo=CriterioTipo.DESCRICAO_CONTEM,
+            criterio_valor="uber",
+            acao_valor="Transporte"
+        )
+        transacoes = [
+            Transacao(descricao=descricao, valor=10.0, tipo=TipoTransacao.SAIDA)
+            for descricao in ["UBER TRIP", "Uber Eats", "Mercado"]
+        ]
+        
+        # Act
+        aplicadas = [coletor.aplicar(regra, t) for t in transacoes]
+        mock_repository.registrar.assert_not_called()
+        coletor.descarregar()
+        
+        # Assert
+        assert aplicadas == [True, True, False]
+        assert transacoes[0].categoria == "Transporte"
+        mock_repository.registrar.assert_called_once()
+        [estatistica] = mock_repository.registrar.call_args.args[0]
+        assert estatistica.regra_id == 7
+        assert estatistica.total_avaliacoes == 3
+        assert estatistica.total_correspondencias == 2
+        assert estatistica.total_aplicacoes == 2
+        assert estatistica.tempo_total_ms >= 0
+    
+    def test_falha_ao_gravar_nao_propaga(self):
+        """Testa que erro ao gravar estatísticas não interrompe o fluxo"""
+        # Arrange
+        mock_repository = Mock()
+        mock_repository.registrar.side_effect = RuntimeError("db fora")
+        coletor = ColetorEstatisticasRegras(mock_repository)
+        regra = Regra(id=1, nome="X", criterio_valor="x", acao_valor="X")
+        coletor.aplicar(regra, Transacao(descricao="x", valor=1.0, tipo=TipoTransacao.SAIDA))
+        
+        # Act & Assert (não lança)
+        coletor.descarregar()
+
+
+@pytest.mark.unit
+class TestListarEstatisticasRegrasUseCase:
+    """Testes para ListarEstatisticasRegrasUseCase"""
+    
+    def test_inclui_regras_nunca_avaliadas_com_contadores_zerados(self):
+        """
+        ARRANGE: 2 regras, apenas uma com estatísticas
+        ACT: Listar estatísticas
+        ASSERT: Ambas retornadas; a sem estatística com zeros
+        """
+        # Arrange
+        mock_regra_repository = Mock()
+        mock_regra_repository.listar.return_value = [
+            Regra(id=1, nome="Ativa", prioridade=2),
+            Regra(id=2, nome="Morta", prioridade=1),
+        ]
+        mock_estatistica_repository = Mock()
+        mock_estatistica_repository.listar.return_value = [
+            EstatisticaRegra(
+                regra_id=1,
+                total_avaliacoes=4,
+                total_correspondencias=2,
+                total_aplicacoes=2,
+                tempo_total_ms=2.0
+            )
+        ]
+        use_case = ListarEstatisticasRegrasUseCase(mock_regra_repository, mock_estatistica_repository)
+        
+        # Act
+        resultado = use_case.execute()
+        
+        # Assert
+        assert [r.nome for r in resultado] == ["Ativa", "Morta"]
+        assert resultado[0].total_aplicacoes == 2
+        assert resultado[0].tempo_medio_ms == 0.5
+        assert resultado[1].total_avaliacoes == 0
+        assert resultado[1].tempo_medio_ms == 0.0
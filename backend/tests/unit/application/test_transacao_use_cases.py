@@ -5,14 +5,16 @@ Objetivo: Testar lógica de aplicação usando mocks dos repositórios
 Padrão: Arrange-Act-Assert com mocks
 """
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
 from datetime import date
 from app.application.use_cases.criar_transacao import CriarTransacaoUseCase
-from app.application.use_cases.listar_transacoes import ListarTransacoesUseCase
+from app.application.use_cases.listar_transacoes import ListarTransacoesAsyncUseCase, ListarTransacoesUseCase
 from app.application.use_cases.atualizar_transacao import AtualizarTransacaoUseCase
 from app.application.use_cases.restaurar_valor_original import RestaurarValorOriginalUseCase
-from app.application.dto.transacao_dto import CriarTransacaoDTO, AtualizarTransacaoDTO
+from app.application.dto.transacao_dto import CriarTransacaoDTO, AtualizarTransacaoDTO, FiltrosTransacaoDTO
+from app.domain.entities.tag import Tag
 from app.domain.entities.transacao import Transacao
+from app.domain.entities.usuario import Usuario
 from app.domain.value_objects.tipo_transacao import TipoTransacao
 from app.application.exceptions.application_exceptions import EntityNotFoundException
 
@@ -160,6 +162,47 @@ class TestListarTransacoesUseCase:
         mock_transacao_repository.listar.assert_called_once()
 
 
+@pytest.mark.unit
+class TestListarTransacoesAsyncUseCase:
+    """Testes para ListarTransacoesAsyncUseCase"""
+    
+    @pytest.mark.asyncio
+    async def test_carrega_tags_e_usuarios_em_uma_consulta_cada(self):
+        """
+        ARRANGE: Transações compartilhando tags e usuário
+        ACT: Executar use case
+        ASSERT: Tags/usuários buscados uma única vez por lista de IDs
+        """
+        # Arrange
+        transacoes = [
+            Transacao(id=i, data=date(2024, 1, i), descricao=f"T{i}", valor=10.0,
+                      tipo=TipoTransacao.SAIDA, tag_ids=[1, 2] if i % 2 else [2], usuario_id=1)
+            for i in range(1, 5)
+        ]
+        transacao_repo = AsyncMock()
+        transacao_repo.listar.return_value = transacoes
+        config_repo = AsyncMock()
+        config_repo.obter.return_value = "data_transacao"
+        tag_repo = AsyncMock()
+        tag_repo.listar_por_ids.return_value = [
+            Tag(id=1, nome="Casa", cor="#FF0000"),
+            Tag(id=2, nome="Fixo", cor="#00FF00"),
+        ]
+        usuario_repo = AsyncMock()
+        usuario_repo.listar_por_ids.return_value = [Usuario(id=1, nome="Ana")]
+        use_case = ListarTransacoesAsyncUseCase(transacao_repo, config_repo, tag_repo, usuario_repo)
+        
+        # Act
+        resultado = await use_case.execute(FiltrosTransacaoDTO(mes=1, ano=2024))
+        
+        # Assert
+        tag_repo.listar_por_ids.assert_awaited_once_with([1, 2])
+        usuario_repo.listar_por_ids.assert_awaited_once_with([1])
+        assert [t.nome for t in resultado[0].tags] == ["Casa", "Fixo"]
+        assert [t.nome for t in resultado[1].tags] == ["Fixo"]
+        assert all(dto.usuario.nome == "Ana" for dto in resultado)
+
+
 @pytest.mark.unit
 class TestAtualizarTransacaoUseCase:
     """Testes para AtualizarTransacaoUseCase"""
@@ -0,0 +1,56 @@
+"""
+Testes unitários para ArquivoTratadoParser (leitura em blocos)
+"""
+from io import BytesIO
+
+import pytest
+from app.application.exceptions import ValidationException
+from app.infrastructure.parsers.arquivo_tratado_parser import ArquivoTratadoParser
+
+
+class TestArquivoTratadoParserEmBlocos:
+    """Testes para parse_em_blocos"""
+    
+    @pytest.fixture
+    def parser(self):
+        """Instância do parser de arquivo tratado"""
+        return ArquivoTratadoParser()
+    
+    def test_parse_em_blocos_divide_csv(self, parser):
+        """Deve produzir blocos do tamanho pedido, já convertidos"""
+        # Arrange
+        linhas = "".join(f"2025-01-{dia:02d},Compra {dia},-{dia}.50,extrato_bancario,\n" for dia in range(1, 6))
+        arquivo = BytesIO(("data,descricao,valor,origem,data_fatura\n" + linhas).encode())
+        
+        # Act
+        blocos = list(parser.parse_em_blocos(arquivo, "historico.csv", tamanho_bloco=2))
+        
+        # Assert
+        assert [len(bloco) for bloco in blocos] == [2, 2, 1]
+        assert blocos[2]['descricao'].iloc[0] == "Compra 5"
+        assert blocos[0]['valor'].iloc[0] == -1.5
+        assert str(blocos[1]['data'].dtype).startswith("datetime64")
+    
+    def test_parse_em_blocos_ignora_linhas_invalidas(self, parser):
+        """Blocos sem linhas válidas são pulados"""
+        # Arrange
+        csv_content = (
+            b"data,descricao,valor,origem,data_fatura\n"
+            b"invalida,Sem data,-1.00,extrato_bancario,\n"
+            b"2025-01-02,Outra origem,-2.00,desconhecida,\n"
+            b"2025-01-03,Valida,-3.00,extrato_bancario,\n"
+        )
+        
+        # Act
+        blocos = list(parser.parse_em_blocos(csv_content, "historico.csv", tamanho_bloco=2))
+        
+        # Assert
+        assert len(blocos) == 1
+        assert list(blocos[0]['descricao']) == ["Valida"]
+    
+    def test_parse_em_blocos_sem_linhas_validas_deve_falhar(self, parser):
+        """Arquivo sem nenhuma linha válida deve lançar ValidationException"""
+        csv_content = b"data,descricao,valor,origem,data_fatura\ninvalida,X,abc,extrato_bancario,\n"
+        
+        with pytest.raises(ValidationException):
+            list(parser.parse_em_blocos(csv_content, "historico.csv", tamanho_bloco=10))
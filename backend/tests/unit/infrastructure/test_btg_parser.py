@@ -204,3 +204,104 @@ class TestBTGFaturaParser:
         # Terceira parcela: data original + 2 meses
         assert resultado.iloc[1]['data'] == pd.Timestamp('2024-03-15')
 
+
+
+class TestBTGFaturaParserCache:
+    """Testes do cache de planilhas descriptografadas"""
+    
+    SENHA = "12345678901"
+    NOME = "2025-01-10_Fatura_FULANO_1234_BTG.xlsx"
+    
+    @pytest.fixture(autouse=True)
+    def limpar_caches(self):
+        from app.infrastructure.parsers import btg_fatura_parser
+        
+        btg_fatura_parser._planilhas_descriptografadas.limpar()
+        btg_fatura_parser._chaves_derivadas.limpar()
+        yield
+        btg_fatura_parser._planilhas_descriptografadas.limpar()
+        btg_fatura_parser._chaves_derivadas.limpar()
+    
+    @pytest.fixture(scope="class")
+    def fatura_criptografada(self):
+        """Fatura BTG mínima criptografada com a senha de teste"""
+        import openpyxl
+        from msoffcrypto.format.ooxml import OOXMLFile
+        
+        workbook = openpyxl.Workbook()
+        planilha = workbook.active
+        planilha.append([None, "Data", "Descrição", None, "Valor", "Tipo"])
+        planilha.append([None, "05/01/2025", "Mercado", None, 50.0, "Compra à vista"])
+        conteudo = BytesIO()
+        workbook.save(conteudo)
+        
+        criptografado = BytesIO()
+        OOXMLFile(BytesIO(conteudo.getvalue())).encrypt(self.SENHA, criptografado)
+        return criptografado.getvalue()
+    
+    def test_reenvio_nao_descriptografa_novamente(self, fatura_criptografada):
+        """Mesmo conteúdo e senha devem usar a planilha em cache"""
+        from unittest.mock import patch
+
+        from app.infrastructure.parsers import btg_fatura_parser
+        
+        parser = BTGFaturaParser()
+        with patch.object(
+            btg_fatura_parser.msoffcrypto, "OfficeFile", wraps=btg_fatura_parser.msoffcrypto.OfficeFile
+        ) as office_file:
+            primeiro = parser.parse(fatura_criptografada, self.NOME, password=self.SENHA)
+            segundo = parser.parse(fatura_criptografada, self.NOME, password=self.SENHA)
+        
+        assert office_file.call_count == 1
+        assert list(primeiro['descricao']) == list(segundo['descricao']) == ["Mercado"]
+    
+    def test_senha_errada_em_cache(self, fatura_criptografada):
+        """Tentativa com senha errada deve falhar de novo sem nova derivação"""
+        from unittest.mock import patch
+
+        from app.infrastructure.parsers import btg_fatura_parser
+        
+        parser = BTGFaturaParser()
+        with patch.object(
+            btg_fatura_parser.msoffcrypto, "OfficeFile", wraps=btg_fatura_parser.msoffcrypto.OfficeFile
+        ) as office_file:
+            for _ in range(2):
+                with pytest.raises(ValidationException, match="senha"):
+                    parser.parse(fatura_criptografada, self.NOME, password="00000000000")
+        
+        assert office_file.call_count == 1
+    
+    def test_falha_que_nao_e_senha_errada_nao_fica_em_cache(self, fatura_criptografada):
+        """Falha transitória não deve bloquear a nova tentativa com a senha certa"""
+        from unittest.mock import patch
+
+        from app.infrastructure.parsers import btg_fatura_parser
+        
+        parser = BTGFaturaParser()
+        office_file_real = btg_fatura_parser.msoffcrypto.OfficeFile
+        falhas = [MemoryError("sem memória")]
+        
+        def office_file_instavel(arquivo):
+            if falhas:
+                raise falhas.pop()
+            return office_file_real(arquivo)
+        
+        with patch.object(btg_fatura_parser.msoffcrypto, "OfficeFile", side_effect=office_file_instavel):
+            with pytest.raises(ValidationException):
+                parser.parse(fatura_criptografada, self.NOME, password=self.SENHA)
+            resultado = parser.parse(fatura_criptografada, self.NOME, password=self.SENHA)
+        
+        assert list(resultado['descricao']) == ["Mercado"]
+    
+    def test_chave_derivada_reaproveitada(self, fatura_criptografada):
+        """Mesma senha e parâmetros de criptografia reaproveitam a chave derivada"""
+        from app.infrastructure.parsers import btg_fatura_parser
+        
+        parser = BTGFaturaParser()
+        parser.parse(fatura_criptografada, self.NOME, password=self.SENHA)
+        btg_fatura_parser._planilhas_descriptografadas.limpar()
+        
+        resultado = parser.parse(fatura_criptografada, self.NOME, password=self.SENHA)
+        
+        assert len(btg_fatura_parser._chaves_derivadas) == 1
+        assert list(resultado['descricao']) == ["Mercado"]
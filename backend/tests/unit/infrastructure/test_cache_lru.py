@@ -0,0 +1,55 @@
+"""
+Testes unitários para CacheLRU
+"""
+from app.infrastructure.parsers.cache_lru import CacheLRU
+
+
+class RelogioFalso:
+    """Relógio controlado pelo teste"""
+    
+    def __init__(self):
+        self.agora = 0.0
+    
+    def __call__(self) -> float:
+        return self.agora
+
+
+class TestCacheLRU:
+    """Testes para CacheLRU"""
+    
+    def test_item_expira_apos_ttl(self):
+        """Itens devem expirar após o TTL"""
+        relogio = RelogioFalso()
+        cache = CacheLRU(max_itens=10, max_bytes=100, ttl_segundos=5, relogio=relogio)
+        cache.guardar("a", b"123", tamanho=3)
+        
+        relogio.agora = 4.9
+        assert cache.obter("a") == b"123"
+        relogio.agora = 5.0
+        assert cache.obter("a") is None
+        assert cache.total_bytes == 0
+    
+    def test_descarta_menos_usado_ao_exceder_itens(self):
+        """Ao exceder max_itens, o item menos usado sai primeiro"""
+        cache = CacheLRU(max_itens=2, max_bytes=100, ttl_segundos=60)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        cache.obter("a")
+        
+        cache.guardar("c", 3)
+        
+        assert cache.obter("b") is None
+        assert cache.obter("a") == 1
+        assert cache.obter("c") == 3
+    
+    def test_respeita_limite_de_bytes(self):
+        """Total de bytes nunca passa de max_bytes; itens grandes demais são ignorados"""
+        cache = CacheLRU(max_itens=10, max_bytes=10, ttl_segundos=60)
+        cache.guardar("a", b"x" * 6, tamanho=6)
+        cache.guardar("b", b"y" * 6, tamanho=6)
+        cache.guardar("grande", b"z" * 11, tamanho=11)
+        
+        assert cache.obter("a") is None
+        assert cache.obter("b") == b"y" * 6
+        assert cache.obter("grande") is None
+        assert cache.total_bytes == 6
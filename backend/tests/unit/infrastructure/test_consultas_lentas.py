@@ -0,0 +1,135 @@
+"""
+Testes do log de consultas lentas
+"""
+import asyncio
+import logging
+from datetime import date
+
+import pytest
+from sqlmodel import Session, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.application.use_cases.listar_tags import ListarTagsAsyncUseCase, ListarTagsUseCase
+from app.infrastructure.config import get_settings
+from app.infrastructure.database import consultas_lentas
+from app.infrastructure.database.consultas_lentas import (
+    BufferConsultasLentas,
+    ConsultaLenta,
+    get_buffer_consultas_lentas,
+    mascarar_parametros,
+)
+from app.infrastructure.database.engine import criar_engine, criar_engine_async
+from app.infrastructure.database.repositories.tag_repository import TagRepository, TagRepositoryAsync
+
+
+@pytest.fixture
+def registrar_todas(monkeypatch):
+    """Limite zero: todo statement é registrado, com EXPLAIN"""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_MS", 0)
+    monkeypatch.setattr(settings, "DB_SLOW_QUERY_EXPLAIN", True)
+    monkeypatch.setattr(consultas_lentas, "_buffer", None)
+    return get_buffer_consultas_lentas
+
+
+@pytest.fixture
+def url_banco(tmp_path):
+    # Importar modelos
+    from app.infrastructure.database.models.lote_importacao_model import LoteImportacaoModel  # noqa: F401
+    from app.infrastructure.database.models.tag_model import TagModel  # noqa: F401
+    from app.infrastructure.database.models.transacao_model import TransacaoModel  # noqa: F401
+    from app.infrastructure.database.models.usuario_model import UsuarioModel  # noqa: F401
+
+    url = f"sqlite:///{tmp_path / 'financas.db'}"
+    engine = criar_engine(url)
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+    return url
+
+
+@pytest.mark.unit
+class TestMascararParametros:
+    """Testes de mascarar_parametros"""
+
+    def test_mascara_textos_e_mantem_numeros_datas_e_nulos(self):
+        parametros = ("Mercado Pão de Açúcar", 150.5, 3, None, date(2024, 1, 31), b"\x00\x01")
+
+        assert mascarar_parametros(parametros) == [
+            "<texto:21>", 150.5, 3, None, "2024-01-31", "<bytes:2>",
+        ]
+
+    def test_mascara_parametros_nomeados_e_executemany(self):
+        assert mascarar_parametros({"cpf": "12345678901", "limite": 10}) == {"cpf": "<texto:11>", "limite": 10}
+        assert mascarar_parametros([("a",), ("bc",)]) == [["<texto:1>"], ["<texto:2>"]]
+
+
+@pytest.mark.unit
+class TestBufferConsultasLentas:
+    """Testes do buffer circular"""
+
+    def test_mantem_apenas_as_mais_recentes_em_ordem_decrescente(self):
+        # ARRANGE
+        buffer = BufferConsultasLentas(capacidade=2)
+
+        # ACT
+        for i in range(3):
+            buffer.adicionar(ConsultaLenta(sql=f"SELECT {i}", parametros=[], duracao_ms=1.0, origem=None))
+
+        # ASSERT
+        assert [c.sql for c in buffer.listar()] == ["SELECT 2", "SELECT 1"]
+        assert [c.sql for c in buffer.listar(limite=1)] == ["SELECT 2"]
+
+
+@pytest.mark.unit
+class TestMonitorarConsultasLentas:
+    """Testes dos eventos registrados por criar_engine/criar_engine_async"""
+
+    def test_registra_sql_origem_e_plano_de_consulta_lenta(self, url_banco, registrar_todas, caplog):
+        """Statement lento é logado com o use case de origem e o EXPLAIN QUERY PLAN"""
+        # ARRANGE
+        engine = criar_engine(url_banco)
+
+        # ACT
+        with caplog.at_level(logging.WARNING, logger=consultas_lentas.__name__):
+            with Session(engine) as session:
+                ListarTagsUseCase(TagRepository(session)).execute()
+        engine.dispose()
+
+        # ASSERT
+        consulta = next(c for c in registrar_todas().listar() if "FROM tag" in c.sql)
+        assert consulta.origem == "ListarTagsUseCase.execute"
+        assert consulta.duracao_ms >= 0
+        assert consulta.plano and any("SCAN" in linha for linha in consulta.plano)
+        assert "ListarTagsUseCase.execute" in caplog.text
+
+    def test_identifica_use_case_async(self, url_banco, registrar_todas):
+        """Nas sessões async a origem vem da pilha do greenlet pai"""
+        # ARRANGE
+        engine = criar_engine_async(url_banco.replace("sqlite://", "sqlite+aiosqlite://"))
+
+        async def listar():
+            async with AsyncSession(engine) as session:
+                await ListarTagsAsyncUseCase(TagRepositoryAsync(session)).execute()
+            await engine.dispose()
+
+        # ACT
+        asyncio.run(listar())
+
+        # ASSERT
+        consulta = next(c for c in registrar_todas().listar() if "FROM tag" in c.sql)
+        assert consulta.origem == "ListarTagsAsyncUseCase.execute"
+        assert consulta.plano
+
+    def test_consultas_abaixo_do_limite_nao_sao_registradas(self, url_banco, monkeypatch):
+        # ARRANGE
+        monkeypatch.setattr(get_settings(), "DB_SLOW_QUERY_MS", 60_000)
+        monkeypatch.setattr(consultas_lentas, "_buffer", None)
+        engine = criar_engine(url_banco)
+
+        # ACT
+        with Session(engine) as session:
+            TagRepository(session).listar()
+        engine.dispose()
+
+        # ASSERT
+        assert get_buffer_consultas_lentas().listar() == []
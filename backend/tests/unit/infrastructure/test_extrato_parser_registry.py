@@ -0,0 +1,117 @@
+"""
+Testes unitários para ExtratoParserRegistry (carregamento sob demanda)
+"""
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+from app.application.exceptions import ValidationException
+from app.infrastructure.parsers import extrato_parser_registry
+from app.infrastructure.parsers.extrato_parser_registry import (
+    PARSERS_DISPONIVEIS,
+    ExtratoParserRegistry,
+)
+
+
+class TestExtratoParserRegistry:
+    """Testes para registro por caminho"""
+    
+    def test_parser_registrado_por_caminho_so_e_instanciado_no_uso(self):
+        """Parser registrado por caminho deve ser criado uma vez, no primeiro uso"""
+        # Arrange
+        registry = ExtratoParserRegistry()
+        registry.registrar_caminho("nubank_fatura", PARSERS_DISPONIVEIS["nubank_fatura"])
+        
+        # Act / Assert
+        assert registry.listar_parsers_disponiveis() == ["nubank_fatura"]
+        assert registry._parsers == {}
+        parser = registry.obter_parser("nubank_fatura")
+        assert parser.parser_id == "nubank_fatura"
+        assert registry.obter_parser("nubank_fatura") is parser
+    
+    def test_registrar_caminho_duplicado_deve_falhar(self):
+        """parser_id já registrado deve lançar ValueError"""
+        registry = ExtratoParserRegistry()
+        registry.registrar_caminho("nubank_fatura", PARSERS_DISPONIVEIS["nubank_fatura"])
+        
+        with pytest.raises(ValueError):
+            registry.registrar_caminho("nubank_fatura", PARSERS_DISPONIVEIS["nubank_fatura"])
+    
+    def test_caminho_com_parser_id_divergente_deve_falhar(self):
+        """Classe cujo parser_id não bate com o registro deve ser rejeitada"""
+        registry = ExtratoParserRegistry()
+        registry.registrar_caminho("btg_extrato", PARSERS_DISPONIVEIS["nubank_fatura"])
+        
+        with pytest.raises(ValueError):
+            registry.obter_parser("btg_extrato")
+    
+    def test_import_que_falhou_pode_ser_tentado_de_novo(self, monkeypatch):
+        """Falha no import não deve remover o parser do registro"""
+        # Arrange
+        registry = ExtratoParserRegistry()
+        registry.registrar_caminho("nubank_fatura", PARSERS_DISPONIVEIS["nubank_fatura"])
+        falhas = [ImportError("falha transitória")]
+        
+        def import_instavel(nome):
+            if falhas:
+                raise falhas.pop()
+            return import_module(nome)
+        
+        monkeypatch.setattr(extrato_parser_registry, "import_module", import_instavel)
+        
+        # Act / Assert
+        with pytest.raises(ImportError):
+            registry.obter_parser("nubank_fatura")
+        assert registry.listar_parsers_disponiveis() == ["nubank_fatura"]
+        
+        parser = registry.obter_parser("nubank_fatura")
+        assert parser.parser_id == "nubank_fatura"
+        assert registry.listar_parsers_disponiveis() == ["nubank_fatura"]
+    
+    def test_primeiro_uso_concorrente_cria_uma_instancia(self, monkeypatch):
+        """Requisições simultâneas devem importar e instanciar o parser uma vez"""
+        # Arrange
+        registry = ExtratoParserRegistry()
+        registry.registrar_caminho("nubank_fatura", PARSERS_DISPONIVEIS["nubank_fatura"])
+        imports = []
+        
+        def import_lento(nome):
+            imports.append(nome)
+            time.sleep(0.05)
+            return import_module(nome)
+        
+        monkeypatch.setattr(extrato_parser_registry, "import_module", import_lento)
+        
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parsers = list(executor.map(lambda _: registry.obter_parser("nubank_fatura"), range(8)))
+        
+        # Assert
+        assert len(imports) == 1
+        assert all(parser is parsers[0] for parser in parsers)
+    
+    def test_parser_inexistente_deve_falhar(self):
+        """parser_id desconhecido deve lançar ValidationException"""
+        with pytest.raises(ValidationException):
+            ExtratoParserRegistry().obter_parser("inter_extrato")
+    
+    def test_startup_da_api_nao_importa_pandas(self):
+        """Importar a aplicação não deve carregar pandas nem leitores de planilha"""
+        script = (
+            "import sys, app.main; "
+            "print(','.join(m for m in ('pandas', 'openpyxl', 'msoffcrypto') if m in sys.modules))"
+        )
+        
+        saida = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).resolve().parents[3],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        
+        assert saida.stdout.strip() == ""
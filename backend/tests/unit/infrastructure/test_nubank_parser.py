@@ -140,6 +140,37 @@ invalid-date,Compra data inválida,-25.00
         assert "Colunas obrigatórias faltando" in str(exc_info.value) or \
                "Erro ao processar fatura Nubank" in str(exc_info.value)
 
+    
+    def test_parse_registros_equivale_ao_parse(self, parser):
+        """Caminho rápido deve produzir as mesmas linhas do caminho com pandas"""
+        # Arrange
+        csv_content = """date,title,amount
+2026-01-05,Compra válida,-50.00
+2026-01-07,Compra valor inválido,not-a-number
+2026-01-08,"Loja, com vírgula",40.10
+""".encode('utf-8')
+        
+        # Act
+        registros = parser.parse_registros(csv_content, "Nubank_2026-01-06.csv")
+        df = parser.parse(csv_content, "Nubank_2026-01-06.csv")
+        
+        # Assert
+        assert [r['descricao'] for r in registros] == list(df['descricao'])
+        assert [r['valor'] for r in registros] == list(df['valor'])
+        assert [r['data'] for r in registros] == [d.date() for d in df['data']]
+        assert all(r['data_fatura'] == pd.Timestamp("2026-01-06").date() for r in registros)
+        assert all(r['origem'] == 'fatura_cartao' and r['banco'] == 'nubank' for r in registros)
+    
+    def test_parse_registros_data_fora_do_padrao_usa_pandas(self, parser):
+        """Datas fora de YYYY-MM-DD devem devolver None (usar parse)"""
+        csv_content = b"date,title,amount\n05/01/2026,Compra,-50.00\n"
+        
+        assert parser.parse_registros(csv_content, "Nubank_2026-01-06.csv") is None
+    
+    def test_parse_registros_colunas_faltando_lanca_excecao(self, parser):
+        """Caminho rápido valida colunas como o parse"""
+        with pytest.raises(ValidationException, match="Colunas obrigatórias faltando"):
+            parser.parse_registros(b"date,title\n2026-01-05,Compra\n", "Nubank_2026-01-06.csv")
 
 class TestNubankExtratoParser:
     """Testes para NubankExtratoParser"""
@@ -259,4 +290,29 @@ data_invalida,50.00,Dados ruins
         
         assert "Erro ao processar extrato Nubank" in str(exc_info.value) or \
                "Colunas faltando" in str(exc_info.value)
-
+    
+    def test_parse_registros_equivale_ao_parse(self, parser):
+        """Caminho rápido deve produzir as mesmas linhas do caminho com pandas"""
+        # Arrange
+        csv_data = """Data,Valor,Identificador,Descrição
+15/11/2025,100.00,a1,Compra válida
+data_invalida,50.00,a2,Dados ruins
+16/11/2025,valor_invalido,a3,Mais dados ruins
+17/11/2025,-200.50,a4,"Transferência, Pix"
+18/11/2025,10.00,a5,""".encode('utf-8')
+        
+        # Act
+        registros = parser.parse_registros(csv_data, "NU_454757980_01NOV2025_30NOV2025.csv")
+        df = parser.parse(csv_data, "NU_454757980_01NOV2025_30NOV2025.csv")
+        
+        # Assert
+        assert [r['descricao'] for r in registros] == list(df['descricao'])
+        assert [r['valor'] for r in registros] == list(df['valor'])
+        assert [r['data'] for r in registros] == [d.date() for d in df['data']]
+        assert all(r['origem'] == 'extrato_bancario' for r in registros)
+    
+    def test_parse_registros_nao_utf8_usa_pandas(self, parser):
+        """Conteúdo fora de UTF-8 deve devolver None (usar parse)"""
+        csv_data = "Data,Valor,Descrição\n15/11/2025,1.00,Café\n".encode('latin-1')
+        
+        assert parser.parse_registros(csv_data, "NU_454757980_01NOV2025_30NOV2025.csv") is None
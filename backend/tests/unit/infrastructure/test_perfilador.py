@@ -0,0 +1,130 @@
+"""
+Testes do perfilador por amostragem
+"""
+import contextvars
+import threading
+import time
+
+import pytest
+
+from app.infrastructure.observabilidade.perfilador import (
+    ArmazemPerfis,
+    PerfiladorAmostragem,
+    PerfilRequisicao,
+    encerrar_registro_threads,
+    iniciar_registro_threads,
+    registrar_thread_atual,
+    threads_registradas,
+)
+
+
+def _ocupar_cpu(parar: threading.Event) -> None:
+    while not parar.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.unit
+class TestPerfiladorAmostragem:
+    """Testes de PerfiladorAmostragem"""
+
+    def test_amostra_pilhas_de_threads_ocupadas_e_ignora_ociosas(self):
+        # ARRANGE
+        parar = threading.Event()
+        ocupada = threading.Thread(target=_ocupar_cpu, args=(parar,), name="ocupada")
+        ociosa = threading.Thread(target=parar.wait, name="ociosa")
+        ocupada.start()
+        ociosa.start()
+        perfilador = PerfiladorAmostragem(intervalo_s=0.001)
+
+        # ACT
+        perfilador.iniciar()
+        time.sleep(0.05)
+        pilhas = perfilador.parar()
+        parar.set()
+        ocupada.join()
+        ociosa.join()
+
+        # ASSERT
+        ocupadas = [p for p in pilhas if p.startswith("ocupada;")]
+        assert ocupadas
+        assert all("test_perfilador._ocupar_cpu" in p for p in ocupadas)
+        assert not any(p.startswith("ociosa;") for p in pilhas)
+        assert not any(p.startswith("perfilador;") for p in pilhas)
+
+    def test_amostra_apenas_threads_acompanhadas(self):
+        # ARRANGE
+        parar = threading.Event()
+        da_requisicao = threading.Thread(target=_ocupar_cpu, args=(parar,), name="requisicao")
+        outra = threading.Thread(target=_ocupar_cpu, args=(parar,), name="outra-requisicao")
+        da_requisicao.start()
+        outra.start()
+        perfilador = PerfiladorAmostragem(intervalo_s=0.001, threads={da_requisicao.ident})
+
+        # ACT
+        perfilador.iniciar()
+        time.sleep(0.05)
+        pilhas = perfilador.parar()
+        parar.set()
+        da_requisicao.join()
+        outra.join()
+
+        # ASSERT
+        assert any(p.startswith("requisicao;") for p in pilhas)
+        assert not any(p.startswith("outra-requisicao;") for p in pilhas)
+        assert perfilador.threads_amostradas == [f"requisicao ({da_requisicao.ident})"]
+
+
+@pytest.mark.unit
+class TestRegistroThreads:
+    """Testes do conjunto de threads da requisição (ContextVar)"""
+
+    def test_threads_com_contexto_copiado_entram_no_conjunto(self):
+        # ARRANGE
+        token = iniciar_registro_threads()
+        contexto = contextvars.copy_context()  # Como o threadpool do Starlette/anyio
+        worker = threading.Thread(target=contexto.run, args=(registrar_thread_atual,))
+
+        # ACT
+        worker.start()
+        worker.join()
+        threads = threads_registradas()
+        encerrar_registro_threads(token)
+
+        # ASSERT
+        assert threads == {threading.get_ident(), worker.ident}
+        assert threads_registradas() is None
+
+    def test_registrar_fora_de_requisicao_perfilada_nao_faz_nada(self):
+        registrar_thread_atual()
+
+        assert threads_registradas() is None
+
+
+@pytest.mark.unit
+class TestPerfilRequisicao:
+    """Testes da exportação e armazenamento de perfis"""
+
+    def test_folded_ordena_por_amostras(self):
+        perfil = PerfilRequisicao(
+            metodo="GET", caminho="/tags", duracao_ms=1.0, intervalo_ms=1.0,
+            pilhas={"MainThread;a.f": 2, "MainThread;a.f;b.g": 5},
+        )
+
+        assert perfil.como_folded() == "MainThread;a.f;b.g 5\nMainThread;a.f 2\n"
+        assert perfil.total_amostras == 7
+
+    def test_armazem_descarta_perfis_mais_antigos(self):
+        # ARRANGE
+        armazem = ArmazemPerfis(capacidade=2)
+        perfis = [
+            PerfilRequisicao(metodo="GET", caminho=f"/{i}", duracao_ms=1.0, intervalo_ms=1.0, pilhas={})
+            for i in range(3)
+        ]
+
+        # ACT
+        for perfil in perfis:
+            armazem.guardar(perfil)
+
+        # ASSERT
+        assert armazem.obter(perfis[0].id) is None
+        assert armazem.obter(perfis[2].id) is perfis[2]
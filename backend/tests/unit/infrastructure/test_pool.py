@@ -0,0 +1,72 @@
+"""
+Testes do pool de conexões monitorado
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.infrastructure.database.engine import argumentos_engine
+from app.infrastructure.database.pool import QueuePoolMonitorado, obter_estatisticas_pool
+
+
+@pytest.mark.unit
+class TestQueuePoolMonitorado:
+    """Testes de QueuePoolMonitorado e obter_estatisticas_pool"""
+
+    def test_estatisticas_refletem_conexoes_em_uso_e_timeouts(self, tmp_path):
+        """Deve contar conexões em uso, checkouts e timeouts de espera"""
+        # ARRANGE
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=QueuePoolMonitorado,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+
+        # ACT
+        conexao = engine.connect()
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        estatisticas = obter_estatisticas_pool(engine)
+        conexao.close()
+        engine.dispose()
+
+        # ASSERT
+        assert estatisticas["classe"] == "QueuePoolMonitorado"
+        assert estatisticas["em_uso"] == 1
+        assert estatisticas["overflow"] == 0
+        assert estatisticas["total_checkouts"] == 2
+        assert estatisticas["total_timeouts"] == 1
+        assert estatisticas["espera_max_ms"] >= 50
+
+    def test_pool_sem_fila_informa_apenas_classe(self):
+        """SQLite em memória não usa QueuePool"""
+        engine = create_engine("sqlite:///:memory:")
+
+        assert obter_estatisticas_pool(engine) == {"classe": "SingletonThreadPool"}
+
+
+@pytest.mark.unit
+class TestArgumentosEngine:
+    """Testes de argumentos_engine"""
+
+    def test_sqlite_em_memoria_nao_recebe_argumentos_de_pool(self):
+        assert argumentos_engine("sqlite:///:memory:") == {"echo": False}
+
+    def test_postgres_recebe_pool_e_statement_timeout(self, monkeypatch):
+        """Deve repassar Settings ao pool e o timeout no formato de cada driver"""
+        # ARRANGE
+        from app.infrastructure.config import get_settings
+        monkeypatch.setattr(get_settings(), "DB_POOL_SIZE", 7)
+        monkeypatch.setattr(get_settings(), "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+        # ACT
+        sincrono = argumentos_engine("postgresql://u:s@h/db")
+        assincrono = argumentos_engine("postgresql+asyncpg://u:s@h/db", assincrono=True)
+
+        # ASSERT
+        assert sincrono["poolclass"] is QueuePoolMonitorado
+        assert sincrono["pool_size"] == 7
+        assert sincrono["connect_args"] == {"options": "-c statement_timeout=5000"}
+        assert assincrono["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
@@ -0,0 +1,74 @@
+"""
+Testes das métricas no formato de exposição do Prometheus
+"""
+import pytest
+
+from app.infrastructure.observabilidade.prometheus import RegistroMetricas
+
+
+@pytest.mark.unit
+class TestRegistroMetricas:
+    """Testes de Contador, Gauge, Histograma e exportação"""
+
+    def test_histograma_exporta_buckets_cumulativos_soma_e_contagem(self):
+        # ARRANGE
+        registro = RegistroMetricas()
+        histograma = registro.histograma("duracao_segundos", "Duração", rotulos=("rota",), buckets=(0.1, 1.0))
+
+        # ACT
+        histograma.observar(0.05, rota="/a")
+        histograma.observar(0.5, rota="/a")
+        histograma.observar(3.0, rota="/a")
+        texto = registro.exportar()
+
+        # ASSERT
+        assert "# TYPE duracao_segundos histogram" in texto
+        assert 'duracao_segundos_bucket{rota="/a",le="0.1"} 1' in texto
+        assert 'duracao_segundos_bucket{rota="/a",le="1"} 2' in texto
+        assert 'duracao_segundos_bucket{rota="/a",le="+Inf"} 3' in texto
+        assert 'duracao_segundos_sum{rota="/a"} 3.55' in texto
+        assert 'duracao_segundos_count{rota="/a"} 3' in texto
+
+    def test_contador_e_gauge_por_rotulo(self):
+        # ARRANGE
+        registro = RegistroMetricas()
+        contador = registro.contador("linhas_total", "Linhas", rotulos=("parser_id",))
+        gauge = registro.gauge("em_andamento", "Em andamento")
+
+        # ACT
+        contador.inc(10, parser_id="nubank")
+        contador.inc(5, parser_id="nubank")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+        texto = registro.exportar()
+
+        # ASSERT
+        assert 'linhas_total{parser_id="nubank"} 15' in texto
+        assert "em_andamento 1" in texto
+
+    def test_rotulos_incompativeis_e_contador_negativo_sao_rejeitados(self):
+        registro = RegistroMetricas()
+        contador = registro.contador("linhas_total", "Linhas", rotulos=("parser_id",))
+
+        with pytest.raises(ValueError):
+            contador.inc(1, outro="x")
+        with pytest.raises(ValueError):
+            contador.inc(-1, parser_id="nubank")
+
+    def test_valores_de_rotulos_sao_escapados(self):
+        registro = RegistroMetricas()
+        registro.contador("erros_total", "Erros", rotulos=("mensagem",)).inc(mensagem='a "b"\nc')
+
+        assert 'erros_total{mensagem="a \\"b\\"\\nc"} 1' in registro.exportar()
+
+    def test_coletores_rodam_a_cada_exportacao(self):
+        # ARRANGE
+        registro = RegistroMetricas()
+        gauge = registro.gauge("pool_em_uso", "Em uso")
+        leituras = iter([3, 1])
+        registro.adicionar_coletor(lambda: gauge.set(next(leituras)))
+
+        # ACT / ASSERT
+        assert "pool_em_uso 3" in registro.exportar()
+        assert "pool_em_uso 1" in registro.exportar()
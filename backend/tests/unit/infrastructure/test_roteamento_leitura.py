@@ -0,0 +1,49 @@
+"""
+Testes do registro de escritas usado no roteamento de leituras
+"""
+import pytest
+
+from app.infrastructure.database.roteamento_leitura import RegistroEscritas
+
+
+class RelogioFalso:
+    def __init__(self):
+        self.agora = 100.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.mark.unit
+class TestRegistroEscritas:
+    """Testes de RegistroEscritas"""
+
+    def test_cliente_escreveu_recentemente_apenas_dentro_da_janela(self):
+        # ARRANGE
+        relogio = RelogioFalso()
+        registro = RegistroEscritas(janela_segundos=5, relogio=relogio)
+
+        # ACT
+        registro.registrar_escrita("a")
+        relogio.agora += 4.9
+        dentro = registro.escreveu_recentemente("a")
+        relogio.agora += 0.1
+        fora = registro.escreveu_recentemente("a")
+
+        # ASSERT
+        assert dentro is True
+        assert fora is False
+        assert registro.escreveu_recentemente("b") is False
+
+    def test_entradas_expiradas_sao_descartadas(self):
+        # ARRANGE
+        relogio = RelogioFalso()
+        registro = RegistroEscritas(janela_segundos=5, relogio=relogio)
+        registro.registrar_escrita("a")
+        relogio.agora += 10
+
+        # ACT
+        registro.registrar_escrita("b")
+
+        # ASSERT
+        assert list(registro._ultima_escrita) == ["b"]
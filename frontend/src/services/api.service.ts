@@ -186,6 +186,8 @@ export const importacaoService = {
       transacoes_ids: number[];
       mensagem: string;
       erro?: string;
+      lote_id?: number;
+      replay?: boolean;
     }>;
   }> {
     const formData = new FormData();